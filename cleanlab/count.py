@@ -47,7 +47,12 @@ from cleanlab.internal.latent_algebra import (
     compute_noise_matrix_from_inverse,
     compute_py,
 )
-from cleanlab.internal.multilabel_utils import get_onehot_num_classes, stack_complement
+from cleanlab.internal.multilabel_utils import (
+    calibrate_one_vs_rest_confident_joint,
+    compute_one_vs_rest_confident_joint,
+    get_one_vs_rest_confident_thresholds,
+    get_onehot_num_classes,
+)
 from cleanlab.internal.util import (
     append_extra_datapoint,
     clip_noise_rates,
@@ -291,21 +296,39 @@ def calibrate_confident_joint(
     else:
         num_classes = len(confident_joint)
         label_counts = value_counts_fill_missing_classes(labels, num_classes, multi_label=False)
+    return _calibrate_confident_joint_counts(confident_joint, label_counts)
+
+
+def _calibrate_confident_joint_counts(
+    confident_joint: np.ndarray, label_counts: np.ndarray
+) -> np.ndarray:
+    """Calibrates a confident joint of shape ``(K, K)`` given the ``(K,)`` counts of each given label,
+    see `calibrate_confident_joint`. A stack of confident joints of shape ``(..., K, K)``
+    (e.g. the one-vs-rest confident joints of every class) is calibrated with `label_counts` of shape ``(..., K)``.
+    """
+    num_classes = confident_joint.shape[-1]
     # Calibrate confident joint to have correct p(labels) prior on noisy labels.
     calibrated_cj = (
-        confident_joint.T
-        / np.clip(confident_joint.sum(axis=1), a_min=TINY_VALUE, a_max=None)
-        * label_counts
-    ).T
+        confident_joint
+        / np.clip(confident_joint.sum(axis=-1), a_min=TINY_VALUE, a_max=None)[..., np.newaxis]
+        * label_counts[..., np.newaxis]
+    )
     # Calibrate confident joint to sum to:
     # The number of examples (for single labeled datasets)
     # The number of total labels (for multi-labeled datasets)
+    # Entries are summed in memory order, since the rounding error of the total decides how ties are rounded below
+    if confident_joint.strides[-2] < confident_joint.strides[-1]:
+        totals = np.swapaxes(calibrated_cj, -2, -1).reshape(-1, num_classes**2).sum(axis=1)
+    else:
+        totals = calibrated_cj.reshape(-1, num_classes**2).sum(axis=1)
     calibrated_cj = (
         calibrated_cj
-        / np.clip(np.sum(calibrated_cj), a_min=TINY_VALUE, a_max=None)
-        * sum(label_counts)
+        / np.clip(totals.reshape(label_counts.shape[:-1] + (1, 1)), a_min=TINY_VALUE, a_max=None)
+        * label_counts.sum(axis=-1)[..., np.newaxis, np.newaxis]
+    )
+    return round_preserving_row_totals(calibrated_cj.reshape(-1, num_classes)).reshape(
+        calibrated_cj.shape
     )
-    return round_preserving_row_totals(calibrated_cj)
 
 
 def _calibrate_confident_joint_multilabel(confident_joint: np.ndarray, labels: list) -> np.ndarray:
@@ -333,14 +356,8 @@ def _calibrate_confident_joint_multilabel(confident_joint: np.ndarray, labels: l
     calibrated_cj : np.ndarray
       An array of shape ``(K, 2, 2)`` of type float representing a valid
       estimate of the joint *counts* of noisy and true labels in a one-vs-rest fashion."""
-    y_one, num_classes = get_onehot_num_classes(labels)
-    calibrate_confident_joint_list: np.ndarray = np.ndarray(
-        shape=(num_classes, 2, 2), dtype=np.int64
-    )
-    for class_num, (cj, y) in enumerate(zip(confident_joint, y_one.T)):
-        calibrate_confident_joint_list[class_num] = calibrate_confident_joint(cj, labels=y)
-
-    return calibrate_confident_joint_list
+    y_one, _ = get_onehot_num_classes(labels)
+    return calibrate_one_vs_rest_confident_joint(confident_joint, y_one)
 
 
 def estimate_joint(
@@ -436,7 +453,7 @@ def _estimate_joint_multilabel(
        An array of shape ``(K, 2, 2)`` representing an
        estimate of the true joint distribution of noisy and true labels for each class, in a one-vs-rest format employed for multi-label settings.
     """
-    y_one, num_classes = get_onehot_num_classes(labels, pred_probs)
+    y_one, _ = get_onehot_num_classes(labels, pred_probs)
     if confident_joint is None:
         calibrated_cj = compute_confident_joint(
             labels,
@@ -447,16 +464,10 @@ def _estimate_joint_multilabel(
     else:
         calibrated_cj = confident_joint
     assert isinstance(calibrated_cj, np.ndarray)
-    calibrated_cf: np.ndarray = np.ndarray((num_classes, 2, 2))
-    for class_num, (label, pred_prob_for_class) in enumerate(zip(y_one.T, pred_probs.T)):
-        pred_probs_binary = stack_complement(pred_prob_for_class)
-        calibrated_cf[class_num] = estimate_joint(
-            labels=label,
-            pred_probs=pred_probs_binary,
-            confident_joint=calibrated_cj[class_num],
-        )
-
-    return calibrated_cf
+    calibrated_cj = calibrate_one_vs_rest_confident_joint(calibrated_cj, y_one)
+    return calibrated_cj / np.clip(
+        calibrated_cj.sum(axis=(1, 2), keepdims=True).astype(float), a_min=TINY_VALUE, a_max=None
+    )
 
 
 def compute_confident_joint(
@@ -690,36 +701,16 @@ def _compute_confident_joint_multi_label(
     where `indices_off_diagonal` is a list of arrays (one per class) and each array contains the indices of examples counted in off-diagonals of confident joint for that class.
     """
 
-    y_one, num_classes = get_onehot_num_classes(labels, pred_probs)
-    confident_joint_list: np.ndarray = np.ndarray(shape=(num_classes, 2, 2), dtype=np.int64)
-    indices_off_diagonal = []
-    for class_num, (label, pred_prob_for_class) in enumerate(zip(y_one.T, pred_probs.T)):
-        pred_probs_binary = stack_complement(pred_prob_for_class)
-        if return_indices_of_off_diagonals:
-            cj, ind = compute_confident_joint(
-                labels=label,
-                pred_probs=pred_probs_binary,
-                multi_label=False,
-                thresholds=thresholds,
-                calibrate=calibrate,
-                return_indices_of_off_diagonals=return_indices_of_off_diagonals,
-            )
-            indices_off_diagonal.append(ind)
-        else:
-            cj = compute_confident_joint(
-                labels=label,
-                pred_probs=pred_probs_binary,
-                multi_label=False,
-                thresholds=thresholds,
-                calibrate=calibrate,
-                return_indices_of_off_diagonals=return_indices_of_off_diagonals,
-            )
-        confident_joint_list[class_num] = cj
+    y_one, _ = get_onehot_num_classes(labels, pred_probs)
+    confident_joint, off_diagonal_mask = compute_one_vs_rest_confident_joint(
+        y_one, pred_probs, thresholds=thresholds, calibrate=calibrate
+    )
 
     if return_indices_of_off_diagonals:
-        return confident_joint_list, indices_off_diagonal
+        indices_off_diagonal = [np.flatnonzero(mask) for mask in off_diagonal_mask.T]
+        return confident_joint, indices_off_diagonal
 
-    return confident_joint_list
+    return confident_joint
 
 
 def estimate_latent(
@@ -1490,11 +1481,5 @@ def _get_confident_thresholds_multilabel(
     confident_thresholds : np.ndarray
       An array of shape ``(K, 2, 2)`` where `K` is the number of classes, in a one-vs-rest format.
     """
-    y_one, num_classes = get_onehot_num_classes(labels, pred_probs)
-    confident_thresholds: np.ndarray = np.ndarray((num_classes, 2))
-    for class_num, (label_for_class, pred_prob_for_class) in enumerate(zip(y_one.T, pred_probs.T)):
-        pred_probs_binary = stack_complement(pred_prob_for_class)
-        confident_thresholds[class_num] = get_confident_thresholds(
-            pred_probs=pred_probs_binary, labels=label_for_class
-        )
-    return confident_thresholds
+    y_one, _ = get_onehot_num_classes(labels, pred_probs)
+    return get_one_vs_rest_confident_thresholds(y_one, pred_probs)
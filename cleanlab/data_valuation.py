@@ -18,16 +18,19 @@ Methods for quantifying the value of each data point in a Machine Learning datas
 Data Valuation helps us assess individual training data points' contributions to a ML model's predictive performance.
 """
 
-
+import multiprocessing
 from typing import Callable, Optional, Union
 
 import numpy as np
 from scipy.sparse import csr_matrix
 
 from cleanlab.internal.neighbor.knn_graph import create_knn_graph_and_index
+from cleanlab.internal.util import get_num_jobs
 
 
-def _knn_shapley_score(neighbor_indices: np.ndarray, y: np.ndarray, k: int) -> np.ndarray:
+def _knn_shapley_score(
+    neighbor_indices: np.ndarray, y: np.ndarray, k: int, n_jobs: Optional[int] = 1
+) -> np.ndarray:
     """Compute the Data Shapley values of data points using neighbor indices in a K-Nearest Neighbors (KNN) graph.
 
     This function leverages equations (18) and (19) from the paper available at https://arxiv.org/abs/1908.08619
@@ -41,6 +44,10 @@ def _knn_shapley_score(neighbor_indices: np.ndarray, y: np.ndarray, k: int) -> n
         A 1D array of target values corresponding to the data points.
     k :
         The number of nearest neighbors to consider for each data point.
+    n_jobs :
+        Number of processes used to accumulate the scores over chunks of rows.
+        If None, uses the number of physical cores (or logical cores if psutil is not installed).
+        Results are the same (up to floating point tolerance) no matter its value.
 
     Notes
     -----
@@ -51,19 +58,37 @@ def _knn_shapley_score(neighbor_indices: np.ndarray, y: np.ndarray, k: int) -> n
         - This simplification implies that the term min(K, j + 1) will always be j + 1, which is offset by the
           corresponding denominator term in the inner loop.
         - Dividing by K in the end achieves the same result as dividing by K* in the paper.
-    - The pre-allocated `scores` array incorporates equation (18) for j = k - 1, ensuring efficient computation.
+    - With this simplification, the recursion of equation (19) telescopes: the value that the test point alpha assigns to
+      its j-th nearest neighbor is ``match[j] - match[k - 1]`` (and 0 to every other point, per equation (18)).
+      These contributions are accumulated directly into a length-N vector, so memory usage is O(N * k) rather than O(N^2).
     """
     N = y.shape[0]
-    scores = np.zeros((N, N))
+    y = np.asarray(y).reshape(N)
+    neighbor_indices = np.asarray(neighbor_indices)[:, :k]
+
+    n_jobs = min(get_num_jobs(n_jobs), N)
+    if n_jobs == 1:
+        return _knn_shapley_score_chunk(neighbor_indices, y, np.arange(N), k) / (k * N)
+
+    row_chunks = np.array_split(np.arange(N), n_jobs)
+    args = [(neighbor_indices[rows], y, rows, k) for rows in row_chunks if len(rows) > 0]
+    with multiprocessing.Pool(n_jobs) as p:
+        partial_scores = p.starmap(_knn_shapley_score_chunk, args)
+    return np.sum(partial_scores, axis=0) / (k * N)
 
-    for y_alpha, s_alpha, idx in zip(y, scores, neighbor_indices):
-        y_neighbors = y[idx]
-        ans_matches = (y_neighbors == y_alpha).flatten()
-        for j in range(k - 2, -1, -1):
-            s_alpha[idx[j]] = s_alpha[idx[j + 1]] + float(
-                int(ans_matches[j]) - int(ans_matches[j + 1])
-            )
-    return np.mean(scores / k, axis=0)
+
+def _knn_shapley_score_chunk(
+    neighbor_indices: np.ndarray, y: np.ndarray, rows: np.ndarray, k: int
+) -> np.ndarray:
+    """Sum of the (unnormalized) contributions of the test points in `rows` to every data point's Shapley value.
+
+    `neighbor_indices` holds the first `k` neighbors of each of the points in `rows` (one row each).
+    """
+    ans_matches = (y[neighbor_indices] == y[rows].reshape(-1, 1)).astype(np.float64)
+    contributions = ans_matches - ans_matches[:, [k - 1]]
+    return np.bincount(
+        neighbor_indices.ravel(), weights=contributions.ravel(), minlength=y.shape[0]
+    )
 
 
 def data_shapley_knn(
@@ -73,6 +98,7 @@ def data_shapley_knn(
     knn_graph: Optional[csr_matrix] = None,
     metric: Optional[Union[str, Callable]] = None,
     k: int = 10,
+    n_jobs: Optional[int] = 1,
 ) -> np.ndarray:
     """
     Compute the Data Shapley values of data points using a K-Nearest Neighbors (KNN) graph.
@@ -107,6 +133,11 @@ def data_shapley_knn(
         The number of neighbors to consider for the KNN graph and Data Shapley value computation.
         Must be less than the total number of data points.
         The value may not exceed the number of neighbors of each data point stored in the KNN graph.
+    n_jobs :
+        Number of processes used by multiprocessing to compute the Data Shapley values over chunks of the dataset.
+        Default is 1, which computes everything in the current process.
+        If None, uses the number of physical cores on your CPU (or logical cores if ``psutil`` is not installed).
+        `n_jobs` only affects runtimes, results will be the same (up to floating point tolerance) no matter its value.
 
     Returns
     -------
@@ -139,5 +170,5 @@ def data_shapley_knn(
 
     num_examples = labels.shape[0]
     distances = knn_graph.indices.reshape(num_examples, -1)
-    scores = _knn_shapley_score(neighbor_indices=distances, y=labels, k=k)
+    scores = _knn_shapley_score(neighbor_indices=distances, y=labels, k=k, n_jobs=n_jobs)
     return 0.5 * (scores + 1)
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
-from collections import Counter
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Iterator, List, Optional, Union
 
 import numpy as np
 import pandas as pd
 
 from cleanlab.datalab.internal.issue_manager import IssueManager
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover
+    pa = None
+
 if TYPE_CHECKING:  # pragma: no cover
     import numpy.typing as npt
 
+    FeaturesLike = Union[npt.NDArray[Any], pd.DataFrame, "pa.Table", "pa.RecordBatch"]
+
 
 class NullIssueManager(IssueManager):
     """Manages issues related to null/missing values in the rows of features.
@@ -32,32 +39,82 @@ class NullIssueManager(IssueManager):
         2: ["most_common_issue"],
     }
 
+    _PATTERN_HASH_OFFSET: ClassVar[np.uint64] = np.uint64(0xCBF29CE484222325)
+    _PATTERN_HASH_PRIME: ClassVar[np.uint64] = np.uint64(0x100000001B3)
+
     @staticmethod
+    def _iter_null_columns(features: FeaturesLike) -> Iterator[npt.NDArray[np.bool_]]:
+        """Yields a boolean array for each column of the features, where True indicates null/missing entries.
+
+        Columns are read one at a time, so only O(N) extra memory is needed for N rows.
+        Arrow tables are checked with their validity bitmaps (NaN values also count as null),
+        DataFrame columns are checked in their own dtype, without converting the DataFrame to a single array.
+        """
+        if pa is not None and isinstance(features, (pa.Table, pa.RecordBatch)):
+            for column in features.columns:
+                is_null = pc.is_null(column, nan_is_null=True)
+                yield np.asarray(is_null.to_numpy(zero_copy_only=False), dtype=bool)
+        elif isinstance(features, pd.DataFrame):
+            for _, column in features.items():
+                yield column.isna().to_numpy(dtype=bool)
+        else:
+            features = np.asarray(features)
+            for j in range(features.shape[1]):
+                yield pd.isna(features[:, j])
+
+    @staticmethod
+    def _num_columns(features: FeaturesLike) -> int:
+        if isinstance(features, pd.DataFrame) or (
+            pa is not None and isinstance(features, (pa.Table, pa.RecordBatch))
+        ):
+            return features.shape[1]
+        return np.asarray(features).shape[1]
+
+    @classmethod
     def _calculate_null_issues(
-        features: npt.NDArray[Any],
-    ) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.float64], npt.NDArray[np.bool_]]:
+        cls,
+        features: FeaturesLike,
+    ) -> tuple[
+        npt.NDArray[np.bool_],
+        npt.NDArray[np.float64],
+        npt.NDArray[np.int64],
+        npt.NDArray[np.uint64],
+    ]:
         """Tracks the number of null values in each row of a feature array,
         computes quality scores based on the fraction of null values in each row,
-        and returns a boolean array indicating whether each row only has null values."""
-        cols = features.shape[1]
-        null_tracker = pd.isna(features)
-        non_null_count = cols - null_tracker.sum(axis=1)
+        and returns a boolean array indicating whether each row only has null values.
+
+        This is done in a single pass over the columns, which also counts the null values
+        in each column and computes a hash of the null value pattern of each row (see :py:meth:`_most_common_issue`).
+        """
+        cols = cls._num_columns(features)
+        num_rows = len(features)
+        null_count = np.zeros(num_rows, dtype=np.int64)
+        pattern_hashes = np.full(num_rows, cls._PATTERN_HASH_OFFSET, dtype=np.uint64)
+        column_null_count = np.zeros(cols, dtype=np.int64)
+        for j, is_null in enumerate(cls._iter_null_columns(features)):
+            null_count += is_null
+            column_null_count[j] = np.count_nonzero(is_null)
+            # FNV-1a style hash of the row patterns (overflow wraps around)
+            pattern_hashes ^= is_null.astype(np.uint64)
+            pattern_hashes *= cls._PATTERN_HASH_PRIME
+        non_null_count = cols - null_count
         scores = non_null_count / cols
         is_null_issue = non_null_count == 0
-        return is_null_issue, scores, null_tracker
+        return is_null_issue, scores, column_null_count, pattern_hashes
 
     def find_issues(
         self,
-        features: Optional[npt.NDArray | pd.DataFrame] = None,
+        features: Optional[FeaturesLike] = None,
         **kwargs,
     ) -> None:
         if features is None:
             raise ValueError("features must be provided to check for null values.")
-        # Support features as a numpy array. Temporarily allow this issuecheck to convert a DataFrame to a numpy array.
-        if isinstance(features, pd.DataFrame):
-            features = features.to_numpy()
 
-        is_null_issue, scores, null_tracker = self._calculate_null_issues(features=features)
+        is_null_issue, scores, column_null_count, pattern_hashes = self._calculate_null_issues(
+            features=features
+        )
+        column_impact = column_null_count / max(len(features), 1)
 
         self.issues = pd.DataFrame(
             {
@@ -67,11 +124,19 @@ class NullIssueManager(IssueManager):
         )
 
         self.summary = self.make_summary(score=scores.mean())
-        self.info = self.collect_info(null_tracker)
+        self.info = self.collect_info(
+            features=features,
+            has_null=scores < 1,
+            column_impact=column_impact,
+            pattern_hashes=pattern_hashes,
+        )
 
-    @staticmethod
+    @classmethod
     def _most_common_issue(
-        null_tracker: np.ndarray,
+        cls,
+        features: FeaturesLike,
+        has_null: npt.NDArray[np.bool_],
+        pattern_hashes: npt.NDArray[np.uint64],
     ) -> dict[str, dict[str, str | int | list[int] | list[int | None]]]:
         """
         Identify and return the most common null value pattern across all rows
@@ -79,34 +144,42 @@ class NullIssueManager(IssueManager):
 
         Parameters
         ------------
-        null_tracker : np.ndarray
-            A boolean array of the same shape as features, where True indicates null/missing entries.
+        features :
+            The features that were checked for null values.
+        has_null :
+            A boolean array with one entry per row, where True indicates rows with at least one null value.
+        pattern_hashes :
+            A hash of the null value pattern of each row, as computed by :py:meth:`_calculate_null_issues`.
 
         Returns
         --------
         Dict[str, Any]
             A dictionary containing the most common issue pattern and the count of rows with this pattern.
         """
-        # Convert the boolean null_tracker matrix into a list of strings.
         most_frequent_pattern = "no_null"
         rows_affected: List[int] = []
         occurrence_of_most_frequent_pattern = 0
-        if np.any(null_tracker, axis=None):
-            null_row_indices = np.where(np.any(null_tracker, axis=1))[0]
-            null_patterns_as_strings = [
-                "".join(map(str, null_tracker[i].astype(int).tolist())) for i in null_row_indices
-            ]
+        null_row_indices = np.flatnonzero(has_null)
+        if len(null_row_indices):
+            _, first_occurrence, counts = np.unique(
+                pattern_hashes[null_row_indices], return_index=True, return_counts=True
+            )
+            # Ties go to the pattern that occurs first
+            is_most_common = counts == counts.max()
+            first_row = null_row_indices[np.min(first_occurrence[is_most_common])]
 
-            # Use Counter to efficiently count occurrences and find the most common pattern.
-            pattern_counter = Counter(null_patterns_as_strings)
-            (
-                most_frequent_pattern,
-                occurrence_of_most_frequent_pattern,
-            ) = pattern_counter.most_common(1)[0]
-            rows_affected = []
-            for idx, row in enumerate(null_patterns_as_strings):
-                if row == most_frequent_pattern:
-                    rows_affected.append(int(null_row_indices[idx]))
+            # Verify the candidate rows against the actual pattern, to be robust to hash collisions
+            candidate_rows = null_row_indices[
+                pattern_hashes[null_row_indices] == pattern_hashes[first_row]
+            ]
+            matches = np.ones(len(candidate_rows), dtype=bool)
+            pattern = []
+            for is_null in cls._iter_null_columns(features):
+                pattern.append(str(int(is_null[first_row])))
+                matches &= is_null[candidate_rows] == is_null[first_row]
+            most_frequent_pattern = "".join(pattern)
+            rows_affected = candidate_rows[matches].tolist()
+            occurrence_of_most_frequent_pattern = len(rows_affected)
         return {
             "most_common_issue": {
                 "pattern": most_frequent_pattern,
@@ -116,15 +189,15 @@ class NullIssueManager(IssueManager):
         }
 
     @staticmethod
-    def _column_impact(null_tracker: np.ndarray) -> Dict[str, List[float]]:
+    def _column_impact(column_impact: np.ndarray) -> Dict[str, List[float]]:
         """
-        Calculate and return the impact of null values per column, represented as the proportion
+        Return the impact of null values per column, represented as the proportion
         of rows having null values in each column.
 
         Parameters
         ----------
-        null_tracker : np.ndarray
-            A boolean array of the same shape as features, where True indicates null/missing entries.
+        column_impact : np.ndarray
+            The proportion of null values in each column, from the counts computed by :py:meth:`_calculate_null_issues`.
 
         Returns
         -------
@@ -132,17 +205,21 @@ class NullIssueManager(IssueManager):
             A dictionary containing the impact per column, with values being a list
             where each element is the percentage of rows having null values in the corresponding column.
         """
-        # Calculate proportion of nulls in each column
-        proportion_of_nulls_per_column = null_tracker.mean(axis=0)
-
-        # Return result as a dictionary containing a list of proportions
-        return {"column_impact": proportion_of_nulls_per_column.tolist()}
+        return {"column_impact": column_impact.tolist()}
 
-    def collect_info(self, null_tracker: np.ndarray) -> dict:
-        most_common_issue = self._most_common_issue(null_tracker=null_tracker)
-        column_impact = self._column_impact(null_tracker=null_tracker)
+    def collect_info(
+        self,
+        features: FeaturesLike,
+        has_null: np.ndarray,
+        column_impact: np.ndarray,
+        pattern_hashes: np.ndarray,
+    ) -> dict:
+        most_common_issue = self._most_common_issue(
+            features=features, has_null=has_null, pattern_hashes=pattern_hashes
+        )
+        column_impact_dict = self._column_impact(column_impact=column_impact)
         average_null_score = {"average_null_score": self.issues[self.issue_score_key].mean()}
-        issues_dict = {**average_null_score, **most_common_issue, **column_impact}
+        issues_dict = {**average_null_score, **most_common_issue, **column_impact_dict}
         info_dict: Dict[str, Any] = {**issues_dict}
         return info_dict
 
@@ -22,6 +22,7 @@ import inspect
 import numpy as np
 import pandas as pd
 from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
 from sklearn.cluster import DBSCAN
 
 from cleanlab.datalab.internal.issue_manager import IssueManager
@@ -35,6 +36,8 @@ if TYPE_CHECKING:  # pragma: no cover
 
 CLUSTERING_ALGO = "DBSCAN"
 CLUSTERING_PARAMS_DEFAULT = {"metric": "precomputed"}
+GRAPH_CLUSTERING_ALGO = "connected_components"
+CLUSTERING_ALGOS = (CLUSTERING_ALGO, GRAPH_CLUSTERING_ALGO)
 
 
 class UnderperformingGroupIssueManager(IssueManager):
@@ -44,6 +47,18 @@ class UnderperformingGroupIssueManager(IssueManager):
     Note: The `min_cluster_samples` argument should not be confused with the
     `min_samples` argument of sklearn.cluster.DBSCAN.
 
+    The `clustering_algorithm` argument selects how clusters are found in the knn graph:
+
+    - ``"DBSCAN"`` (default): runs sklearn.cluster.DBSCAN on a copy of the knn graph
+      used as a precomputed sparse distance matrix.
+    - ``"connected_components"``: a graph-native, DBSCAN-like clustering that runs directly on the
+      CSR knn graph without copying it. Core points (at least `min_samples` neighbors within `eps`,
+      counting the point itself) that are connected by an edge of length at most `eps` form a cluster.
+      Each remaining point with an edge within `eps` from a core point joins the cluster of its nearest
+      such core point, all other points are outliers. The `eps` and `min_samples` keys of
+      `clustering_kwargs` are used, with the same defaults as DBSCAN.
+      This scales to large datasets with many clusters.
+
     Examples
     --------
     >>> from cleanlab import Datalab
@@ -82,6 +97,7 @@ class UnderperformingGroupIssueManager(IssueManager):
         k: int = 10,
         clustering_kwargs: Dict[str, Any] = {},
         min_cluster_samples: int = 5,
+        clustering_algorithm: str = CLUSTERING_ALGO,
         **_: Any,
     ):
         super().__init__(datalab)
@@ -90,6 +106,12 @@ class UnderperformingGroupIssueManager(IssueManager):
         self.k = k
         self.clustering_kwargs = clustering_kwargs
         self.min_cluster_samples = min_cluster_samples
+        if clustering_algorithm not in CLUSTERING_ALGOS:
+            raise ValueError(
+                f"Invalid clustering_algorithm: {clustering_algorithm}. "
+                f"Must be one of {CLUSTERING_ALGOS}."
+            )
+        self.clustering_algorithm = clustering_algorithm
 
     def find_issues(
         self,
@@ -154,18 +176,30 @@ class UnderperformingGroupIssueManager(IssueManager):
         Returns:
             cluster_ids (npt.NDArray[np.int_]): Cluster IDs for each datapoint.
         """
+        clustering_params = self._get_clustering_params()
+        if self.clustering_algorithm == GRAPH_CLUSTERING_ALGO:
+            return _cluster_knn_graph(knn_graph, **clustering_params)
+        clusterer = DBSCAN(**clustering_params)
+        cluster_ids = clusterer.fit_predict(
+            knn_graph.copy()
+        )  # Copy to avoid modification by DBSCAN
+        return cluster_ids
+
+    def _get_clustering_params(self) -> Dict[str, Any]:
+        """Returns the parameters passed to the selected clustering algorithm, based on `clustering_kwargs`."""
+        if self.clustering_algorithm == GRAPH_CLUSTERING_ALGO:
+            return {
+                "eps": self.clustering_kwargs.get("eps", 0.5),
+                "min_samples": self.clustering_kwargs.get("min_samples", 5),
+            }
         DBSCAN_VALID_KEYS = inspect.signature(DBSCAN).parameters.keys()
         dbscan_params = {
             key: value
             for key, value in ((k, self.clustering_kwargs.get(k, None)) for k in DBSCAN_VALID_KEYS)
             if value is not None
         }
-        dbscan_params["metric"] = "precomputed"
-        clusterer = DBSCAN(**dbscan_params)
-        cluster_ids = clusterer.fit_predict(
-            knn_graph.copy()
-        )  # Copy to avoid modification by DBSCAN
-        return cluster_ids
+        dbscan_params.update(CLUSTERING_PARAMS_DEFAULT)
+        return dbscan_params
 
     def filter_cluster_ids(self, cluster_ids: npt.NDArray[np.int_]) -> npt.NDArray[np.int_]:
         """Remove outlier clusters and return IDs of clusters with at least `self.min_cluster_samples` number of datapoints.
@@ -179,18 +213,9 @@ class UnderperformingGroupIssueManager(IssueManager):
             removing outlier clusters and clusters with less than `self.min_cluster_samples`
             number of datapoints.
         """
-        unique_cluster_ids = np.array(
-            [label for label in set(cluster_ids) if label not in self.OUTLIER_CLUSTER_LABELS]
-        )
-        frequencies = np.bincount(cluster_ids[~np.isin(cluster_ids, self.OUTLIER_CLUSTER_LABELS)])
-        unique_cluster_ids = np.array(
-            [
-                cluster_id
-                for cluster_id in unique_cluster_ids
-                if frequencies[cluster_id] >= self.min_cluster_samples
-            ]
-        )
-        return unique_cluster_ids
+        cluster_ids = cluster_ids[~np.isin(cluster_ids, self.OUTLIER_CLUSTER_LABELS)]
+        unique_cluster_ids, frequencies = np.unique(cluster_ids, return_counts=True)
+        return unique_cluster_ids[frequencies >= self.min_cluster_samples]
 
     def get_worst_cluster(
         self,
@@ -210,19 +235,25 @@ class UnderperformingGroupIssueManager(IssueManager):
         Returns:
             Tuple[int, float]: (Underperforming Cluster ID, Cluster Quality Score)
         """
+        self_confidence = get_self_confidence_for_each_label(labels, pred_probs)
+        # Average the self-confidence of each cluster in a single weighted bincount pass
+        # (cluster IDs outside `unique_cluster_ids` are ignored)
+        in_cluster = np.isin(cluster_ids, unique_cluster_ids)
+        minlength = max(unique_cluster_ids) + 1
+        cluster_sizes = np.bincount(cluster_ids[in_cluster], minlength=minlength)
+        cluster_totals = np.bincount(
+            cluster_ids[in_cluster], weights=self_confidence[in_cluster], minlength=minlength
+        )
+        cluster_performances = (
+            cluster_totals[unique_cluster_ids] / cluster_sizes[unique_cluster_ids]
+        )
         worst_cluster_performance = 1  # Largest possible probability value
         worst_cluster_id = min(unique_cluster_ids) - 1
-        for cluster_id in unique_cluster_ids:
-            cluster_mask = cluster_ids == cluster_id
-            cur_cluster_ids = labels[cluster_mask]
-            cur_cluster_pred_probs = pred_probs[cluster_mask]
-            cluster_performance = get_self_confidence_for_each_label(
-                cur_cluster_ids, cur_cluster_pred_probs
-            ).mean()
-            if cluster_performance < worst_cluster_performance:
-                worst_cluster_performance = cluster_performance
-                worst_cluster_id = cluster_id
-        mean_performance = get_self_confidence_for_each_label(labels, pred_probs).mean()
+        worst_index = np.argmin(cluster_performances)
+        if cluster_performances[worst_index] < worst_cluster_performance:
+            worst_cluster_performance = cluster_performances[worst_index]
+            worst_cluster_id = unique_cluster_ids[worst_index]
+        mean_performance = self_confidence.mean()
         worst_cluster_ratio = min(worst_cluster_performance / mean_performance, 1.0)
         worst_cluster_id = (
             worst_cluster_id
@@ -325,7 +356,7 @@ class UnderperformingGroupIssueManager(IssueManager):
         }
         if performed_clustering:
             cluster_stats["clustering"].update(
-                {"algorithm": CLUSTERING_ALGO, "params": CLUSTERING_PARAMS_DEFAULT}
+                {"algorithm": self.clustering_algorithm, "params": self._get_clustering_params()}
             )
 
         return cluster_stats
@@ -344,3 +375,47 @@ class UnderperformingGroupIssueManager(IssueManager):
             )
             threshold = 0
         return threshold
+
+
+def _cluster_knn_graph(
+    knn_graph: csr_matrix, eps: float = 0.5, min_samples: int = 5
+) -> npt.NDArray[np.int_]:
+    """DBSCAN-like clustering computed directly on the CSR structure of a knn graph.
+
+    Core points have at least `min_samples` neighbors within distance `eps` (counting the point itself).
+    Clusters are the (weakly) connected components of core points linked by edges of length at most `eps`.
+    Every non-core point with an edge within `eps` from a core point is assigned to the cluster of the
+    nearest such core point, all remaining points are labeled as outliers (-1).
+    Cluster IDs are numbered in order of the first core point of each cluster.
+
+    The knn graph is not copied or modified.
+    """
+    N = knn_graph.shape[0]
+    rows = np.repeat(np.arange(N), np.diff(knn_graph.indptr))
+    cols = knn_graph.indices
+    within_eps = knn_graph.data <= eps
+    num_neighbors = np.bincount(rows[within_eps], minlength=N) + 1
+    is_core = num_neighbors >= min_samples
+
+    core_edges = within_eps & is_core[rows] & is_core[cols]
+    core_graph = csr_matrix(
+        (np.ones(np.sum(core_edges), dtype=np.int8), (rows[core_edges], cols[core_edges])),
+        shape=(N, N),
+    )
+    _, component_ids = connected_components(core_graph, directed=True, connection="weak")
+
+    cluster_ids = np.full(N, -1, dtype=np.int_)
+    core_ids = np.flatnonzero(is_core)
+    _, first_core, core_cluster_ids = np.unique(
+        component_ids[core_ids], return_index=True, return_inverse=True
+    )
+    # Renumber clusters by their first core point
+    order = np.argsort(np.argsort(first_core))
+    cluster_ids[core_ids] = order[core_cluster_ids]
+
+    # Attach border points to the cluster of their nearest core point
+    border_edges = np.flatnonzero(within_eps & is_core[rows] & ~is_core[cols])
+    border_edges = border_edges[np.lexsort((knn_graph.data[border_edges], cols[border_edges]))]
+    border_points, nearest = np.unique(cols[border_edges], return_index=True)
+    cluster_ids[border_points] = cluster_ids[rows[border_edges[nearest]]]
+    return cluster_ids
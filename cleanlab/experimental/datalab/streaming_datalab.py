@@ -0,0 +1,520 @@
+# Copyright (C) 2017-2024  Cleanlab Inc.
+# This file is part of cleanlab.
+#
+# cleanlab is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# cleanlab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with cleanlab.  If not, see <https://www.gnu.org/licenses/>.
+"""
+The experimental feature that audits a Hugging Face dataset that is too large to fit in memory.
+
+Unlike :py:class:`Datalab <cleanlab.datalab.datalab.Datalab>`, the ``StreamingDatalab`` never materializes
+a full column of the dataset (or of the model outputs) in memory.
+It iterates over Arrow record batches of the (memory-mapped) dataset, computes the statistics of each issue type
+batch by batch, and writes the per-example results to ``.npy`` files on disk.
+
+Supported issue types: ``"null"``, ``"class_imbalance"``, ``"label"`` and ``"outlier"``.
+"""
+from __future__ import annotations
+
+import json
+import os
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from scipy.stats import iqr
+
+try:
+    import pyarrow.compute as pc
+    from datasets import ClassLabel
+    from datasets.arrow_dataset import Dataset
+except ImportError as error:  # pragma: no cover
+    raise ImportError(
+        "Cannot import datasets package. "
+        "Please install it and try again, or just install cleanlab with "
+        "all optional dependencies via: `pip install 'cleanlab[all]'`"
+    ) from error
+
+from cleanlab.count import _reduce_issues
+from cleanlab.datalab.internal.data import Data
+from cleanlab.datalab.internal.issue_manager.null import NullIssueManager
+from cleanlab.datalab.internal.issue_manager.outlier import OutlierIssueManager
+from cleanlab.experimental.label_issues_batched import LabelInspector
+from cleanlab.internal.neighbor.metric import decide_default_metric
+from cleanlab.internal.neighbor.search import construct_knn
+from cleanlab.internal.outlier import correct_precision_errors, transform_distances_to_scores
+from cleanlab.rank import find_top_issues
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pyarrow as pa
+
+
+SUPPORTED_ISSUE_TYPES = ["null", "class_imbalance", "label", "outlier"]
+
+
+class StreamingDatalab:
+    """
+    An object that audits a dataset larger than memory for issues, one batch of rows at a time.
+
+    Results for each issue type are written to `output_dir`:
+
+    - ``is_<issue_name>_issue.npy`` : boolean array of shape ``(N,)``
+    - ``<issue_name>_score.npy`` : float array of shape ``(N,)``
+    - ``issue_summary.csv`` and ``info.json`` : the summary and statistics of the issues found.
+
+    Load the per-example results with ``np.load(path, mmap_mode="r")`` to avoid reading them fully into memory,
+    or with :py:meth:`get_issues` for a DataFrame.
+
+    Parameters
+    ----------
+    data :
+        A ``datasets.Dataset``, which is memory-mapped from its Arrow files on disk,
+        or a string (path to a local file or a dataset identifier on the Hugging Face Hub) that is loaded into one.
+    output_dir :
+        Directory to which the results are written. It is created if it does not exist.
+    label_name :
+        Name of the label column in the dataset. Required for the ``"class_imbalance"`` and ``"label"`` issue types.
+    batch_size :
+        Number of rows of the dataset (and of `pred_probs` / `features`) that are held in memory at a time.
+        To maximize efficiency, try to use the largest `batch_size` your memory allows.
+    verbose :
+        Whether to print progress information.
+
+    Examples
+    --------
+    >>> from datasets import load_from_disk
+    >>> dataset = load_from_disk("BIG_DATASET")  # memory-mapped, not loaded into RAM
+    >>> pred_probs = np.load("PREDPROBS.npy", mmap_mode="r")
+    >>> features = np.load("EMBEDDINGS.npy", mmap_mode="r")
+    >>> lab = StreamingDatalab(dataset, output_dir="audit", label_name="label", batch_size=100000)
+    >>> lab.find_issues(pred_probs=pred_probs, features=features)
+    >>> lab.issue_summary
+    >>> is_label_issue = np.load("audit/is_label_issue.npy", mmap_mode="r")
+    """
+
+    def __init__(
+        self,
+        data: Union[Dataset, str],
+        output_dir: str,
+        label_name: Optional[str] = None,
+        *,
+        batch_size: int = 10000,
+        verbose: bool = True,
+    ):
+        if isinstance(data, str):
+            data = Data._load_dataset_from_string(data)
+        if not isinstance(data, Dataset):
+            raise TypeError(f"data must be a datasets.Dataset or a str, but got {type(data)}.")
+        if label_name is not None and label_name not in data.column_names:
+            raise ValueError(f"Label column '{label_name}' not found in dataset.")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be a positive integer, but got {batch_size}.")
+
+        self.data = data
+        self.output_dir = output_dir
+        self.label_name = label_name
+        self.batch_size = batch_size
+        self.verbose = verbose
+        os.makedirs(output_dir, exist_ok=True)
+
+        self._classes: Optional[np.ndarray] = None
+        self._label_map: Dict[int, Any] = {}
+        if label_name is not None:
+            self._classes, self._label_map = self._scan_label_map()
+
+        self.issue_summary = pd.DataFrame(columns=["issue_type", "num_issues", "score"])
+        self.info: Dict[str, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    @property
+    def class_names(self) -> List[Any]:
+        return list(self._label_map.values())
+
+    def find_issues(
+        self,
+        *,
+        pred_probs: Optional[np.ndarray] = None,
+        features: Optional[np.ndarray] = None,
+        issue_types: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Checks the dataset for issues, reading it (and the provided model outputs) one batch at a time.
+
+        Parameters
+        ----------
+        pred_probs :
+            2D array-like of model-predicted class probabilities, of shape ``(N, K)``.
+            To avoid loading it into memory, pass a memory-mapped object like ``np.load(YOURFILE.npy, mmap_mode="r")``
+            or a Zarr array. Required for the ``"label"`` issue type.
+        features :
+            2D array-like of feature embeddings, of shape ``(N, D)``, that can also be memory-mapped or a Zarr array.
+            Required for the ``"outlier"`` issue type.
+            Both `pred_probs` and `features` are only read in contiguous slices of rows.
+        issue_types :
+            Collection specifying which types of issues to consider and the keyword arguments for each of them.
+            Keys are issue types (one of ``"null"``, ``"class_imbalance"``, ``"label"``, ``"outlier"``),
+            values are dicts of keyword arguments for that check:
+
+            - ``"null"``: ``feature_columns`` (list of columns to check, defaults to all columns except the labels).
+            - ``"class_imbalance"``: ``threshold`` (default 0.1).
+            - ``"label"``: ``quality_score_kwargs``, ``num_issue_kwargs`` and ``n_jobs``,
+              passed to :py:class:`LabelInspector <cleanlab.experimental.label_issues_batched.LabelInspector>`.
+            - ``"outlier"``: ``k`` (default 10), ``t`` (default 1), ``metric``, ``threshold``,
+              ``num_reference_examples`` (default 100000) and ``seed``.
+              Each example is compared against its ``k`` nearest neighbors among a random subset of
+              ``num_reference_examples`` examples, which is the only part of `features` held in memory.
+              If the subset covers the whole dataset, this matches the kNN-based outlier check of Datalab.
+
+            If `None`, every issue type whose required inputs are available is checked.
+        """
+        if issue_types is None:
+            issue_types = {"null": {}}
+            if self.label_name is not None:
+                issue_types["class_imbalance"] = {}
+                if pred_probs is not None:
+                    issue_types["label"] = {}
+            if features is not None:
+                issue_types["outlier"] = {}
+
+        unsupported_issue_types = set(issue_types) - set(SUPPORTED_ISSUE_TYPES)
+        if unsupported_issue_types:
+            raise ValueError(
+                f"Unsupported issue types: {sorted(unsupported_issue_types)}. "
+                f"StreamingDatalab supports: {SUPPORTED_ISSUE_TYPES}."
+            )
+
+        for array, name in ((pred_probs, "pred_probs"), (features, "features")):
+            if array is not None and len(array) != len(self):
+                raise ValueError(
+                    f"len({name})={len(array)} does not match the number of examples in the dataset ({len(self)})."
+                )
+
+        finders: Dict[str, Callable[..., Tuple[int, float, Dict[str, Any]]]] = {
+            "null": self._find_null_issues,
+            "class_imbalance": self._find_class_imbalance_issues,
+            "label": lambda **kwargs: self._find_label_issues(pred_probs, **kwargs),
+            "outlier": lambda **kwargs: self._find_outlier_issues(features, **kwargs),
+        }
+        for issue_name, issue_kwargs in issue_types.items():
+            if self.verbose:
+                print(f"Finding {issue_name} issues ...")
+            num_issues, score, info = finders[issue_name](**(issue_kwargs or {}))
+            self._update_results(issue_name, num_issues, score, info)
+
+        if self.verbose:
+            num_issues_total = int(self.issue_summary["num_issues"].sum())
+            print(
+                f"\nAudit complete. {num_issues_total} issues found in the dataset. "
+                f"Results were written to: {self.output_dir}"
+            )
+
+    def get_issues(self, issue_name: Optional[str] = None) -> pd.DataFrame:
+        """
+        Loads the per-example results written to disk into a DataFrame.
+
+        Note that this reads the selected columns fully into memory.
+        Use ``np.load(path, mmap_mode="r")`` on the files in `output_dir` instead for datasets larger than memory.
+
+        Parameters
+        ----------
+        issue_name :
+            The type of issue to load. If `None`, loads the results of all issue types checked so far.
+        """
+        issue_names = list(self.info) if issue_name is None else [issue_name]
+        columns = {}
+        for name in issue_names:
+            if name not in self.info:
+                raise ValueError(
+                    f"issue_name {name} not found in the issues checked so far: {list(self.info)}"
+                )
+            for column in (f"is_{name}_issue", f"{name}_score"):
+                columns[column] = np.load(self._output_path(column), mmap_mode="r")
+        return pd.DataFrame(columns)
+
+    def get_issue_summary(self, issue_name: Optional[str] = None) -> pd.DataFrame:
+        """Summarize the issues found in the dataset, in the same format as ``Datalab.get_issue_summary``."""
+        if issue_name is None:
+            return self.issue_summary
+        return self.issue_summary.query(f"issue_type == '{issue_name}'").reset_index(drop=True)
+
+    def get_info(self, issue_name: str) -> Dict[str, Any]:
+        """Get the statistics collected while checking the dataset for the given issue type."""
+        if issue_name not in self.info:
+            raise ValueError(
+                f"issue_name {issue_name} not found in the issues checked so far: {list(self.info)}"
+            )
+        return self.info[issue_name]
+
+    def _iter_batches(self, columns: Optional[List[str]] = None) -> Iterator[Tuple[int, pa.Table]]:
+        """Yields the start index and an Arrow table for each batch of rows of the dataset."""
+        dataset = self.data.with_format("arrow", columns=columns)
+        for start in range(0, len(dataset), self.batch_size):
+            yield start, dataset[start : start + self.batch_size]
+
+    def _iter_label_batches(self) -> Iterator[Tuple[int, np.ndarray]]:
+        """Yields the start index and the labels (as integers in ``0, 1, ..., K-1``) for each batch of rows."""
+        if self.label_name is None:
+            raise ValueError("label_name must be provided to check for this type of issue.")
+        for start, batch in self._iter_batches([self.label_name]):
+            labels = batch.column(self.label_name).to_numpy(zero_copy_only=False)
+            if self._classes is not None:
+                labels = np.searchsorted(self._classes, labels)
+            yield start, labels.astype(int)
+
+    def _scan_label_map(self) -> Tuple[Optional[np.ndarray], Dict[int, Any]]:
+        """Finds the classes present in the label column with one pass over the dataset.
+
+        The label map matches that of Datalab: ``ClassLabel`` features keep their integer encoding,
+        other labels are mapped to integers in their sorted order.
+        """
+        assert self.label_name is not None
+        label_feature = self.data.features[self.label_name]
+        if isinstance(label_feature, ClassLabel):
+            return None, dict(enumerate(label_feature.names))
+        classes: Optional[np.ndarray] = None
+        for _, batch in self._iter_batches([self.label_name]):
+            batch_classes = pc.unique(batch.column(self.label_name)).to_numpy(zero_copy_only=False)
+            classes = (
+                np.unique(batch_classes) if classes is None else np.union1d(classes, batch_classes)
+            )
+        assert classes is not None
+        return classes, dict(enumerate(classes.tolist()))
+
+    def _output_path(self, column: str) -> str:
+        return os.path.join(self.output_dir, f"{column}.npy")
+
+    def _open_issue_outputs(self, issue_name: str) -> Tuple[np.memmap, np.memmap]:
+        """Creates the on-disk arrays holding the issue mask and the quality scores of an issue type."""
+        is_issue = np.lib.format.open_memmap(
+            self._output_path(f"is_{issue_name}_issue"), mode="w+", dtype=bool, shape=(len(self),)
+        )
+        scores = np.lib.format.open_memmap(
+            self._output_path(f"{issue_name}_score"),
+            mode="w+",
+            dtype=np.float64,
+            shape=(len(self),),
+        )
+        return is_issue, scores
+
+    def _update_results(
+        self, issue_name: str, num_issues: int, score: float, info: Dict[str, Any]
+    ) -> None:
+        summary = self.issue_summary.query(f"issue_type != '{issue_name}'")
+        new_summary = pd.DataFrame(
+            {"issue_type": [issue_name], "num_issues": [int(num_issues)], "score": [float(score)]}
+        )
+        self.issue_summary = (
+            pd.concat([summary, new_summary]) if len(summary) else new_summary
+        ).reset_index(drop=True)
+        self.info[issue_name] = info
+
+        self.issue_summary.to_csv(os.path.join(self.output_dir, "issue_summary.csv"), index=False)
+        with open(os.path.join(self.output_dir, "info.json"), "w") as f:
+            json.dump(self.info, f, default=str)
+
+    def _find_null_issues(
+        self, feature_columns: Optional[List[str]] = None
+    ) -> Tuple[int, float, Dict[str, Any]]:
+        """Flags rows where all feature columns are null (or NaN), using the validity bitmaps of the Arrow columns."""
+        if feature_columns is None:
+            feature_columns = [c for c in self.data.column_names if c != self.label_name]
+        if not feature_columns:
+            raise ValueError("The dataset has no feature columns to check for null values.")
+        num_columns = len(feature_columns)
+
+        is_issue, scores = self._open_issue_outputs("null")
+        null_count_per_column = np.zeros(num_columns, dtype=np.int64)
+        num_issues, score_sum = 0, 0.0
+        for start, batch in self._iter_batches(feature_columns):
+            batch_is_issue, batch_scores, batch_null_count_per_column, _ = (
+                NullIssueManager._calculate_null_issues(batch)
+            )
+            end = start + batch.num_rows
+            scores[start:end] = batch_scores
+            is_issue[start:end] = batch_is_issue
+            null_count_per_column += batch_null_count_per_column
+            num_issues += int(np.sum(batch_is_issue))
+            score_sum += float(np.sum(batch_scores))
+        is_issue.flush()
+        scores.flush()
+
+        average_null_score = score_sum / len(self)
+        info = {
+            "average_null_score": average_null_score,
+            "column_impact": (null_count_per_column / len(self)).tolist(),
+            "feature_columns": feature_columns,
+        }
+        return num_issues, average_null_score, info
+
+    def _find_class_imbalance_issues(
+        self, threshold: float = 0.1
+    ) -> Tuple[int, float, Dict[str, Any]]:
+        """Flags examples of the rarest class, in the same way as the ``ClassImbalanceIssueManager``."""
+        K = len(self._label_map)
+        class_counts = np.zeros(K, dtype=np.int64)
+        for _, labels in self._iter_label_batches():
+            class_counts += np.bincount(labels, minlength=K)
+        class_probs = class_counts / len(self)
+        rarest_class_idx = int(np.argmin(class_probs))
+        imbalance_exists = class_probs[rarest_class_idx] < threshold * (1 / K)
+        rarest_class_issue = rarest_class_idx if imbalance_exists else -1
+
+        is_issue, scores = self._open_issue_outputs("class_imbalance")
+        for start, labels in self._iter_label_batches():
+            end = start + len(labels)
+            scores[start:end] = np.where(
+                labels == rarest_class_idx, class_probs[rarest_class_idx], 1
+            )
+            is_issue[start:end] = labels == rarest_class_issue
+        is_issue.flush()
+        scores.flush()
+
+        num_issues = int(class_counts[rarest_class_issue]) if imbalance_exists else 0
+        info = {
+            "threshold": threshold,
+            "Rarest Class": self._label_map.get(rarest_class_issue, "NA"),
+            "class_counts": class_counts.tolist(),
+        }
+        return num_issues, float(class_probs[rarest_class_idx]), info
+
+    def _find_label_issues(
+        self,
+        pred_probs: Optional[np.ndarray],
+        quality_score_kwargs: Optional[dict] = None,
+        num_issue_kwargs: Optional[dict] = None,
+        n_jobs: Optional[int] = 1,
+    ) -> Tuple[int, float, Dict[str, Any]]:
+        """Flags label issues in two passes over the data with a
+        :py:class:`LabelInspector <cleanlab.experimental.label_issues_batched.LabelInspector>`,
+        in the same way as :py:func:`find_label_issues_batched <cleanlab.experimental.label_issues_batched.find_label_issues_batched>`.
+        """
+        if pred_probs is None:
+            raise ValueError("pred_probs must be provided to check for label issues.")
+        inspector = LabelInspector(
+            num_class=pred_probs.shape[1],
+            store_results=False,
+            verbose=False,
+            quality_score_kwargs=quality_score_kwargs,
+            num_issue_kwargs=num_issue_kwargs,
+            n_jobs=n_jobs,
+        )
+        for start, labels in self._iter_label_batches():
+            inspector.update_confident_thresholds(labels, pred_probs[start : start + len(labels)])
+
+        # Store whether the model disagrees with each label, only those examples can be flagged as issues
+        is_issue, scores = self._open_issue_outputs("label")
+        for start, labels in self._iter_label_batches():
+            end = start + len(labels)
+            pred_probs_batch = np.asarray(pred_probs[start:end])
+            scores[start:end] = inspector.score_label_quality(labels, pred_probs_batch)
+            is_issue[start:end] = ~_reduce_issues(pred_probs=pred_probs_batch, labels=labels)
+
+        # Only the (N,) scores are needed in memory to rank the examples across all batches
+        num_issues = inspector.get_num_issues(silent=True)
+        is_top_issue = np.zeros(len(self), dtype=bool)
+        is_top_issue[find_top_issues(np.asarray(scores), top=num_issues)] = True
+        np.logical_and(is_issue, is_top_issue, out=is_issue)
+        is_issue.flush()
+        scores.flush()
+
+        info = {
+            "confident_thresholds": inspector.get_confident_thresholds(silent=True).tolist(),
+            "num_label_issues": int(num_issues),
+        }
+        return int(np.sum(is_issue)), float(np.mean(scores)), info
+
+    def _find_outlier_issues(
+        self,
+        features: Optional[np.ndarray],
+        k: int = 10,
+        t: int = 1,
+        metric: Optional[Union[str, Callable]] = None,
+        threshold: Optional[float] = None,
+        num_reference_examples: int = 100000,
+        seed: Optional[int] = 0,
+    ) -> Tuple[int, float, Dict[str, Any]]:
+        """Flags outliers based on the average distance of each example to its `k` nearest neighbors
+        among a random reference subset of the dataset, with the same thresholds as the ``OutlierIssueManager``.
+        """
+        if features is None:
+            raise ValueError("features must be provided to check for outlier issues.")
+        if threshold is None:
+            threshold = OutlierIssueManager.DEFAULT_THRESHOLDS["features"]
+        if not 0 <= threshold <= 1:
+            raise ValueError(f"threshold must be a number between 0 and 1, got {threshold}.")
+        N = len(self)
+        num_reference_examples = min(num_reference_examples, N)
+        if k >= num_reference_examples:
+            raise ValueError(
+                f"k={k} must be smaller than the number of reference examples ({num_reference_examples})."
+            )
+
+        rng = np.random.default_rng(seed)
+        reference_ids = np.sort(rng.choice(N, size=num_reference_examples, replace=False))
+        # features are only sliced in contiguous batches, which Zarr arrays also support
+        reference_batches = []
+        for start in range(0, N, self.batch_size):
+            end = min(start + self.batch_size, N)
+            lo, hi = np.searchsorted(reference_ids, [start, end])
+            if hi > lo:
+                batch_features = np.asarray(features[start:end])
+                reference_batches.append(batch_features[reference_ids[lo:hi] - start])
+        reference_features = np.concatenate(reference_batches)
+        del reference_batches
+        if metric is None:
+            metric = decide_default_metric(reference_features)
+        knn = construct_knn(n_neighbors=k, metric=metric).fit(reference_features)
+        del reference_features
+
+        # First pass: store the average distances in the scores array
+        is_issue, scores = self._open_issue_outputs("outlier")
+        for start in range(0, N, self.batch_size):
+            end = min(start + self.batch_size, N)
+            distances, _ = knn.kneighbors(np.asarray(features[start:end]), n_neighbors=k + 1)
+            # Reference examples are their own nearest neighbor, so skip that one
+            in_reference = np.isin(np.arange(start, end), reference_ids, assume_unique=True)
+            scores[start:end] = np.where(
+                in_reference, distances[:, 1:].mean(axis=1), distances[:, :-1].mean(axis=1)
+            )
+
+        avg_distances = np.asarray(scores)
+        iqr_scale = 1 / threshold - 1 if threshold != 0 else np.inf
+        issue_threshold = float(np.percentile(avg_distances, 75) + iqr_scale * iqr(avg_distances))
+        scaling_factor = float(max(np.median(avg_distances), 100 * np.finfo(np.float64).eps))
+        del avg_distances
+
+        # Second pass: convert the average distances to scores
+        _metric = metric if isinstance(metric, str) else metric.__name__
+        for start in range(0, N, self.batch_size):
+            end = min(start + self.batch_size, N)
+            avg_distances_batch = np.array(scores[start:end])
+            is_issue[start:end] = avg_distances_batch > issue_threshold
+            scores_batch = transform_distances_to_scores(
+                avg_distances_batch, t=t, scaling_factor=scaling_factor
+            )
+            scores[start:end] = correct_precision_errors(scores_batch, avg_distances_batch, _metric)
+        is_issue.flush()
+        scores.flush()
+
+        average_ood_score = float(np.mean(scores))
+        info = {
+            "average_ood_score": average_ood_score,
+            "threshold": threshold,
+            "issue_threshold": issue_threshold,
+            "scaling_factor": scaling_factor,
+            "k": k,
+            "metric": _metric,
+            "num_reference_examples": num_reference_examples,
+        }
+        return int(np.sum(is_issue)), average_ood_score, info
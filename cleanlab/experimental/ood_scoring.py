@@ -0,0 +1,342 @@
+# Copyright (C) 2017-2024  Cleanlab Inc.
+# This file is part of cleanlab.
+#
+# cleanlab is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# cleanlab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with cleanlab.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Reusable scoring engine for online out-of-distribution detection with a fitted
+:py:class:`OutOfDistribution <cleanlab.outlier.OutOfDistribution>` estimator.
+
+Calling :py:meth:`OutOfDistribution.score <cleanlab.outlier.OutOfDistribution.score>` on many small batches of
+new examples has a high per-call overhead. The ``OutOfDistributionScorer`` class defined in this module keeps the
+fitted nearest neighbors index loaded, splits big queries into chunks that are searched in parallel threads, and can
+combine many small concurrent requests into micro-batches that are scored together.
+
+The scores returned by this approach are the same as those returned by ``OutOfDistribution.score(features=...)``.
+"""
+
+import queue
+import threading
+import time
+import warnings
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from cleanlab.internal.util import get_num_jobs
+from cleanlab.outlier import OutOfDistribution
+
+
+class OutOfDistributionScorer:
+    """
+    Scores new examples for being out-of-distribution, based on their numeric features, with a previously fit
+    :py:class:`OutOfDistribution <cleanlab.outlier.OutOfDistribution>` estimator.
+
+    Queries are scored either synchronously via :py:meth:`score`, or submitted from any number of threads via
+    :py:meth:`submit`, in which case requests that arrive at around the same time are scored together in a single
+    micro-batch by a background thread.
+
+    Examples
+    --------
+    >>> ood = OutOfDistribution()
+    >>> ood.fit(features=train_features)
+    >>> with OutOfDistributionScorer(ood, n_jobs=4) as scorer:
+    ...     scores = scorer.score(test_features)
+    ...     future = scorer.submit(new_features)  # from a request handler
+    ...     new_scores = future.result()
+    ...     latency = scorer.latency_percentiles()
+
+    Parameters
+    ----------
+    ood : OutOfDistribution
+      Estimator that has previously been fit on `features` (or had a fitted ``knn`` object specified in its `params`
+      and was used to score `features` at least once).
+
+    batch_size : int, default=1024
+      Maximum number of examples for which the nearest neighbors are searched at once.
+      Bigger queries are split into chunks of this size, which are searched in parallel threads if ``n_jobs > 1``.
+
+    n_jobs : int, optional
+      Number of threads used to search for the nearest neighbors of the chunks of a query.
+      If ``None``, this is set to the number of cores on your CPU (physical cores if you have ``psutil`` package installed).
+      Threads are used instead of processes, as nearest neighbors searches release the GIL
+      and the fitted index is then shared rather than copied.
+
+    max_batch_size : int, optional
+      Maximum number of examples combined into a single micro-batch from requests given to :py:meth:`submit`.
+      Defaults to `batch_size` times `n_jobs`. Memory for a micro-batch of this size is allocated once and reused.
+
+    max_wait : float, default=0.001
+      Maximum time (in seconds) that a request given to :py:meth:`submit` waits for other requests
+      to be added to the same micro-batch.
+
+    num_latencies : int, default=10000
+      Number of latencies of the most recent requests that are stored to compute :py:meth:`latency_percentiles`.
+    """
+
+    def __init__(
+        self,
+        ood: OutOfDistribution,
+        *,
+        batch_size: int = 1024,
+        n_jobs: Optional[int] = 1,
+        max_batch_size: Optional[int] = None,
+        max_wait: float = 0.001,
+        num_latencies: int = 10000,
+    ):
+        knn: Any = ood.params["knn"]
+        if knn is None or ood.params["scaling_factor"] is None:
+            raise ValueError(
+                "OOD estimator needs to be fit on features first. Call `fit()` or `fit_score()` before creating a scorer."
+            )
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+        n_jobs = get_num_jobs(n_jobs)
+
+        k = ood.params["k"]
+        max_k = knn.n_neighbors
+        if k is None:
+            k = max_k
+        elif k > max_k:
+            warnings.warn(
+                f"Chosen k={k} cannot be greater than n_neighbors={max_k} which was used when fitting "
+                f"NearestNeighbors object! Value of k changed to k={max_k}.",
+                UserWarning,
+            )
+            k = max_k
+
+        self.ood = ood
+        self.knn = knn
+        self.k = k
+        self.t: Any = ood.params["t"]
+        self.batch_size = batch_size
+        self.n_jobs = n_jobs
+        self.max_batch_size = max_batch_size or batch_size * n_jobs
+        self.max_wait = max_wait
+        self.num_features: Optional[int] = getattr(knn, "n_features_in_", None)
+
+        self._executor = ThreadPoolExecutor(max_workers=n_jobs) if n_jobs > 1 else None
+        self._requests: "queue.Queue[Optional[Tuple[np.ndarray, Future, float]]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._latencies: Deque[float] = deque(maxlen=num_latencies)
+        self._batch_features: Optional[np.ndarray] = (
+            None  # allocated once the number of features is known
+        )
+        self._batch_avg_distances = np.empty(self.max_batch_size, dtype=np.float64)
+        self._closed = False
+
+    def score(self, features: np.ndarray) -> np.ndarray:
+        """
+        Returns the OOD scores of the given examples, as ``OutOfDistribution.score(features=features)`` would.
+
+        Parameters
+        ----------
+        features : np.ndarray
+          Feature array of shape ``(N, M)``, in the same feature space as the data the estimator was fit on.
+
+        Returns
+        -------
+        scores : np.ndarray
+          Array of shape ``(N,)`` with scores in [0,1], where smaller values indicate examples that are less typical
+          under the data distribution (values near 0 indicate outliers).
+        """
+        start_time = time.perf_counter()
+        features = self._validate_features(features)
+        avg_knn_distances = np.empty(len(features), dtype=np.float64)
+        self._compute_avg_knn_distances(features, out=avg_knn_distances)
+        scores = self._transform(avg_knn_distances)
+        self._latencies.append(time.perf_counter() - start_time)
+        return scores
+
+    def submit(self, features: np.ndarray) -> "Future[np.ndarray]":
+        """
+        Submits a request to score the given examples, which may be combined with other concurrent requests
+        into a single micro-batch.
+
+        Parameters
+        ----------
+        features : np.ndarray
+          Feature array of shape ``(N, M)`` (or ``(M,)`` for a single example).
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+          Future whose result is the array of OOD scores of the given examples, see :py:meth:`score`.
+        """
+        start_time = time.perf_counter()
+        features = self._validate_features(features)
+        future: "Future[np.ndarray]" = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot submit requests to a scorer that has been closed.")
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._serve, daemon=True)
+                self._worker.start()
+            self._requests.put((features, future, start_time))
+        return future
+
+    def latency_percentiles(self, percentiles: Sequence[float] = (50, 99)) -> Dict[str, float]:
+        """
+        Returns percentiles of the latencies (in seconds) of the most recent requests,
+        measured from the time a request was given to :py:meth:`score` or :py:meth:`submit` until its scores were ready.
+
+        Parameters
+        ----------
+        percentiles : Sequence[float], default=(50, 99)
+          Percentiles to compute, each in [0, 100].
+
+        Returns
+        -------
+        latencies : Dict[str, float]
+          Dictionary mapping keys such as ``"p50"`` and ``"p99"`` to the corresponding latency percentile.
+          Values are NaN if no request has been scored yet.
+        """
+        latencies = np.array(self._latencies, dtype=np.float64)
+        if len(latencies) == 0:
+            return {f"p{q:g}": np.nan for q in percentiles}
+        return {
+            f"p{q:g}": float(v) for q, v in zip(percentiles, np.percentile(latencies, percentiles))
+        }
+
+    def close(self) -> None:
+        """Stops the background thread after all submitted requests are scored, and releases the thread pool."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            worker = self._worker
+            if worker is not None:
+                self._requests.put(None)
+        if worker is not None:
+            worker.join()
+        if self._executor is not None:
+            self._executor.shutdown()
+
+    def __enter__(self) -> "OutOfDistributionScorer":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _validate_features(self, features: np.ndarray) -> np.ndarray:
+        features = np.asarray(features)
+        if features.ndim == 1:
+            features = features.reshape(1, -1)
+        if features.ndim != 2:
+            raise ValueError(
+                f"features must be a 2D array. Got an array of shape {features.shape}."
+            )
+        if self.num_features is not None and features.shape[1] != self.num_features:
+            raise ValueError(
+                f"features have {features.shape[1]} columns, but the OOD estimator was fit on {self.num_features} features."
+            )
+        return features
+
+    def _compute_avg_knn_distances(self, features: np.ndarray, out: np.ndarray) -> None:
+        """Writes the average distance of each example to its `k` nearest neighbors into `out`."""
+        chunks = [
+            (start, min(start + self.batch_size, len(features)))
+            for start in range(0, len(features), self.batch_size)
+        ]
+        if self._executor is None or len(chunks) <= 1:
+            for start, end in chunks:
+                self._search_chunk(features, out, start, end)
+        else:
+            futures = [
+                self._executor.submit(self._search_chunk, features, out, start, end)
+                for start, end in chunks
+            ]
+            for future in futures:
+                future.result()
+
+    def _search_chunk(self, features: np.ndarray, out: np.ndarray, start: int, end: int) -> None:
+        distances, _ = self.knn.kneighbors(features[start:end], n_neighbors=self.k)
+        np.mean(distances, axis=1, out=out[start:end])
+
+    def _transform(self, avg_knn_distances: np.ndarray) -> np.ndarray:
+        return self.ood._transform_knn_distances(avg_knn_distances, self.knn, t=self.t)
+
+    def _serve(self) -> None:
+        """Background loop that combines submitted requests into micro-batches and scores them."""
+        pending: Optional[Tuple[np.ndarray, Future, float]] = None
+        stop = False
+        while not stop:
+            request = pending if pending is not None else self._requests.get()
+            pending = None
+            if request is None:
+                break
+            batch = [request]
+            num_rows = len(request[0])
+            deadline = time.perf_counter() + self.max_wait
+            while num_rows < self.max_batch_size:
+                timeout = deadline - time.perf_counter()
+                try:
+                    request = (
+                        self._requests.get(timeout=timeout)
+                        if timeout > 0
+                        else self._requests.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+                if request is None:
+                    stop = True
+                    break
+                if num_rows + len(request[0]) > self.max_batch_size:
+                    pending = request  # starts the next micro-batch
+                    break
+                batch.append(request)
+                num_rows += len(request[0])
+            self._score_batch(batch, num_rows)
+
+    def _score_batch(self, batch: List[Tuple[np.ndarray, Future, float]], num_rows: int) -> None:
+        try:
+            if len(batch) == 1:
+                features = batch[0][0]
+            else:
+                features = self._fill_batch_features([request[0] for request in batch], num_rows)
+            if num_rows <= self.max_batch_size:
+                avg_knn_distances = self._batch_avg_distances[:num_rows]
+            else:  # a single request bigger than max_batch_size
+                avg_knn_distances = np.empty(num_rows, dtype=np.float64)
+            self._compute_avg_knn_distances(features, out=avg_knn_distances)
+            scores = self._transform(avg_knn_distances)
+        except Exception as e:
+            for _, future, _ in batch:
+                future.set_exception(e)
+            return
+        end_time = time.perf_counter()
+        offset = 0
+        for features, future, start_time in batch:
+            future.set_result(scores[offset : offset + len(features)])
+            offset += len(features)
+            self._latencies.append(end_time - start_time)
+
+    def _fill_batch_features(self, features_list: List[np.ndarray], num_rows: int) -> np.ndarray:
+        """Copies the features of several requests into the reusable micro-batch buffer."""
+        num_features = features_list[0].shape[1]
+        dtype = np.result_type(*features_list)
+        if (
+            self._batch_features is None
+            or self._batch_features.shape[1] != num_features
+            or self._batch_features.dtype != dtype
+        ):
+            self._batch_features = np.empty((self.max_batch_size, num_features), dtype=dtype)
+        offset = 0
+        for features in features_list:
+            self._batch_features[offset : offset + len(features)] = features
+            offset += len(features)
+        return self._batch_features[:num_rows]
@@ -27,7 +27,7 @@ from sklearn.metrics import confusion_matrix
 import multiprocessing
 import sys
 import warnings
-from typing import Any, Dict, Optional, Tuple, List
+from typing import Any, Dict, Optional, Tuple, List, Union
 from functools import reduce
 import platform
 
@@ -40,7 +40,13 @@ from cleanlab.internal.util import (
     round_preserving_row_totals,
     get_num_classes,
 )
-from cleanlab.internal.multilabel_utils import stack_complement, get_onehot_num_classes, int2onehot
+from cleanlab.internal.multilabel_utils import (
+    SparseMultilabelLabels,
+    as_sparse_multilabel_labels,
+    stack_complement,
+    get_onehot_num_classes,
+    int2onehot,
+)
 from cleanlab.typing import LabelLike
 from cleanlab.multilabel_classification.filter import find_multilabel_issues_per_class
 
@@ -109,6 +115,9 @@ def find_label_issues(
       *Format requirements*: for dataset with K classes, each label must be integer in 0, 1, ..., K-1.
       For a standard (multi-class) classification dataset where each example is labeled with one class,
       `labels` should be 1D array of shape ``(N,)``, for example: ``labels = [1,0,2,1,1,0...]``.
+      For multi-label classification with the deprecated ``multi_label=True``, `labels` should be a list of lists of classes
+      or a :py:class:`SparseMultilabelLabels <cleanlab.multilabel_classification.SparseMultilabelLabels>` object,
+      as in `~cleanlab.multilabel_classification.filter.find_label_issues` which should be used instead.
 
     pred_probs : np.ndarray, optional
       An array of shape ``(N, K)`` of model-predicted class probabilities,
@@ -220,17 +229,19 @@ def find_label_issues(
         "confident_learning",
         "predicted_neq_given",
     ]  # TODO: change default to confident_learning ?
-    allow_one_class = False
-    if isinstance(labels, np.ndarray) or all(isinstance(lab, int) for lab in labels):
-        if set(labels) == {0}:  # occurs with missing classes in multi-label settings
-            allow_one_class = True
-    assert_valid_inputs(
-        X=None,
-        y=labels,
-        pred_probs=pred_probs,
-        multi_label=multi_label,
-        allow_one_class=allow_one_class,
-    )
+    # SparseMultilabelLabels are already validated, and are checked against pred_probs when converted
+    if not (multi_label and isinstance(labels, SparseMultilabelLabels)):
+        allow_one_class = False
+        if isinstance(labels, np.ndarray) or all(isinstance(lab, int) for lab in labels):
+            if set(labels) == {0}:  # occurs with missing classes in multi-label settings
+                allow_one_class = True
+        assert_valid_inputs(
+            X=None,
+            y=labels,
+            pred_probs=pred_probs,
+            multi_label=multi_label,
+            allow_one_class=allow_one_class,
+        )
 
     if filter_by in [
         "confident_learning",
@@ -299,8 +310,10 @@ def find_label_issues(
         assert n_jobs >= 1
 
     if multi_label:
-        if not isinstance(labels, list):
-            raise TypeError("`labels` must be list when `multi_label=True`.")
+        if not isinstance(labels, (list, SparseMultilabelLabels)):
+            raise TypeError(
+                "`labels` must be list or SparseMultilabelLabels when `multi_label=True`."
+            )
         warnings.warn(
             "The multi_label argument to filter.find_label_issues() is deprecated and will be removed in future versions. Please use `multilabel_classification.filter.find_label_issues()` instead.",
             DeprecationWarning,
@@ -363,13 +376,9 @@ def find_label_issues(
         )
 
         if num_to_remove_per_class is not None:
-            # Estimate joint probability distribution over label issues
-            psy = prune_count_matrix / np.sum(prune_count_matrix, axis=1)
-            noise_per_s = psy.sum(axis=1) - psy.diagonal()
-            # Calibrate labels.t. noise rates sum to num_to_remove_per_class
-            tmp = (psy.T * num_to_remove_per_class / noise_per_s).T
-            np.fill_diagonal(tmp, label_counts - num_to_remove_per_class)
-            prune_count_matrix = round_preserving_row_totals(tmp)
+            prune_count_matrix = _calibrate_prune_counts(
+                prune_count_matrix, label_counts, num_to_remove_per_class
+            )
 
         # Prepare multiprocessing shared data
         # On Linux, multiprocessing is started with fork,
@@ -465,7 +474,7 @@ def find_label_issues(
 
 
 def _find_label_issues_multilabel(
-    labels: list,
+    labels: Union[list, SparseMultilabelLabels],
     pred_probs: np.ndarray,
     return_indices_ranked_by: Optional[str] = None,
     rank_by_kwargs={},
@@ -481,22 +490,23 @@ def _find_label_issues_multilabel(
     """
     Finds label issues in multi-label classification data where each example can belong to more than one class.
     This is done via a one-vs-rest reduction for each class and the results are subsequently aggregated across all classes.
-    Here `labels` must be formatted as an iterable of iterables, e.g. ``List[List[int]]``.
+    Here `labels` must be formatted as an iterable of iterables, e.g. ``List[List[int]]``, or as a
+    :py:class:`SparseMultilabelLabels <cleanlab.multilabel_classification.SparseMultilabelLabels>` object.
     """
+    # Convert the labels once, instead of in each of the functions below
+    labels = as_sparse_multilabel_labels(labels, pred_probs)
     if filter_by in ["low_normalized_margin", "low_self_confidence"] and not low_memory:
-        num_errors = sum(
-            find_label_issues(
-                labels=labels,
-                pred_probs=pred_probs,
-                confident_joint=confident_joint,
-                multi_label=True,
-                filter_by="confident_learning",
-            )
+        cl_issues = find_multilabel_issues_per_class(
+            labels,
+            pred_probs,
+            filter_by="confident_learning",
+            confident_joint=confident_joint,
         )
+        assert isinstance(cl_issues, np.ndarray)
+        num_errors = np.count_nonzero(cl_issues.any(axis=1))
 
-        y_one, num_classes = get_onehot_num_classes(labels, pred_probs)
         label_quality_scores = ml_scorer.get_label_quality_scores(
-            labels=y_one,
+            labels=labels,
             pred_probs=pred_probs,
         )
 
@@ -506,7 +516,7 @@ def _find_label_issues_multilabel(
 
         if return_indices_ranked_by is not None:
             label_quality_scores_issues = ml_scorer.get_label_quality_scores(
-                labels=y_one[label_issues_mask],
+                labels=labels.select(label_issues_mask),
                 pred_probs=pred_probs[label_issues_mask],
                 method=ml_scorer.MultilabelScorer(
                     base_scorer=ml_scorer.ClassLabelScorer.from_str(return_indices_ranked_by),
@@ -537,9 +547,8 @@ def _find_label_issues_multilabel(
     else:
         label_issues_list, labels_list, pred_probs_list = per_class_issues
         label_issues_idx = reduce(np.union1d, label_issues_list)
-        y_one, num_classes = get_onehot_num_classes(labels, pred_probs)
         label_quality_scores = ml_scorer.get_label_quality_scores(
-            labels=y_one,
+            labels=labels,
             pred_probs=pred_probs,
             method=ml_scorer.MultilabelScorer(
                 base_scorer=ml_scorer.ClassLabelScorer.from_str(return_indices_ranked_by),
@@ -567,6 +576,7 @@ def _keep_at_least_n_per_class(
     prune_count_matrix : np.ndarray of shape (K, K), K = number of classes
         A counts of mislabeled examples in every class. For this function.
         NOTE prune_count_matrix is transposed relative to confident_joint.
+        A stack of matrices of shape ``(..., K, K)`` (e.g. the one-vs-rest matrices of every class) is adjusted matrix by matrix.
 
     n : int
         Number of examples to make sure are left in each class.
@@ -584,7 +594,7 @@ def _keep_at_least_n_per_class(
         This the same as the confident_joint, but has been transposed and the counts are adjusted.
     """
 
-    prune_count_matrix_diagonal = np.diagonal(prune_count_matrix)
+    prune_count_matrix_diagonal = np.diagonal(prune_count_matrix, axis1=-2, axis2=-1)
 
     # Set diagonal terms less than n, to n.
     new_diagonal = np.maximum(prune_count_matrix_diagonal, n)
@@ -595,19 +605,19 @@ def _keep_at_least_n_per_class(
     # Count non-zero, non-diagonal items per column
     # np.maximum(*, 1) makes this never 0 (we divide by this next)
     num_noise_rates_per_col = np.maximum(
-        np.count_nonzero(prune_count_matrix, axis=0) - 1.0,
+        np.count_nonzero(prune_count_matrix, axis=-2) - 1.0,
         1.0,
     )
 
     # Uniformly decrease non-zero noise rates by the same amount
     # that the diagonal items were increased
-    new_mat = prune_count_matrix - diff_per_col / num_noise_rates_per_col
+    new_mat = prune_count_matrix - (diff_per_col / num_noise_rates_per_col)[..., np.newaxis, :]
 
     # Originally zero noise rates will now be negative, fix them back to zero
     new_mat[new_mat < 0] = 0
 
     # Round diagonal terms (correctly labeled examples)
-    np.fill_diagonal(new_mat, new_diagonal)
+    _fill_diagonal(new_mat, new_diagonal)
 
     # Reduce (multiply) all noise rates (non-diagonal) by frac_noise and
     # increase diagonal by the total amount reduced in each column
@@ -615,7 +625,7 @@ def _keep_at_least_n_per_class(
     new_mat = _reduce_prune_counts(new_mat, frac_noise)
 
     # These are counts, so return a matrix of ints.
-    return round_preserving_row_totals(new_mat).astype(int)
+    return _round_preserving_row_totals(new_mat).astype(int)
 
 
 def _reduce_prune_counts(prune_count_matrix: np.ndarray, frac_noise: float = 1.0) -> np.ndarray:
@@ -629,6 +639,7 @@ def _reduce_prune_counts(prune_count_matrix: np.ndarray, frac_noise: float = 1.0
         A counts of mislabeled examples in every class. For this function, it
         does not matter what the rows or columns are, but the diagonal terms
         reflect the number of correctly labeled examples.
+        A stack of matrices of shape ``(..., K, K)`` is reduced matrix by matrix.
 
     frac_noise : float
       Used to only return the "top" ``frac_noise * num_label_issues``. The choice of which "top"
@@ -638,17 +649,48 @@ def _reduce_prune_counts(prune_count_matrix: np.ndarray, frac_noise: float = 1.0
       When frac_noise=1.0, return all "confident" estimated noise indices (recommended).
     """
 
+    prune_count_matrix_diagonal = np.diagonal(prune_count_matrix, axis1=-2, axis2=-1)
     new_mat = prune_count_matrix * frac_noise
-    np.fill_diagonal(new_mat, prune_count_matrix.diagonal())
-    np.fill_diagonal(
+    _fill_diagonal(new_mat, prune_count_matrix_diagonal)
+    _fill_diagonal(
         new_mat,
-        prune_count_matrix.diagonal() + np.sum(prune_count_matrix - new_mat, axis=0),
+        prune_count_matrix_diagonal + np.sum(prune_count_matrix - new_mat, axis=-2),
     )
 
     # These are counts, so return a matrix of ints.
     return new_mat.astype(int)
 
 
+def _calibrate_prune_counts(
+    prune_count_matrix: np.ndarray,
+    label_counts: np.ndarray,
+    num_to_remove_per_class: Union[List[int], np.ndarray],
+) -> np.ndarray:
+    """Calibrates the prune counts so that ``num_to_remove_per_class[k]`` examples with given label ``k`` are flagged.
+    Works on a single matrix of shape ``(K, K)`` with `label_counts` of shape ``(K,)``,
+    or on a stack of matrices of shape ``(..., K, K)`` with `label_counts` and `num_to_remove_per_class` of shape ``(..., K)``.
+    """
+    num_to_remove_per_class = np.asarray(num_to_remove_per_class)
+    # Estimate joint probability distribution over label issues
+    psy = prune_count_matrix / np.sum(prune_count_matrix, axis=-1)[..., np.newaxis, :]
+    noise_per_s = psy.sum(axis=-1) - np.diagonal(psy, axis1=-2, axis2=-1)
+    # Calibrate labels.t. noise rates sum to num_to_remove_per_class
+    tmp = psy * num_to_remove_per_class[..., np.newaxis] / noise_per_s[..., np.newaxis]
+    _fill_diagonal(tmp, label_counts - num_to_remove_per_class)
+    return _round_preserving_row_totals(tmp)
+
+
+def _fill_diagonal(matrix: np.ndarray, diagonal: np.ndarray) -> None:
+    """Sets the diagonal of a matrix of shape ``(K, K)``, or of every matrix in a stack of shape ``(..., K, K)``, in place."""
+    idx = np.arange(matrix.shape[-1])
+    matrix[..., idx, idx] = diagonal
+
+
+def _round_preserving_row_totals(matrix: np.ndarray) -> np.ndarray:
+    """Applies `round_preserving_row_totals` to a matrix of shape ``(K, K)``, or to every matrix in a stack of shape ``(..., K, K)``."""
+    return round_preserving_row_totals(matrix.reshape(-1, matrix.shape[-1])).reshape(matrix.shape)
+
+
 def find_predicted_neq_given(
     labels: LabelLike, pred_probs: np.ndarray, *, multi_label: bool = False
 ) -> np.ndarray:
@@ -21,6 +21,15 @@ CONFIDENT_THRESHOLDS_LOWER_BOUND = (
     2 * FLOATING_POINT_COMPARISON
 )  # lower bound imposed to clip confident thresholds from below, has to be larger than floating point comparison
 TINY_VALUE = 1e-100  # very tiny value for clipping
+SOFTMIN_CHUNK_SIZE = (
+    2**16
+)  # number of scores per row (e.g. pixels per image) processed at a time when streaming the softmin over long rows
+TEMP_SCALING_BLOCK_SIZE = (
+    2**22
+)  # max number of (temperature, example, class) entries processed at a time when searching for the best temperature
+ACTIVE_LEARNING_BLOCK_SIZE = (
+    2**20
+)  # max number of (model, example, class) entries processed at a time when scoring unlabeled examples for active learning
 
 
 # Object Detection Constants
@@ -19,42 +19,252 @@ Helper methods used internally in cleanlab.multiannotator
 """
 
 import warnings
-from typing import Optional, Tuple
+from typing import Any, Iterable, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
+from scipy.optimize import minimize_scalar
+from scipy.sparse import csr_matrix, issparse
 
+from cleanlab.internal.constants import EPSILON, TEMP_SCALING_BLOCK_SIZE
 from cleanlab.internal.numerics import softmax
-from cleanlab.internal.util import get_num_classes, value_counts
+from cleanlab.internal.util import get_num_classes
 from cleanlab.internal.validation import assert_valid_class_labels
 from cleanlab.typing import LabelLike
 
 SMALL_CONST = 1e-30
 
 
+class SparseMultiannotatorLabels:
+    """
+    Stores the labels given by ``M`` annotators to ``N`` examples in sparse (CSR) format,
+    without the dense ``(N, M)`` array of labels that is mostly ``NaN`` when each annotator only labels a few examples.
+
+    The labels of the `n`-th example are ``labels[indptr[n]:indptr[n+1]]``, given by the annotators ``annotator_idx[indptr[n]:indptr[n+1]]``.
+    Objects of this class can be passed as `labels_multiannotator` to the functions in :py:mod:`cleanlab.multiannotator`.
+    Use :py:meth:`from_long` or :py:func:`convert_long_to_sparse_dataset <cleanlab.multiannotator.convert_long_to_sparse_dataset>`
+    to create them from a long format dataset, and :py:meth:`from_csr` to create them from a sparse matrix.
+
+    Parameters
+    ----------
+    labels:
+        Array of shape ``(L,)`` with each given label, which must be an integer in 0, 1, ..., K-1,
+        where ``L`` is the total number of labels in the dataset.
+
+    annotator_idx:
+        Array of shape ``(L,)`` with the index of the annotator that gave each label, sorted (and unique) within each example.
+
+    indptr:
+        Array of shape ``(N+1,)`` where the labels of the `n`-th example are ``labels[indptr[n]:indptr[n+1]]``.
+
+    num_annotators:
+        Number of annotators ``M``.
+
+    example_ids:
+        Optional IDs of the ``N`` examples, used as the index of the returned DataFrames.
+
+    annotator_ids:
+        Optional IDs of the ``M`` annotators, used as the index of the returned annotator statistics.
+    """
+
+    def __init__(
+        self,
+        labels: np.ndarray,
+        annotator_idx: np.ndarray,
+        indptr: np.ndarray,
+        num_annotators: int,
+        *,
+        example_ids: Optional[Iterable] = None,
+        annotator_ids: Optional[Iterable] = None,
+    ):
+        labels = np.asarray(labels)
+        if not np.issubdtype(labels.dtype, np.integer):
+            if not np.equal(np.mod(labels, 1), 0).all():
+                raise ValueError(
+                    "Labels must be zero-indexed integers corresponding to class indices."
+                )
+            labels = labels.astype(np.int64)
+        annotator_idx = np.asarray(annotator_idx, dtype=np.int64)
+        indptr = np.asarray(indptr, dtype=np.int64)
+        num_examples = len(indptr) - 1
+        if num_examples < 0 or indptr[0] != 0 or indptr[-1] != len(labels):
+            raise ValueError(
+                f"indptr must start at 0 and end at the number of labels ({len(labels)})."
+            )
+        if annotator_idx.shape != labels.shape:
+            raise ValueError("labels and annotator_idx must have the same length.")
+        if len(annotator_idx) and (
+            annotator_idx.min() < 0 or annotator_idx.max() >= num_annotators
+        ):
+            raise ValueError(f"annotator_idx must be in 0, 1, ..., {num_annotators - 1}.")
+
+        example_idx = np.repeat(np.arange(num_examples), np.diff(indptr))
+        same_example = example_idx[1:] == example_idx[:-1]
+        if np.any(same_example & (annotator_idx[1:] <= annotator_idx[:-1])):
+            raise ValueError(
+                "annotator_idx must be sorted within each example, and each annotator can only label each example once."
+            )
+
+        self.labels = labels
+        self.annotator_idx = annotator_idx
+        self.indptr = indptr
+        self.example_idx = example_idx
+        self.shape = (num_examples, int(num_annotators))
+        self.example_ids = None if example_ids is None else pd.Index(example_ids)
+        self.annotator_ids = None if annotator_ids is None else pd.Index(annotator_ids)
+
+    @classmethod
+    def from_dense(
+        cls,
+        labels_multiannotator: Union[pd.DataFrame, np.ndarray],
+    ) -> "SparseMultiannotatorLabels":
+        """
+        Converts a 2D pandas DataFrame or array of shape ``(N, M)`` with ``NaN`` for missing labels,
+        in the format expected by `~cleanlab.multiannotator.get_label_quality_multiannotator`, to a ``SparseMultiannotatorLabels`` object.
+        """
+        example_ids, annotator_ids = None, None
+        if isinstance(labels_multiannotator, pd.DataFrame):
+            example_ids, annotator_ids = labels_multiannotator.index, labels_multiannotator.columns
+            labels_multiannotator = (
+                labels_multiannotator.replace({pd.NA: np.NaN}).astype(float).to_numpy()
+            )
+        given_mask = ~np.isnan(labels_multiannotator)
+        example_idx, annotator_idx = np.nonzero(given_mask)
+        indptr = np.zeros(len(labels_multiannotator) + 1, dtype=np.int64)
+        np.cumsum(np.sum(given_mask, axis=1), out=indptr[1:])
+        return cls(
+            labels_multiannotator[example_idx, annotator_idx],
+            annotator_idx,
+            indptr,
+            labels_multiannotator.shape[1],
+            example_ids=example_ids,
+            annotator_ids=annotator_ids,
+        )
+
+    @classmethod
+    def from_long(
+        cls,
+        example_ids: Iterable,
+        annotator_ids: Iterable,
+        labels: Iterable,
+    ) -> "SparseMultiannotatorLabels":
+        """
+        Creates a ``SparseMultiannotatorLabels`` object from a long format dataset,
+        where ``labels[i]`` is the label given by annotator ``annotator_ids[i]`` to example ``example_ids[i]``, in any order.
+        The examples and annotators are sorted by their IDs, like in `~cleanlab.multiannotator.convert_long_to_wide_dataset`.
+        """
+        example_idx, example_uniques = pd.factorize(np.asarray(example_ids), sort=True)
+        annotator_idx, annotator_uniques = pd.factorize(np.asarray(annotator_ids), sort=True)
+        order = np.lexsort((annotator_idx, example_idx))
+        indptr = np.zeros(len(example_uniques) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(example_idx, minlength=len(example_uniques)), out=indptr[1:])
+        return cls(
+            np.asarray(labels)[order],
+            annotator_idx[order],
+            indptr,
+            len(annotator_uniques),
+            example_ids=example_uniques,
+            annotator_ids=annotator_uniques,
+        )
+
+    @classmethod
+    def from_csr(
+        cls,
+        labels_multiannotator: Any,
+        *,
+        example_ids: Optional[Iterable] = None,
+        annotator_ids: Optional[Iterable] = None,
+    ) -> "SparseMultiannotatorLabels":
+        """
+        Converts a ``scipy.sparse`` matrix of shape ``(N, M)``, where the label given by the `m`-th annotator to the `n`-th example is stored at ``[n, m]``,
+        to a ``SparseMultiannotatorLabels`` object.
+        Every stored entry is a given label, so labels of class 0 must be stored as explicit zeros.
+        """
+        labels_multiannotator = csr_matrix(labels_multiannotator, copy=True)
+        labels_multiannotator.sort_indices()
+        return cls(
+            labels_multiannotator.data,
+            labels_multiannotator.indices,
+            labels_multiannotator.indptr,
+            labels_multiannotator.shape[1],
+            example_ids=example_ids,
+            annotator_ids=annotator_ids,
+        )
+
+    @property
+    def num_annotations(self) -> np.ndarray:
+        """Array of shape ``(N,)`` with the number of annotators that labeled each example."""
+        return np.diff(self.indptr)
+
+    @property
+    def num_examples_labeled(self) -> np.ndarray:
+        """Array of shape ``(M,)`` with the number of examples labeled by each annotator."""
+        return np.bincount(self.annotator_idx, minlength=self.shape[1])
+
+    def to_dense(self) -> np.ndarray:
+        """Returns the 2D array of shape ``(N, M)`` of labels, with ``NaN`` for missing labels."""
+        labels_multiannotator = np.full(self.shape, np.NaN)
+        labels_multiannotator[self.example_idx, self.annotator_idx] = self.labels
+        return labels_multiannotator
+
+    def to_csr(self):
+        """Returns the labels as a ``scipy.sparse.csr_matrix`` of shape ``(N, M)``, where labels of class 0 are explicit zeros."""
+        return csr_matrix((self.labels, self.annotator_idx, self.indptr), shape=self.shape)
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    @property
+    def nnz(self) -> int:
+        """Total number of labels in the dataset."""
+        return len(self.labels)
+
+
+def as_sparse_multiannotator_labels(labels_multiannotator: Any) -> SparseMultiannotatorLabels:
+    """Returns `labels_multiannotator` as a ``SparseMultiannotatorLabels`` object,
+    converting it from a 2D pandas DataFrame or array, or from a ``scipy.sparse`` matrix if needed.
+    """
+    if isinstance(labels_multiannotator, SparseMultiannotatorLabels):
+        return labels_multiannotator
+    if issparse(labels_multiannotator):
+        return SparseMultiannotatorLabels.from_csr(labels_multiannotator)
+    return SparseMultiannotatorLabels.from_dense(labels_multiannotator)
+
+
 def assert_valid_inputs_multiannotator(
-    labels_multiannotator: np.ndarray,
+    labels_multiannotator: Union[np.ndarray, SparseMultiannotatorLabels],
     pred_probs: Optional[np.ndarray] = None,
     ensemble: bool = False,
     allow_single_label: bool = False,
     annotator_ids: Optional[pd.Index] = None,
-) -> None:
-    """Validate format of multi-annotator labels"""
-    # Check that labels_multiannotator is a 2D array
-    if labels_multiannotator.ndim != 2:
-        raise ValueError(
-            "labels_multiannotator must be a 2D array or dataframe, "
-            "each row represents an example and each column represents an annotator."
-        )
+) -> SparseMultiannotatorLabels:
+    """Validate format of multi-annotator labels.
 
-    # Raise error if labels are not formatted properly
-    if any([isinstance(label, str) for label in labels_multiannotator.ravel()]):
-        raise ValueError(
-            "Labels cannot be strings, they must be zero-indexed integers corresponding to class indices."
-        )
+    Returns the validated labels as a ``SparseMultiannotatorLabels`` object (converted once here if needed),
+    so callers do not need to convert them again.
+    """
+    if isinstance(labels_multiannotator, SparseMultiannotatorLabels):
+        if annotator_ids is None:
+            annotator_ids = labels_multiannotator.annotator_ids
+    else:
+        # Check that labels_multiannotator is a 2D array
+        if labels_multiannotator.ndim != 2:
+            raise ValueError(
+                "labels_multiannotator must be a 2D array or dataframe, "
+                "each row represents an example and each column represents an annotator."
+            )
+
+        # Raise error if labels are not formatted properly (only arrays of strings or objects can contain strings)
+        if labels_multiannotator.dtype.kind in "OUS" and any(
+            [isinstance(label, str) for label in labels_multiannotator.ravel()]
+        ):
+            raise ValueError(
+                "Labels cannot be strings, they must be zero-indexed integers corresponding to class indices."
+            )
 
     # Raise error if labels_multiannotator has NaN rows
-    nan_row_mask = np.isnan(labels_multiannotator).all(axis=1)
+    labels_sparse = as_sparse_multiannotator_labels(labels_multiannotator)
+    nan_row_mask = labels_sparse.num_annotations == 0
     if nan_row_mask.any():
         nan_rows = list(np.where(nan_row_mask)[0])
         raise ValueError(
@@ -63,7 +273,7 @@ def assert_valid_inputs_multiannotator(
         )
 
     # Raise error if labels_multiannotator has NaN columns
-    nan_col_mask = np.isnan(labels_multiannotator).all(axis=0)
+    nan_col_mask = labels_sparse.num_examples_labeled == 0
     if nan_col_mask.any():
         if annotator_ids is not None:
             nan_columns = list(annotator_ids[np.where(nan_col_mask)[0]])
@@ -74,16 +284,19 @@ def assert_valid_inputs_multiannotator(
             f"Annotators {nan_columns} did not label any examples."
         )
 
+    # Check labels
+    assert_valid_class_labels(labels_sparse.labels, allow_one_class=True)
+
     if not allow_single_label:
         # Raise error if labels_multiannotator has <= 1 column
-        if labels_multiannotator.shape[1] <= 1:
+        if labels_sparse.shape[1] <= 1:
             raise ValueError(
                 "labels_multiannotator must have more than one column.\n"
                 "If there is only one annotator, use cleanlab.rank.get_label_quality_scores instead"
             )
 
         # Raise error if labels_multiannotator only has 1 label per example
-        if (np.sum(~np.isnan(labels_multiannotator), axis=1) == 1).all():
+        if (labels_sparse.num_annotations == 1).all():
             raise ValueError(
                 "Each example only has one label, collapse the labels into a 1-D array and use "
                 "cleanlab.rank.get_label_quality_scores instead"
@@ -91,17 +304,10 @@ def assert_valid_inputs_multiannotator(
 
         # Raise warning if no examples with 2 or more annotators agree
         # TODO: might shift this later in the code to avoid extra compute
-        has_agreement = np.zeros(labels_multiannotator.shape[0], dtype=bool)
-        for i in np.unique(labels_multiannotator):
-            has_agreement |= (labels_multiannotator == i).sum(axis=1) > 1
-        if not has_agreement.any():
+        label_counts = get_label_counts(labels_sparse, num_classes=np.max(labels_sparse.labels) + 1)
+        if not np.any(label_counts > 1):
             warnings.warn("Annotators do not agree on any example. Check input data.")
 
-    # Check labels
-    all_labels_flatten = labels_multiannotator.ravel()
-    all_labels_flatten = all_labels_flatten[~np.isnan(all_labels_flatten)]
-    assert_valid_class_labels(all_labels_flatten, allow_one_class=True)
-
     # Raise error if number of classes in labels_multiannoator does not match number of classes in pred_probs
     if pred_probs is not None:
         if not isinstance(pred_probs, np.ndarray):
@@ -130,7 +336,7 @@ def assert_valid_inputs_multiannotator(
 
             num_classes = pred_probs.shape[1]
 
-        highest_class = np.nanmax(labels_multiannotator) + 1
+        highest_class = np.max(labels_sparse.labels) + 1
 
         # this allows for missing labels, but not missing columns in pred_probs
         if num_classes < highest_class:
@@ -140,6 +346,8 @@ def assert_valid_inputs_multiannotator(
                 "establishing consensus labels used to train your classifier."
             )
 
+    return labels_sparse
+
 
 def assert_valid_pred_probs(
     pred_probs: Optional[np.ndarray] = None,
@@ -249,13 +457,12 @@ def format_multiannotator_labels(labels: LabelLike) -> Tuple[pd.DataFrame, dict]
 
 
 def check_consensus_label_classes(
-    labels_multiannotator: np.ndarray,
+    labels_multiannotator: SparseMultiannotatorLabels,
     consensus_label: np.ndarray,
     consensus_method: str,
 ) -> None:
     """Check if any classes no longer appear in the set of consensus labels (established using the consensus_method stated)"""
-    unique_ma_labels = np.unique(labels_multiannotator)
-    unique_ma_labels = unique_ma_labels[~np.isnan(unique_ma_labels)]
+    unique_ma_labels = np.unique(labels_multiannotator.labels)
     labels_set_difference = set(unique_ma_labels) - set(consensus_label)
 
     if len(labels_set_difference) > 0:
@@ -268,19 +475,131 @@ def check_consensus_label_classes(
         )
 
 
+def get_label_counts(
+    labels_multiannotator: SparseMultiannotatorLabels,
+    num_classes: int,
+    annotator_weight: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Returns an array of shape ``(N,K)`` with the number of annotators that gave each class label to each example,
+    or the total weight of these annotators if `annotator_weight` of shape ``(M,)`` is provided.
+    """
+    num_examples = len(labels_multiannotator)
+    weights = (
+        None if annotator_weight is None else annotator_weight[labels_multiannotator.annotator_idx]
+    )
+    label_counts = np.bincount(
+        labels_multiannotator.example_idx * num_classes + labels_multiannotator.labels,
+        weights=weights,
+        minlength=num_examples * num_classes,
+    )
+    return label_counts.reshape(num_examples, num_classes)
+
+
+def get_empirical_label_distribution(
+    labels_multiannotator: Union[np.ndarray, SparseMultiannotatorLabels],
+    num_classes: int,
+) -> np.ndarray:
+    """Returns an array of shape ``(N,K)`` with the fraction of the annotators of each example that gave each class label.
+    Counts are placed at the class index of each label, so classes no annotator chose for an example get zero probability.
+    """
+    labels_multiannotator = as_sparse_multiannotator_labels(labels_multiannotator)
+    return get_label_counts(
+        labels_multiannotator, num_classes
+    ) / labels_multiannotator.num_annotations.reshape(-1, 1)
+
+
+def get_annotator_agreement(
+    labels_multiannotator: SparseMultiannotatorLabels,
+    consensus_label: np.ndarray,
+    example_mask: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Returns an array of shape ``(M,)`` with the fraction of the labels given by each annotator that agree with the consensus label,
+    or NaN for annotators that did not label any of the examples.
+    If the boolean array `example_mask` of shape ``(N,)`` is provided, only the labels of these examples are considered.
+    """
+    example_idx = labels_multiannotator.example_idx
+    annotator_idx = labels_multiannotator.annotator_idx
+    agree_mask = labels_multiannotator.labels == consensus_label[example_idx]
+    if example_mask is not None:
+        label_mask = example_mask[example_idx]
+        annotator_idx, agree_mask = annotator_idx[label_mask], agree_mask[label_mask]
+
+    num_annotators = labels_multiannotator.shape[1]
+    num_labeled = np.bincount(annotator_idx, minlength=num_annotators)
+    num_agree = np.bincount(annotator_idx, weights=agree_mask, minlength=num_annotators)
+    annotator_agreement = np.full(num_annotators, np.NaN)
+    np.divide(num_agree, num_labeled, out=annotator_agreement, where=num_labeled > 0)
+    return annotator_agreement
+
+
+def select_best_candidates(candidates: np.ndarray, scores: np.ndarray) -> np.ndarray:
+    """Breaks ties between candidate classes, given as a boolean array of shape ``(N,K)``,
+    by only keeping the candidates with the highest score in each row.
+    `scores` is an array of shape ``(N,K)``, or of shape ``(K,)`` if the scores are the same for every row.
+    """
+    candidate_scores = np.where(candidates, scores, -np.inf)
+    return candidates & (candidate_scores == np.max(candidate_scores, axis=1, keepdims=True))
+
+
+def break_majority_vote_ties(
+    candidates: np.ndarray,
+    pred_probs: Optional[np.ndarray] = None,
+    class_frequencies: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Breaks ties between the most voted classes of each example like `~cleanlab.multiannotator.get_majority_vote_label`,
+    first keeping the candidates with the highest `pred_probs` (if provided), then the candidates of the least
+    frequent classes given `class_frequencies` (if provided), to prevent larger class imbalance.
+    """
+    if pred_probs is not None:
+        candidates = select_best_candidates(candidates, pred_probs)
+    if class_frequencies is not None:
+        candidates = select_best_candidates(candidates, -class_frequencies)
+    return candidates
+
+
+def impute_missing_agreement(agreement: np.ndarray) -> np.ndarray:
+    """Imputes (in place) the average agreement for the annotators that do not overlap with the consensus labels,
+    whose agreement from `get_annotator_agreement` is NaN."""
+    nan_mask = np.isnan(agreement)
+    agreement[nan_mask] = np.mean(agreement[~nan_mask])
+    return agreement
+
+
+def break_ties_by_agreement(
+    candidates: np.ndarray, label_counts: np.ndarray, weighted_label_counts: np.ndarray
+) -> np.ndarray:
+    """Breaks the remaining ties between candidate classes by keeping the candidates whose annotators have the highest
+    average agreement with the consensus, where `weighted_label_counts` are the `label_counts` weighted by the agreement
+    of each annotator (see `impute_missing_agreement`).
+    """
+    label_quality_score = weighted_label_counts / np.maximum(label_counts, 1)
+    return select_best_candidates(candidates, label_quality_score)
+
+
+def break_ties_randomly(candidates: np.ndarray, example_idx: np.ndarray) -> np.ndarray:
+    """Returns the consensus label of each example from its candidate classes,
+    selected at random (with a warning) among the candidates that are still tied."""
+    consensus_label = np.argmax(candidates, axis=1)
+    still_tied_mask = np.sum(candidates, axis=1) > 1
+    if np.any(still_tied_mask):
+        warnings.warn(
+            f"breaking ties of examples {list(example_idx[still_tied_mask])} by random selection, you may want to set seed for reproducability"
+        )
+        for i in np.flatnonzero(still_tied_mask):
+            consensus_label[i] = np.random.choice(np.flatnonzero(candidates[i]))
+    return consensus_label
+
+
 def compute_soft_cross_entropy(
-    labels_multiannotator: np.ndarray,
+    labels_multiannotator: Union[np.ndarray, SparseMultiannotatorLabels],
     pred_probs: np.ndarray,
 ) -> float:
     """Compute soft cross entropy between the annotators' empirical label distribution and model pred_probs"""
     num_classes = get_num_classes(pred_probs=pred_probs)
 
-    empirical_label_distribution = np.full((len(labels_multiannotator), num_classes), np.NaN)
-    for i, labels in enumerate(labels_multiannotator):
-        labels_subset = labels[~np.isnan(labels)]
-        empirical_label_distribution[i, :] = value_counts(
-            labels_subset, num_classes=num_classes
-        ) / len(labels_subset)
+    empirical_label_distribution = get_empirical_label_distribution(
+        labels_multiannotator, num_classes
+    )
 
     clipped_pred_probs = np.clip(pred_probs, a_min=SMALL_CONST, a_max=None)
     soft_cross_entropy = -np.sum(
@@ -290,35 +609,113 @@ def compute_soft_cross_entropy(
     return soft_cross_entropy
 
 
+def compute_temp_scaled_soft_cross_entropy(
+    labels_multiannotator: Union[np.ndarray, SparseMultiannotatorLabels],
+    pred_probs: np.ndarray,
+    temps: Iterable[float],
+    block_size: int = TEMP_SCALING_BLOCK_SIZE,
+) -> np.ndarray:
+    """Compute the mean soft cross entropy between the annotators' empirical label distribution and model pred_probs
+    temperature scaled by each of the given temperatures.
+
+    All temperatures are evaluated at once on blocks of examples, where each block holds at most about `block_size`
+    (temperature, example, class) entries, so the memory used does not grow with the number of examples.
+    Only the log-normalizer of the scaled pred_probs needs every class, the cross entropy itself is only computed for the given labels.
+    Returns an array of shape ``(T,)`` with the mean soft cross entropy for each of the T temperatures.
+    """
+    num_classes = get_num_classes(pred_probs=pred_probs)
+    temps = np.maximum(np.asarray(temps, dtype=float), EPSILON)
+
+    # empirical label distribution, only stored for the classes given by some annotator of each example
+    labels_multiannotator = as_sparse_multiannotator_labels(labels_multiannotator)
+    label_counts = get_label_counts(labels_multiannotator, num_classes)
+    example_idx, class_idx = np.nonzero(label_counts)
+    empirical_label_weight = (
+        label_counts[example_idx, class_idx] / labels_multiannotator.num_annotations[example_idx]
+    )
+
+    # shift the log pred_probs by their max, which does not change the temperature scaled pred_probs
+    with np.errstate(divide="ignore"):
+        log_pred_probs = np.log(pred_probs)
+    log_pred_probs -= np.max(log_pred_probs, axis=1, keepdims=True)
+    log_clip = np.log(SMALL_CONST)
+
+    num_examples = len(pred_probs)
+    block_rows = max(block_size // (len(temps) * num_classes), 1)
+    block_starts = np.searchsorted(example_idx, np.arange(0, num_examples + block_rows, block_rows))
+    total_cross_entropy = np.zeros(len(temps))
+    for i, start in enumerate(range(0, num_examples, block_rows)):
+        # log-normalizer of the temperature scaled pred_probs of the block, with shape (T, B)
+        scaled_logits = log_pred_probs[np.newaxis, start : start + block_rows] / temps.reshape(
+            -1, 1, 1
+        )
+        log_normalizer = np.log(np.sum(np.exp(scaled_logits), axis=2))
+
+        # log of the scaled pred_probs of the given labels, clipped like in compute_soft_cross_entropy
+        entries = slice(block_starts[i], block_starts[i + 1])
+        block_example_idx = example_idx[entries] - start
+        log_scaled_pred_probs = (
+            log_pred_probs[example_idx[entries], class_idx[entries]] / temps.reshape(-1, 1)
+            - log_normalizer[:, block_example_idx]
+        )
+        np.maximum(log_scaled_pred_probs, log_clip, out=log_scaled_pred_probs)
+        total_cross_entropy -= log_scaled_pred_probs @ empirical_label_weight[entries]
+
+    return total_cross_entropy / (num_examples * np.log(num_classes))
+
+
 def find_best_temp_scaler(
-    labels_multiannotator: np.ndarray,
+    labels_multiannotator: Union[np.ndarray, SparseMultiannotatorLabels],
     pred_probs: np.ndarray,
     coarse_search_range: list = [0.1, 0.2, 0.5, 0.8, 1, 2, 3, 5, 8],
     fine_search_size: int = 4,
+    method: str = "grid",
 ) -> float:
     """Find the best temperature scaling factor that minimizes the soft cross entropy between the annotators' empirical label distribution
-    and model pred_probs"""
+    and model pred_probs.
 
-    soft_cross_entropy_coarse = np.full(len(coarse_search_range), np.NaN)
-    log_pred_probs = np.log(
-        pred_probs, where=pred_probs > 0, out=np.full(pred_probs.shape, -np.inf)
-    )
-    for i, curr_temp in enumerate(coarse_search_range):
-        scaled_pred_probs = softmax(log_pred_probs, temperature=curr_temp, axis=1, shift=False)
-        soft_cross_entropy_coarse[i] = np.mean(
-            compute_soft_cross_entropy(labels_multiannotator, scaled_pred_probs)
+    The temperatures in `coarse_search_range` are evaluated first. With ``method="grid"``, a finer grid of `fine_search_size` temperatures
+    is then evaluated on each side of the best coarse temperature. With ``method="bounded"``, the best temperature between the neighbors
+    of the best coarse temperature is instead found with a bounded scalar optimizer (``scipy.optimize.minimize_scalar``).
+    """
+    valid_methods = ["grid", "bounded"]
+    if method not in valid_methods:
+        raise ValueError(
+            f"""
+            {method} is not a valid temperature search method!
+            Please choose a valid method: {valid_methods}
+            """
         )
 
+    labels_multiannotator = as_sparse_multiannotator_labels(labels_multiannotator)
+    soft_cross_entropy_coarse = compute_temp_scaled_soft_cross_entropy(
+        labels_multiannotator, pred_probs, coarse_search_range
+    )
     min_entropy_ind = np.argmin(soft_cross_entropy_coarse)
+
+    if method == "bounded":
+        lower_ind = max(int(min_entropy_ind) - 1, 0)
+        upper_ind = min(int(min_entropy_ind) + 1, len(coarse_search_range) - 1)
+        bounds = (coarse_search_range[lower_ind], coarse_search_range[upper_ind])
+        result = minimize_scalar(
+            lambda temp: compute_temp_scaled_soft_cross_entropy(
+                labels_multiannotator, pred_probs, [temp]
+            )[0],
+            bounds=bounds,
+            method="bounded",
+            options={"xatol": 1e-3},
+        )
+        # the optimizer only looks for a local minimum, so never return a worse temperature than the coarse search
+        if result.fun > soft_cross_entropy_coarse[min_entropy_ind]:
+            return coarse_search_range[min_entropy_ind]
+        return float(result.x)
+
     fine_search_range = _set_fine_search_range(
         coarse_search_range, fine_search_size, min_entropy_ind
     )
-    soft_cross_entropy_fine = np.full(len(fine_search_range), np.NaN)
-    for i, curr_temp in enumerate(fine_search_range):
-        scaled_pred_probs = softmax(log_pred_probs, temperature=curr_temp, axis=1, shift=False)
-        soft_cross_entropy_fine[i] = np.mean(
-            compute_soft_cross_entropy(labels_multiannotator, scaled_pred_probs)
-        )
+    soft_cross_entropy_fine = compute_temp_scaled_soft_cross_entropy(
+        labels_multiannotator, pred_probs, fine_search_range
+    )
     best_temp = fine_search_range[np.argmin(soft_cross_entropy_fine)]
     return best_temp
 
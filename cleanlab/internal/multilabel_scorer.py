@@ -23,8 +23,14 @@ from typing import Callable, Dict, Optional, Union
 import numpy as np
 from sklearn.model_selection import cross_val_predict
 
+from cleanlab.internal.constants import EPSILON
 from cleanlab.internal.label_quality_utils import _subtract_confident_thresholds
-from cleanlab.internal.multilabel_utils import _is_multilabel, stack_complement
+from cleanlab.internal.multilabel_utils import (
+    SparseMultilabelLabels,
+    _is_multilabel,
+    get_one_vs_rest_confident_thresholds,
+    stack_complement,
+)
 from cleanlab.internal.numerics import softmax
 from cleanlab.rank import (
     get_confidence_weighted_entropy_for_each_label,
@@ -223,6 +229,7 @@ def softmin(
     *,
     temperature: float = 0.1,
     axis: int = 1,
+    chunk_size: Optional[int] = None,
     **_,
 ) -> np.ndarray:
     """Softmin score aggregation function.
@@ -238,16 +245,100 @@ def softmin(
     axis :
         Axis along which to apply the function.
 
+    chunk_size :
+        Optional number of scores along `axis` to process at a time.
+        If provided, the softmin is computed in a streaming fashion with running (log-sum-exp style) accumulators,
+        so only one chunk of `s` is converted to float64 at a time. This gives the same scores (up to floating point error)
+        while using much less memory for long rows, e.g. the pixels of high-resolution images.
+
     Returns
     -------
         Softmin score.
     """
+    if chunk_size is not None:
+        return _online_softmin(s, temperature=temperature, axis=axis, chunk_size=chunk_size)
 
     return np.einsum(
         "ij,ij->i", s, softmax(x=1 - s, temperature=temperature, axis=axis, shift=True)
     )
 
 
+def _online_softmin(s: np.ndarray, *, temperature: float, axis: int, chunk_size: int) -> np.ndarray:
+    """Computes the softmin of `s` along `axis` one chunk of `chunk_size` scores at a time.
+
+    Keeps the running max of ``(1 - s) / temperature``, the running sum of its shifted exponentials
+    and the running dot product with the scores, rescaling both sums whenever the max increases.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}")
+    s = np.moveaxis(s, axis, -1)
+    temperature = max(temperature, EPSILON)
+    running_max = np.full(s.shape[:-1], -np.inf)
+    running_sum = np.zeros(s.shape[:-1])
+    running_dot = np.zeros(s.shape[:-1])
+    for start in range(0, s.shape[-1], chunk_size):
+        s_chunk = np.asarray(s[..., start : start + chunk_size], dtype=np.float64)
+        x = (1 - s_chunk) / temperature
+        new_max = np.maximum(running_max, np.max(x, axis=-1))
+        rescale = np.exp(running_max - new_max)
+        exp_x = np.exp(x - new_max[..., np.newaxis])
+        running_sum = running_sum * rescale + np.sum(exp_x, axis=-1)
+        running_dot = running_dot * rescale + np.einsum("...j,...j->...", s_chunk, exp_x)
+        running_max = new_max
+    return running_dot / running_sum
+
+
+def ragged_softmin(
+    s: np.ndarray,
+    lengths: np.ndarray,
+    *,
+    temperature: float = 0.1,
+) -> np.ndarray:
+    """Softmin score aggregation function for rows of different lengths.
+
+    Computes the same scores as :py:func:`softmin` for each row, with all rows scored in a single vectorized call,
+    e.g. the token scores of all sentences in a token classification dataset.
+
+    Parameters
+    ----------
+    s :
+        Flat array of shape ``(L,)`` with the scores of all rows concatenated.
+
+    lengths :
+        Array of shape ``(R,)`` with the number of scores in each row, which must sum to ``L``.
+        Every row must contain at least one score.
+
+    temperature :
+        Temperature parameter. Too small values may cause numerical underflow and NaN scores.
+
+    Returns
+    -------
+        Array of shape ``(R,)`` with the softmin score of each row.
+
+    Examples
+    --------
+    >>> from cleanlab.internal.multilabel_scorer import ragged_softmin
+    >>> import numpy as np
+    >>> s = np.array([0.9, 0.6, 0.0, 0.8, 0.8, 0.8])
+    >>> ragged_softmin(s, lengths=[2, 3, 1], temperature=0.05)
+    array([6.00741787e-01, 1.80056239e-07, 8.00000000e-01])
+    """
+    s = np.asarray(s, dtype=np.float64)
+    lengths = np.asarray(lengths, dtype=np.int64)
+    if np.any(lengths < 1):
+        raise ValueError("Every row must contain at least one score.")
+    if np.sum(lengths) != len(s):
+        raise ValueError(f"lengths must sum to the number of scores ({len(s)}).")
+    if len(lengths) == 0:
+        return np.empty(0)
+
+    row_starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    x = (1 - s) / max(temperature, EPSILON)
+    row_max = np.maximum.reduceat(x, row_starts)
+    exp_x = np.exp(x - np.repeat(row_max, lengths))
+    return np.add.reduceat(s * exp_x, row_starts) / np.add.reduceat(exp_x, row_starts)
+
+
 class Aggregator:
     """Helper class for aggregating the label quality scores for each class into a single score for each datapoint.
 
@@ -356,7 +447,7 @@ class MultilabelScorer:
 
     def __call__(
         self,
-        labels: np.ndarray,
+        labels: Union[np.ndarray, SparseMultilabelLabels],
         pred_probs: np.ndarray,
         base_scorer_kwargs: Optional[dict] = None,
         **aggregator_kwargs,
@@ -369,7 +460,8 @@ class MultilabelScorer:
         Parameters
         ----------
         labels:
-            A 2D array of shape (n_samples, n_labels) with binary labels.
+            A 2D array of shape (n_samples, n_labels) with binary labels,
+            or a :py:class:`SparseMultilabelLabels <cleanlab.multilabel_classification.SparseMultilabelLabels>` object.
 
         pred_probs:
             A 2D array of shape (n_samples, n_labels) with predicted probabilities.
@@ -458,7 +550,7 @@ class MultilabelScorer:
 
     def get_class_label_quality_scores(
         self,
-        labels: np.ndarray,
+        labels: Union[np.ndarray, SparseMultilabelLabels],
         pred_probs: np.ndarray,
         base_scorer_kwargs: Optional[dict] = None,
     ) -> np.ndarray:
@@ -467,7 +559,8 @@ class MultilabelScorer:
         Parameters
         ----------
         labels:
-            A 2D array of shape (n_samples, n_labels) with binary labels.
+            A 2D array of shape (n_samples, n_labels) with binary labels,
+            or a :py:class:`SparseMultilabelLabels <cleanlab.multilabel_classification.SparseMultilabelLabels>` object.
 
         pred_probs:
             A 2D array of shape (n_samples, n_labels) with predicted probabilities.
@@ -492,31 +585,86 @@ class MultilabelScorer:
         array([[0.9, 0.9, 0.3],
                [0.4, 0.9, 0.6]])
         """
-        class_label_quality_scores = np.zeros(shape=labels.shape)
         if base_scorer_kwargs is None:
             base_scorer_kwargs = {}
-        for i, (label_i, pred_prob_i) in enumerate(zip(labels.T, pred_probs.T)):
-            pred_prob_i_two_columns = stack_complement(pred_prob_i)
-            class_label_quality_scores[:, i] = self.base_scorer(
-                label_i, pred_prob_i_two_columns, **base_scorer_kwargs
+        labels_t = _as_one_vs_rest_labels(labels)
+        num_classes, num_examples = labels_t.shape
+        if not isinstance(self.base_scorer, ClassLabelScorer):
+            class_label_quality_scores = np.zeros(shape=(num_examples, num_classes))
+            for i, (label_i, pred_prob_i) in enumerate(zip(labels_t, pred_probs.T)):
+                pred_prob_i_two_columns = stack_complement(pred_prob_i)
+                class_label_quality_scores[:, i] = self.base_scorer(
+                    label_i, pred_prob_i_two_columns, **base_scorer_kwargs
+                )
+            return class_label_quality_scores
+
+        # The built-in scores are computed row by row, so the one-vs-rest problems of all classes
+        # are scored in one call, as a single binary problem with N*K examples.
+        labels_one_vs_rest = labels_t.ravel()
+        if (
+            base_scorer_kwargs.get("adjust_pred_probs", False) is True
+            and self.base_scorer != ClassLabelScorer.CONFIDENCE_WEIGHTED_ENTROPY
+        ):
+            # confident thresholds are specific to each class
+            pred_probs_one_vs_rest = _subtract_one_vs_rest_confident_thresholds(
+                labels_t.T, pred_probs
             )
-        return class_label_quality_scores
+            base_scorer_kwargs = {**base_scorer_kwargs, "adjust_pred_probs": False}
+        else:
+            pred_probs_one_vs_rest = stack_complement(np.asarray(pred_probs).T.ravel())
+        class_label_quality_scores = self.base_scorer(
+            labels_one_vs_rest, pred_probs_one_vs_rest, **base_scorer_kwargs
+        )
+        return class_label_quality_scores.reshape(num_classes, num_examples).T
 
     @staticmethod
-    def _validate_labels_and_pred_probs(labels: np.ndarray, pred_probs: np.ndarray) -> None:
+    def _validate_labels_and_pred_probs(
+        labels: Union[np.ndarray, SparseMultilabelLabels], pred_probs: np.ndarray
+    ) -> None:
         """
         Checks that (multi-)labels are in the proper binary indicator format and that
         they are compatible with the predicted probabilities.
         """
-        # Only allow dense matrices for labels for now
-        if not isinstance(labels, np.ndarray):
-            raise TypeError("Labels must be a numpy array.")
-        if not _is_multilabel(labels):
+        if isinstance(labels, SparseMultilabelLabels):
+            # Same check as `_is_multilabel`, without the dense matrix
+            num_examples, num_classes = labels.shape
+            if num_classes <= 1 or labels.nnz in (0, num_examples * num_classes):
+                raise ValueError("Labels must be in multi-label format.")
+        elif not isinstance(labels, np.ndarray):
+            # Only allow dense matrices or SparseMultilabelLabels for labels
+            raise TypeError("Labels must be a numpy array or SparseMultilabelLabels.")
+        elif not _is_multilabel(labels):
             raise ValueError("Labels must be in multi-label format.")
         if labels.shape != pred_probs.shape:
             raise ValueError("Labels and predicted probabilities must have the same shape.")
 
 
+def _as_one_vs_rest_labels(labels: Union[np.ndarray, SparseMultilabelLabels]) -> np.ndarray:
+    """Returns the binary labels as a ``(K, N)`` integer array whose row ``k`` contains the labels of the one-vs-rest problem of class ``k``.
+    Boolean labels are viewed as ``int8`` without a copy, since the base scorers use the labels to index the predicted probabilities.
+    """
+    if isinstance(labels, SparseMultilabelLabels):
+        return labels.to_one_vs_rest(dtype=np.int8)
+    labels_t = np.asarray(labels).T
+    if labels_t.dtype == bool:
+        return labels_t.view(np.int8)
+    return labels_t
+
+
+def _subtract_one_vs_rest_confident_thresholds(
+    labels: np.ndarray, pred_probs: np.ndarray
+) -> np.ndarray:
+    """Returns the ``(N*K, 2)`` one-vs-rest predicted probabilities of all classes, after subtracting the confident thresholds
+    of each class and renormalizing, like `~cleanlab.internal.label_quality_utils._subtract_confident_thresholds` for each class.
+    """
+    confident_thresholds = get_one_vs_rest_confident_thresholds(labels, pred_probs)[:, np.newaxis]
+    pred_probs_t = np.asarray(pred_probs).T
+    pred_probs_adj = np.stack((1 - pred_probs_t, pred_probs_t), axis=-1) - confident_thresholds
+    pred_probs_adj += confident_thresholds.max(axis=-1, keepdims=True)
+    pred_probs_adj /= pred_probs_adj.sum(axis=-1, keepdims=True)
+    return pred_probs_adj.reshape(-1, 2)
+
+
 def get_label_quality_scores(
     labels,
     pred_probs,
@@ -531,7 +679,7 @@ def get_label_quality_scores(
     Parameters
     ----------
     labels:
-        A 2D array of shape (N, K) with binary labels.
+        A 2D array of shape (N, K) with binary labels, or a `SparseMultilabelLabels` object.
 
     pred_probs:
         A 2D array of shape (N, K) with predicted probabilities.
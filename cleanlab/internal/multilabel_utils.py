@@ -17,11 +17,16 @@
 """
 Helper functions used internally for multi-label classification tasks.
 """
-from typing import List, Optional, Tuple
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Any, Iterable, List, Optional, Tuple, Union
 
 import numpy as np
+from scipy.sparse import csr_matrix, issparse
 
-from cleanlab.internal.util import get_num_classes
+from cleanlab.internal.constants import CONFIDENT_THRESHOLDS_LOWER_BOUND, FLOATING_POINT_COMPARISON
+from cleanlab.internal.util import get_num_classes, get_num_jobs
 
 
 def _is_multilabel(y: np.ndarray) -> bool:
@@ -103,3 +108,576 @@ def onehot2int(onehot_matrix: np.ndarray) -> List[List[int]]:
       All integers from 0,1,...,K-1 must be represented."""
 
     return [np.where(row)[0].tolist() for row in onehot_matrix]
+
+
+class SparseMultilabelLabels:
+    """
+    Stores the given labels of ``N`` examples in a multi-label dataset with ``K`` classes in sparse (CSR) format,
+    without the dense ``(N, K)`` one-hot matrix of labels that is mostly zeros when each example only belongs to a few classes.
+
+    The classes of the `i`-th example are ``indices[indptr[i]:indptr[i+1]]``.
+    Objects of this class can be passed as `labels` to the functions in :py:mod:`cleanlab.multilabel_classification`
+    and to `~cleanlab.internal.multilabel_scorer.MultilabelScorer`,
+    which only expand them to the binary labels of each one-vs-rest problem (1 byte per entry) while computing.
+    Use :py:meth:`from_lists` to convert labels in the ``List[List[int]]`` format, and :py:meth:`from_csr` to create them from a sparse matrix.
+    This class is available as ``cleanlab.multilabel_classification.SparseMultilabelLabels``.
+
+    Parameters
+    ----------
+    indices:
+        Array of shape ``(L,)`` with the classes of each example, sorted (and unique) within each example,
+        where ``L`` is the total number of class annotations in the dataset.
+
+    indptr:
+        Array of shape ``(N+1,)`` where the classes of the `i`-th example are ``indices[indptr[i]:indptr[i+1]]``.
+
+    num_classes:
+        Number of classes ``K``.
+    """
+
+    def __init__(self, indices: np.ndarray, indptr: np.ndarray, num_classes: int):
+        num_classes = int(num_classes)
+        indptr = np.asarray(indptr, dtype=np.int64)
+        index_dtype = np.int32 if num_classes <= np.iinfo(np.int32).max else np.int64
+        indices = np.asarray(indices).astype(index_dtype, copy=False)
+        num_examples = len(indptr) - 1
+        if num_examples < 0 or indptr[0] != 0 or indptr[-1] != len(indices):
+            raise ValueError(
+                f"indptr must start at 0 and end at the number of class annotations ({len(indices)})."
+            )
+        if len(indices) and (indices.min() < 0 or indices.max() >= num_classes):
+            raise ValueError(f"indices must be in 0, 1, ..., {num_classes - 1}.")
+
+        self.indices = indices
+        self.indptr = indptr
+        self.shape = (num_examples, num_classes)
+        example_idx = self.example_idx
+        if np.any((example_idx[1:] == example_idx[:-1]) & (indices[1:] <= indices[:-1])):
+            raise ValueError("indices must be sorted within each example, without duplicates.")
+
+    @classmethod
+    def from_lists(
+        cls, labels: Iterable, num_classes: Optional[int] = None
+    ) -> "SparseMultilabelLabels":
+        """
+        Converts multi-label classification `labels` in the ``List[List[int]]`` format (e.g. ``[[0,1], [3], [1,2,3], [], [2]]``)
+        to a ``SparseMultilabelLabels`` object.
+        If `num_classes` is not provided, it is one more than the largest class in `labels`.
+        """
+        try:
+            num_labels = np.fromiter(map(len, labels), dtype=np.int64)
+            indices = np.fromiter(chain.from_iterable(labels), dtype=np.int64)
+        except (TypeError, ValueError):
+            raise ValueError(
+                "wrong format for labels, should be a list of list[indices], please check the documentation in find_label_issues for further information"
+            )
+        example_idx = np.repeat(np.arange(len(num_labels)), num_labels)
+        same_example = example_idx[1:] == example_idx[:-1]
+        if np.any(same_example & (indices[1:] <= indices[:-1])):
+            order = np.lexsort((indices, example_idx))
+            indices = indices[order]
+            keep = np.ones(len(indices), dtype=bool)
+            keep[1:] = ~same_example | (indices[1:] != indices[:-1])
+            indices = indices[keep]
+            num_labels = np.bincount(example_idx[keep], minlength=len(num_labels))
+        indptr = np.zeros(len(num_labels) + 1, dtype=np.int64)
+        np.cumsum(num_labels, out=indptr[1:])
+        if num_classes is None:
+            num_classes = int(indices.max()) + 1 if len(indices) else 0
+        return cls(indices, indptr, num_classes)
+
+    @classmethod
+    def from_onehot(cls, onehot_matrix: np.ndarray) -> "SparseMultilabelLabels":
+        """
+        Converts a 2D array of shape ``(N, K)`` of 0s and 1s, like the one returned by `int2onehot`,
+        to a ``SparseMultilabelLabels`` object.
+        """
+        onehot_matrix = np.asarray(onehot_matrix)
+        example_idx, indices = np.nonzero(onehot_matrix)
+        indptr = np.zeros(len(onehot_matrix) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(example_idx, minlength=len(onehot_matrix)), out=indptr[1:])
+        return cls(indices, indptr, onehot_matrix.shape[1])
+
+    @classmethod
+    def from_csr(cls, labels: Any) -> "SparseMultilabelLabels":
+        """
+        Converts a ``scipy.sparse`` matrix of shape ``(N, K)``, which is nonzero at ``[i, k]`` if the `i`-th example belongs to class ``k``,
+        to a ``SparseMultilabelLabels`` object.
+        """
+        labels = csr_matrix(labels, copy=True)
+        labels.eliminate_zeros()
+        labels.sum_duplicates()
+        return cls(labels.indices, labels.indptr, labels.shape[1])
+
+    @property
+    def example_idx(self) -> np.ndarray:
+        """Array of shape ``(L,)`` with the index of the example of each class annotation."""
+        return np.repeat(np.arange(len(self)), self.num_labels_per_example)
+
+    @property
+    def num_labels_per_example(self) -> np.ndarray:
+        """Array of shape ``(N,)`` with the number of classes each example belongs to."""
+        return np.diff(self.indptr)
+
+    @property
+    def class_counts(self) -> np.ndarray:
+        """Array of shape ``(K,)`` with the number of examples that belong to each class."""
+        return np.bincount(self.indices, minlength=self.shape[1])
+
+    def select(self, examples: np.ndarray) -> "SparseMultilabelLabels":
+        """Returns the labels of the examples selected by `examples`, a boolean mask of shape ``(N,)`` or an array of example indices,
+        as a new ``SparseMultilabelLabels`` object."""
+        examples = np.arange(len(self))[examples]
+        num_labels = self.num_labels_per_example[examples]
+        indptr = np.zeros(len(examples) + 1, dtype=np.int64)
+        np.cumsum(num_labels, out=indptr[1:])
+        positions = np.repeat(self.indptr[examples] - indptr[:-1], num_labels) + np.arange(
+            indptr[-1]
+        )
+        return type(self)(self.indices[positions], indptr, self.shape[1])
+
+    def to_lists(self) -> List[List[int]]:
+        """Returns the labels in the ``List[List[int]]`` format."""
+        return [indices.tolist() for indices in np.split(self.indices, self.indptr[1:-1])]
+
+    def to_onehot(self, dtype=int) -> np.ndarray:
+        """Returns the 2D array of shape ``(N, K)`` of binarized labels, like `int2onehot`."""
+        onehot_matrix = np.zeros(self.shape, dtype=dtype)
+        onehot_matrix[self.example_idx, self.indices] = 1
+        return onehot_matrix
+
+    def to_one_vs_rest(self, dtype=bool) -> np.ndarray:
+        """Returns the C-contiguous 2D array of shape ``(K, N)`` whose row ``k`` contains the binary labels of the one-vs-rest problem of class ``k``,
+        i.e. the transpose of :py:meth:`to_onehot`."""
+        labels = np.zeros(self.shape[::-1], dtype=dtype)
+        labels[self.indices, self.example_idx] = 1
+        return labels
+
+    def to_csr(self):
+        """Returns the labels as a boolean ``scipy.sparse.csr_matrix`` of shape ``(N, K)``, e.g. to save them with ``scipy.sparse.save_npz``."""
+        data = np.ones(len(self.indices), dtype=bool)
+        return csr_matrix((data, self.indices, self.indptr), shape=self.shape)
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    @property
+    def nnz(self) -> int:
+        """Total number of class annotations in the dataset."""
+        return len(self.indices)
+
+
+def as_sparse_multilabel_labels(
+    labels: Any, pred_probs: Optional[np.ndarray] = None
+) -> SparseMultilabelLabels:
+    """Returns `labels` as a ``SparseMultilabelLabels`` object,
+    converting it from the ``List[List[int]]`` format, or from a ``scipy.sparse`` matrix if needed.
+    If `pred_probs` is provided, the labels have as many classes as it has columns.
+    """
+    if not isinstance(labels, SparseMultilabelLabels):
+        if issparse(labels):
+            labels = SparseMultilabelLabels.from_csr(labels)
+        else:
+            num_classes = None if pred_probs is None else pred_probs.shape[1]
+            labels = SparseMultilabelLabels.from_lists(labels, num_classes=num_classes)
+    if pred_probs is None or pred_probs.shape == labels.shape:
+        return labels
+    if len(pred_probs) != len(labels):
+        raise ValueError("pred_probs and labels must have same length.")
+    if pred_probs.shape[1] < labels.shape[1]:
+        raise ValueError(
+            f"pred_probs must have at least {labels.shape[1]} columns, based on the number of classes in labels."
+        )
+    return SparseMultilabelLabels(labels.indices, labels.indptr, pred_probs.shape[1])
+
+
+# One-vs-rest engine
+#
+# The functions below treat the K one-vs-rest binary problems of a multi-label dataset as a single computation,
+# with the binary labels and predicted probabilities of class ``k`` stored in row ``k`` of ``(K, N)`` arrays.
+# For each class, entry 0 of the binary problem is "does not belong to class k" and entry 1 is "belongs to class k",
+# like in the two columns returned by `stack_complement`.
+
+
+def get_one_vs_rest_confident_thresholds(
+    y_one: Union[np.ndarray, SparseMultilabelLabels], pred_probs: np.ndarray
+) -> np.ndarray:
+    """Returns the confident thresholds of the one-vs-rest problem of every class.
+
+    Parameters
+    ----------
+    y_one:
+        A 2D array of shape ``(N, K)`` with the binarized labels, as returned by `get_onehot_num_classes`,
+        or a `SparseMultilabelLabels` object.
+
+    pred_probs:
+        A 2D array of shape ``(N, K)`` with the predicted probabilities of each class.
+
+    Returns
+    -------
+    confident_thresholds:
+        An array of shape ``(K, 2)`` where row ``k`` contains the thresholds
+        that `~cleanlab.count.get_confident_thresholds` returns for the binary problem of class ``k``.
+    """
+    labels, probs = _as_one_vs_rest(y_one, pred_probs)
+    return _get_one_vs_rest_confident_thresholds(labels, probs)
+
+
+def compute_one_vs_rest_confident_joint(
+    y_one: Union[np.ndarray, SparseMultilabelLabels],
+    pred_probs: np.ndarray,
+    *,
+    thresholds: Optional[Union[np.ndarray, list]] = None,
+    calibrate: bool = True,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Computes the one-vs-rest confident joint of every class at once.
+
+    Parameters
+    ----------
+    y_one:
+        A 2D array of shape ``(N, K)`` with the binarized labels, as returned by `get_onehot_num_classes`,
+        or a `SparseMultilabelLabels` object.
+
+    pred_probs:
+        A 2D array of shape ``(N, K)`` with the predicted probabilities of each class.
+
+    thresholds:
+        Optional confident thresholds that can be broadcast to shape ``(K, 2)``.
+        If not provided, they are computed with `get_one_vs_rest_confident_thresholds`.
+
+    calibrate:
+        Whether to calibrate the confident joint of each class, see `calibrate_one_vs_rest_confident_joint`.
+
+    Returns
+    -------
+    confident_joint:
+        An array of shape ``(K, 2, 2)`` with the confident joint of each class,
+        in the format returned by `~cleanlab.count.compute_confident_joint` with ``multi_label=True``.
+
+    off_diagonal_mask:
+        A boolean array of shape ``(N, K)`` which is True for the examples counted in the off-diagonal of the confident joint of each class.
+    """
+    labels, probs = _as_one_vs_rest(y_one, pred_probs)
+    confident_joint, off_diagonal_mask = _compute_one_vs_rest_confident_joint(
+        labels, probs, thresholds=thresholds, calibrate=calibrate
+    )
+    return confident_joint, off_diagonal_mask.T
+
+
+def calibrate_one_vs_rest_confident_joint(
+    confident_joint: np.ndarray, y_one: Union[np.ndarray, SparseMultilabelLabels]
+) -> np.ndarray:
+    """Calibrates the one-vs-rest confident joint of every class at once,
+    such that the counts of each class sum to the number of examples and the rows match the given labels.
+
+    Parameters
+    ----------
+    confident_joint:
+        An array of shape ``(K, 2, 2)`` with the one-vs-rest confident joint of each class.
+
+    y_one:
+        A 2D array of shape ``(N, K)`` with the binarized labels, as returned by `get_onehot_num_classes`,
+        or a `SparseMultilabelLabels` object.
+
+    Returns
+    -------
+    calibrated_cj:
+        An integer array of shape ``(K, 2, 2)``, the same as `~cleanlab.count.calibrate_confident_joint` returns for each class.
+    """
+    if isinstance(y_one, SparseMultilabelLabels):
+        num_positive = y_one.class_counts
+    else:
+        num_positive = np.count_nonzero(y_one, axis=0)
+    label_counts = np.column_stack((len(y_one) - num_positive, num_positive))
+    return _calibrate_one_vs_rest_confident_joint(confident_joint, label_counts)
+
+
+def find_one_vs_rest_label_issues(
+    y_one: Union[np.ndarray, SparseMultilabelLabels],
+    pred_probs: np.ndarray,
+    *,
+    filter_by: str = "prune_by_noise_rate",
+    frac_noise: float = 1.0,
+    num_to_remove_per_class: Optional[List[int]] = None,
+    min_examples_per_class: int = 1,
+    confident_joint: Optional[np.ndarray] = None,
+    n_jobs: Optional[int] = None,
+) -> np.ndarray:
+    """Finds the label issues of every class in a multi-label dataset, treating the K one-vs-rest problems as one computation.
+
+    Gives the same results as calling `~cleanlab.filter.find_label_issues` on the one-vs-rest problem of each class,
+    but the confident thresholds, confident joints and prune counts of all classes are computed together,
+    and only the sorting needed to prune each class is done separately, in a single pool of `n_jobs` threads.
+
+    Parameters
+    ----------
+    y_one:
+        A 2D array of shape ``(N, K)`` with the binarized labels, as returned by `get_onehot_num_classes`,
+        or a `SparseMultilabelLabels` object.
+
+    pred_probs:
+        A 2D array of shape ``(N, K)`` with the predicted probabilities of each class.
+
+    filter_by, frac_noise, min_examples_per_class:
+        Refer to documentation for these arguments in :py:func:`filter.find_label_issues <cleanlab.filter.find_label_issues>`.
+
+    num_to_remove_per_class:
+        Optional list of length K with the number of examples to flag in the one-vs-rest problem of each class.
+
+    confident_joint:
+        Optional array of shape ``(K, 2, 2)`` with the one-vs-rest confident joint of each class.
+        If not provided, it is computed from `y_one` and `pred_probs`.
+
+    n_jobs:
+        Number of threads used to prune the classes. Defaults to the number of physical cores if psutil is installed,
+        or the number of logical cores otherwise.
+
+    Returns
+    -------
+    label_issues:
+        A boolean array of shape ``(N, K)`` which is True where class ``k`` appears incorrectly annotated for example ``i``.
+    """
+    assert filter_by in [
+        "low_normalized_margin",
+        "low_self_confidence",
+        "prune_by_noise_rate",
+        "prune_by_class",
+        "both",
+        "confident_learning",
+        "predicted_neq_given",
+    ]
+    labels, probs = _as_one_vs_rest(y_one, pred_probs)
+    num_classes, num_examples = labels.shape
+    if (np.min(probs, initial=0) < 0 - FLOATING_POINT_COMPARISON) or (
+        np.max(probs, initial=0) > 1 + FLOATING_POINT_COMPARISON
+    ):
+        raise ValueError("Values in pred_probs must be between 0 and 1.")
+    from cleanlab.filter import _calibrate_prune_counts, _keep_at_least_n_per_class
+
+    num_positive = np.count_nonzero(labels, axis=1)
+    label_counts = np.column_stack((num_examples - num_positive, num_positive))
+    if np.any(label_counts[:, 0] == 0):
+        # the one-vs-rest problem of a class that every example belongs to only has one class
+        raise ValueError("Labels must contain at least 2 classes.")
+
+    if filter_by in [
+        "confident_learning",
+        "predicted_neq_given",
+        "low_normalized_margin",
+        "low_self_confidence",
+    ]:
+        if frac_noise != 1.0 or num_to_remove_per_class is not None:
+            warnings.warn(
+                "frac_noise and num_to_remove_per_class parameters are only supported"
+                " for filter_by 'prune_by_noise_rate', 'prune_by_class', and 'both'. They "
+                "are not supported for methods 'confident_learning', 'predicted_neq_given', "
+                "'low_normalized_margin' or 'low_self_confidence'."
+            )
+        if num_to_remove_per_class is not None:
+            raise ValueError(
+                "filter_by 'confident_learning', 'predicted_neq_given', 'low_normalized_margin' "
+                "or 'low_self_confidence' is not supported (yet) when setting 'num_to_remove_per_class'"
+            )
+    if filter_by == "confident_learning" and isinstance(confident_joint, np.ndarray):
+        warnings.warn(
+            "The supplied `confident_joint` is ignored when `filter_by = 'confident_learning'`; confident joint will be "
+            "re-estimated from the given labels. To use your supplied `confident_joint`, please specify a different "
+            "`filter_by` value."
+        )
+
+    if filter_by == "predicted_neq_given":
+        label_issues = (probs > 1 - probs) != labels
+    elif filter_by in ["confident_learning", "low_normalized_margin", "low_self_confidence"]:
+        _, label_issues = _compute_one_vs_rest_confident_joint(labels, probs, calibrate=False)
+        if filter_by != "confident_learning":
+            num_errors = np.count_nonzero(
+                label_issues & ~_predicts_given_label(labels, probs), axis=1
+            )
+            scores = _get_one_vs_rest_self_confidence(labels, probs)
+            if filter_by == "low_normalized_margin":
+                scores = (scores - np.where(labels, 1 - probs, probs) + 1) / 2
+            with _get_executor(n_jobs, num_classes) as executor:
+                order = list(executor.map(np.argsort, scores))
+            label_issues = np.zeros(labels.shape, dtype=bool)
+            for k in range(num_classes):
+                label_issues[k, order[k][: num_errors[k]]] = True
+            return label_issues.T
+    else:
+        if confident_joint is None:
+            confident_joint, _ = _compute_one_vs_rest_confident_joint(labels, probs)
+        prune_count_matrix = _keep_at_least_n_per_class(
+            np.swapaxes(confident_joint, 1, 2), n=min_examples_per_class, frac_noise=frac_noise
+        )
+        if num_to_remove_per_class is not None:
+            # class k removes [num_to_remove_per_class[k], 0] examples of each binary label
+            num_to_remove = np.zeros(label_counts.shape)
+            num_to_remove[:, 0] = num_to_remove_per_class
+            prune_count_matrix = _calibrate_prune_counts(
+                prune_count_matrix, label_counts, num_to_remove
+            )
+        with _get_executor(n_jobs, num_classes) as executor:
+            label_issues = np.array(
+                list(
+                    executor.map(
+                        lambda k: _prune_one_vs_rest(
+                            labels[k],
+                            probs[k],
+                            prune_count_matrix[k],
+                            filter_by=filter_by,
+                            min_examples_per_class=min_examples_per_class,
+                        ),
+                        range(num_classes),
+                    )
+                ),
+                dtype=bool,
+            ).reshape(labels.shape)
+
+    # Remove label issues if model prediction is close to given label
+    label_issues &= ~_predicts_given_label(labels, probs)
+    return label_issues.T
+
+
+def _as_one_vs_rest(
+    y_one: Union[np.ndarray, SparseMultilabelLabels], pred_probs: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the binary labels and predicted probabilities of shape ``(N, K)`` as C-contiguous ``(K, N)`` arrays,
+    so the one-vs-rest problem of each class is a contiguous row.
+    Boolean labels that are already stored in this layout (e.g. ``labels.to_one_vs_rest().T``) are not copied.
+    """
+    if isinstance(y_one, SparseMultilabelLabels):
+        labels = y_one.to_one_vs_rest()
+    else:
+        labels = np.asarray(np.asarray(y_one).T, dtype=bool, order="C")
+    probs = np.ascontiguousarray(np.asarray(pred_probs).T)
+    if labels.shape != probs.shape:
+        raise ValueError("Labels and predicted probabilities must have the same shape.")
+    return labels, probs
+
+
+def _get_one_vs_rest_confident_thresholds(labels: np.ndarray, probs: np.ndarray) -> np.ndarray:
+    """Returns the ``(K, 2)`` confident thresholds for ``(K, N)`` labels and predicted probabilities.
+    Like in `~cleanlab.count.get_confident_thresholds`, the threshold of a missing class is 2 so that no example is confidently counted in it.
+    """
+    num_positive = np.count_nonzero(labels, axis=1)
+    label_counts = np.column_stack((labels.shape[1] - num_positive, num_positive))
+    class_sums = np.column_stack(
+        (
+            np.sum(np.where(labels, 0, 1 - probs), axis=1),
+            np.sum(np.where(labels, probs, 0), axis=1),
+        )
+    )
+    confident_thresholds = np.full(label_counts.shape, 2.0)
+    np.divide(class_sums, label_counts, out=confident_thresholds, where=label_counts > 0)
+    return np.clip(confident_thresholds, a_min=CONFIDENT_THRESHOLDS_LOWER_BOUND, a_max=None)
+
+
+def _compute_one_vs_rest_confident_joint(
+    labels: np.ndarray,
+    probs: np.ndarray,
+    *,
+    thresholds: Optional[Union[np.ndarray, list]] = None,
+    calibrate: bool = True,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the ``(K, 2, 2)`` confident joint and the ``(K, N)`` off-diagonal mask for ``(K, N)`` labels and predicted probabilities."""
+    num_classes, num_examples = labels.shape
+    if thresholds is None:
+        thresholds = _get_one_vs_rest_confident_thresholds(labels, probs)
+    thresholds = np.broadcast_to(np.asarray(thresholds), (num_classes, 2))
+
+    confident_negative = 1 - probs >= thresholds[:, [0]] - FLOATING_POINT_COMPARISON
+    confident_positive = probs >= thresholds[:, [1]] - FLOATING_POINT_COMPARISON
+    confident = confident_negative | confident_positive
+    # When both labels are confident, choose the one with the largest probability
+    true_label_guess = np.where(
+        confident_negative & confident_positive, probs > 1 - probs, confident_positive
+    )
+
+    # Count into (guess, given label) bins, the transpose of the confident joint,
+    # like the confusion matrix that `~cleanlab.count.compute_confident_joint` transposes
+    confident_joint_t = np.empty((num_classes, 2, 2), dtype=np.int64)
+    for given_label in (0, 1):
+        given_confident = confident & (labels == given_label)
+        num_guessed_positive = np.count_nonzero(given_confident & true_label_guess, axis=1)
+        confident_joint_t[:, 1, given_label] = num_guessed_positive
+        confident_joint_t[:, 0, given_label] = (
+            np.count_nonzero(given_confident, axis=1) - num_guessed_positive
+        )
+    # Guarantee at least one correctly labeled example is represented in every class
+    confident_joint_t[:, [0, 1], [0, 1]] = np.maximum(confident_joint_t[:, [0, 1], [0, 1]], 1)
+    confident_joint = np.swapaxes(confident_joint_t, 1, 2)
+    if calibrate:
+        num_positive = np.count_nonzero(labels, axis=1)
+        label_counts = np.column_stack((num_examples - num_positive, num_positive))
+        confident_joint = _calibrate_one_vs_rest_confident_joint(confident_joint, label_counts)
+    else:
+        confident_joint = np.ascontiguousarray(confident_joint)
+    return confident_joint, confident & (true_label_guess != labels)
+
+
+def _calibrate_one_vs_rest_confident_joint(
+    confident_joint: np.ndarray, label_counts: np.ndarray
+) -> np.ndarray:
+    """Calibrates a ``(K, 2, 2)`` confident joint given the ``(K, 2)`` counts of each binary label,
+    with the same kernel as `~cleanlab.count.calibrate_confident_joint`."""
+    from cleanlab.count import _calibrate_confident_joint_counts
+
+    return _calibrate_confident_joint_counts(confident_joint, label_counts)
+
+
+def _prune_one_vs_rest(
+    labels: np.ndarray,
+    probs: np.ndarray,
+    prune_count_matrix: np.ndarray,
+    *,
+    filter_by: str,
+    min_examples_per_class: int,
+) -> np.ndarray:
+    """Flags the label issues of the one-vs-rest problem of a single class
+    with `~cleanlab.filter._prune_by_class` and `~cleanlab.filter._prune_by_count`,
+    like `~cleanlab.filter.find_label_issues` does for a binary problem.
+    """
+    from cleanlab.filter import _prune_by_class, _prune_by_count
+
+    label_issues_by_class = np.zeros(len(labels), dtype=bool)
+    label_issues_by_count = np.zeros(len(labels), dtype=bool)
+    for label in (0, 1):
+        members = labels == label
+        args = [
+            label,
+            min_examples_per_class,
+            [stack_complement(probs[members]), prune_count_matrix[:, label]],
+        ]
+        if filter_by in ["prune_by_class", "both"]:
+            mask = _prune_by_class(args)
+            if len(mask) > 1:
+                label_issues_by_class[members] = mask
+        if filter_by in ["prune_by_noise_rate", "both"]:
+            mask = _prune_by_count(args)
+            if len(mask) > 1:
+                label_issues_by_count[members] = mask
+    if filter_by == "prune_by_class":
+        return label_issues_by_class
+    if filter_by == "prune_by_noise_rate":
+        return label_issues_by_count
+    return label_issues_by_class & label_issues_by_count
+
+
+def _get_one_vs_rest_self_confidence(labels: np.ndarray, probs: np.ndarray) -> np.ndarray:
+    """Returns the predicted probability of the given binary label in each one-vs-rest problem."""
+    return np.where(labels, probs, 1 - probs)
+
+
+def _predicts_given_label(labels: np.ndarray, probs: np.ndarray) -> np.ndarray:
+    """Returns True where the prediction matches the given binary label, or is within a margin around 0.5,
+    by applying `~cleanlab.count._reduce_issues` to the one-vs-rest problem of each class."""
+    from cleanlab.count import _reduce_issues
+
+    predicts_given_label = np.zeros(labels.shape, dtype=bool)
+    for k in range(len(labels)):
+        predicts_given_label[k] = _reduce_issues(stack_complement(probs[k]), labels[k].astype(int))
+    return predicts_given_label
+
+
+def _get_executor(n_jobs: Optional[int], num_tasks: int) -> ThreadPoolExecutor:
+    """Returns the pool of threads shared by the per-class work of the one-vs-rest engine."""
+    return ThreadPoolExecutor(max_workers=max(1, min(get_num_jobs(n_jobs), num_tasks)))
@@ -63,7 +63,7 @@ def assert_valid_aggregation_weights(aggregation_weights: Dict[str, Any]) -> Non
 
 
 def assert_valid_inputs(
-    labels: List[Dict[str, Any]],
+    labels,
     predictions,
     method: Optional[str] = None,
     threshold: Optional[float] = None,
@@ -17,10 +17,13 @@
 """
 Helper functions used internally for segmentation tasks.
 """
+import platform
 from typing import Optional, List
 
 import numpy as np
 
+from cleanlab.internal.util import get_num_jobs
+
 
 def _get_valid_optional_params(
     batch_size: Optional[int] = None,
@@ -35,6 +38,15 @@ def _get_valid_optional_params(
     return batch_size, n_jobs
 
 
+def _get_n_jobs(n_jobs: Optional[int] = None) -> int:
+    """Returns the number of processes to use for multiprocessing, which is always 1 on platforms other than Linux.
+    If `n_jobs` is None, uses the number of physical cores if psutil is installed, or logical cores otherwise.
+    """
+    if platform.system() != "Linux":
+        return 1
+    return get_num_jobs(n_jobs)
+
+
 def _get_summary_optional_params(
     class_names: Optional[List[str]] = None,
     exclude: Optional[List[int]] = None,
@@ -19,11 +19,13 @@ Helper methods used internally in cleanlab.token_classification
 """
 from __future__ import annotations
 
+import itertools
 import re
 import string
 import numpy as np
+import pandas as pd
 from termcolor import colored
-from typing import List, Optional, Callable, Tuple, TypeVar, TYPE_CHECKING
+from typing import List, Optional, Callable, Tuple, TypeVar, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
     import numpy.typing as npt
@@ -225,6 +227,234 @@ def merge_probs(
     return probs_merged
 
 
+def get_sentence_offsets(lengths: npt.ArrayLike) -> np.ndarray:
+    """
+    Returns the offsets where the tokens of each sentence start in a flat array of tokens
+
+    Parameters
+    ----------
+    lengths:
+        Array of shape ``(N,)`` with the number of tokens in each of the N sentences.
+
+    Returns
+    ---------
+    offsets:
+        Array of shape ``(N+1,)``, such that the tokens of the `i`-th sentence are ``offsets[i]:offsets[i+1]``.
+
+    Examples
+    --------
+    >>> from cleanlab.internal.token_classification_utils import get_sentence_offsets
+    >>> get_sentence_offsets([3, 2])
+    array([0, 3, 5])
+    """
+    lengths = np.asarray(lengths, dtype=np.int64)
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+def flatten_token_inputs(
+    labels: Union[list, np.ndarray], pred_probs: Union[list, np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Converts the nested per-sentence `labels` and `pred_probs` of a token classification dataset
+    to flat arrays over all tokens, along with the offsets where the tokens of each sentence start.
+
+    Parameters
+    ----------
+    labels:
+        Nested list of given labels for all tokens, such that `labels[i]` is a list of labels, one for each token in the `i`-th sentence.
+
+    pred_probs:
+        List of np arrays, such that `pred_probs[i]` has shape ``(T, K)`` if the `i`-th sentence contains T tokens.
+
+    Returns
+    ---------
+    labels_flat:
+        Array of shape ``(L,)`` with the labels of all L tokens in the dataset.
+
+    pred_probs_flat:
+        Array of shape ``(L, K)`` with the predicted probabilities of all tokens in the dataset.
+
+    offsets:
+        Array of shape ``(N+1,)``, such that the tokens of the `i`-th sentence are ``offsets[i]:offsets[i+1]``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from cleanlab.internal.token_classification_utils import flatten_token_inputs
+    >>> labels = [[0, 0, 1], [0, 1]]
+    >>> pred_probs = [
+    ...     np.array([[0.9, 0.1], [0.7, 0.3], [0.05, 0.95]]),
+    ...     np.array([[0.8, 0.2], [0.8, 0.2]]),
+    ... ]
+    >>> labels_flat, pred_probs_flat, offsets = flatten_token_inputs(labels, pred_probs)
+    >>> labels_flat
+    array([0, 0, 1, 0, 1])
+    >>> offsets
+    array([0, 3, 5])
+    """
+    offsets = get_sentence_offsets([len(label) for label in labels])
+    labels_flat = np.fromiter(
+        itertools.chain.from_iterable(labels), dtype=np.int64, count=offsets[-1]
+    )
+    pred_probs_nonempty = [pred_prob for pred_prob in pred_probs if len(pred_prob) > 0]
+    if pred_probs_nonempty:
+        pred_probs_flat = np.concatenate(pred_probs_nonempty)
+    else:
+        pred_probs_flat = np.empty((0, 0))
+    return labels_flat, pred_probs_flat, offsets
+
+
+def _flatten_token_scores(token_scores: Union[list, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Concatenates per-sentence token scores (lists, arrays or ``pd.Series``) into a flat array,
+    and returns it along with the offsets where the scores of each sentence start.
+    """
+    # Unwrap pd.Series first, since numpy probes their attributes slowly when concatenating
+    token_scores = [getattr(scores, "values", scores) for scores in token_scores]
+    offsets = get_sentence_offsets([len(scores) for scores in token_scores])
+    flat_scores = np.concatenate(token_scores) if token_scores else np.empty(0)
+    return flat_scores, offsets
+
+
+TOKEN_ISSUE_DTYPE = np.dtype([("sentence", np.int64), ("token", np.int64)])
+
+
+def unflatten_token_indices(
+    flat_indices: npt.ArrayLike, offsets: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Converts indices into a flat array of tokens to ``(sentence, token)`` coordinates
+
+    Parameters
+    ----------
+    flat_indices:
+        Array of indices into the flat array of all tokens in the dataset.
+
+    offsets:
+        Array of shape ``(N+1,)``, such that the tokens of the `i`-th sentence are ``offsets[i]:offsets[i+1]``.
+
+    Returns
+    ---------
+    sentence_indices, token_indices:
+        Arrays with the index of the sentence of each token, and its index within that sentence.
+
+    Examples
+    --------
+    >>> from cleanlab.internal.token_classification_utils import unflatten_token_indices
+    >>> unflatten_token_indices([4, 0, 2], offsets=[0, 3, 3, 5])
+    (array([2, 0, 0]), array([1, 0, 2]))
+    """
+    flat_indices = np.asarray(flat_indices, dtype=np.int64)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    sentence_indices = np.searchsorted(offsets, flat_indices, side="right") - 1
+    return sentence_indices, flat_indices - offsets[sentence_indices]
+
+
+def flatten_token_indices(
+    sentence_indices: npt.ArrayLike, token_indices: npt.ArrayLike, offsets: np.ndarray
+) -> np.ndarray:
+    """
+    Converts ``(sentence, token)`` coordinates to indices into the flat array of tokens,
+    the inverse of `~cleanlab.internal.token_classification_utils.unflatten_token_indices`
+
+    Examples
+    --------
+    >>> from cleanlab.internal.token_classification_utils import flatten_token_indices
+    >>> flatten_token_indices([2, 0, 0], [1, 0, 2], offsets=[0, 3, 3, 5])
+    array([4, 0, 2])
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    return offsets[np.asarray(sentence_indices, dtype=np.int64)] + np.asarray(
+        token_indices, dtype=np.int64
+    )
+
+
+def _format_token_issues(
+    sentence_indices: np.ndarray, token_indices: np.ndarray, return_array: bool = False
+) -> Union[List[Tuple[int, int]], np.ndarray]:
+    """
+    Returns the token issues as a list of ``(i, j)`` tuples,
+    or as a structured array with fields ``"sentence"`` and ``"token"`` if `return_array` is True.
+    """
+    if return_array:
+        issues = np.empty(len(sentence_indices), dtype=TOKEN_ISSUE_DTYPE)
+        issues["sentence"] = sentence_indices
+        issues["token"] = token_indices
+        return issues
+    return list(zip(sentence_indices.tolist(), token_indices.tolist()))
+
+
+class TokenIndex:
+    """
+    Index of the tokens (strings/words) in a token classification dataset, which maps each distinct token to an integer id once
+    (by hashing), so that label issues can be summarized per token with vectorized operations.
+
+    Build it once and pass it as the `tokens` argument of :py:func:`token_classification.summary.common_label_issues <cleanlab.token_classification.summary.common_label_issues>`
+    or :py:func:`token_classification.summary.filter_by_token <cleanlab.token_classification.summary.filter_by_token>`
+    to reuse it across calls.
+
+    Parameters
+    ----------
+    tokens:
+        Nested list such that `tokens[i]` is a list of tokens (strings/words) that comprise the `i`-th sentence.
+
+    Examples
+    --------
+    >>> from cleanlab.internal.token_classification_utils import TokenIndex
+    >>> token_index = TokenIndex([["A", "?weird", "sentence"], ["A", "valid", "sentence"]])
+    >>> token_index.vocabulary
+    array(['A', '?weird', 'sentence', 'valid'], dtype=object)
+    >>> token_index.get_token_ids([1, 0], [2, 1])
+    array([2, 1])
+    """
+
+    def __init__(self, tokens: List[List[str]]):
+        self.offsets = get_sentence_offsets([len(sentence) for sentence in tokens])
+        flat_tokens = np.empty(self.offsets[-1], dtype=object)
+        flat_tokens[:] = list(itertools.chain.from_iterable(tokens))
+        self.token_ids, self.vocabulary = pd.factorize(flat_tokens)
+        self._lowercase_vocabulary: Optional[np.ndarray] = None
+
+    def get_token_ids(
+        self, sentence_indices: npt.ArrayLike, token_indices: npt.ArrayLike
+    ) -> np.ndarray:
+        """Returns the integer id of the `j`-th token of the `i`-th sentence, for each pair of `sentence_indices` and `token_indices`."""
+        return self.token_ids[flatten_token_indices(sentence_indices, token_indices, self.offsets)]
+
+    def find(self, token: str) -> np.ndarray:
+        """Returns the ids of all distinct tokens that are equal to `token`, ignoring case."""
+        if self._lowercase_vocabulary is None:
+            self._lowercase_vocabulary = np.array(
+                [word.lower() for word in self.vocabulary], dtype=object
+            )
+        return np.flatnonzero(self._lowercase_vocabulary == token.lower())
+
+
+def _get_issue_indices(issues: Union[list, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the sentence and token index of each issue, given as a list of tuples ``(i, j)``
+    or as a structured array with fields ``"sentence"`` and ``"token"``.
+    """
+    if isinstance(issues, np.ndarray) and issues.dtype.names is not None:
+        return issues["sentence"], issues["token"]
+    issues_array = np.array(issues, dtype=np.int64).reshape(-1, 2)
+    return issues_array[:, 0], issues_array[:, 1]
+
+
+def _check_sentence_offsets(offsets: np.ndarray, num_tokens: int) -> np.ndarray:
+    """Checks that `offsets` delimit non-empty sentences in a flat array of `num_tokens` tokens."""
+    offsets = np.asarray(offsets, dtype=np.int64)
+    if offsets.ndim != 1 or len(offsets) < 1 or offsets[0] != 0 or offsets[-1] != num_tokens:
+        raise ValueError(
+            f"offsets must be a 1D array starting at 0 and ending at the number of tokens ({num_tokens})."
+        )
+    if np.any(np.diff(offsets) < 1):
+        raise ValueError("Every sentence must contain at least one token.")
+    return offsets
+
+
 def color_sentence(sentence: str, word: str) -> str:
     """
     Searches for a given token in the sentence and returns the sentence where the given token is colored red
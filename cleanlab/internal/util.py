@@ -18,6 +18,7 @@
 Ancillary helper methods used internally throughout this package; mostly related to Confident Learning algorithms.
 """
 
+import multiprocessing
 import warnings
 from typing import Optional, Tuple, Union
 
@@ -28,6 +29,15 @@ from cleanlab.internal.constants import FLOATING_POINT_COMPARISON, TINY_VALUE
 from cleanlab.internal.validation import labels_to_array
 from cleanlab.typing import DatasetLike, LabelLike
 
+# psutil is a package used to count physical cores for multiprocessing
+# This package is not necessary, because we can always fall back to logical cores as the default
+try:
+    import psutil
+
+    psutil_exists = True
+except ImportError as e:  # pragma: no cover
+    psutil_exists = False
+
 
 def remove_noise_from_class(noise_matrix: np.ndarray, class_without_noise: int) -> np.ndarray:
     """A helper function in the setting of PU learning.
@@ -756,3 +766,20 @@ def force_two_dimensions(X) -> DatasetLike:
     if X is not None and len(X.shape) > 2:
         X = X.reshape((len(X), -1))
     return X
+
+
+def get_num_jobs(n_jobs: Optional[int] = None) -> int:
+    """Returns the number of processes (or threads) to use for parallel computation.
+    If `n_jobs` is None, uses the number of physical cores if psutil is installed, or logical cores otherwise.
+    """
+    if n_jobs is None:
+        if psutil_exists:
+            n_jobs = psutil.cpu_count(logical=False)  # physical cores
+        if not n_jobs:
+            # either psutil does not exist
+            # or psutil can return None when physical cores cannot be determined
+            # switch to logical cores
+            n_jobs = multiprocessing.cpu_count()
+    else:
+        assert n_jobs >= 1
+    return n_jobs
@@ -34,6 +34,8 @@ which can be used to prioritize which examples are most informative to collect a
 This function is effective for settings where some examples have been labeled by one or more annotators and other examples can have no labels at all so far,
 as well as settings where new labels are collected either in batches of examples or one at a time.
 Here is an `example notebook <https://github.com/cleanlab/examples/blob/master/active_learning_multiannotator/active_learning.ipynb>`_ showcasing the use of this ActiveLab method for active learning with data re-labeling.
+When new labels are collected in many small rounds without retraining the classifier in between,
+`~cleanlab.multiannotator.MultiannotatorState` keeps these scores up to date by only updating the examples that received new labels.
 
 The algorithms to compute these active learning scores are described in `the ActiveLab paper <https://arxiv.org/abs/2301.11856>`_.
 
@@ -41,26 +43,36 @@ Each of the main functions in this module utilizes any trained classifier model.
 Variants of these functions are provided for settings where you have trained an ensemble of multiple models.
 """
 
-import warnings
-from typing import Any, Dict, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 import numpy as np
 import pandas as pd
+from scipy.sparse import issparse
 
-from cleanlab.internal.constants import CLIPPING_LOWER_BOUND
+from cleanlab.internal.constants import ACTIVE_LEARNING_BLOCK_SIZE, CLIPPING_LOWER_BOUND
 from cleanlab.internal.multiannotator_utils import (
+    SparseMultiannotatorLabels,
+    as_sparse_multiannotator_labels,
     assert_valid_inputs_multiannotator,
     assert_valid_pred_probs,
+    break_majority_vote_ties,
+    break_ties_by_agreement,
+    break_ties_randomly,
     check_consensus_label_classes,
     find_best_temp_scaler,
+    get_annotator_agreement,
+    get_label_counts,
+    impute_missing_agreement,
+    select_best_candidates,
     temp_scale_pred_probs,
 )
-from cleanlab.internal.util import get_num_classes, value_counts
+from cleanlab.internal.util import get_num_classes, get_num_jobs
 from cleanlab.rank import get_label_quality_scores
 
 
 def get_label_quality_multiannotator(
-    labels_multiannotator: Union[pd.DataFrame, np.ndarray],
+    labels_multiannotator: Union[pd.DataFrame, np.ndarray, SparseMultiannotatorLabels],
     pred_probs: np.ndarray,
     *,
     consensus_method: Union[str, List[str]] = "best_quality",
@@ -87,7 +99,7 @@ def get_label_quality_multiannotator(
 
     Parameters
     ----------
-    labels_multiannotator : pd.DataFrame or np.ndarray
+    labels_multiannotator : pd.DataFrame, np.ndarray or SparseMultiannotatorLabels
         2D pandas DataFrame or array of multiple given labels for each example with shape ``(N, M)``,
         where N is the number of examples and M is the number of annotators.
         ``labels_multiannotator[n][m]`` = label for n-th example given by m-th annotator.
@@ -95,6 +107,12 @@ def get_label_quality_multiannotator(
         For a dataset with K classes, each given label must be an integer in 0, 1, ..., K-1 or ``NaN`` if this annotator did not label a particular example.
         If you have string or other differently formatted labels, you can convert them to the proper format using :py:func:`format_multiannotator_labels <cleanlab.internal.multiannotator_utils.format_multiannotator_labels>`.
         If pd.DataFrame, column names should correspond to each annotator's ID.
+
+        When each annotator only labels a small fraction of the examples, the labels can instead be provided in sparse format, either as a
+        :py:class:`SparseMultiannotatorLabels <cleanlab.internal.multiannotator_utils.SparseMultiannotatorLabels>` object
+        (e.g. from a long format dataset via `~cleanlab.multiannotator.convert_long_to_sparse_dataset`)
+        or as a ``scipy.sparse`` matrix of shape ``(N, M)`` where every stored entry is a given label (labels of class 0 must be stored as explicit zeros).
+        The dense ``(N, M)`` array is then never created, and ``detailed_label_quality`` is returned in long format.
     pred_probs : np.ndarray
         An array of shape ``(N, K)`` of predicted class probabilities from a trained classifier model.
         Predicted probabilities in the same format expected by the :py:func:`get_label_quality_scores <cleanlab.rank.get_label_quality_scores>`.
@@ -148,6 +166,8 @@ def get_label_quality_multiannotator(
             Only returned if `return_detailed_quality=True`.
             Returns a pandas DataFrame with columns `quality_annotator_1`, `quality_annotator_2`, ..., `quality_annotator_M` where each entry is
             the label quality score for the labels provided by each annotator (is ``NaN`` for examples which this annotator did not label).
+            If `labels_multiannotator` is provided in sparse format, the DataFrame is in long format instead, with columns
+            `task`, `annotator` and `quality` and one row per given label.
 
         ``annotator_stats`` : pandas.DataFrame
             Only returned if `return_annotator_stats=True`.
@@ -180,8 +200,17 @@ def get_label_quality_multiannotator(
     elif isinstance(labels_multiannotator, np.ndarray):
         annotator_ids = None
         index_col = None
+    elif isinstance(labels_multiannotator, SparseMultiannotatorLabels) or issparse(
+        labels_multiannotator
+    ):
+        labels_multiannotator = as_sparse_multiannotator_labels(labels_multiannotator)
+        annotator_ids = labels_multiannotator.annotator_ids
+        index_col = labels_multiannotator.example_ids
     else:
-        raise ValueError("labels_multiannotator must be either a NumPy array or Pandas DataFrame.")
+        raise ValueError(
+            "labels_multiannotator must be either a NumPy array, Pandas DataFrame, "
+            "scipy sparse matrix or SparseMultiannotatorLabels."
+        )
 
     if return_weights == True and quality_method != "crowdlab":
         raise ValueError(
@@ -189,12 +218,14 @@ def get_label_quality_multiannotator(
             "Either set return_weights=False or quality_method='crowdlab'."
         )
 
-    assert_valid_inputs_multiannotator(
+    # only store the given labels, the rest of the computation does not need the dense (N, M) array
+    return_dense = isinstance(labels_multiannotator, np.ndarray)
+    labels_multiannotator = assert_valid_inputs_multiannotator(
         labels_multiannotator, pred_probs, annotator_ids=annotator_ids
     )
 
     # Count number of non-NaN values for each example
-    num_annotations = np.sum(~np.isnan(labels_multiannotator), axis=1)
+    num_annotations = labels_multiannotator.num_annotations
 
     # calibrate pred_probs
     if calibrate_probs:
@@ -241,16 +272,7 @@ def get_label_quality_multiannotator(
             annotator_weight = MV_annotator_weight
 
         elif curr_method == "best_quality":
-            consensus_label = np.full(len(majority_vote_label), np.nan)
-            for i in range(len(consensus_label)):
-                max_pred_probs_ind = np.where(
-                    MV_post_pred_probs[i] == np.max(MV_post_pred_probs[i])
-                )[0]
-                if len(max_pred_probs_ind) == 1:
-                    consensus_label[i] = max_pred_probs_ind[0]
-                else:
-                    consensus_label[i] = majority_vote_label[i]
-            consensus_label = consensus_label.astype(int)  # convert all label types to int
+            consensus_label = _get_best_quality_label(MV_post_pred_probs, majority_vote_label)
 
             (
                 annotator_agreement,
@@ -310,16 +332,18 @@ def get_label_quality_multiannotator(
 
             if return_detailed_quality:
                 # Compute the label quality scores for each annotators' labels
-                detailed_label_quality = np.apply_along_axis(
-                    _get_annotator_label_quality_score,
-                    axis=0,
-                    arr=labels_multiannotator,
+                detailed_label_quality = _get_detailed_label_quality(
+                    labels_multiannotator=labels_multiannotator,
                     pred_probs=post_pred_probs,
                     label_quality_score_kwargs=label_quality_score_kwargs,
                 )
-                detailed_label_quality_df = pd.DataFrame(
-                    detailed_label_quality, index=index_col, columns=annotator_ids
-                ).add_prefix("quality_annotator_")
+                detailed_label_quality_df = _get_detailed_label_quality_df(
+                    labels_multiannotator,
+                    detailed_label_quality,
+                    return_dense=return_dense,
+                    index=index_col,
+                    columns=annotator_ids,
+                )
 
             if return_annotator_stats:
                 annotator_stats = _get_annotator_stats(
@@ -365,7 +389,7 @@ def get_label_quality_multiannotator(
 
 
 def get_label_quality_multiannotator_ensemble(
-    labels_multiannotator: Union[pd.DataFrame, np.ndarray],
+    labels_multiannotator: Union[pd.DataFrame, np.ndarray, SparseMultiannotatorLabels],
     pred_probs: np.ndarray,
     *,
     calibrate_probs: bool = False,
@@ -382,7 +406,7 @@ def get_label_quality_multiannotator_ensemble(
 
     Parameters
     ----------
-    labels_multiannotator : pd.DataFrame or np.ndarray
+    labels_multiannotator : pd.DataFrame, np.ndarray or SparseMultiannotatorLabels
         Multiannotator labels in the same format expected by `~cleanlab.multiannotator.get_label_quality_multiannotator`.
     pred_probs : np.ndarray
         An array of shape ``(P, N, K)`` where P is the number of models, consisting of predicted class probabilities from the ensemble models.
@@ -437,22 +461,39 @@ def get_label_quality_multiannotator_ensemble(
     elif isinstance(labels_multiannotator, np.ndarray):
         annotator_ids = None
         index_col = None
+    elif isinstance(labels_multiannotator, SparseMultiannotatorLabels) or issparse(
+        labels_multiannotator
+    ):
+        labels_multiannotator = as_sparse_multiannotator_labels(labels_multiannotator)
+        annotator_ids = labels_multiannotator.annotator_ids
+        index_col = labels_multiannotator.example_ids
     else:
-        raise ValueError("labels_multiannotator must be either a NumPy array or Pandas DataFrame.")
+        raise ValueError(
+            "labels_multiannotator must be either a NumPy array, Pandas DataFrame, "
+            "scipy sparse matrix or SparseMultiannotatorLabels."
+        )
 
-    assert_valid_inputs_multiannotator(
+    # only store the given labels, the rest of the computation does not need the dense (N, M) array
+    return_dense = isinstance(labels_multiannotator, np.ndarray)
+    labels_multiannotator = assert_valid_inputs_multiannotator(
         labels_multiannotator, pred_probs, ensemble=True, annotator_ids=annotator_ids
     )
 
     # Count number of non-NaN values for each example
-    num_annotations = np.sum(~np.isnan(labels_multiannotator), axis=1)
+    num_annotations = labels_multiannotator.num_annotations
 
     # temp scale pred_probs
     if calibrate_probs:
-        for i in range(len(pred_probs)):
-            curr_pred_probs = pred_probs[i]
-            optimal_temp = find_best_temp_scaler(labels_multiannotator, curr_pred_probs)
-            pred_probs[i] = temp_scale_pred_probs(curr_pred_probs, optimal_temp)
+        # scaled copies, so the given pred_probs are not modified
+        pred_probs = np.stack(
+            [
+                temp_scale_pred_probs(
+                    curr_pred_probs,
+                    find_best_temp_scaler(labels_multiannotator, curr_pred_probs),
+                )
+                for curr_pred_probs in pred_probs
+            ]
+        )
 
     label_quality = pd.DataFrame({"num_annotations": num_annotations}, index=index_col)
 
@@ -480,14 +521,7 @@ def get_label_quality_multiannotator_ensemble(
     )
 
     # get crowdlab stats
-    consensus_label = np.full(len(majority_vote_label), np.nan)
-    for i in range(len(consensus_label)):
-        max_pred_probs_ind = np.where(MV_post_pred_probs[i] == np.max(MV_post_pred_probs[i]))[0]
-        if len(max_pred_probs_ind) == 1:
-            consensus_label[i] = max_pred_probs_ind[0]
-        else:
-            consensus_label[i] = majority_vote_label[i]
-    consensus_label = consensus_label.astype(int)  # convert all label types to int
+    consensus_label = _get_best_quality_label(MV_post_pred_probs, majority_vote_label)
 
     (
         annotator_agreement,
@@ -537,16 +571,18 @@ def get_label_quality_multiannotator_ensemble(
 
     if return_detailed_quality:
         # Compute the label quality scores for each annotators' labels
-        detailed_label_quality = np.apply_along_axis(
-            _get_annotator_label_quality_score,
-            axis=0,
-            arr=labels_multiannotator,
+        detailed_label_quality = _get_detailed_label_quality(
+            labels_multiannotator=labels_multiannotator,
             pred_probs=post_pred_probs,
             label_quality_score_kwargs=label_quality_score_kwargs,
         )
-        detailed_label_quality_df = pd.DataFrame(
-            detailed_label_quality, index=index_col, columns=annotator_ids
-        ).add_prefix("quality_annotator_")
+        detailed_label_quality_df = _get_detailed_label_quality_df(
+            labels_multiannotator,
+            detailed_label_quality,
+            return_dense=return_dense,
+            index=index_col,
+            columns=annotator_ids,
+        )
 
     if return_annotator_stats:
         annotator_stats = _get_annotator_stats(
@@ -578,9 +614,13 @@ def get_label_quality_multiannotator_ensemble(
 
 
 def get_active_learning_scores(
-    labels_multiannotator: Optional[Union[pd.DataFrame, np.ndarray]] = None,
+    labels_multiannotator: Optional[
+        Union[pd.DataFrame, np.ndarray, SparseMultiannotatorLabels]
+    ] = None,
     pred_probs: Optional[np.ndarray] = None,
     pred_probs_unlabeled: Optional[np.ndarray] = None,
+    *,
+    n_jobs: Optional[int] = None,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """Returns an ActiveLab quality score for each example in the dataset, to estimate which examples are most informative to (re)label next in active learning.
 
@@ -600,7 +640,7 @@ def get_active_learning_scores(
 
     Parameters
     ----------
-    labels_multiannotator : pd.DataFrame or np.ndarray, optional
+    labels_multiannotator : pd.DataFrame, np.ndarray or SparseMultiannotatorLabels, optional
         2D pandas DataFrame or array of multiple given labels for each example with shape ``(N, M)``,
         where N is the number of examples and M is the number of annotators. Note that this function also works with
         datasets where there is only one annotator (M=1).
@@ -615,6 +655,10 @@ def get_active_learning_scores(
         An array of shape ``(N, K)`` of predicted class probabilities from a trained classifier model for examples that have no annotator labels.
         Predicted probabilities in the same format expected by the :py:func:`get_label_quality_scores <cleanlab.rank.get_label_quality_scores>`.
         This argument is optional if you only want to get active learning scores for already-labeled examples (specify only ``pred_probs`` instead).
+        The unlabeled examples are scored in blocks, so this can also be a memmap array for large pools of unlabeled examples.
+    n_jobs : int, optional
+        Number of threads used to score the blocks of unlabeled examples in parallel.
+        If ``None``, uses one thread per physical core if you have ``psutil`` package installed, otherwise per logical core.
 
     Returns
     -------
@@ -645,21 +689,27 @@ def get_active_learning_scores(
             labels_multiannotator = (
                 labels_multiannotator.replace({pd.NA: np.NaN}).astype(float).to_numpy()
             )
+        elif isinstance(labels_multiannotator, SparseMultiannotatorLabels) or issparse(
+            labels_multiannotator
+        ):
+            labels_multiannotator = as_sparse_multiannotator_labels(labels_multiannotator)
         elif not isinstance(labels_multiannotator, np.ndarray):
             raise ValueError(
-                "labels_multiannotator must be either a NumPy array or Pandas DataFrame."
+                "labels_multiannotator must be either a NumPy array, Pandas DataFrame, "
+                "scipy sparse matrix or SparseMultiannotatorLabels."
             )
         # check that labels_multiannotator is a 2D array
-        if labels_multiannotator.ndim != 2:
+        if isinstance(labels_multiannotator, np.ndarray) and labels_multiannotator.ndim != 2:
             raise ValueError(
                 "labels_multiannotator must be a 2D array or dataframe, "
                 "each row represents an example and each column represents an annotator."
             )
+        labels_multiannotator = as_sparse_multiannotator_labels(labels_multiannotator)
 
         num_classes = get_num_classes(pred_probs=pred_probs)
 
         # if all examples are only labeled by a single annotator
-        if (np.sum(~np.isnan(labels_multiannotator), axis=1) == 1).all():
+        if (labels_multiannotator.num_annotations == 1).all():
             optimal_temp = 1.0  # do not temp scale for single annotator case, temperature is defined here for later use
 
             assert_valid_inputs_multiannotator(
@@ -697,15 +747,14 @@ def get_active_learning_scores(
             avg_annotator_weight = np.mean(annotator_weight)
 
         # compute scores for labeled data
-        active_learning_scores = np.full(len(labels_multiannotator), np.nan)
-        for i, annotator_labels in enumerate(labels_multiannotator):
-            active_learning_scores[i] = np.average(
-                (quality_of_consensus_labeled[i], 1 / num_classes),
-                weights=(
-                    np.sum(annotator_weight[~np.isnan(annotator_labels)]) + model_weight,
-                    avg_annotator_weight,
-                ),
-            )
+        active_learning_scores = _get_labeled_active_learning_scores(
+            labels_multiannotator=labels_multiannotator,
+            quality_of_consensus=quality_of_consensus_labeled,
+            model_weight=model_weight,
+            annotator_weight=annotator_weight,
+            avg_annotator_weight=avg_annotator_weight,
+            num_classes=num_classes,
+        )
 
     # no labeled data provided so do not estimate temperature and model/annotator weights
     elif pred_probs_unlabeled is not None:
@@ -722,18 +771,15 @@ def get_active_learning_scores(
 
     # compute scores for unlabeled data
     if pred_probs_unlabeled is not None:
-        pred_probs_unlabeled = temp_scale_pred_probs(pred_probs_unlabeled, optimal_temp)
-        quality_of_consensus_unlabeled = np.max(pred_probs_unlabeled, axis=1)
-
-        active_learning_scores_unlabeled = np.average(
-            np.stack(
-                [
-                    quality_of_consensus_unlabeled,
-                    np.full(len(quality_of_consensus_unlabeled), 1 / num_classes),
-                ]
+        active_learning_scores_unlabeled = cast(
+            np.ndarray,
+            _get_unlabeled_active_learning_scores(
+                pred_probs_unlabeled,
+                optimal_temp=optimal_temp,
+                model_weight=model_weight,
+                avg_annotator_weight=avg_annotator_weight,
+                n_jobs=n_jobs,
             ),
-            weights=[model_weight, avg_annotator_weight],
-            axis=0,
         )
 
     else:
@@ -743,9 +789,13 @@ def get_active_learning_scores(
 
 
 def get_active_learning_scores_ensemble(
-    labels_multiannotator: Optional[Union[pd.DataFrame, np.ndarray]] = None,
+    labels_multiannotator: Optional[
+        Union[pd.DataFrame, np.ndarray, SparseMultiannotatorLabels]
+    ] = None,
     pred_probs: Optional[np.ndarray] = None,
     pred_probs_unlabeled: Optional[np.ndarray] = None,
+    *,
+    n_jobs: Optional[int] = None,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """Returns an ActiveLab quality score for each example in the dataset, based on predictions from an ensemble of models.
 
@@ -754,7 +804,7 @@ def get_active_learning_scores_ensemble(
 
     Parameters
     ----------
-    labels_multiannotator : pd.DataFrame or np.ndarray
+    labels_multiannotator : pd.DataFrame, np.ndarray or SparseMultiannotatorLabels
         Multiannotator labels in the same format expected by `~cleanlab.multiannotator.get_active_learning_scores`.
         This argument is optional if ``pred_probs`` is not provided (in cases where you only provide ``pred_probs_unlabeled`` to get active learning scores for unlabeled examples).
     pred_probs : np.ndarray
@@ -767,6 +817,8 @@ def get_active_learning_scores_ensemble(
         for examples that have no annotated labels so far (but which we may want to label in the future, and hence compute active learning quality scores for).
         Each set of predicted probabilities with shape ``(N, K)`` is in the same format expected by the :py:func:`get_label_quality_scores <cleanlab.rank.get_label_quality_scores>`.
         This argument is optional if you only want to get active learning scores for labeled examples (pass in ``pred_probs`` instead).
+    n_jobs : int, optional
+        Number of threads used to score the unlabeled examples, as in `~cleanlab.multiannotator.get_active_learning_scores`.
 
     Returns
     -------
@@ -797,22 +849,28 @@ def get_active_learning_scores_ensemble(
             labels_multiannotator = (
                 labels_multiannotator.replace({pd.NA: np.NaN}).astype(float).to_numpy()
             )
+        elif isinstance(labels_multiannotator, SparseMultiannotatorLabels) or issparse(
+            labels_multiannotator
+        ):
+            labels_multiannotator = as_sparse_multiannotator_labels(labels_multiannotator)
         elif not isinstance(labels_multiannotator, np.ndarray):
             raise ValueError(
-                "labels_multiannotator must be either a NumPy array or Pandas DataFrame."
+                "labels_multiannotator must be either a NumPy array, Pandas DataFrame, "
+                "scipy sparse matrix or SparseMultiannotatorLabels."
             )
 
         # check that labels_multiannotator is a 2D array
-        if labels_multiannotator.ndim != 2:
+        if isinstance(labels_multiannotator, np.ndarray) and labels_multiannotator.ndim != 2:
             raise ValueError(
                 "labels_multiannotator must be a 2D array or dataframe, "
                 "each row represents an example and each column represents an annotator."
             )
+        labels_multiannotator = as_sparse_multiannotator_labels(labels_multiannotator)
 
         num_classes = get_num_classes(pred_probs=pred_probs[0])
 
         # if all examples are only labeled by a single annotator
-        if (np.sum(~np.isnan(labels_multiannotator), axis=1) == 1).all():
+        if (labels_multiannotator.num_annotations == 1).all():
             # do not temp scale for single annotator case, temperature is defined here for later use
             optimal_temp = np.full(len(pred_probs), 1.0)
 
@@ -833,11 +891,19 @@ def get_active_learning_scores_ensemble(
 
         # examples are annotated by multiple annotators
         else:
-            optimal_temp = np.full(len(pred_probs), np.NaN)
-            for i, curr_pred_probs in enumerate(pred_probs):
-                curr_optimal_temp = find_best_temp_scaler(labels_multiannotator, curr_pred_probs)
-                pred_probs[i] = temp_scale_pred_probs(curr_pred_probs, curr_optimal_temp)
-                optimal_temp[i] = curr_optimal_temp
+            optimal_temp = np.array(
+                [
+                    find_best_temp_scaler(labels_multiannotator, curr_pred_probs)
+                    for curr_pred_probs in pred_probs
+                ]
+            )
+            # scaled copies, so the given pred_probs are not modified
+            pred_probs = np.stack(
+                [
+                    temp_scale_pred_probs(curr_pred_probs, curr_optimal_temp)
+                    for curr_pred_probs, curr_optimal_temp in zip(pred_probs, optimal_temp)
+                ]
+            )
 
             multiannotator_info = get_label_quality_multiannotator_ensemble(
                 labels_multiannotator,
@@ -855,15 +921,14 @@ def get_active_learning_scores_ensemble(
             avg_annotator_weight = np.mean(annotator_weight)
 
         # compute scores for labeled data
-        active_learning_scores = np.full(len(labels_multiannotator), np.nan)
-        for i, annotator_labels in enumerate(labels_multiannotator):
-            active_learning_scores[i] = np.average(
-                (quality_of_consensus_labeled[i], 1 / num_classes),
-                weights=(
-                    np.sum(annotator_weight[~np.isnan(annotator_labels)]) + np.sum(model_weight),
-                    avg_annotator_weight,
-                ),
-            )
+        active_learning_scores = _get_labeled_active_learning_scores(
+            labels_multiannotator=labels_multiannotator,
+            quality_of_consensus=quality_of_consensus_labeled,
+            model_weight=np.sum(model_weight),
+            annotator_weight=annotator_weight,
+            avg_annotator_weight=avg_annotator_weight,
+            num_classes=num_classes,
+        )
 
     # no labeled data provided so do not estimate temperature and model/annotator weights
     elif pred_probs_unlabeled is not None:
@@ -880,29 +945,15 @@ def get_active_learning_scores_ensemble(
 
     # compute scores for unlabeled data
     if pred_probs_unlabeled is not None:
-        for i in range(len(pred_probs_unlabeled)):
-            pred_probs_unlabeled[i] = temp_scale_pred_probs(
-                pred_probs_unlabeled[i], optimal_temp[i]
-            )
-
-        avg_pred_probs_unlabeled = np.mean(pred_probs_unlabeled, axis=0)
-        consensus_label_unlabeled = get_majority_vote_label(
-            np.argmax(pred_probs_unlabeled, axis=2).T,
-            avg_pred_probs_unlabeled,
-        )
-        modified_pred_probs_unlabeled = np.average(
-            np.concatenate(
-                (
-                    pred_probs_unlabeled,
-                    np.full(pred_probs_unlabeled.shape[1:], 1 / num_classes)[np.newaxis, :, :],
-                )
+        active_learning_scores_unlabeled = cast(
+            np.ndarray,
+            _get_unlabeled_active_learning_scores_ensemble(
+                pred_probs_unlabeled,
+                optimal_temp=optimal_temp,
+                model_weight=model_weight,
+                avg_annotator_weight=avg_annotator_weight,
+                n_jobs=n_jobs,
             ),
-            weights=np.concatenate((model_weight, np.array([avg_annotator_weight]))),
-            axis=0,
-        )
-
-        active_learning_scores_unlabeled = get_label_quality_scores(
-            consensus_label_unlabeled, modified_pred_probs_unlabeled
         )
     else:
         active_learning_scores_unlabeled = np.array([])
@@ -911,7 +962,7 @@ def get_active_learning_scores_ensemble(
 
 
 def get_majority_vote_label(
-    labels_multiannotator: Union[pd.DataFrame, np.ndarray],
+    labels_multiannotator: Union[pd.DataFrame, np.ndarray, SparseMultiannotatorLabels],
     pred_probs: Optional[np.ndarray] = None,
     verbose: bool = True,
 ) -> np.ndarray:
@@ -919,7 +970,7 @@ def get_majority_vote_label(
 
     Parameters
     ----------
-    labels_multiannotator : pd.DataFrame or np.ndarray
+    labels_multiannotator : pd.DataFrame, np.ndarray or SparseMultiannotatorLabels
         2D pandas DataFrame or array of multiple given labels for each example with shape ``(N, M)``,
         where N is the number of examples and M is the number of annotators.
         For more details, labels in the same format expected by the `~cleanlab.multiannotator.get_label_quality_multiannotator`.
@@ -947,123 +998,73 @@ def get_majority_vote_label(
         )
     elif isinstance(labels_multiannotator, np.ndarray):
         annotator_ids = None
+    elif isinstance(labels_multiannotator, SparseMultiannotatorLabels) or issparse(
+        labels_multiannotator
+    ):
+        labels_multiannotator = as_sparse_multiannotator_labels(labels_multiannotator)
+        annotator_ids = labels_multiannotator.annotator_ids
     else:
-        raise ValueError("labels_multiannotator must be either a NumPy array or Pandas DataFrame.")
+        raise ValueError(
+            "labels_multiannotator must be either a NumPy array, Pandas DataFrame, "
+            "scipy sparse matrix or SparseMultiannotatorLabels."
+        )
 
     if verbose:
-        assert_valid_inputs_multiannotator(
+        labels_multiannotator = assert_valid_inputs_multiannotator(
             labels_multiannotator, pred_probs, annotator_ids=annotator_ids
         )
-
+    else:
+        labels_multiannotator = as_sparse_multiannotator_labels(labels_multiannotator)
     if pred_probs is not None:
         num_classes = pred_probs.shape[1]
     else:
-        num_classes = int(np.nanmax(labels_multiannotator) + 1)
-
-    array_idx = np.arange(labels_multiannotator.shape[0])
-    label_count = np.zeros((labels_multiannotator.shape[0], num_classes))
-    for i in range(labels_multiannotator.shape[1]):
-        not_nan_mask = ~np.isnan(labels_multiannotator[:, i])
-        # Get the indexes where the label is not missing for the annotator i as int.
-        label_index = labels_multiannotator[not_nan_mask, i].astype(int)
-        # Increase the counts of those labels by 1.
-        label_count[array_idx[not_nan_mask], label_index] += 1
-
-    mode_labels_multiannotator = np.full(label_count.shape, np.nan)
-    modes_mask = label_count == np.max(label_count, axis=1).reshape(-1, 1)
-    insert_index = np.zeros(modes_mask.shape[0], dtype=int)
-    for i in range(modes_mask.shape[1]):
-        mode_index = np.where(modes_mask[:, i])[0]
-        mode_labels_multiannotator[mode_index, insert_index[mode_index]] = i
-        insert_index[mode_index] += 1
-
-    majority_vote_label = np.full(len(labels_multiannotator), np.nan)
-    label_mode_count = (~np.isnan(mode_labels_multiannotator)).sum(axis=1)
+        num_classes = int(np.max(labels_multiannotator.labels) + 1)
+
+    label_count = get_label_counts(labels_multiannotator, num_classes)
+
+    # candidate labels of each example, ties are broken by only keeping the best candidates in each step
+    modes_mask = label_count == np.max(label_count, axis=1, keepdims=True)
+    nontied_mask = np.sum(modes_mask, axis=1) == 1
+    tied_idx = np.flatnonzero(~nontied_mask)
+    tied_candidates = modes_mask[tied_idx]
 
     # obtaining consensus using annotator majority vote
-    mode_count_one_mask = label_mode_count == 1
-    majority_vote_label[mode_count_one_mask] = mode_labels_multiannotator[mode_count_one_mask, 0]
-    nontied_idx = array_idx[mode_count_one_mask]
-    tied_idx = {
-        i: label_mode[:count].astype(int)
-        for i, label_mode, count in zip(
-            array_idx[~mode_count_one_mask],
-            mode_labels_multiannotator[~mode_count_one_mask, :],
-            label_mode_count[~mode_count_one_mask],
-        )
-    }
+    majority_vote_label = np.argmax(modes_mask, axis=1)
 
     # tiebreak 1: using pred_probs (if provided)
-    if pred_probs is not None and len(tied_idx) > 0:
-        for idx, label_mode in tied_idx.copy().items():
-            max_pred_probs = np.where(
-                pred_probs[idx, label_mode] == np.max(pred_probs[idx, label_mode])
-            )[0]
-            if len(max_pred_probs) == 1:
-                majority_vote_label[idx] = label_mode[max_pred_probs[0]]
-                del tied_idx[idx]
-            else:
-                tied_idx[idx] = label_mode[max_pred_probs]
-
     # tiebreak 2: using empirical class frequencies
     # current tiebreak will select the minority class (to prevent larger class imbalance)
     if len(tied_idx) > 0:
-        class_frequencies = label_count.sum(axis=0)
-        for idx, label_mode in tied_idx.copy().items():
-            min_frequency = np.where(
-                class_frequencies[label_mode] == np.min(class_frequencies[label_mode])
-            )[0]
-            if len(min_frequency) == 1:
-                majority_vote_label[idx] = label_mode[min_frequency[0]]
-                del tied_idx[idx]
-            else:
-                tied_idx[idx] = label_mode[min_frequency]
+        tied_candidates = break_majority_vote_ties(
+            tied_candidates,
+            pred_probs=pred_probs[tied_idx] if pred_probs is not None else None,
+            class_frequencies=label_count.sum(axis=0),
+        )
 
     # tiebreak 3: using initial annotator quality scores
-    if len(tied_idx) > 0:
-        nontied_majority_vote_label = majority_vote_label[nontied_idx]
-        nontied_labels_multiannotator = labels_multiannotator[nontied_idx]
-        annotator_agreement_with_consensus = np.zeros(nontied_labels_multiannotator.shape[1])
-        for i in range(len(annotator_agreement_with_consensus)):
-            labels = nontied_labels_multiannotator[:, i]
-            labels_mask = ~np.isnan(labels)
-            if np.sum(labels_mask) == 0:
-                annotator_agreement_with_consensus[i] = np.NaN
-            else:
-                annotator_agreement_with_consensus[i] = np.mean(
-                    labels[labels_mask] == nontied_majority_vote_label[labels_mask]
-                )
+    still_tied_mask = np.sum(tied_candidates, axis=1) > 1
+    if np.any(still_tied_mask):
+        annotator_agreement_with_consensus = get_annotator_agreement(
+            labels_multiannotator, majority_vote_label, example_mask=nontied_mask
+        )
 
         # impute average annotator accuracy for any annotator that do not overlap with consensus
-        nan_mask = np.isnan(annotator_agreement_with_consensus)
-        avg_annotator_agreement = np.mean(annotator_agreement_with_consensus[~nan_mask])
-        annotator_agreement_with_consensus[nan_mask] = avg_annotator_agreement
-
-        for idx, label_mode in tied_idx.copy().items():
-            label_quality_score = np.array(
-                [
-                    np.mean(
-                        annotator_agreement_with_consensus[
-                            np.where(labels_multiannotator[idx] == label)[0]
-                        ]
-                    )
-                    for label in label_mode
-                ]
-            )
-            max_score = np.where(label_quality_score == label_quality_score.max())[0]
-            if len(max_score) == 1:
-                majority_vote_label[idx] = label_mode[max_score[0]]
-                del tied_idx[idx]
-            else:
-                tied_idx[idx] = label_mode[max_score]
+        impute_missing_agreement(annotator_agreement_with_consensus)
+
+        # average quality of the annotators that gave each label, only computed for the tied candidates
+        still_tied_idx = tied_idx[still_tied_mask]
+        tied_candidates[still_tied_mask] = break_ties_by_agreement(
+            tied_candidates[still_tied_mask],
+            label_count[still_tied_idx],
+            get_label_counts(
+                labels_multiannotator,
+                num_classes,
+                annotator_weight=annotator_agreement_with_consensus,
+            )[still_tied_idx],
+        )
 
     # if still tied, break by random selection
-    if len(tied_idx) > 0:
-        warnings.warn(
-            f"breaking ties of examples {list(tied_idx.keys())} by random selection, you may want to set seed for reproducability"
-        )
-        for idx, label_mode in tied_idx.items():
-            majority_vote_label[idx] = np.random.choice(label_mode)
+    majority_vote_label[tied_idx] = break_ties_randomly(tied_candidates, tied_idx)
 
     if verbose:
         # check if any classes no longer appear in the set of consensus labels
@@ -1106,8 +1107,503 @@ def convert_long_to_wide_dataset(
     return labels_multiannotator_wide
 
 
+def convert_long_to_sparse_dataset(
+    labels_multiannotator_long: pd.DataFrame,
+) -> SparseMultiannotatorLabels:
+    """Converts a long format dataset to a sparse format which can be passed as ``labels_multiannotator`` into
+    the other ``cleanlab.multiannotator`` functions, without ever creating the dense ``(N, M)`` wide format.
+    This is preferable to `~cleanlab.multiannotator.convert_long_to_wide_dataset` when there are many annotators
+    that each only label a small fraction of the examples.
+
+    Dataframe must contain the same three columns as in `~cleanlab.multiannotator.convert_long_to_wide_dataset`:
+    ``task``, ``annotator`` and ``label``. Examples and annotators are sorted by their ids, like in the wide format.
+
+    Parameters
+    ----------
+    labels_multiannotator_long : pd.DataFrame
+        pandas DataFrame in long format with three columns named ``task``, ``annotator`` and ``label``
+
+    Returns
+    -------
+    labels_multiannotator_sparse : SparseMultiannotatorLabels
+        Sparse labels of the proper format to be passed as ``labels_multiannotator`` for the other ``cleanlab.multiannotator`` functions.
+    """
+    return SparseMultiannotatorLabels.from_long(
+        labels_multiannotator_long["task"],
+        labels_multiannotator_long["annotator"],
+        labels_multiannotator_long["label"],
+    )
+
+
+class MultiannotatorState:
+    """Keeps the ActiveLab scores of a pool of examples up to date while new annotations are collected in many small rounds.
+
+    `~cleanlab.multiannotator.get_active_learning_scores` recomputes the consensus labels, the model and annotator weights
+    and the posterior predicted probabilities of every example from scratch, which is wasteful in active learning loops
+    that only collect a few new labels between calls. This object computes them once for the whole pool of examples
+    (some of which may not have any labels yet), then ingests each round of new annotations with :py:meth:`add_annotations`
+    in time proportional to the number of new annotations (and the other annotations of the same examples):
+
+    * The label counts of the affected examples and the agreement counts of their annotators are updated.
+    * The model weight and annotator weights are updated from these running counts.
+    * The consensus labels, posterior predicted probabilities and active learning scores of the affected examples are recomputed with the updated weights.
+
+    The active learning scores of the other examples are not recomputed after each round, so they use the weights of the last time they were updated.
+    Call :py:meth:`refit` to recompute everything from scratch, e.g. after retraining the classifier model on the new consensus labels.
+    Right after fitting, the scores are the same as the ones returned by `~cleanlab.multiannotator.get_active_learning_scores`
+    for the labeled and unlabeled examples of the pool.
+
+    Parameters
+    ----------
+    labels_multiannotator : pd.DataFrame, np.ndarray or SparseMultiannotatorLabels
+        Multiple given labels for each of the N examples in the pool, in the same format expected by
+        `~cleanlab.multiannotator.get_label_quality_multiannotator`,
+        except that examples without any labels so far are also included (all ``NaN`` in the dense format).
+        Examples and annotators are then referred to by their position (row and column index).
+    pred_probs : np.ndarray
+        An array of shape ``(N, K)`` of predicted class probabilities from a trained classifier model for all examples in the pool.
+
+    Attributes
+    ----------
+    active_learning_scores : np.ndarray
+        Array of shape ``(N,)`` with the ActiveLab quality score of each example in the pool, labeled or not.
+        Examples with the lowest scores are those we should label next.
+    consensus_label : np.ndarray
+        Array of shape ``(N,)`` with the consensus label of each example, or -1 for examples without labels.
+    model_weight : float
+        Current weight of the classifier model.
+    annotator_weight : np.ndarray
+        Array of shape ``(M,)`` with the current weight of each annotator.
+    temperature : float
+        Temperature used to calibrate `pred_probs` the last time the state was fit.
+    """
+
+    def __init__(
+        self,
+        labels_multiannotator: Union[pd.DataFrame, np.ndarray, SparseMultiannotatorLabels],
+        pred_probs: np.ndarray,
+    ):
+        self.refit(labels_multiannotator, pred_probs)
+
+    def refit(
+        self,
+        labels_multiannotator: Optional[
+            Union[pd.DataFrame, np.ndarray, SparseMultiannotatorLabels]
+        ] = None,
+        pred_probs: Optional[np.ndarray] = None,
+    ) -> None:
+        """Recomputes the state from scratch, with the given labels and/or pred_probs,
+        or with the labels ingested so far and the last given pred_probs if they are not provided.
+        """
+        if labels_multiannotator is None:
+            labels_multiannotator = self.labels_multiannotator
+        if pred_probs is None:
+            pred_probs = self.pred_probs
+
+        assert_valid_pred_probs(pred_probs=pred_probs)
+        labels_multiannotator = as_sparse_multiannotator_labels(labels_multiannotator)
+        if len(labels_multiannotator) != len(pred_probs):
+            raise ValueError(
+                "labels_multiannotator and pred_probs must have the same number of examples (rows)."
+            )
+
+        num_classes = get_num_classes(pred_probs=pred_probs)
+        num_annotators = labels_multiannotator.shape[1]
+        num_annotations = labels_multiannotator.num_annotations
+        labeled_mask = num_annotations > 0
+        if not np.any(labeled_mask):
+            raise ValueError("labels_multiannotator must contain at least one label.")
+
+        # labels of the labeled examples only, like the labels_multiannotator expected by get_active_learning_scores
+        labeled_indptr = np.zeros(np.sum(labeled_mask) + 1, dtype=np.int64)
+        np.cumsum(num_annotations[labeled_mask], out=labeled_indptr[1:])
+        labels_labeled = SparseMultiannotatorLabels(
+            labels_multiannotator.labels,
+            labels_multiannotator.annotator_idx,
+            labeled_indptr,
+            num_annotators,
+        )
+
+        # same steps as get_active_learning_scores for the labeled examples
+        self._single_annotator = bool(np.all(num_annotations[labeled_mask] == 1))
+        if self._single_annotator:
+            assert_valid_inputs_multiannotator(
+                labels_labeled, pred_probs[labeled_mask], allow_single_label=True
+            )
+            self.temperature = 1.0
+            scaled_pred_probs = pred_probs
+            consensus_label_labeled = get_majority_vote_label(
+                labels_multiannotator=labels_labeled,
+                pred_probs=pred_probs[labeled_mask],
+                verbose=False,
+            )
+            quality_of_consensus_labeled = get_label_quality_scores(
+                consensus_label_labeled, pred_probs[labeled_mask]
+            )
+            model_weight = 1.0
+            annotator_weight = np.full(num_annotators, 1.0)
+        else:
+            self.temperature = find_best_temp_scaler(labels_labeled, pred_probs[labeled_mask])
+            scaled_pred_probs = temp_scale_pred_probs(pred_probs, self.temperature)
+            multiannotator_info = get_label_quality_multiannotator(
+                labels_labeled,
+                scaled_pred_probs[labeled_mask],
+                return_annotator_stats=False,
+                return_detailed_quality=False,
+                return_weights=True,
+            )
+            consensus_label_labeled = multiannotator_info["label_quality"][
+                "consensus_label"
+            ].to_numpy()
+            quality_of_consensus_labeled = multiannotator_info["label_quality"][
+                "consensus_quality_score"
+            ].to_numpy()
+            model_weight = multiannotator_info["model_weight"]
+            annotator_weight = multiannotator_info["annotator_weight"]
+
+        self.pred_probs: np.ndarray = pred_probs
+        self.num_classes = num_classes
+        self.model_weight = model_weight
+        self.annotator_weight = annotator_weight
+        self.consensus_label = np.full(len(pred_probs), -1)
+        self.consensus_label[labeled_mask] = consensus_label_labeled
+        self._scaled_pred_probs = scaled_pred_probs
+        self._labels = labels_multiannotator
+        self._added_annotations: Dict[int, List[Tuple[int, int]]] = {}
+
+        # running counts, from which the model and annotator weights are updated
+        self._num_annotations = num_annotations.copy()
+        self._total_annotations = int(np.sum(num_annotations))
+        self._num_labeled = int(np.sum(labeled_mask))
+        self._label_counts = get_label_counts(labels_multiannotator, num_classes)
+        self._class_counts = np.sum(self._label_counts, axis=0)
+        (
+            self._annotator_num_agree,
+            self._annotator_num_other_annotations,
+        ) = _get_annotator_agreement_counts(labels_multiannotator, num_annotations)
+        self._num_multi_annotated = 0
+        self._consensus_agreement_sum = 0.0
+        self._consensus_class_counts = np.zeros(num_classes)
+        self._num_model_errors = 0
+        multi_annotated_idx = np.flatnonzero(num_annotations > 1)
+        self._update_consensus_counts(
+            multi_annotated_idx, self.consensus_label[multi_annotated_idx]
+        )
+
+        # scores for the labeled and unlabeled examples
+        avg_annotator_weight = np.mean(annotator_weight)
+        self.active_learning_scores = np.full(len(pred_probs), np.nan)
+        self.active_learning_scores[labeled_mask] = _get_labeled_active_learning_scores(
+            labels_multiannotator=labels_labeled,
+            quality_of_consensus=quality_of_consensus_labeled,
+            model_weight=model_weight,
+            annotator_weight=annotator_weight,
+            avg_annotator_weight=avg_annotator_weight,
+            num_classes=num_classes,
+        )
+        self.active_learning_scores[~labeled_mask] = (
+            np.max(scaled_pred_probs[~labeled_mask], axis=1) * model_weight
+            + avg_annotator_weight / num_classes
+        ) / (model_weight + avg_annotator_weight)
+
+    def add_annotations(
+        self,
+        example_idx: np.ndarray,
+        annotator_idx: np.ndarray,
+        labels: np.ndarray,
+    ) -> np.ndarray:
+        """Ingests new annotations, where ``labels[i]`` is the label given by annotator ``annotator_idx[i]`` to example ``example_idx[i]``.
+        Annotators that did not label any example so far can be added with the next annotator indices ``M, M+1, ...``.
+
+        Returns the (sorted) indices of the examples whose consensus label and active learning score were updated.
+        If all labeled examples had a single annotation so far and some example now has multiple annotations,
+        the state is refit from scratch to estimate the model and annotator weights, like in `~cleanlab.multiannotator.get_active_learning_scores`.
+        """
+        example_idx = np.asarray(example_idx, dtype=np.int64)
+        annotator_idx = np.asarray(annotator_idx, dtype=np.int64)
+        labels = np.asarray(labels)
+        if not (example_idx.shape == annotator_idx.shape == labels.shape):
+            raise ValueError("example_idx, annotator_idx and labels must have the same length.")
+        if len(labels) == 0:
+            return example_idx
+        if not np.equal(np.mod(labels, 1), 0).all() or labels.min() < 0:
+            raise ValueError("Labels must be zero-indexed integers corresponding to class indices.")
+        labels = labels.astype(np.int64)
+        if labels.max() >= self.num_classes:
+            raise ValueError(f"Labels must be in 0, 1, ..., {self.num_classes - 1}.")
+        if example_idx.min() < 0 or example_idx.max() >= len(self.pred_probs):
+            raise ValueError(f"example_idx must be in 0, 1, ..., {len(self.pred_probs) - 1}.")
+        if annotator_idx.min() < 0:
+            raise ValueError("annotator_idx must be non-negative.")
+
+        # validate all annotations before changing the state
+        num_annotators = max(len(self.annotator_weight), int(annotator_idx.max()) + 1)
+        new_annotators = np.unique(annotator_idx[annotator_idx >= len(self.annotator_weight)])
+        if len(new_annotators) != num_annotators - len(self.annotator_weight):
+            raise ValueError(
+                f"New annotators must be added with the next annotator indices {len(self.annotator_weight)}, "
+                f"{len(self.annotator_weight) + 1}, ..., without gaps, got {list(new_annotators)}."
+            )
+        if len(np.unique(example_idx * num_annotators + annotator_idx)) != len(labels):
+            raise ValueError("Each annotator can only label each example once.")
+        for example, annotator in zip(example_idx, annotator_idx):
+            if annotator in self._get_example_annotations(example)[0]:
+                raise ValueError(f"Annotator {annotator} already labeled example {example}.")
+
+        # new annotators, whose weights are imputed until they overlap with other annotators
+        num_new_annotators = num_annotators - len(self.annotator_weight)
+        if num_new_annotators > 0:
+            self.annotator_weight = np.append(
+                self.annotator_weight, np.full(num_new_annotators, np.mean(self.annotator_weight))
+            )
+            self._annotator_num_agree = np.append(
+                self._annotator_num_agree, np.zeros(num_new_annotators)
+            )
+            self._annotator_num_other_annotations = np.append(
+                self._annotator_num_other_annotations, np.zeros(num_new_annotators)
+            )
+
+        # the consensus counts of the affected examples are removed, then added back with their new consensus labels
+        affected_idx = np.unique(example_idx)
+        multi_annotated_idx = affected_idx[self._num_annotations[affected_idx] > 1]
+        self._update_consensus_counts(
+            multi_annotated_idx, self.consensus_label[multi_annotated_idx], sign=-1
+        )
+
+        for example, annotator, label in zip(example_idx, annotator_idx, labels):
+            # agreement counts of the new label with the other labels of the same example and vice versa
+            other_annotators, other_labels = self._get_example_annotations(example)
+            agree = other_labels == label
+            self._annotator_num_agree[other_annotators] += agree
+            self._annotator_num_other_annotations[other_annotators] += 1
+            self._annotator_num_agree[annotator] += np.sum(agree)
+            self._annotator_num_other_annotations[annotator] += len(other_labels)
+
+            self._added_annotations.setdefault(example, []).append((annotator, label))
+            self._label_counts[example, label] += 1
+            self._class_counts[label] += 1
+            self._num_labeled += self._num_annotations[example] == 0
+            self._num_annotations[example] += 1
+            self._total_annotations += 1
+
+        if self._single_annotator and np.any(self._num_annotations[affected_idx] > 1):
+            self.refit()
+        else:
+            self._update_examples(affected_idx)
+        return affected_idx
+
+    def get_unlabeled_active_learning_scores(
+        self,
+        pred_probs_unlabeled: np.ndarray,
+        *,
+        top: Optional[int] = None,
+        n_jobs: Optional[int] = None,
+    ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+        """Returns the active learning scores of unlabeled examples outside of the pool, e.g. a large set of candidates to label next,
+        with the current temperature and model and annotator weights. These scores are directly comparable with `active_learning_scores`.
+
+        Parameters
+        ----------
+        pred_probs_unlabeled : np.ndarray
+            An array of shape ``(N_u, K)`` of predicted class probabilities for the unlabeled examples, from the same model as `pred_probs`.
+            The examples are scored in blocks, so this can also be a memmap array.
+        top : int, optional
+            If specified, only returns the indices and scores of the `top` examples with the lowest scores,
+            without storing the scores of all the unlabeled examples.
+        n_jobs : int, optional
+            Number of threads used to score the blocks of unlabeled examples in parallel.
+            If ``None``, uses one thread per physical core if you have ``psutil`` package installed, otherwise per logical core.
+
+        Returns
+        -------
+        active_learning_scores_unlabeled : np.ndarray or tuple
+            Array of shape ``(N_u,)`` with the active learning score of each unlabeled example.
+            If `top` is specified, returns a tuple ``(indices, scores)`` with the indices (in `pred_probs_unlabeled`) and scores
+            of the `top` examples to label next, sorted from lowest to highest score.
+        """
+        assert_valid_pred_probs(
+            pred_probs=self.pred_probs, pred_probs_unlabeled=pred_probs_unlabeled
+        )
+        if top is not None and top < 1:
+            raise ValueError(f"top must be a positive integer, got {top}")
+        return _get_unlabeled_active_learning_scores(
+            pred_probs_unlabeled,
+            optimal_temp=self.temperature,
+            model_weight=self.model_weight,
+            avg_annotator_weight=np.mean(self.annotator_weight),
+            top=top,
+            n_jobs=n_jobs,
+        )
+
+    @property
+    def labels_multiannotator(self) -> SparseMultiannotatorLabels:
+        """All the labels ingested so far, in sparse format."""
+        if not self._added_annotations:
+            return self._labels
+        added_example_idx = np.repeat(
+            list(self._added_annotations.keys()),
+            [len(annotations) for annotations in self._added_annotations.values()],
+        )
+        added_annotator_idx, added_labels = np.array(
+            [
+                annotation
+                for annotations in self._added_annotations.values()
+                for annotation in annotations
+            ]
+        ).T
+        example_idx = np.concatenate([self._labels.example_idx, added_example_idx])
+        annotator_idx = np.concatenate([self._labels.annotator_idx, added_annotator_idx])
+        labels = np.concatenate([self._labels.labels, added_labels])
+        order = np.lexsort((annotator_idx, example_idx))
+        indptr = np.zeros(len(self.pred_probs) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(example_idx, minlength=len(self.pred_probs)), out=indptr[1:])
+        return SparseMultiannotatorLabels(
+            labels[order], annotator_idx[order], indptr, len(self.annotator_weight)
+        )
+
+    @property
+    def num_annotations(self) -> np.ndarray:
+        """Array of shape ``(N,)`` with the number of labels given to each example so far."""
+        return self._num_annotations
+
+    def _get_example_annotations(self, example: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the annotators that labeled the given example so far and their labels."""
+        start, end = self._labels.indptr[example], self._labels.indptr[example + 1]
+        annotator_idx = self._labels.annotator_idx[start:end]
+        labels = self._labels.labels[start:end]
+        added_annotations = self._added_annotations.get(example)
+        if added_annotations:
+            added_annotator_idx, added_labels = np.array(added_annotations).T
+            annotator_idx = np.concatenate([annotator_idx, added_annotator_idx])
+            labels = np.concatenate([labels, added_labels])
+        return annotator_idx, labels
+
+    def _update_consensus_counts(
+        self, example_idx: np.ndarray, consensus_label: np.ndarray, sign: int = 1
+    ) -> None:
+        """Adds (or removes if ``sign=-1``) the consensus label of the given examples labeled by multiple annotators
+        to the running counts used to estimate the model and annotator weights."""
+        self._num_multi_annotated += sign * len(example_idx)
+        self._consensus_agreement_sum += sign * np.sum(
+            self._label_counts[example_idx, consensus_label] / self._num_annotations[example_idx]
+        )
+        self._consensus_class_counts += sign * np.bincount(
+            consensus_label, minlength=self.num_classes
+        )
+        self._num_model_errors += sign * np.sum(
+            np.argmax(self._scaled_pred_probs[example_idx], axis=1) != consensus_label
+        )
+
+    def _update_weights(self) -> None:
+        """Updates the model and annotator weights from the running counts, like in ``_get_post_pred_probs_and_weights``."""
+        num_multi_annotated = max(self._num_multi_annotated, 1)
+        self._consensus_likelihood = self._consensus_agreement_sum / num_multi_annotated
+        most_likely_class_error = np.clip(
+            1 - np.max(self._consensus_class_counts) / num_multi_annotated,
+            a_min=CLIPPING_LOWER_BOUND,
+            a_max=None,
+        )
+
+        # impute average annotator agreement for any annotator that do not overlap with other annotators
+        annotator_agreement = np.full(len(self._annotator_num_agree), np.NaN)
+        overlap_mask = self._annotator_num_other_annotations > 0
+        np.divide(
+            self._annotator_num_agree,
+            self._annotator_num_other_annotations,
+            out=annotator_agreement,
+            where=overlap_mask,
+        )
+        annotator_agreement[~overlap_mask] = np.mean(annotator_agreement[overlap_mask])
+        self.annotator_weight = np.clip(
+            1 - ((1 - annotator_agreement) / most_likely_class_error),
+            a_min=CLIPPING_LOWER_BOUND,
+            a_max=None,
+        )
+
+        model_error = self._num_model_errors / num_multi_annotated
+        self.model_weight = np.max(
+            [(1 - (model_error / most_likely_class_error)), CLIPPING_LOWER_BOUND]
+        ) * np.sqrt(self._total_annotations / self._num_labeled)
+
+    def _get_post_pred_probs(
+        self, labels_multiannotator: SparseMultiannotatorLabels, example_idx: np.ndarray
+    ) -> np.ndarray:
+        """Returns the posterior predicted probabilities of the given examples with the current weights,
+        where `labels_multiannotator` only contains the labels of these examples."""
+        label_weight = get_label_counts(
+            labels_multiannotator, self.num_classes, annotator_weight=self.annotator_weight
+        )
+        annotation_weight = np.sum(label_weight, axis=1, keepdims=True)
+        non_consensus_likelihood = (1 - self._consensus_likelihood) / (self.num_classes - 1)
+        return (
+            self._scaled_pred_probs[example_idx] * self.model_weight
+            + label_weight * self._consensus_likelihood
+            + (annotation_weight - label_weight) * non_consensus_likelihood
+        ) / (annotation_weight + self.model_weight)
+
+    def _update_examples(self, example_idx: np.ndarray) -> None:
+        """Recomputes the consensus labels and active learning scores of the given (sorted) examples after they received new labels."""
+        annotations = [self._get_example_annotations(example) for example in example_idx]
+        annotator_idx = np.concatenate([annotators for annotators, _ in annotations])
+        labels = np.concatenate([labels for _, labels in annotations])
+        indptr = np.zeros(len(example_idx) + 1, dtype=np.int64)
+        np.cumsum([len(labels) for _, labels in annotations], out=indptr[1:])
+        order = np.lexsort((annotator_idx, np.repeat(np.arange(len(example_idx)), np.diff(indptr))))
+        labels_multiannotator = SparseMultiannotatorLabels(
+            labels[order], annotator_idx[order], indptr, len(self.annotator_weight)
+        )
+
+        # majority vote, with the tiebreaks of get_majority_vote_label that only need the running counts
+        label_counts = self._label_counts[example_idx]
+        candidates = label_counts == np.max(label_counts, axis=1, keepdims=True)
+        candidates = break_majority_vote_ties(
+            candidates,
+            pred_probs=self._scaled_pred_probs[example_idx],
+            class_frequencies=self._class_counts,
+        )
+        majority_vote_label = np.argmax(candidates, axis=1)
+
+        if self._single_annotator:
+            consensus_label = majority_vote_label
+            quality_of_consensus = get_label_quality_scores(
+                consensus_label, self._scaled_pred_probs[example_idx]
+            )
+        else:
+            # like in get_label_quality_multiannotator, the best quality consensus label is selected with the
+            # posterior of the majority vote label, then the weights and posterior are updated with the selected label
+            multi_annotated_mask = self._num_annotations[example_idx] > 1
+            multi_annotated_idx = example_idx[multi_annotated_mask]
+            self._update_consensus_counts(
+                multi_annotated_idx, majority_vote_label[multi_annotated_mask]
+            )
+            self._update_weights()
+            consensus_label = _get_best_quality_label(
+                self._get_post_pred_probs(labels_multiannotator, example_idx), majority_vote_label
+            )
+            self._update_consensus_counts(
+                multi_annotated_idx, majority_vote_label[multi_annotated_mask], sign=-1
+            )
+            self._update_consensus_counts(
+                multi_annotated_idx, consensus_label[multi_annotated_mask]
+            )
+            self._update_weights()
+            quality_of_consensus = get_label_quality_scores(
+                consensus_label, self._get_post_pred_probs(labels_multiannotator, example_idx)
+            )
+
+        self.consensus_label[example_idx] = consensus_label
+        self.active_learning_scores[example_idx] = _get_labeled_active_learning_scores(
+            labels_multiannotator=labels_multiannotator,
+            quality_of_consensus=quality_of_consensus,
+            model_weight=self.model_weight,
+            annotator_weight=self.annotator_weight,
+            avg_annotator_weight=np.mean(self.annotator_weight),
+            num_classes=self.num_classes,
+        )
+
+
 def _get_consensus_stats(
-    labels_multiannotator: np.ndarray,
+    labels_multiannotator: SparseMultiannotatorLabels,
     pred_probs: np.ndarray,
     num_annotations: np.ndarray,
     consensus_label: np.ndarray,
@@ -1120,10 +1616,9 @@ def _get_consensus_stats(
 
     Parameters
     ----------
-    labels_multiannotator : np.ndarray
-        2D numpy array of multiple given labels for each example with shape ``(N, M)``,
-        where N is the number of examples and M is the number of annotators.
-        For more details, labels in the same format expected by the `~cleanlab.multiannotator.get_label_quality_multiannotator`.
+    labels_multiannotator : SparseMultiannotatorLabels
+        Multiple given labels for each example in sparse format, where N is the number of examples and M is the number of annotators.
+        For more details, see :py:class:`SparseMultiannotatorLabels <cleanlab.internal.multiannotator_utils.SparseMultiannotatorLabels>`.
     pred_probs : np.ndarray
         An array of shape ``(N, K)`` of model-predicted probabilities, ``P(label=k|x)``.
         For details, predicted probabilities in the same format expected by the `~cleanlab.multiannotator.get_label_quality_multiannotator`.
@@ -1194,8 +1689,36 @@ def _get_consensus_stats(
     )
 
 
+def _get_best_quality_label(
+    post_pred_probs: np.ndarray,
+    majority_vote_label: np.ndarray,
+) -> np.ndarray:
+    """Returns the class with the highest posterior predicted probability for each example,
+    or the majority vote label for examples where multiple classes are tied for the highest probability.
+
+    Parameters
+    ----------
+    post_pred_probs : np.ndarray
+        An array of shape ``(N, K)`` with the posterior predicted probabilities.
+    majority_vote_label : np.ndarray
+        An array of shape ``(N,)`` with the majority vote label aggregated from all annotators.
+
+    Returns
+    -------
+    consensus_label : np.ndarray
+        An array of shape ``(N,)`` with the best quality consensus labels.
+    """
+    max_pred_probs_mask = post_pred_probs == np.max(post_pred_probs, axis=1, keepdims=True)
+    consensus_label = np.where(
+        np.sum(max_pred_probs_mask, axis=1) == 1,
+        np.argmax(max_pred_probs_mask, axis=1),
+        majority_vote_label,
+    )
+    return consensus_label.astype(int)  # convert all label types to int
+
+
 def _get_annotator_stats(
-    labels_multiannotator: np.ndarray,
+    labels_multiannotator: SparseMultiannotatorLabels,
     pred_probs: np.ndarray,
     consensus_label: np.ndarray,
     num_annotations: np.ndarray,
@@ -1211,10 +1734,9 @@ def _get_annotator_stats(
 
     Parameters
     ----------
-    labels_multiannotator : np.ndarray
-        2D numpy array of multiple given labels for each example with shape ``(N, M)``,
-        where N is the number of examples and M is the number of annotators.
-        For more details, labels in the same format expected by the `~cleanlab.multiannotator.get_label_quality_multiannotator`.
+    labels_multiannotator : SparseMultiannotatorLabels
+        Multiple given labels for each example in sparse format, where N is the number of examples and M is the number of annotators.
+        For more details, see :py:class:`SparseMultiannotatorLabels <cleanlab.internal.multiannotator_utils.SparseMultiannotatorLabels>`.
     pred_probs : np.ndarray
         An array of shape ``(N, K)`` of model-predicted probabilities, ``P(label=k|x)``.
         For details, predicted probabilities in the same format expected by the `~cleanlab.multiannotator.get_label_quality_multiannotator`.
@@ -1258,15 +1780,11 @@ def _get_annotator_stats(
     )
 
     # Compute the number of labels labeled/ by each annotator
-    num_examples_labeled = np.sum(~np.isnan(labels_multiannotator), axis=0)
+    num_examples_labeled = labels_multiannotator.num_examples_labeled
 
     # Compute the fraction of labels annotated by each annotator that agrees with the consensus label
     # TODO: check if we should drop singleton labels here
-    agreement_with_consensus = np.zeros(labels_multiannotator.shape[1])
-    for i in range(len(agreement_with_consensus)):
-        labels = labels_multiannotator[:, i]
-        labels_mask = ~np.isnan(labels)
-        agreement_with_consensus[i] = np.mean(labels[labels_mask] == consensus_label[labels_mask])
+    agreement_with_consensus = get_annotator_agreement(labels_multiannotator, consensus_label)
 
     # Find the worst labeled class for each annotator
     worst_class = _get_annotator_worst_class(
@@ -1290,7 +1808,7 @@ def _get_annotator_stats(
 
 
 def _get_annotator_agreement_with_consensus(
-    labels_multiannotator: np.ndarray,
+    labels_multiannotator: SparseMultiannotatorLabels,
     consensus_label: np.ndarray,
 ) -> np.ndarray:
     """Returns the fractions of annotators that agree with the consensus label per example. Note that the
@@ -1298,10 +1816,9 @@ def _get_annotator_agreement_with_consensus(
 
     Parameters
     ----------
-    labels_multiannotator : np.ndarray
-        2D numpy array of multiple given labels for each example with shape ``(N, M)``,
-        where N is the number of examples and M is the number of annotators.
-        For more details, labels in the same format expected by the `~cleanlab.multiannotator.get_label_quality_multiannotator`.
+    labels_multiannotator : SparseMultiannotatorLabels
+        Multiple given labels for each example in sparse format, where N is the number of examples and M is the number of annotators.
+        For more details, see :py:class:`SparseMultiannotatorLabels <cleanlab.internal.multiannotator_utils.SparseMultiannotatorLabels>`.
     consensus_label : np.ndarray
         An array of shape ``(N,)`` with the consensus labels aggregated from all annotators.
 
@@ -1310,15 +1827,17 @@ def _get_annotator_agreement_with_consensus(
     annotator_agreement : np.ndarray
         An array of shape ``(N,)`` with the fraction of annotators that agree with each consensus label.
     """
-    annotator_agreement = np.zeros(len(labels_multiannotator))
-    for i in range(labels_multiannotator.shape[1]):
-        annotator_agreement += labels_multiannotator[:, i] == consensus_label
-    annotator_agreement /= (~np.isnan(labels_multiannotator)).sum(axis=1)
+    num_agree = np.bincount(
+        labels_multiannotator.example_idx,
+        weights=labels_multiannotator.labels == consensus_label[labels_multiannotator.example_idx],
+        minlength=len(labels_multiannotator),
+    )
+    annotator_agreement = num_agree / labels_multiannotator.num_annotations
     return annotator_agreement
 
 
 def _get_annotator_agreement_with_annotators(
-    labels_multiannotator: np.ndarray,
+    labels_multiannotator: SparseMultiannotatorLabels,
     num_annotations: np.ndarray,
     verbose: bool = True,
 ) -> np.ndarray:
@@ -1326,10 +1845,9 @@ def _get_annotator_agreement_with_annotators(
 
     Parameters
     ----------
-    labels_multiannotator : np.ndarray
-        2D numpy array of multiple given labels for each example with shape ``(N, M)``,
-        where N is the number of examples and M is the number of annotators.
-        For more details, labels in the same format expected by the `~cleanlab.multiannotator.get_label_quality_multiannotator`.
+    labels_multiannotator : SparseMultiannotatorLabels
+        Multiple given labels for each example in sparse format, where N is the number of examples and M is the number of annotators.
+        For more details, see :py:class:`SparseMultiannotatorLabels <cleanlab.internal.multiannotator_utils.SparseMultiannotatorLabels>`.
     consensus_label : np.ndarray
         An array of shape ``(N,)`` with the consensus labels aggregated from all annotators.
     verbose : bool, default = True
@@ -1342,13 +1860,17 @@ def _get_annotator_agreement_with_annotators(
         annotators that labeled the same examples.
     """
 
-    annotator_agreement_with_annotators = np.zeros(labels_multiannotator.shape[1])
-    for i in range(len(annotator_agreement_with_annotators)):
-        annotator_labels = labels_multiannotator[:, i]
-        annotator_labels_mask = ~np.isnan(annotator_labels)
-        annotator_agreement_with_annotators[i] = _get_single_annotator_agreement(
-            labels_multiannotator[annotator_labels_mask], num_annotations[annotator_labels_mask], i
-        )
+    # average agreement of each annotator, weighted by the number of other annotators of each example
+    total_agree, total_other_annotations = _get_annotator_agreement_counts(
+        labels_multiannotator, num_annotations
+    )
+    annotator_agreement_with_annotators = np.full(labels_multiannotator.shape[1], np.NaN)
+    np.divide(
+        total_agree,
+        total_other_annotations,
+        out=annotator_agreement_with_annotators,
+        where=total_other_annotations > 0,
+    )
 
     # impute average annotator accuracy for any annotator that do not overlap with other annotators
     non_overlap_mask = np.isnan(annotator_agreement_with_annotators)
@@ -1365,50 +1887,32 @@ def _get_annotator_agreement_with_annotators(
     return annotator_agreement_with_annotators
 
 
-def _get_single_annotator_agreement(
-    labels_multiannotator: np.ndarray,
+def _get_annotator_agreement_counts(
+    labels_multiannotator: SparseMultiannotatorLabels,
     num_annotations: np.ndarray,
-    annotator_idx: int,
-) -> float:
-    """Returns the average agreement of a given annotator other annotators that label the same example.
-
-    Parameters
-    ----------
-    labels_multiannotator : np.ndarray
-        2D numpy array of multiple given labels for each example with shape ``(N, M)``,
-        where N is the number of examples and M is the number of annotators.
-        For more details, labels in the same format expected by the `~cleanlab.multiannotator.get_label_quality_multiannotator`.
-    num_annotations : np.ndarray
-        An array of shape ``(N,)`` with the number of annotators that have labeled each example.
-    annotator_idx : int
-        The index of the annotator we want to compute the annotator agreement for.
-
-    Returns
-    -------
-    annotator_agreement : float
-        An float repesenting the agreement of each annotator with other annotators that labeled the same examples.
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns two arrays of shape ``(M,)``, with the total number of other labels given to the examples labeled by each annotator
+    that agree with the annotator's label, and the total number of these other labels.
     """
-    adjusted_num_annotations = num_annotations - 1
-    if np.sum(adjusted_num_annotations) == 0:
-        return np.NaN
-
-    multi_annotations_mask = num_annotations > 1
-    annotator_agreement_per_example = np.zeros(len(labels_multiannotator))
-    for i in range(labels_multiannotator.shape[1]):
-        annotator_agreement_per_example[multi_annotations_mask] += (
-            labels_multiannotator[multi_annotations_mask, annotator_idx]
-            == labels_multiannotator[multi_annotations_mask, i]
-        )
-    annotator_agreement_per_example[multi_annotations_mask] = (
-        annotator_agreement_per_example[multi_annotations_mask] - 1
-    ) / adjusted_num_annotations[multi_annotations_mask]
-
-    annotator_agreement = np.average(annotator_agreement_per_example, weights=num_annotations - 1)
-    return annotator_agreement
+    labels = labels_multiannotator.labels
+    example_idx = labels_multiannotator.example_idx
+    annotator_idx = labels_multiannotator.annotator_idx
+    label_count = get_label_counts(labels_multiannotator, num_classes=int(np.max(labels)) + 1)
+
+    # for each given label, count the other annotators of the example and how many of them agree with the label
+    num_agree = label_count[example_idx, labels] - 1
+    num_other_annotations = num_annotations[example_idx] - 1
+
+    num_annotators = labels_multiannotator.shape[1]
+    total_agree = np.bincount(annotator_idx, weights=num_agree, minlength=num_annotators)
+    total_other_annotations = np.bincount(
+        annotator_idx, weights=num_other_annotations, minlength=num_annotators
+    )
+    return total_agree, total_other_annotations
 
 
 def _get_post_pred_probs_and_weights(
-    labels_multiannotator: np.ndarray,
+    labels_multiannotator: SparseMultiannotatorLabels,
     consensus_label: np.ndarray,
     prior_pred_probs: np.ndarray,
     num_annotations: np.ndarray,
@@ -1420,10 +1924,9 @@ def _get_post_pred_probs_and_weights(
 
     Parameters
     ----------
-    labels_multiannotator : np.ndarray
-        2D numpy array of multiple given labels for each example with shape ``(N, M)``,
-        where N is the number of examples and M is the number of annotators.
-        For more details, labels in the same format expected by the `~cleanlab.multiannotator.get_label_quality_multiannotator`.
+    labels_multiannotator : SparseMultiannotatorLabels
+        Multiple given labels for each example in sparse format, where N is the number of examples and M is the number of annotators.
+        For more details, see :py:class:`SparseMultiannotatorLabels <cleanlab.internal.multiannotator_utils.SparseMultiannotatorLabels>`.
     consensus_label : np.ndarray
         An array of shape ``(N,)`` with the consensus labels aggregated from all annotators.
     prior_pred_probs : np.ndarray
@@ -1499,33 +2002,26 @@ def _get_post_pred_probs_and_weights(
             [(1 - (model_error / most_likely_class_error)), CLIPPING_LOWER_BOUND]
         ) * np.sqrt(np.mean(num_annotations))
 
-        non_nan_mask = ~np.isnan(labels_multiannotator)
-        annotation_weight = np.zeros(labels_multiannotator.shape[0])
-        for i in range(labels_multiannotator.shape[1]):
-            annotation_weight[non_nan_mask[:, i]] += adjusted_annotator_agreement[i]
+        # total weight of the annotators that gave each class label to each example
+        label_weight = get_label_counts(
+            labels_multiannotator, num_classes, annotator_weight=adjusted_annotator_agreement
+        )
+        annotation_weight = np.sum(label_weight, axis=1, keepdims=True)
         total_weight = annotation_weight + model_weight
 
         # compute weighted average
-        post_pred_probs = np.full(prior_pred_probs.shape, np.nan)
-        for i in range(prior_pred_probs.shape[1]):
-            post_pred_probs[:, i] = prior_pred_probs[:, i] * model_weight
-            for k in range(labels_multiannotator.shape[1]):
-                mask = ~np.isnan(labels_multiannotator[:, k])
-                post_pred_probs[mask, i] += np.where(
-                    labels_multiannotator[mask, k] == i,
-                    adjusted_annotator_agreement[k] * consensus_likelihood,
-                    adjusted_annotator_agreement[k] * non_consensus_likelihood,
-                )
-            post_pred_probs[:, i] /= total_weight
+        post_pred_probs = (
+            prior_pred_probs * model_weight
+            + label_weight * consensus_likelihood
+            + (annotation_weight - label_weight) * non_consensus_likelihood
+        ) / total_weight
 
         return_model_weight = model_weight
         return_annotator_weight = adjusted_annotator_agreement
 
     elif quality_method == "agreement":
         num_classes = get_num_classes(pred_probs=prior_pred_probs)
-        label_counts = np.full((len(labels_multiannotator), num_classes), np.NaN)
-        for i, labels in enumerate(labels_multiannotator):
-            label_counts[i, :] = value_counts(labels[~np.isnan(labels)], num_classes=num_classes)
+        label_counts = get_label_counts(labels_multiannotator, num_classes)
 
         post_pred_probs = label_counts / num_annotations.reshape(-1, 1)
 
@@ -1541,7 +2037,7 @@ def _get_post_pred_probs_and_weights(
 
 
 def _get_post_pred_probs_and_weights_ensemble(
-    labels_multiannotator: np.ndarray,
+    labels_multiannotator: SparseMultiannotatorLabels,
     consensus_label: np.ndarray,
     prior_pred_probs: np.ndarray,
     num_annotations: np.ndarray,
@@ -1553,10 +2049,9 @@ def _get_post_pred_probs_and_weights_ensemble(
 
     Parameters
     ----------
-    labels_multiannotator : np.ndarray
-        2D numpy array of multiple given labels for each example with shape ``(N, M)``,
-        where N is the number of examples and M is the number of annotators.
-        For more details, labels in the same format expected by the `~cleanlab.multiannotator.get_label_quality_multiannotator`.
+    labels_multiannotator : SparseMultiannotatorLabels
+        Multiple given labels for each example in sparse format, where N is the number of examples and M is the number of annotators.
+        For more details, see :py:class:`SparseMultiannotatorLabels <cleanlab.internal.multiannotator_utils.SparseMultiannotatorLabels>`.
     consensus_label : np.ndarray
         An array of shape ``(P, N, K)`` where P is the number of models, consisting of predicted class probabilities from the ensemble models.
         Each set of predicted probabilities with shape ``(N, K)`` is in the same format expected by the :py:func:`get_label_quality_scores <cleanlab.rank.get_label_quality_scores>`.
@@ -1627,26 +2122,19 @@ def _get_post_pred_probs_and_weights_ensemble(
             [(1 - (model_error / most_likely_class_error)), CLIPPING_LOWER_BOUND]
         ) * np.sqrt(np.mean(num_annotations))
 
+    # total weight of the annotators that gave each class label to each example
+    label_weight = get_label_counts(
+        labels_multiannotator, num_classes, annotator_weight=adjusted_annotator_agreement
+    )
+    annotation_weight = np.sum(label_weight, axis=1, keepdims=True)
+    total_weight = annotation_weight + np.sum(model_weight)
+
     # compute weighted average
-    post_pred_probs = np.full(prior_pred_probs[0].shape, np.nan)
-    for i, labels in enumerate(labels_multiannotator):
-        labels_mask = ~np.isnan(labels)
-        labels_subset = labels[labels_mask]
-        post_pred_probs[i] = [
-            np.average(
-                [prior_pred_probs[ind][i, true_label] for ind in range(prior_pred_probs.shape[0])]
-                + [
-                    (
-                        consensus_likelihood
-                        if annotator_label == true_label
-                        else non_consensus_likelihood
-                    )
-                    for annotator_label in labels_subset
-                ],
-                weights=np.concatenate((model_weight, adjusted_annotator_agreement[labels_mask])),
-            )
-            for true_label in range(num_classes)
-        ]
+    post_pred_probs = (
+        np.tensordot(model_weight, prior_pred_probs, axes=1)
+        + label_weight * consensus_likelihood
+        + (annotation_weight - label_weight) * non_consensus_likelihood
+    ) / total_weight
 
     return_model_weight = model_weight
     return_annotator_weight = adjusted_annotator_agreement
@@ -1666,10 +2154,9 @@ def _get_consensus_quality_score(
 
     Parameters
     ----------
-    labels_multiannotator : np.ndarray
-        2D numpy array of multiple given labels for each example with shape ``(N, M)``,
-        where N is the number of examples and M is the number of annotators.
-        For more details, labels in the same format expected by the `~cleanlab.multiannotator.get_label_quality_multiannotator`.
+    labels_multiannotator : SparseMultiannotatorLabels
+        Multiple given labels for each example in sparse format, where N is the number of examples and M is the number of annotators.
+        For more details, see :py:class:`SparseMultiannotatorLabels <cleanlab.internal.multiannotator_utils.SparseMultiannotatorLabels>`.
     consensus_label : np.ndarray
         An array of shape ``(N,)`` with the consensus labels aggregated from all annotators.
     pred_probs : np.ndarray
@@ -1713,30 +2200,78 @@ def _get_consensus_quality_score(
     return consensus_quality_score
 
 
-def _get_annotator_label_quality_score(
-    annotator_label: np.ndarray,
+def _get_detailed_label_quality(
+    labels_multiannotator: SparseMultiannotatorLabels,
     pred_probs: np.ndarray,
     label_quality_score_kwargs: dict = {},
 ) -> np.ndarray:
-    """Returns quality scores for each datapoint.
-    Very similar functionality as ``_get_consensus_quality_score`` with additional support for annotator labels that contain NaN values.
-    For more info about parameters and returns, see the docstring of `~cleanlab.multiannotator._get_consensus_quality_score`.
+    """Returns quality scores for each label given by the annotators.
+    Very similar functionality as ``_get_consensus_quality_score``, but scores every given label instead of the consensus label.
+    For more info about parameters, see the docstring of `~cleanlab.multiannotator._get_consensus_quality_score`.
+
+    Returns
+    -------
+    detailed_label_quality : np.ndarray
+        An array of shape ``(L,)`` with the quality score of each given label, in the same order as ``labels_multiannotator.labels``,
+        where L is the total number of labels given by all annotators.
     """
-    mask = ~np.isnan(annotator_label)
+    labels = labels_multiannotator.labels
+    example_idx = labels_multiannotator.example_idx
 
-    annotator_label_quality_score_subset = get_label_quality_scores(
-        labels=annotator_label[mask].astype(int),
-        pred_probs=pred_probs[mask],
-        **label_quality_score_kwargs,
-    )
+    if not label_quality_score_kwargs.get("adjust_pred_probs", False):
+        # the score of each label only depends on its own example, so all the labels are scored at once
+        return get_label_quality_scores(
+            labels=labels, pred_probs=pred_probs[example_idx], **label_quality_score_kwargs
+        )
 
-    annotator_label_quality_score = np.full(len(annotator_label), np.nan)
-    annotator_label_quality_score[mask] = annotator_label_quality_score_subset
-    return annotator_label_quality_score
+    # adjusted pred_probs depend on the labels of all the examples scored together, so score each annotator separately
+    detailed_label_quality = np.full(len(labels), np.nan)
+    annotator_idx = labels_multiannotator.annotator_idx
+    for annotator in np.unique(annotator_idx):
+        mask = annotator_idx == annotator
+        detailed_label_quality[mask] = get_label_quality_scores(
+            labels=labels[mask],
+            pred_probs=pred_probs[example_idx[mask]],
+            **label_quality_score_kwargs,
+        )
+    return detailed_label_quality
+
+
+def _get_detailed_label_quality_df(
+    labels_multiannotator: SparseMultiannotatorLabels,
+    detailed_label_quality: np.ndarray,
+    return_dense: bool = True,
+    index: Optional[pd.Index] = None,
+    columns: Optional[pd.Index] = None,
+) -> pd.DataFrame:
+    """Returns the quality scores of each given label as a DataFrame.
+
+    If ``return_dense`` is ``True``, the DataFrame has shape ``(N, M)`` with one ``quality_annotator_<id>`` column per annotator,
+    and NaN for the examples not labeled by an annotator. Otherwise, the DataFrame is in long format with one row per given label
+    and columns ``task``, ``annotator`` and ``quality``, so the dense ``(N, M)`` array is never created.
+    """
+    if return_dense:
+        dense_label_quality = np.full(labels_multiannotator.shape, np.nan)
+        dense_label_quality[
+            labels_multiannotator.example_idx, labels_multiannotator.annotator_idx
+        ] = detailed_label_quality
+        return pd.DataFrame(dense_label_quality, index=index, columns=columns).add_prefix(
+            "quality_annotator_"
+        )
+
+    task = labels_multiannotator.example_idx
+    annotator = labels_multiannotator.annotator_idx
+    return pd.DataFrame(
+        {
+            "task": task if index is None else index[task],
+            "annotator": annotator if columns is None else columns[annotator],
+            "quality": detailed_label_quality,
+        }
+    )
 
 
 def _get_annotator_quality(
-    labels_multiannotator: np.ndarray,
+    labels_multiannotator: SparseMultiannotatorLabels,
     pred_probs: np.ndarray,
     consensus_label: np.ndarray,
     num_annotations: np.ndarray,
@@ -1750,10 +2285,9 @@ def _get_annotator_quality(
 
     Parameters
     ----------
-    labels_multiannotator : np.ndarray
-        2D numpy array of multiple given labels for each example with shape ``(N, M)``,
-        where N is the number of examples and M is the number of annotators.
-        For more details, labels in the same format expected by the `~cleanlab.multiannotator.get_label_quality_multiannotator`.
+    labels_multiannotator : SparseMultiannotatorLabels
+        Multiple given labels for each example in sparse format, where N is the number of examples and M is the number of annotators.
+        For more details, see :py:class:`SparseMultiannotatorLabels <cleanlab.internal.multiannotator_utils.SparseMultiannotatorLabels>`.
     pred_probs : np.ndarray
         An array of shape ``(N, K)`` of model-predicted probabilities, ``P(label=k|x)``.
         For details, predicted probabilities in the same format expected by the `~cleanlab.multiannotator.get_label_quality_multiannotator`.
@@ -1788,35 +2322,23 @@ def _get_annotator_quality(
 
     if quality_method == "crowdlab":
         if detailed_label_quality is None:
-            annotator_lqs = np.zeros(labels_multiannotator.shape[1])
-            for i in range(len(annotator_lqs)):
-                labels = labels_multiannotator[:, i]
-                labels_mask = ~np.isnan(labels)
-                annotator_lqs[i] = np.mean(
-                    get_label_quality_scores(
-                        labels[labels_mask].astype(int),
-                        pred_probs[labels_mask],
-                    )
-                )
-        else:
-            annotator_lqs = np.nanmean(detailed_label_quality, axis=0)
-
-        mask = num_annotations != 1
-        labels_multiannotator_subset = labels_multiannotator[mask]
-        consensus_label_subset = consensus_label[mask]
+            detailed_label_quality = _get_detailed_label_quality(labels_multiannotator, pred_probs)
+
+        # average the label quality scores of each annotator
+        annotator_lqs = (
+            np.bincount(
+                labels_multiannotator.annotator_idx,
+                weights=detailed_label_quality,
+                minlength=labels_multiannotator.shape[1],
+            )
+            / labels_multiannotator.num_examples_labeled
+        )
 
-        annotator_agreement = np.zeros(labels_multiannotator_subset.shape[1])
-        for i in range(len(annotator_agreement)):
-            labels = labels_multiannotator_subset[:, i]
-            labels_mask = ~np.isnan(labels)
-            # case where annotator does not annotate any examples with any other annotators
-            # TODO: do we want to impute the mean or just return np.nan
-            if np.sum(labels_mask) == 0:
-                annotator_agreement[i] = np.NaN
-            else:
-                annotator_agreement[i] = np.mean(
-                    labels[labels_mask] == consensus_label_subset[labels_mask],
-                )
+        # case where annotator does not annotate any examples with any other annotators is NaN
+        # TODO: do we want to impute the mean or just return np.nan
+        annotator_agreement = get_annotator_agreement(
+            labels_multiannotator, consensus_label, example_mask=num_annotations != 1
+        )
 
         avg_num_annotations_frac = np.mean(num_annotations) / len(annotator_weight)
         annotator_weight_adjusted = np.sum(annotator_weight) * avg_num_annotations_frac
@@ -1825,21 +2347,10 @@ def _get_annotator_quality(
         annotator_quality = w * annotator_lqs + (1 - w) * annotator_agreement
 
     elif quality_method == "agreement":
-        mask = num_annotations != 1
-        labels_multiannotator_subset = labels_multiannotator[mask]
-        consensus_label_subset = consensus_label[mask]
-
-        annotator_quality = np.zeros(labels_multiannotator_subset.shape[1])
-        for i in range(len(annotator_quality)):
-            labels = labels_multiannotator_subset[:, i]
-            labels_mask = ~np.isnan(labels)
-            # case where annotator does not annotate any examples with any other annotators
-            if np.sum(labels_mask) == 0:
-                annotator_quality[i] = np.NaN
-            else:
-                annotator_quality[i] = np.mean(
-                    labels[labels_mask] == consensus_label_subset[labels_mask],
-                )
+        # case where annotator does not annotate any examples with any other annotators is NaN
+        annotator_quality = get_annotator_agreement(
+            labels_multiannotator, consensus_label, example_mask=num_annotations != 1
+        )
 
     else:
         raise ValueError(
@@ -1853,7 +2364,7 @@ def _get_annotator_quality(
 
 
 def _get_annotator_worst_class(
-    labels_multiannotator: np.ndarray,
+    labels_multiannotator: SparseMultiannotatorLabels,
     consensus_label: np.ndarray,
     consensus_quality_score: np.ndarray,
 ) -> np.ndarray:
@@ -1861,10 +2372,9 @@ def _get_annotator_worst_class(
 
     Parameters
     ----------
-    labels_multiannotator : np.ndarray
-        2D pandas DataFrame of multiple given labels for each example with shape ``(N, M)``,
-        where N is the number of examples and M is the number of annotators.
-        For more details, labels in the same format expected by the `~cleanlab.multiannotator.get_label_quality_multiannotator`.
+    labels_multiannotator : SparseMultiannotatorLabels
+        Multiple given labels for each example in sparse format, where N is the number of examples and M is the number of annotators.
+        For more details, see :py:class:`SparseMultiannotatorLabels <cleanlab.internal.multiannotator_utils.SparseMultiannotatorLabels>`.
     consensus_label : np.ndarray
         An array of shape ``(N,)`` with the consensus labels aggregated from all annotators.
     consensus_quality_score : np.ndarray
@@ -1876,64 +2386,254 @@ def _get_annotator_worst_class(
         The class that is most frequently mislabeled by a given annotator.
     """
 
-    worst_class = np.apply_along_axis(
-        _get_single_annotator_worst_class,
-        axis=0,
-        arr=labels_multiannotator,
-        consensus_label=consensus_label,
-        consensus_quality_score=consensus_quality_score,
-    ).astype(int)
+    labels = labels_multiannotator.labels
+    example_idx = labels_multiannotator.example_idx
+    annotator_idx = labels_multiannotator.annotator_idx
+    num_annotators = labels_multiannotator.shape[1]
+    num_classes = int(np.max(labels)) + 1
+
+    # per-class statistics of each annotator, flattened as annotator_idx * num_classes + label
+    class_idx = annotator_idx * num_classes + labels
+    minlength = num_annotators * num_classes
+    class_count = np.bincount(class_idx, minlength=minlength).reshape(num_annotators, -1)
+    class_correct = np.bincount(
+        class_idx, weights=labels == consensus_label[example_idx], minlength=minlength
+    ).reshape(num_annotators, -1)
+    class_quality = np.bincount(
+        class_idx, weights=consensus_quality_score[example_idx], minlength=minlength
+    ).reshape(num_annotators, -1)
+
+    # only consider the classes labeled by each annotator
+    candidates = class_count > 0
+    num_labeled = np.maximum(class_count, 1)
+    candidates = select_best_candidates(candidates, -class_correct / num_labeled)
+
+    # tiebreak 1: class counts
+    candidates = select_best_candidates(candidates, class_count)
+
+    # tiebreak 2: consensus quality scores
+    candidates = select_best_candidates(candidates, class_quality / num_labeled)
+
+    # return first item even if there are ties - no better methods to tiebreak
+    worst_class = np.argmax(candidates, axis=1)
 
     return worst_class
 
 
-def _get_single_annotator_worst_class(
-    labels: np.ndarray,
-    consensus_label: np.ndarray,
-    consensus_quality_score: np.ndarray,
-) -> int:
-    """Returns the class a given annotator makes the most errors in.
+def _get_labeled_active_learning_scores(
+    labels_multiannotator: SparseMultiannotatorLabels,
+    quality_of_consensus: np.ndarray,
+    model_weight: float,
+    annotator_weight: np.ndarray,
+    avg_annotator_weight: float,
+    num_classes: int,
+) -> np.ndarray:
+    """Returns the active learning scores of the labeled examples, the weighted average of the quality of the consensus label
+    (weighted by the model weight plus the weights of the annotators that labeled the example) and ``1 / num_classes``
+    (weighted by the average annotator weight).
 
-    Parameters
-    ----------
-    labels : np.ndarray
-        An array of shape ``(N,)`` with the labels from the annotator we want to evaluate.
-    consensus_label : np.ndarray
-        An array of shape ``(N,)`` with the consensus labels aggregated from all annotators.
-    consensus_quality_score : np.ndarray
-        An array of shape ``(N,)`` with the quality score of the consensus.
+    For more info about parameters, see the docstring of `~cleanlab.multiannotator.get_active_learning_scores`.
+    """
+    labeled_weight = (
+        np.bincount(
+            labels_multiannotator.example_idx,
+            weights=annotator_weight[labels_multiannotator.annotator_idx],
+            minlength=len(labels_multiannotator),
+        )
+        + model_weight
+    )
+    return (
+        np.asarray(quality_of_consensus) * labeled_weight + avg_annotator_weight / num_classes
+    ) / (labeled_weight + avg_annotator_weight)
+
+
+def _get_unlabeled_active_learning_scores(
+    pred_probs_unlabeled: np.ndarray,
+    optimal_temp: float,
+    model_weight: float,
+    avg_annotator_weight: float,
+    top: Optional[int] = None,
+    n_jobs: Optional[int] = None,
+) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+    """Returns the active learning scores of the unlabeled examples, the weighted average of the highest temperature scaled
+    predicted probability (weighted by the model weight) and ``1 / num_classes`` (weighted by the average annotator weight).
+
+    The examples are scored in blocks spread across `n_jobs` threads, so the temporary arrays only hold one block per thread
+    and `pred_probs_unlabeled` can also be a memmap array.
+    If `top` is specified, only returns the indices and scores of the `top` examples with the lowest scores,
+    without storing the scores of all examples.
+    """
+    num_examples, num_classes = pred_probs_unlabeled.shape
+
+    def score_block(start: int, end: int) -> Any:
+        scaled_pred_probs = temp_scale_pred_probs(pred_probs_unlabeled[start:end], optimal_temp)
+        quality_of_consensus = np.max(scaled_pred_probs, axis=1)
+        scores = (
+            quality_of_consensus * model_weight + (1 / num_classes) * avg_annotator_weight
+        ) / (model_weight + avg_annotator_weight)
+        if top is None:
+            return scores
+        return _select_lowest_scores(np.arange(start, end), scores, top)
+
+    block_rows = max(ACTIVE_LEARNING_BLOCK_SIZE // num_classes, 1)
+    results = _map_blocks(score_block, num_examples, block_rows, n_jobs)
+    if top is None:
+        return np.concatenate([np.array([])] + results)
+    return _select_lowest_scores(
+        np.concatenate([np.array([], dtype=int)] + [idx for idx, _ in results]),
+        np.concatenate([np.array([])] + [scores for _, scores in results]),
+        top,
+    )
 
-    Returns
-    -------
-    worst_class : int
-        The class that is most frequently mislabeled by the given annotator.
+
+def _get_unlabeled_active_learning_scores_ensemble(
+    pred_probs_unlabeled: np.ndarray,
+    optimal_temp: np.ndarray,
+    model_weight: np.ndarray,
+    avg_annotator_weight: float,
+    top: Optional[int] = None,
+    n_jobs: Optional[int] = None,
+) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+    """Returns the active learning scores of the unlabeled examples based on predictions from an ensemble of models.
+    The consensus label of each example is the majority vote of the models (as if each model was an annotator in
+    `~cleanlab.multiannotator.get_majority_vote_label`), and its score is its self-confidence under the weighted average of the
+    temperature scaled predicted probabilities of each model and ``1 / num_classes``.
+
+    Like `~cleanlab.multiannotator._get_unlabeled_active_learning_scores`, the examples are scored in blocks spread across `n_jobs` threads.
+    The few examples that are still tied after breaking ties with the average predicted probabilities need statistics of all the examples,
+    so they are scored after all the blocks.
     """
-    labels = pd.Series(labels)
-    labels_mask = pd.notna(labels)
-    class_accuracies = (labels[labels_mask] == consensus_label[labels_mask]).groupby(labels).mean()
-    accuracy_min_idx = class_accuracies[class_accuracies == class_accuracies.min()].index.values
+    num_models, num_examples, num_classes = pred_probs_unlabeled.shape
+    weights = np.concatenate((model_weight, np.array([avg_annotator_weight])))
+
+    def score_block(start: int, end: int) -> Any:
+        scaled_pred_probs = np.stack(
+            [
+                temp_scale_pred_probs(pred_probs_unlabeled[i, start:end], optimal_temp[i])
+                for i in range(num_models)
+            ]
+        )
+        modified_pred_probs = np.average(
+            np.concatenate(
+                (
+                    scaled_pred_probs,
+                    np.full(scaled_pred_probs.shape[1:], 1 / num_classes)[np.newaxis, :, :],
+                )
+            ),
+            weights=weights,
+            axis=0,
+        )
 
-    if len(accuracy_min_idx) == 1:
-        return accuracy_min_idx[0]
+        # majority vote of the models, tiebreak 1: using the average pred_probs
+        model_labels = np.argmax(scaled_pred_probs, axis=2)
+        block_idx = np.arange(end - start)
+        label_count = np.zeros((end - start, num_classes))
+        for labels in model_labels:
+            label_count[block_idx, labels] += 1
+        modes_mask = label_count == np.max(label_count, axis=1, keepdims=True)
+        nontied_mask = np.sum(modes_mask, axis=1) == 1
+        candidates = break_majority_vote_ties(
+            modes_mask, pred_probs=np.mean(scaled_pred_probs, axis=0)
+        )
+        consensus_label = np.argmax(candidates, axis=1)
 
-    # tiebreak 1: class counts
-    class_count = labels[labels_mask].groupby(labels).count()[accuracy_min_idx]
-    count_max_idx = class_count[class_count == class_count.max()].index.values
+        # self-confidence of the consensus label, like get_label_quality_scores
+        tied_mask = np.sum(candidates, axis=1) > 1
+        scores = modified_pred_probs[block_idx, consensus_label]
+        if top is None:
+            scores[tied_mask] = np.NaN
+        else:
+            scores = _select_lowest_scores(block_idx[~tied_mask] + start, scores[~tied_mask], top)
+
+        # statistics to break the remaining ties: class frequencies and agreement of each model with the non-tied consensus
+        tie_stats = (
+            np.sum(label_count, axis=0),
+            np.sum(model_labels[:, nontied_mask] == consensus_label[nontied_mask], axis=1),
+            np.sum(nontied_mask),
+            block_idx[tied_mask] + start,
+            candidates[tied_mask],
+            label_count[tied_mask],
+            model_labels[:, tied_mask],
+            modified_pred_probs[tied_mask],
+        )
+        return scores, tie_stats
 
-    if len(count_max_idx) == 1:
-        return count_max_idx[0]
+    block_rows = max(ACTIVE_LEARNING_BLOCK_SIZE // (num_models * num_classes), 1)
+    results = _map_blocks(score_block, num_examples, block_rows, n_jobs)
+    tie_stats = [stats for _, stats in results]
 
-    # tiebreak 2: consensus quality scores
-    avg_consensus_quality = (
-        pd.DataFrame(
-            {"annotator_label": labels, "consensus_quality_score": consensus_quality_score}
-        )[labels_mask]
-        .groupby("annotator_label")
-        .mean()["consensus_quality_score"][count_max_idx]
+    tied_idx = np.concatenate([np.array([], dtype=int)] + [stats[3] for stats in tie_stats])
+    tied_scores = np.array([])
+    if len(tied_idx) > 0:
+        tied_candidates = np.concatenate([stats[4] for stats in tie_stats])
+        tied_label_count = np.concatenate([stats[5] for stats in tie_stats])
+        tied_model_labels = np.concatenate([stats[6] for stats in tie_stats], axis=1)
+        tied_modified_pred_probs = np.concatenate([stats[7] for stats in tie_stats])
+
+        # tiebreak 2: using empirical class frequencies
+        class_frequencies = np.sum([stats[0] for stats in tie_stats], axis=0)
+        tied_candidates = break_majority_vote_ties(
+            tied_candidates, class_frequencies=class_frequencies
+        )
+
+        # tiebreak 3: using the agreement of each model with the consensus of the non-tied examples
+        still_tied_mask = np.sum(tied_candidates, axis=1) > 1
+        if np.any(still_tied_mask):
+            model_agreement = impute_missing_agreement(
+                np.sum([stats[1] for stats in tie_stats], axis=0)
+                / np.sum([stats[2] for stats in tie_stats])
+            )
+
+            tied_label_weight = np.zeros(tied_label_count.shape)
+            for agreement, labels in zip(model_agreement, tied_model_labels):
+                tied_label_weight[np.arange(len(tied_idx)), labels] += agreement
+            tied_candidates[still_tied_mask] = break_ties_by_agreement(
+                tied_candidates[still_tied_mask],
+                tied_label_count[still_tied_mask],
+                tied_label_weight[still_tied_mask],
+            )
+
+        # if still tied, break by random selection
+        tied_consensus_label = break_ties_randomly(tied_candidates, tied_idx)
+
+        tied_scores = tied_modified_pred_probs[np.arange(len(tied_idx)), tied_consensus_label]
+
+    if top is None:
+        scores = np.concatenate([np.array([])] + [scores for scores, _ in results])
+        scores[tied_idx] = tied_scores
+        return scores
+    return _select_lowest_scores(
+        np.concatenate([tied_idx] + [idx for (idx, _), _ in results]),
+        np.concatenate([tied_scores] + [scores for (_, scores), _ in results]),
+        top,
     )
-    quality_max_idx = avg_consensus_quality[
-        avg_consensus_quality == avg_consensus_quality.max()
-    ].index.values
 
-    # return first item even if there are ties - no better methods to tiebreak
-    return quality_max_idx[0]
+
+def _map_blocks(
+    func: Any, num_examples: int, block_rows: int, n_jobs: Optional[int] = None
+) -> list:
+    """Applies ``func(start, end)`` to each block of `block_rows` examples, in order,
+    using `n_jobs` threads if there is more than one block. If `n_jobs` is None, uses one thread per physical core.
+    """
+    n_jobs = get_num_jobs(n_jobs)
+    block_ends = [
+        (start, min(start + block_rows, num_examples))
+        for start in range(0, num_examples, block_rows)
+    ]
+    if n_jobs > 1 and len(block_ends) > 1:
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            return list(executor.map(lambda block: func(*block), block_ends))
+    return [func(start, end) for start, end in block_ends]
+
+
+def _select_lowest_scores(
+    idx: np.ndarray, scores: np.ndarray, top: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the indices and scores of the `top` lowest scores, sorted from lowest to highest score,
+    where equal scores are sorted by index like a stable sort of all the scores would."""
+    if top < len(scores):
+        kth_score = np.partition(scores, top - 1)[top - 1]
+        keep = np.flatnonzero(scores <= kth_score)
+        idx, scores = idx[keep], scores[keep]
+    order = np.lexsort((idx, scores))[:top]
+    return idx[order], scores[order]
@@ -1,4 +1,5 @@
 from .rank import get_label_quality_scores
+from cleanlab.internal.multilabel_utils import SparseMultilabelLabels
 from . import rank
 from . import dataset
 from . import filter
@@ -27,7 +27,7 @@ from cleanlab.multilabel_classification.filter import (
     find_multilabel_issues_per_class,
     find_label_issues,
 )
-from cleanlab.internal.multilabel_utils import get_onehot_num_classes
+from cleanlab.internal.multilabel_utils import as_sparse_multilabel_labels
 from collections import defaultdict
 
 
@@ -44,7 +44,7 @@ def common_multilabel_issues(
 
     Parameters
     ----------
-    labels : List[List[int]]
+    labels : List[List[int]] or SparseMultilabelLabels
        List of noisy labels for multi-label classification where each example can belong to multiple classes.
        Refer to documentation for this argument in :py:func:`multilabel_classification.filter.find_label_issues <cleanlab.multilabel_classification.filter.find_label_issues>` for further details.
 
@@ -77,20 +77,21 @@ def common_multilabel_issues(
 
     num_examples = _get_num_examples_multilabel(labels=labels, confident_joint=confident_joint)
     summary_issue_counts = defaultdict(list)
-    y_one, num_classes = get_onehot_num_classes(labels, pred_probs)
-    label_issues_list, labels_list, pred_probs_list = find_multilabel_issues_per_class(
+    labels = as_sparse_multilabel_labels(labels, pred_probs)
+    label_issues = find_multilabel_issues_per_class(
         labels=labels,
         pred_probs=pred_probs,
         confident_joint=confident_joint,
-        return_indices_ranked_by="self_confidence",
     )
-
-    for class_num, (label, issues_for_class) in enumerate(zip(y_one.T, label_issues_list)):
-        binary_label_issues = np.zeros(len(label)).astype(bool)
-        binary_label_issues[issues_for_class] = True
-        true_but_false_count = sum(np.logical_and(label == 1, binary_label_issues))
-        false_but_true_count = sum(np.logical_and(label == 0, binary_label_issues))
-
+    assert isinstance(label_issues, np.ndarray)
+
+    # Split the issues of each class by whether the class is in the given label, using the sparse labels
+    in_given_label = label_issues[labels.example_idx, labels.indices]
+    true_but_false_counts = np.bincount(labels.indices[in_given_label], minlength=labels.shape[1])
+    false_but_true_counts = np.count_nonzero(label_issues, axis=0) - true_but_false_counts
+    for class_num, (true_but_false_count, false_but_true_count) in enumerate(
+        zip(true_but_false_counts, false_but_true_counts)
+    ):
         if class_names is not None:
             summary_issue_counts["Class Name"].append(class_names[class_num])
         summary_issue_counts["Class Index"].append(class_num)
@@ -290,6 +291,9 @@ def multilabel_health_summary(
 
     if num_examples is None:
         num_examples = _get_num_examples_multilabel(labels=labels)
+    if labels is not None:
+        # Convert the labels once, instead of in each of the summaries below
+        labels = as_sparse_multilabel_labels(labels, pred_probs)
 
     if verbose:
         longest_line = f"|   for your dataset with {num_examples:,} examples "
@@ -25,9 +25,11 @@ import inspect
 from typing import Optional, Union, Tuple, List, Any
 import numpy as np
 
+from cleanlab.internal.multilabel_utils import SparseMultilabelLabels
+
 
 def find_label_issues(
-    labels: list,
+    labels: Union[list, SparseMultilabelLabels],
     pred_probs: np.ndarray,
     return_indices_ranked_by: Optional[str] = None,
     rank_by_kwargs={},
@@ -46,13 +48,18 @@ def find_label_issues(
 
     Parameters
     ----------
-    labels : List[List[int]]
+    labels : List[List[int]] or SparseMultilabelLabels
       List of noisy labels for multi-label classification where each example can belong to multiple classes.
       This is an iterable of iterables where the i-th element of `labels` corresponds to a list of classes that the i-th example belongs to,
       according to the original data annotation (e.g. ``labels = [[1,2],[1],[0],..]``).
       This method will return the indices i where the inner list ``labels[i]`` is estimated to have some error.
       For a dataset with K classes, each class must be represented as an integer in 0, 1, ..., K-1 within the labels.
 
+      For large datasets, the labels can instead be stored in sparse format as a
+      :py:class:`SparseMultilabelLabels <cleanlab.multilabel_classification.SparseMultilabelLabels>` object,
+      e.g. ``SparseMultilabelLabels.from_lists(labels)`` or ``SparseMultilabelLabels.from_csr(sparse_matrix)``,
+      which avoids the dense one-hot matrix of labels and is only converted once for all classes.
+
     pred_probs : np.ndarray
       An array of shape ``(N, K)`` of model-predicted class probabilities.
       Each row of this matrix corresponds to an example `x`
@@ -170,7 +177,7 @@ def find_label_issues(
 
 
 def find_multilabel_issues_per_class(
-    labels: list,
+    labels: Union[list, SparseMultilabelLabels],
     pred_probs: np.ndarray,
     return_indices_ranked_by: Optional[str] = None,
     rank_by_kwargs={},
@@ -191,7 +198,7 @@ def find_multilabel_issues_per_class(
 
     Parameters
     ----------
-    labels : List[List[int]]
+    labels : List[List[int]] or SparseMultilabelLabels
       List of noisy labels for multi-label classification where each example can belong to multiple classes.
       Refer to documentation for this argument in `~cleanlab.multilabel_classification.filter.find_label_issues` for further details.
       This method will identify whether ``labels[i][k]`` appears correct, for every example ``i`` and class ``k``.
@@ -251,17 +258,18 @@ def find_multilabel_issues_per_class(
         - *pred_probs_list*: a one-vs-rest representation of the original predicted probabilities of shape ``(N, 2)``, useful if you want to compute label quality scores.
           ``pred_probs_list[k][i][0]`` is the estimated probability that example ``i`` belongs to class ``k``, and is equal to: ``1 - pred_probs_list[k][i][1]``.
     """
-    import cleanlab.filter
-    from cleanlab.internal.multilabel_utils import get_onehot_num_classes, stack_complement
+    import cleanlab.internal.multilabel_scorer as ml_scorer
+    from cleanlab.internal.multilabel_utils import (
+        as_sparse_multilabel_labels,
+        find_one_vs_rest_label_issues,
+        stack_complement,
+    )
     from cleanlab.experimental.label_issues_batched import find_label_issues_batched
 
-    y_one, num_classes = get_onehot_num_classes(labels, pred_probs)
-    if return_indices_ranked_by is None:
-        bissues = np.zeros(y_one.shape).astype(bool)
-    else:
-        label_issues_list = []
-    labels_list = []
-    pred_probs_list = []
+    labels = as_sparse_multilabel_labels(labels, pred_probs)
+    num_classes = labels.shape[1]
+    # Binary labels of shape (N, K), stored as the (K, N) array used by the one-vs-rest engine and scorer
+    y_one = labels.to_one_vs_rest().T
     if confident_joint is not None and not low_memory:
         confident_joint_shape = confident_joint.shape
         if confident_joint_shape == (num_classes, num_classes):
@@ -271,41 +279,56 @@ def find_multilabel_issues_per_class(
             confident_joint = None
         elif confident_joint_shape != (num_classes, 2, 2):
             raise ValueError("confident_joint should be of shape (num_classes, 2, 2)")
+
+    if not low_memory:
+        # All one-vs-rest problems are solved together, see `find_one_vs_rest_label_issues`
+        bissues = find_one_vs_rest_label_issues(
+            y_one,
+            pred_probs,
+            filter_by=filter_by,
+            frac_noise=frac_noise,
+            num_to_remove_per_class=num_to_remove_per_class,
+            min_examples_per_class=min_examples_per_class,
+            confident_joint=confident_joint,
+            n_jobs=n_jobs,
+        )
+        if verbose:
+            print("Number of label issues found per class: {}".format(bissues.sum(axis=0)))
+        if return_indices_ranked_by is None:
+            return bissues
+        class_label_quality_scores = ml_scorer.MultilabelScorer(
+            base_scorer=ml_scorer.ClassLabelScorer.from_str(return_indices_ranked_by),
+        ).get_class_label_quality_scores(y_one, pred_probs, base_scorer_kwargs=rank_by_kwargs)
+        label_issues_list = []
+        for class_num in range(num_classes):
+            label_issues_idx = np.flatnonzero(bissues[:, class_num])
+            label_quality_scores_issues = class_label_quality_scores[label_issues_idx, class_num]
+            label_issues_list.append(label_issues_idx[np.argsort(label_quality_scores_issues)])
+        labels_list = [label.astype(int) for label in y_one.T]
+        pred_probs_list = [
+            stack_complement(pred_prob_for_class) for pred_prob_for_class in pred_probs.T
+        ]
+        return label_issues_list, labels_list, pred_probs_list
+
+    if return_indices_ranked_by is None:
+        bissues = np.zeros(y_one.shape).astype(bool)
+    else:
+        label_issues_list = []
+    labels_list = []
+    pred_probs_list = []
     for class_num, (label, pred_prob_for_class) in enumerate(zip(y_one.T, pred_probs.T)):
+        label = label.astype(int)
         pred_probs_binary = stack_complement(pred_prob_for_class)
-        if low_memory:
-            quality_score_kwargs = (
-                {"method": return_indices_ranked_by} if return_indices_ranked_by else None
-            )
-            binary_label_issues = find_label_issues_batched(
-                labels=label,
-                pred_probs=pred_probs_binary,
-                verbose=verbose,
-                quality_score_kwargs=quality_score_kwargs,
-                return_mask=return_indices_ranked_by is None,
-            )
-        else:
-            if confident_joint is None:
-                conf = None
-            else:
-                conf = confident_joint[class_num]
-            if num_to_remove_per_class is not None:
-                ml_num_to_remove_per_class = [num_to_remove_per_class[class_num], 0]
-            else:
-                ml_num_to_remove_per_class = None
-            binary_label_issues = cleanlab.filter.find_label_issues(
-                labels=label,
-                pred_probs=pred_probs_binary,
-                return_indices_ranked_by=return_indices_ranked_by,
-                frac_noise=frac_noise,
-                rank_by_kwargs=rank_by_kwargs,
-                filter_by=filter_by,
-                num_to_remove_per_class=ml_num_to_remove_per_class,
-                min_examples_per_class=min_examples_per_class,
-                confident_joint=conf,
-                n_jobs=n_jobs,
-                verbose=verbose,
-            )
+        quality_score_kwargs = (
+            {"method": return_indices_ranked_by} if return_indices_ranked_by else None
+        )
+        binary_label_issues = find_label_issues_batched(
+            labels=label,
+            pred_probs=pred_probs_binary,
+            verbose=verbose,
+            quality_score_kwargs=quality_score_kwargs,
+            return_mask=return_indices_ranked_by is None,
+        )
 
         if return_indices_ranked_by is None:
             bissues[:, class_num] = binary_label_issues
@@ -22,11 +22,10 @@ Unlike in standard multi-class classification, model-predicted class probabiliti
 from __future__ import annotations
 
 import numpy as np  # noqa: F401: Imported for type annotations
-from typing import List, TypeVar, Dict, Any, Optional, Tuple, TYPE_CHECKING
+from typing import List, TypeVar, Dict, Any, Optional, Tuple, Union, TYPE_CHECKING
 
 from cleanlab.internal.validation import assert_valid_inputs
-from cleanlab.internal.util import get_num_classes
-from cleanlab.internal.multilabel_utils import int2onehot
+from cleanlab.internal.multilabel_utils import SparseMultilabelLabels, as_sparse_multilabel_labels
 from cleanlab.internal.multilabel_scorer import MultilabelScorer, ClassLabelScorer, Aggregator
 
 
@@ -37,16 +36,16 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 def _labels_to_binary(
-    labels: List[List[int]],
+    labels: Union[List[List[int]], SparseMultilabelLabels],
     pred_probs: npt.NDArray["np.floating[T]"],
-) -> np.ndarray:
-    """Validate the inputs to the multilabel scorer. Also transform the labels to a binary representation."""
-    assert_valid_inputs(
-        X=None, y=labels, pred_probs=pred_probs, multi_label=True, allow_one_class=True
-    )
-    num_classes = get_num_classes(labels=labels, pred_probs=pred_probs, multi_label=True)
-    binary_labels = int2onehot(labels, K=num_classes)
-    return binary_labels
+) -> SparseMultilabelLabels:
+    """Validate the inputs to the multilabel scorer. Also transform the labels to a binary representation,
+    which is stored in sparse format until the scorer needs it."""
+    if not isinstance(labels, SparseMultilabelLabels):
+        assert_valid_inputs(
+            X=None, y=labels, pred_probs=pred_probs, multi_label=True, allow_one_class=True
+        )
+    return as_sparse_multilabel_labels(labels, pred_probs)
 
 
 def _create_multilabel_scorer(
@@ -66,7 +65,7 @@ def _create_multilabel_scorer(
 
 
 def get_label_quality_scores(
-    labels: List[List[int]],
+    labels: Union[List[List[int]], SparseMultilabelLabels],
     pred_probs: npt.NDArray["np.floating[T]"],
     *,
     method: str = "self_confidence",
@@ -82,7 +81,7 @@ def get_label_quality_scores(
 
     Parameters
     ----------
-    labels : List[List[int]]
+    labels : List[List[int]] or SparseMultilabelLabels
        List of noisy labels for multi-label classification where each example can belong to multiple classes.
        Refer to documentation for this argument in :py:func:`multilabel_classification.filter.find_label_issues <cleanlab.multilabel_classification.filter.find_label_issues>` for further details.
 
@@ -137,7 +136,7 @@ def get_label_quality_scores(
 
 
 def get_label_quality_scores_per_class(
-    labels: List[List[int]],
+    labels: Union[List[List[int]], SparseMultilabelLabels],
     pred_probs: npt.NDArray["np.floating[T]"],
     *,
     method: str = "self_confidence",
@@ -152,7 +151,7 @@ def get_label_quality_scores_per_class(
 
     Parameters
     ----------
-    labels : List[List[int]]
+    labels : List[List[int]] or SparseMultilabelLabels
        List of noisy labels for multi-label classification where each example can belong to multiple classes.
        Refer to documentation for this argument in :py:func:`find_label_issues <cleanlab.multilabel_classification.filter.find_label_issues>` for further details.
 
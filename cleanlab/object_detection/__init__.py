@@ -1,3 +1,4 @@
 from . import rank
 from . import filter
 from . import summary
+from . import ragged
@@ -16,7 +16,6 @@
 
 """Methods to find label issues in an object detection dataset, where each annotated bounding box in an image receives its own class label."""
 
-from collections import defaultdict
 from multiprocessing import Pool
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -32,10 +31,10 @@ from cleanlab.internal.constants import (
     AP_SCALE_FACTOR,
 )
 from cleanlab.internal.object_detection_utils import assert_valid_inputs
+from cleanlab.object_detection.ragged import RaggedBoxes
 from cleanlab.object_detection.rank import (
+    _get_subtype_label_quality_scores,
     _get_valid_inputs_for_compute_scores,
-    _separate_label,
-    _separate_prediction,
     compute_badloc_box_scores,
     compute_overlooked_box_scores,
     compute_swap_box_scores,
@@ -46,8 +45,8 @@ from cleanlab.object_detection.rank import (
 
 
 def find_label_issues(
-    labels: List[Dict[str, Any]],
-    predictions: List[np.ndarray],
+    labels: Union[List[Dict[str, Any]], RaggedBoxes],
+    predictions: Union[List[np.ndarray], RaggedBoxes],
     *,
     return_indices_ranked_by_score: Optional[bool] = False,
     overlapping_label_check: Optional[bool] = True,
@@ -77,6 +76,9 @@ def find_label_issues(
 
         For more information on proper labels formatting, check out the `MMDetection library <https://mmdetection.readthedocs.io/en/dev-3.x/advanced_guides/customize_dataset.html>`_.
 
+        Labels may also be provided as a :py:class:`RaggedBoxes <cleanlab.object_detection.ragged.RaggedBoxes>` object, which stores the boxes of all images in flat arrays.
+        Use ``RaggedBoxes.from_labels(labels)`` to convert from the list format.
+
     predictions:
         Predictions output by a trained object detection model.
         For the most accurate results, predictions should be out-of-sample to avoid overfitting, eg. obtained via :ref:`cross-validation <pred_probs_cross_val>`.
@@ -89,6 +91,9 @@ def find_label_issues(
 
         For more information see the `MMDetection package <https://github.com/open-mmlab/mmdetection>`_ for an example object detection library that outputs predictions in the correct format.
 
+        Predictions may also be provided as a :py:class:`RaggedBoxes <cleanlab.object_detection.ragged.RaggedBoxes>` object, which stores the boxes of all images in flat arrays.
+        Use ``RaggedBoxes.from_predictions(predictions)`` to convert from the list format.
+
     return_indices_ranked_by_score:
         Determines what is returned by this method (see description of return value for details).
 
@@ -125,8 +130,8 @@ def find_label_issues(
 
 
 def _find_label_issues(
-    labels: List[Dict[str, Any]],
-    predictions: List[np.ndarray],
+    labels: Union[List[Dict[str, Any]], RaggedBoxes],
+    predictions: Union[List[np.ndarray], RaggedBoxes],
     *,
     scoring_method: Optional[str] = "objectlab",
     return_indices_ranked_by_score: Optional[bool] = True,
@@ -138,8 +143,8 @@ def _find_label_issues(
         auxiliary_inputs = _get_valid_inputs_for_compute_scores(ALPHA, labels, predictions)
 
         per_class_scores = _get_per_class_ap(labels, predictions)
-        lab_list = [_separate_label(label)[1] for label in labels]
-        pred_list = [_separate_prediction(pred)[1] for pred in predictions]
+        lab_list = [auxiliary_input["lab_labels"] for auxiliary_input in auxiliary_inputs]
+        pred_list = [auxiliary_input["pred_labels"] for auxiliary_input in auxiliary_inputs]
         pred_thresholds_list = _process_class_list(pred_list, per_class_scores)
         lab_thresholds_list = _process_class_list(lab_list, per_class_scores)
         overlooked_scores_per_box = compute_overlooked_box_scores(
@@ -186,7 +191,13 @@ def _find_label_issues(
         )
 
     if return_indices_ranked_by_score:
-        scores = get_label_quality_scores(labels, predictions)
+        if scoring_method == "objectlab":
+            # Reuse the auxiliary inputs from above instead of recomputing them for every image
+            scores = _get_subtype_label_quality_scores(
+                labels, predictions, alpha=ALPHA, auxiliary_inputs=auxiliary_inputs
+            )
+        else:
+            scores = get_label_quality_scores(labels, predictions)
         sorted_scores_idx = issues_from_scores(scores, threshold=1.0)
         is_issue_idx = np.where(is_issue == True)[0]
         sorted_issue_mask = np.in1d(sorted_scores_idx, is_issue_idx, assume_unique=True)
@@ -259,68 +270,83 @@ def _process_class_list(class_list: List[np.ndarray], class_dict: Dict[int, floa
 
 
 def _calculate_ap_per_class(
-    labels: List[Dict[str, Any]],
-    predictions: List[np.ndarray],
+    labels: Union[List[Dict[str, Any]], RaggedBoxes],
+    predictions: Union[List[np.ndarray], RaggedBoxes],
     *,
-    iou_threshold: Optional[float] = 0.5,
+    iou_threshold: Union[float, np.ndarray] = 0.5,
     num_procs: int = 1,
 ) -> List:
     """
     Computes the average precision for each class based on provided labels and predictions.
     It uses an Intersection over Union (IoU) threshold and supports parallel processing with a specified number of processes.
-
+    If `iou_threshold` is an array of ``T`` thresholds, the average precision of each class is computed for all of them in a single pass over the images,
+    and the returned array for each class has shape ``(T,)``.
     """
     num_images = len(predictions)
-    num_scale = 1
-    num_classes = len(predictions[0])
-    if num_images > 1:
-        num_procs = min(num_procs, num_images)
-        pool = Pool(num_procs)
+    if isinstance(predictions, RaggedBoxes):
+        num_classes = predictions.num_classes
+    else:
+        num_classes = len(predictions[0])
+    if num_procs > 1 and num_images > 1:
+        with Pool(min(num_procs, num_images)) as pool:
+            tpfpfn_per_image = _get_true_positives_false_positives_per_image(
+                labels, predictions, iou_threshold, pool
+            )
+    else:
+        tpfpfn_per_image = _get_true_positives_false_positives_per_image(
+            labels, predictions, iou_threshold
+        )
+
+    pred_probs_per_class: List[List[np.ndarray]]
+    if isinstance(predictions, RaggedBoxes):
+        pred_probs_per_class = [
+            [pred_bboxes[:, -1] for pred_bboxes in predictions.class_boxes(class_num)]
+            for class_num in range(num_classes)
+        ]
+    else:
+        pred_probs_per_class = [[] for _ in range(num_classes)]
+        for prediction in predictions:
+            for class_num in range(num_classes):
+                pred_probs_per_class[class_num].append(prediction[class_num][:, -1])
+
     ap_per_class_list = []
     for class_num in range(num_classes):
-        pred_bboxes, lab_bboxes = _filter_by_class(labels, predictions, class_num)
-        if num_images > 1:
-            tpfp = pool.starmap(
-                _calculate_true_positives_false_positives,
-                zip(pred_bboxes, lab_bboxes, [iou_threshold for _ in range(num_images)]),
-            )
-        else:
-            tpfp = [
-                _calculate_true_positives_false_positives(
-                    pred_bboxes[0],
-                    lab_bboxes[0],
-                    iou_threshold,
-                )
-            ]
-        true_positives, false_positives = tuple(zip(*tpfp))
-        num_gts = np.zeros(num_scale, dtype=int)
-        for j, bbox in enumerate(lab_bboxes):
-            num_gts[0] += bbox.shape[0]
-        pred_bboxes = np.vstack(pred_bboxes)
-        sort_inds = np.argsort(-pred_bboxes[:, -1])
+        true_positives, false_positives, false_negatives = tuple(
+            zip(*(tpfpfn[class_num] for tpfpfn in tpfpfn_per_image))
+        )
+        num_gts = np.array([sum(fn.shape[-1] for fn in false_negatives)])
+        sort_inds = np.argsort(-np.concatenate(pred_probs_per_class[class_num]))
         true_positives = np.hstack(true_positives)[:, sort_inds]
         false_positives = np.hstack(false_positives)[:, sort_inds]
         true_positives = np.cumsum(true_positives, axis=1)
         false_positives = np.cumsum(false_positives, axis=1)
         eps = np.finfo(np.float32).eps
-        recalls = true_positives / np.maximum(num_gts[:, np.newaxis], eps)
+        recalls = true_positives / np.maximum(num_gts, eps)
         precisions = true_positives / np.maximum((true_positives + false_positives), eps)
-        recalls = recalls[0, :]
-        precisions = precisions[0, :]
-        ap = _calculate_average_precision(recalls, precisions)
+        ap = np.concatenate(
+            [
+                _calculate_average_precision(recalls_i, precisions_i)
+                for recalls_i, precisions_i in zip(recalls, precisions)
+            ]
+        )
         ap_per_class_list.append(ap)
-    if num_images > 1:
-        pool.close()
     return ap_per_class_list
 
 
 def _filter_by_class(
-    labels: List[Dict[str, Any]], predictions: List[np.ndarray], class_num: int
+    labels: Union[List[Dict[str, Any]], RaggedBoxes],
+    predictions: Union[List[np.ndarray], RaggedBoxes],
+    class_num: int,
 ) -> Tuple[List, List]:
     """
     Filters predictions and labels based on a specific class number.
     """
-    pred_bboxes = [prediction[class_num] for prediction in predictions]
+    if isinstance(predictions, RaggedBoxes):
+        pred_bboxes = predictions.class_boxes(class_num)
+    else:
+        pred_bboxes = [prediction[class_num] for prediction in predictions]
+    if isinstance(labels, RaggedBoxes):
+        return pred_bboxes, labels.class_boxes(class_num)
     lab_bboxes = []
     for label in labels:
         gt_inds = label["labels"] == class_num
@@ -350,28 +376,104 @@ def _calculate_true_positives_false_positives(
             return true_positives, false_positives, np.array([], dtype=np.float32)
         else:
             return true_positives, false_positives
+    true_positives, false_positives, false_negatives = (
+        _calculate_true_positives_false_positives_per_threshold(
+            pred_bboxes, lab_bboxes, np.array([iou_threshold])
+        )
+    )
+    if return_false_negative:
+        return true_positives, false_positives, false_negatives
+    return true_positives, false_positives
+
+
+def _calculate_true_positives_false_positives_per_threshold(
+    pred_bboxes: np.ndarray,
+    lab_bboxes: np.ndarray,
+    iou_thresholds: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Calculates true positives, false positives and false negatives at each of ``T`` IoU thresholds at once.
+    The IoU matrix between predicted and given boxes is computed only once for all thresholds.
+    Returns arrays of shape ``(T, M)``, ``(T, M)`` and ``(T, L)`` for ``M`` predicted and ``L`` given boxes.
+    """
+    iou_thresholds = np.asarray(iou_thresholds, dtype=float).reshape(-1, 1)
+    num_thresholds = iou_thresholds.shape[0]
+    num_preds = pred_bboxes.shape[0]
+    num_labels = lab_bboxes.shape[0]
+    true_positives = np.zeros((num_thresholds, num_preds), dtype=np.float32)
+    if num_labels == 0:
+        false_negatives = np.zeros((num_thresholds, 0), dtype=np.float32)
+        return true_positives, 1 - true_positives, false_negatives
+
     ious = _get_overlap_matrix(pred_bboxes, lab_bboxes)
     ious_max = ious.max(axis=1)
     ious_argmax = ious.argmax(axis=1)
     sorted_indices = np.argsort(-pred_bboxes[:, -1])
-    is_covered = np.zeros(num_labels, dtype=bool)
-    for index in sorted_indices:
-        if ious_max[index] >= iou_threshold:
-            matching_label = ious_argmax[index]
-            if not is_covered[matching_label]:
-                is_covered[matching_label] = True
-                true_positives[0, index] = 1
-            else:
-                false_positives[0, index] = 1
-        else:
-            false_positives[0, index] = 1
-    if return_false_negative:
-        false_negatives = np.zeros((num_scales, num_labels), dtype=np.float32)
-        for label_index in range(num_labels):
-            if not is_covered[label_index]:
-                false_negatives[0, label_index] = 1
-        return true_positives, false_positives, false_negatives
-    return true_positives, false_positives
+    sorted_ious_max = ious_max[sorted_indices]
+    sorted_ious_argmax = ious_argmax[sorted_indices]
+    # Predictions are greedily matched in order of decreasing confidence to their most overlapping label.
+    # Column j + 1 holds the largest IoU of the j + 1 most confident predictions matched to each label,
+    # so a prediction is a true positive at the thresholds it passes that no more confident prediction for its label passed.
+    running_ious_max = np.full((num_labels, num_preds + 1), -np.inf)
+    running_ious_max[sorted_ious_argmax, np.arange(1, num_preds + 1)] = sorted_ious_max
+    running_ious_max = np.maximum.accumulate(running_ious_max, axis=1)
+    previous_ious_max = running_ious_max[sorted_ious_argmax, np.arange(num_preds)]
+    true_positives[:, sorted_indices] = (sorted_ious_max >= iou_thresholds) & (
+        previous_ious_max < iou_thresholds
+    )
+    false_negatives = (running_ious_max[:, -1] < iou_thresholds).astype(np.float32)
+    return true_positives, 1 - true_positives, false_negatives
+
+
+def _calculate_true_positives_false_positives_per_class(
+    args: list,
+) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Calculates true positives, false positives and false negatives of every class for a single image.
+
+    Parameters
+    ----------
+    args:
+        List of [pred_bboxes, lab_bboxes, iou_thresholds] for the image,
+        where ``pred_bboxes[k]`` and ``lab_bboxes[k]`` are the predicted and given boxes of class ``k``.
+    """
+    pred_bboxes, lab_bboxes, iou_thresholds = args
+    return [
+        _calculate_true_positives_false_positives_per_threshold(
+            class_pred_bboxes, class_lab_bboxes, iou_thresholds
+        )
+        for class_pred_bboxes, class_lab_bboxes in zip(pred_bboxes, lab_bboxes)
+    ]
+
+
+def _get_true_positives_false_positives_per_image(
+    labels: Union[List[Dict[str, Any]], RaggedBoxes],
+    predictions: Union[List[np.ndarray], RaggedBoxes],
+    iou_thresholds: Union[float, np.ndarray] = 0.5,
+    pool: Optional[Any] = None,
+) -> List[List[Tuple[np.ndarray, np.ndarray, np.ndarray]]]:
+    """Returns the true positives, false positives and false negatives of every class for each image,
+    with one row per IoU threshold in `iou_thresholds`.
+
+    Work is grouped by image so that each image is sent to the ``multiprocessing.Pool`` `pool` only once.
+    If `pool` is None, images are processed in the current process.
+    The boxes of each class are split by `_filter_by_class`, which reads them directly from the flat arrays of ``RaggedBoxes`` inputs.
+    """
+    iou_thresholds = np.atleast_1d(iou_thresholds)
+    if len(predictions) == 0:
+        return []
+    if isinstance(predictions, RaggedBoxes):
+        num_classes = predictions.num_classes
+    else:
+        num_classes = len(predictions[0])
+    pred_bboxes_per_class, lab_bboxes_per_class = zip(
+        *(_filter_by_class(labels, predictions, class_num) for class_num in range(num_classes))
+    )
+    args = [
+        [pred_bboxes, lab_bboxes, iou_thresholds]
+        for pred_bboxes, lab_bboxes in zip(zip(*pred_bboxes_per_class), zip(*lab_bboxes_per_class))
+    ]
+    if pool is None:
+        return [_calculate_true_positives_false_positives_per_class(arg) for arg in args]
+    return pool.map(_calculate_true_positives_false_positives_per_class, args)
 
 
 def _calculate_average_precision(
@@ -403,19 +505,19 @@ def _calculate_average_precision(
 
 
 def _get_per_class_ap(
-    labels: List[Dict[str, Any]], predictions: List[np.ndarray]
+    labels: Union[List[Dict[str, Any]], RaggedBoxes],
+    predictions: Union[List[np.ndarray], RaggedBoxes],
+    num_procs: int = 1,
 ) -> Dict[int, float]:
     """Computes the Average Precision (AP) for each class in an object detection task.
     It takes a list of label dictionaries and a list of prediction arrays as inputs.
     It calculates AP values for different Intersection over Union (IoU) thresholds, averages them per class, and then scales the AP values.
     """
     iou_thrs = np.linspace(0.5, 0.95, int(np.round((0.95 - 0.5) / 0.05)) + 1, endpoint=True)
-    class_num_to_iou_list = defaultdict(list)
-    for threshold in iou_thrs:
-        ap_per_class = _calculate_ap_per_class(labels, predictions, iou_threshold=threshold)
-        for class_num in range(0, len(ap_per_class)):
-            class_num_to_iou_list[class_num].append(ap_per_class[class_num])
+    ap_per_class = _calculate_ap_per_class(
+        labels, predictions, iou_threshold=iou_thrs, num_procs=num_procs
+    )
     class_num_to_AP = {}
-    for class_num in class_num_to_iou_list:
-        class_num_to_AP[class_num] = np.mean(class_num_to_iou_list[class_num]) * AP_SCALE_FACTOR
+    for class_num in range(0, len(ap_per_class)):
+        class_num_to_AP[class_num] = np.mean(ap_per_class[class_num]) * AP_SCALE_FACTOR
     return class_num_to_AP
@@ -0,0 +1,311 @@
+# Copyright (C) 2017-2024  Cleanlab Inc.
+# This file is part of cleanlab.
+#
+# cleanlab is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# cleanlab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with cleanlab.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Compact columnar representation of the labels or predictions of an object detection dataset.
+
+Instead of one Python object per image (and per class for predictions), all bounding boxes of the dataset are stored
+in flat arrays, along with the offsets where the boxes of each image start (similar to the CSR format of sparse matrices).
+A :py:class:`RaggedBoxes` object can be passed as the `labels` or `predictions` argument of the methods in
+:py:mod:`object_detection.rank <cleanlab.object_detection.rank>`, :py:mod:`object_detection.filter <cleanlab.object_detection.filter>`
+and :py:mod:`object_detection.summary <cleanlab.object_detection.summary>`.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class RaggedBoxes:
+    """
+    Stores the bounding boxes of ``N`` images in flat arrays, where the boxes of the `i`-th image are those
+    in ``offsets[i]:offsets[i+1]``.
+
+    This can hold either the given labels of a dataset (when `pred_probs` is ``None``),
+    or the predictions output by a trained object detection model.
+    Use :py:meth:`from_labels` and :py:meth:`from_predictions` to convert from the list formats expected by
+    :py:func:`object_detection.filter.find_label_issues <cleanlab.object_detection.filter.find_label_issues>`,
+    and :py:meth:`to_labels` and :py:meth:`to_predictions` to convert back.
+    Converting back does not copy any data, the arrays of each image are views into the flat arrays.
+
+    Indexing a ``RaggedBoxes`` object with an integer ``i`` returns the labels or predictions for the `i`-th image
+    in the list format, so it can be used anywhere a list of labels or predictions is expected.
+
+    Parameters
+    ----------
+    bboxes:
+        Array of shape ``(B, 4)`` with the bounding boxes of all images, in ``[x1,y1,x2,y2]`` format,
+        where ``B`` is the total number of boxes in the dataset.
+
+    classes:
+        Array of shape ``(B,)`` with the (given or predicted) class label of each bounding box.
+
+    offsets:
+        Array of shape ``(N+1,)`` where the boxes of the `i`-th image are ``bboxes[offsets[i]:offsets[i+1]]``.
+
+    pred_probs:
+        Optional array of shape ``(B,)`` with the model's confidence in the predicted class label of each box.
+        Provide this to store predictions rather than labels.
+        The boxes of each image are then (stably) sorted by their class label, which is the order of the list format.
+
+    num_classes:
+        Optional number of classes ``K`` in the dataset. Defaults to the largest class label plus one.
+
+    image_names:
+        Optional list of ``N`` image names, which are included in the labels returned by :py:meth:`to_labels`.
+    """
+
+    def __init__(
+        self,
+        bboxes: np.ndarray,
+        classes: np.ndarray,
+        offsets: np.ndarray,
+        *,
+        pred_probs: Optional[np.ndarray] = None,
+        num_classes: Optional[int] = None,
+        image_names: Optional[Sequence[Any]] = None,
+    ):
+        offsets = np.asarray(offsets, dtype=np.int64)
+        classes = np.asarray(classes).astype(np.int64, copy=False)
+        bboxes = np.asarray(bboxes)
+        bboxes = bboxes.reshape(len(bboxes), 4)
+        if offsets.ndim != 1 or len(offsets) == 0 or offsets[0] != 0:
+            raise ValueError("offsets must be a 1D array starting at 0.")
+        if np.any(np.diff(offsets) < 0) or offsets[-1] != len(bboxes):
+            raise ValueError(
+                f"offsets must be non-decreasing and end at the number of boxes ({len(bboxes)})."
+            )
+        if len(classes) != len(bboxes):
+            raise ValueError(
+                f"classes and bboxes length needs to match. len(classes) == {len(classes)} while len(bboxes) == {len(bboxes)}."
+            )
+        if num_classes is None:
+            num_classes = int(classes.max()) + 1 if len(classes) else 0
+        elif len(classes) and (classes.min() < 0 or classes.max() >= num_classes):
+            raise ValueError(f"Class labels must be in 0, 1, ..., {num_classes - 1}.")
+        if image_names is not None and len(image_names) != len(offsets) - 1:
+            raise ValueError("image_names must have one entry per image.")
+
+        self.offsets = offsets
+        self.num_classes = num_classes
+        self.image_names = image_names
+        self._class_offsets: Optional[np.ndarray] = None
+        if pred_probs is None:
+            self.classes = classes
+            self._data = bboxes
+            self.bboxes = bboxes
+            self.pred_probs: Optional[np.ndarray] = None
+        else:
+            pred_probs = np.asarray(pred_probs).reshape(-1)
+            if len(pred_probs) != len(bboxes):
+                raise ValueError(
+                    f"pred_probs and bboxes length needs to match. len(pred_probs) == {len(pred_probs)} while len(bboxes) == {len(bboxes)}."
+                )
+            order = np.lexsort((classes, self.image_ids))
+            self._set_predictions(np.column_stack([bboxes, pred_probs])[order], classes[order])
+
+    @classmethod
+    def from_labels(cls, labels: List[Dict[str, Any]], num_classes: Optional[int] = None):
+        """
+        Converts labels in the list format to a ``RaggedBoxes`` object.
+
+        Parameters
+        ----------
+        labels:
+            A list of ``N`` dictionaries such that ``labels[i]`` contains the given labels for the `i`-th image.
+            Refer to documentation for this argument in :py:func:`find_label_issues <cleanlab.object_detection.filter.find_label_issues>` for further details.
+
+        num_classes:
+            Optional number of classes ``K`` in the dataset. Defaults to the largest class label plus one.
+        """
+        lab_bboxes = [np.asarray(label["bboxes"]).reshape(-1, 4) for label in labels]
+        lab_labels = [np.asarray(label["labels"]).reshape(-1) for label in labels]
+        offsets = np.zeros(len(labels) + 1, dtype=np.int64)
+        np.cumsum([len(bboxes) for bboxes in lab_bboxes], out=offsets[1:])
+        image_names = None
+        if len(labels) and all("image_name" in label for label in labels):
+            image_names = [label["image_name"] for label in labels]
+        return cls(
+            _concatenate(lab_bboxes, (0, 4), np.float64),
+            _concatenate(lab_labels, (0,), np.int64),
+            offsets,
+            num_classes=num_classes,
+            image_names=image_names,
+        )
+
+    @classmethod
+    def from_predictions(cls, predictions: List[Any]):
+        """
+        Converts predictions in the list format to a ``RaggedBoxes`` object.
+
+        Parameters
+        ----------
+        predictions:
+            A list of ``N`` ``np.ndarray`` such that ``predictions[i]`` corresponds to the model predictions for the `i`-th image,
+            where ``predictions[i][k]`` is an array of shape ``(M,5)`` with the boxes predicted for class ``k``.
+            Refer to documentation for this argument in :py:func:`find_label_issues <cleanlab.object_detection.filter.find_label_issues>` for further details.
+        """
+        num_classes = len(predictions[0]) if len(predictions) else 0
+        if any(len(prediction) != num_classes for prediction in predictions):
+            raise ValueError("Each prediction must contain one array per class.")
+        class_predictions = [
+            np.asarray(class_prediction).reshape(-1, 5)
+            for prediction in predictions
+            for class_prediction in prediction
+        ]
+        counts = np.array([len(p) for p in class_predictions], dtype=np.int64).reshape(
+            len(predictions), num_classes
+        )
+        ragged_boxes = cls.__new__(cls)
+        ragged_boxes.offsets = np.zeros(len(predictions) + 1, dtype=np.int64)
+        np.cumsum(counts.sum(axis=1), out=ragged_boxes.offsets[1:])
+        ragged_boxes.num_classes = num_classes
+        ragged_boxes.image_names = None
+        ragged_boxes._set_predictions(
+            _concatenate(class_predictions, (0, 5), np.float64),
+            np.repeat(np.tile(np.arange(num_classes), len(predictions)), counts.reshape(-1)),
+        )
+        return ragged_boxes
+
+    def _set_predictions(self, data: np.ndarray, classes: np.ndarray) -> None:
+        """Stores predictions from an array of shape ``(B, 5)``, sorted by image and then by class."""
+        self._data = data
+        self.classes = classes
+        self.bboxes = data[:, :4]
+        self.pred_probs = data[:, 4]
+        self._class_offsets = None
+
+    @property
+    def is_prediction(self) -> bool:
+        """Whether this object stores predictions (rather than given labels)."""
+        return self.pred_probs is not None
+
+    @property
+    def num_boxes_per_image(self) -> np.ndarray:
+        """Array of shape ``(N,)`` with the number of bounding boxes in each image."""
+        return np.diff(self.offsets)
+
+    @property
+    def image_ids(self) -> np.ndarray:
+        """Array of shape ``(B,)`` with the index of the image that each bounding box belongs to."""
+        return np.repeat(np.arange(len(self)), self.num_boxes_per_image)
+
+    @property
+    def class_offsets(self) -> np.ndarray:
+        """
+        Array of shape ``(N, K+1)`` such that the boxes predicted for class ``k`` in the `i`-th image are
+        those in ``offsets[i] + class_offsets[i, k] : offsets[i] + class_offsets[i, k+1]``. Only available for predictions.
+        """
+        if not self.is_prediction:
+            raise ValueError("class_offsets are only available for predictions.")
+        if self._class_offsets is None:
+            counts = np.bincount(
+                self.image_ids * self.num_classes + self.classes,
+                minlength=len(self) * self.num_classes,
+            ).reshape(len(self), self.num_classes)
+            self._class_offsets = np.zeros((len(self), self.num_classes + 1), dtype=np.int64)
+            np.cumsum(counts, axis=1, out=self._class_offsets[:, 1:])
+        return self._class_offsets
+
+    def image_boxes(self, i: int) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+        """Returns views of the bounding boxes, class labels and pred_probs (``None`` for labels) of the `i`-th image."""
+        start, end = self.offsets[i], self.offsets[i + 1]
+        pred_probs = None if self.pred_probs is None else self.pred_probs[start:end]
+        return self.bboxes[start:end], self.classes[start:end], pred_probs
+
+    def class_boxes(self, class_num: int) -> List[np.ndarray]:
+        """
+        Returns a list of ``N`` arrays with the boxes of class `class_num` in each image.
+        For predictions, these are views of shape ``(M,5)`` that include the pred_prob of each box as in the list format,
+        for labels these are arrays of shape ``(L,4)``.
+        """
+        if self.is_prediction:
+            starts = self.offsets[:-1] + self.class_offsets[:, class_num]
+            ends = self.offsets[:-1] + self.class_offsets[:, class_num + 1]
+            return [self._data[start:end] for start, end in zip(starts, ends)]
+        class_idx = np.flatnonzero(self.classes == class_num)
+        split_idx = np.searchsorted(class_idx, self.offsets[1:-1])
+        return np.split(self.bboxes[class_idx], split_idx)
+
+    def prune(self, threshold: float) -> "RaggedBoxes":
+        """Returns the predictions whose pred_prob is at least `threshold`, as a new ``RaggedBoxes`` object."""
+        if self.pred_probs is None:
+            raise ValueError("Only predictions can be pruned by their pred_probs.")
+        keep = self.pred_probs >= threshold
+        ragged_boxes = type(self).__new__(type(self))
+        ragged_boxes.offsets = np.zeros(len(self) + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(self.image_ids[keep], minlength=len(self)), out=ragged_boxes.offsets[1:]
+        )
+        ragged_boxes.num_classes = self.num_classes
+        ragged_boxes.image_names = self.image_names
+        ragged_boxes._set_predictions(self._data[keep], self.classes[keep])
+        return ragged_boxes
+
+    def to_labels(self) -> List[Dict[str, Any]]:
+        """Returns the labels in the list format, where the arrays of each image are views into the flat arrays."""
+        if self.is_prediction:
+            raise ValueError("to_labels() can only be called on labels, use to_predictions().")
+        return [self._image_labels(i) for i in range(len(self))]
+
+    def to_predictions(self) -> List[List[np.ndarray]]:
+        """Returns the predictions in the list format, where the arrays of each image are views into the flat arrays."""
+        if not self.is_prediction:
+            raise ValueError("to_predictions() can only be called on predictions, use to_labels().")
+        return [self._image_predictions(i) for i in range(len(self))]
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> Any:
+        """Returns the labels (a dict) or predictions (a list of ``K`` arrays) of the `i`-th image in the list format."""
+        if not isinstance(i, (int, np.integer)):
+            raise TypeError(f"RaggedBoxes indices must be integers, not {type(i).__name__}.")
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("RaggedBoxes index out of range.")
+        if self.is_prediction:
+            return self._image_predictions(i)
+        return self._image_labels(i)
+
+    def _image_labels(self, i: int) -> Dict[str, Any]:
+        start, end = self.offsets[i], self.offsets[i + 1]
+        label: Dict[str, Any] = {
+            "bboxes": self.bboxes[start:end],
+            "labels": self.classes[start:end],
+        }
+        if self.image_names is not None:
+            label["image_name"] = self.image_names[i]
+        return label
+
+    def _image_predictions(self, i: int) -> List[np.ndarray]:
+        image_data = self._data[self.offsets[i] : self.offsets[i + 1]]
+        class_offsets = self.class_offsets[i]
+        return [
+            image_data[class_offsets[k] : class_offsets[k + 1]] for k in range(self.num_classes)
+        ]
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(len(self)):
+            yield self[i]
+
+
+def _concatenate(arrays: List[np.ndarray], empty_shape: Tuple[int, ...], dtype) -> np.ndarray:
+    """Concatenates the arrays, or returns an empty array if there are none."""
+    if len(arrays) == 0:
+        return np.empty(empty_shape, dtype=dtype)
+    return np.concatenate(arrays)
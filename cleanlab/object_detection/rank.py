@@ -17,9 +17,11 @@
 """Methods to rank and score images in an object detection dataset (object detection data), based on how likely they
 are to contain label errors. """
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, TypeVar
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, TypeVar, Union
 import warnings
 import copy
+import multiprocessing
+import platform
 import numpy as np
 
 from cleanlab.internal.constants import (
@@ -41,6 +43,8 @@ from cleanlab.internal.object_detection_utils import (
     assert_valid_aggregation_weights,
     assert_valid_inputs,
 )
+from cleanlab.internal.util import get_num_jobs
+from cleanlab.object_detection.ragged import RaggedBoxes
 
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -62,14 +66,18 @@ if TYPE_CHECKING:  # pragma: no cover
 else:
     AuxiliaryTypesDict = TypeVar("AuxiliaryTypesDict")
 
+# global variable for _get_subtype_label_quality_scores multiprocessing
+auxiliary_inputs_shared: List[AuxiliaryTypesDict]
+
 
 def get_label_quality_scores(
-    labels: List[Dict[str, Any]],
-    predictions: List[np.ndarray],
+    labels: Union[List[Dict[str, Any]], RaggedBoxes],
+    predictions: Union[List[np.ndarray], RaggedBoxes],
     *,
     aggregation_weights: Optional[Dict[str, float]] = None,
     overlapping_label_check: Optional[bool] = True,
     verbose: bool = True,
+    n_jobs: Optional[int] = 1,
 ) -> np.ndarray:
     """Computes a label quality score for each image of the ``N`` images in the dataset.
 
@@ -91,10 +99,12 @@ def get_label_quality_scores(
     labels:
         A list of ``N`` dictionaries such that ``labels[i]`` contains the given labels for the `i`-th image.
         Refer to documentation for this argument in :py:func:`find_label_issues <cleanlab.object_detection.filter.find_label_issues>` for further details.
+        This may also be a :py:class:`RaggedBoxes <cleanlab.object_detection.ragged.RaggedBoxes>` object holding the labels of all images.
 
     predictions:
         A list of ``N`` ``np.ndarray`` such that ``predictions[i]`` corresponds to the model predictions for the `i`-th image.
         Refer to documentation for this argument in :py:func:`find_label_issues <cleanlab.object_detection.filter.find_label_issues>` for further details.
+        This may also be a :py:class:`RaggedBoxes <cleanlab.object_detection.ragged.RaggedBoxes>` object holding the predictions for all images.
 
     verbose : bool, default = True
       Set to ``False`` to suppress all print statements.
@@ -111,6 +121,11 @@ def get_label_quality_scores(
     overlapping_label_check : bool, default = True
         If True, boxes annotated with more than one class label have their swap score penalized. Set this to False if you are not concerned when two very similar boxes exist with different class labels in the given annotations.
 
+    n_jobs : int, default = 1
+        Number of processes used to score the images, which are split into chunks scored in parallel.
+        ``None`` sets this to the number of cores on your CPU (physical cores if you have ``psutil`` package installed, otherwise logical cores).
+        The returned scores are the same no matter its value.
+
     Returns
     ---------
     label_quality_scores:
@@ -136,6 +151,7 @@ def get_label_quality_scores(
         aggregation_weights=aggregation_weights,
         overlapping_label_check=overlapping_label_check,
         verbose=verbose,
+        n_jobs=n_jobs,
     )
 
 
@@ -173,14 +189,15 @@ def issues_from_scores(label_quality_scores: np.ndarray, *, threshold: float = 0
 
 
 def _compute_label_quality_scores(
-    labels: List[Dict[str, Any]],
-    predictions: List[np.ndarray],
+    labels: Union[List[Dict[str, Any]], RaggedBoxes],
+    predictions: Union[List[np.ndarray], RaggedBoxes],
     *,
     method: Optional[str] = "objectlab",
     aggregation_weights: Optional[Dict[str, float]] = None,
     threshold: Optional[float] = None,
     overlapping_label_check: Optional[bool] = True,
     verbose: bool = True,
+    n_jobs: Optional[int] = 1,
 ) -> np.ndarray:
     """Internal function to prune extra bounding boxes and compute label quality scores based on passed in method."""
 
@@ -207,6 +224,7 @@ def _compute_label_quality_scores(
             temperature=TEMPERATURE,
             aggregation_weights=aggregation_weights,
             overlapping_label_check=overlapping_label_check,
+            n_jobs=n_jobs,
         )
     else:
         raise ValueError(
@@ -218,9 +236,11 @@ def _compute_label_quality_scores(
 
 
 def _get_min_pred_prob(
-    predictions: List[np.ndarray],
+    predictions: Union[List[np.ndarray], RaggedBoxes],
 ) -> float:
     """Returns min pred_prob out of all predictions."""
+    if isinstance(predictions, RaggedBoxes) and predictions.pred_probs is not None:
+        return np.min(predictions.pred_probs, initial=1.0)
     pred_probs = [1.0]  # avoid calling np.min on empty array.
     for prediction in predictions:
         for class_prediction in prediction:
@@ -231,22 +251,33 @@ def _get_min_pred_prob(
 
 
 def _prune_by_threshold(
-    predictions: List[np.ndarray], threshold: float, verbose: bool = True
-) -> List[np.ndarray]:
+    predictions: Union[List[np.ndarray], RaggedBoxes], threshold: float, verbose: bool = True
+) -> Union[List[np.ndarray], RaggedBoxes]:
     """Removes predicted bounding boxes from predictions who's pred_prob is below the cuttoff threshold."""
 
-    predictions_copy = copy.deepcopy(predictions)
-    num_ann_to_zero = 0
-    total_ann = 0
-    for idx_predictions, prediction in enumerate(predictions_copy):
-        for idx_class, class_prediction in enumerate(prediction):
-            filtered_class_prediction = class_prediction[class_prediction[:, -1] >= threshold]
-            if len(class_prediction) > 0:
-                total_ann += 1
-                if len(filtered_class_prediction) == 0:
-                    num_ann_to_zero += 1
-
-            predictions_copy[idx_predictions][idx_class] = filtered_class_prediction
+    predictions_copy: Union[List[np.ndarray], RaggedBoxes]
+    if isinstance(predictions, RaggedBoxes):
+        predictions_copy = predictions.prune(threshold)
+        # Count the (image, class) pairs with predicted boxes, and how many of those have no boxes left
+        num_boxes_per_class = np.diff(predictions.class_offsets, axis=1)
+        num_pruned_boxes_per_class = np.diff(predictions_copy.class_offsets, axis=1)
+        total_ann = int(np.count_nonzero(num_boxes_per_class))
+        num_ann_to_zero = int(
+            np.count_nonzero((num_boxes_per_class > 0) & (num_pruned_boxes_per_class == 0))
+        )
+    else:
+        predictions_copy = copy.deepcopy(predictions)
+        num_ann_to_zero = 0
+        total_ann = 0
+        for idx_predictions, prediction in enumerate(predictions_copy):
+            for idx_class, class_prediction in enumerate(prediction):
+                filtered_class_prediction = class_prediction[class_prediction[:, -1] >= threshold]
+                if len(class_prediction) > 0:
+                    total_ann += 1
+                    if len(filtered_class_prediction) == 0:
+                        num_ann_to_zero += 1
+
+                predictions_copy[idx_predictions][idx_class] = filtered_class_prediction
 
     p_ann_pruned = total_ann and num_ann_to_zero / total_ann or 0  # avoid division by zero
     if p_ann_pruned > MAX_ALLOWED_BOX_PRUNE:
@@ -326,14 +357,38 @@ def _get_overlap(bb1: List[float], bb2: List[float]) -> float:
     return _get_iou(_mod_coordinates(bb1), _mod_coordinates(bb2))
 
 
+def _bbox_coordinates(
+    bbox_list: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Takes in a list of N bounding boxes in xyxy format and returns the x1, y1, x2, y2 coordinates as arrays of shape (N,)."""
+    bboxes = np.asarray(bbox_list, dtype=np.float64).reshape(len(bbox_list), -1)
+    return bboxes[:, 0], bboxes[:, 1], bboxes[:, 2], bboxes[:, 3]
+
+
 def _get_overlap_matrix(bb1_list: np.ndarray, bb2_list: np.ndarray) -> np.ndarray:
     """Takes in two lists of bounding boxes and returns an IoU matrix where IoU[i][j] is the overlap between
-    the i-th box in `bb1_list` and the j-th box in `bb2_list`."""
-    wd = np.zeros(shape=(len(bb1_list), len(bb2_list)))
-    for i in range(len(bb1_list)):
-        for j in range(len(bb2_list)):
-            wd[i][j] = _get_overlap(bb1_list[i], bb2_list[j])
-    return wd
+    the i-th box in `bb1_list` and the j-th box in `bb2_list`.
+
+    All pairs are computed at once with broadcasting, giving the same values as calling `_get_overlap` on each pair.
+    """
+    if len(bb1_list) == 0 or len(bb2_list) == 0:
+        return np.zeros(shape=(len(bb1_list), len(bb2_list)))
+    x1_1, y1_1, x2_1, y2_1 = (c[:, None] for c in _bbox_coordinates(bb1_list))
+    x1_2, y1_2, x2_2, y2_2 = (c[None, :] for c in _bbox_coordinates(bb2_list))
+
+    # determine the width and height of the intersection rectangle of each pair of boxes
+    intersection_width = np.minimum(x2_1, x2_2) - np.maximum(x1_1, x1_2)
+    intersection_height = np.minimum(y2_1, y2_2) - np.maximum(y1_1, y1_2)
+    intersection_area = np.where(
+        (intersection_width >= 0) & (intersection_height >= 0),
+        intersection_width * intersection_height,
+        0.0,
+    )
+
+    bb1_area = (x2_1 - x1_1) * (y2_1 - y1_1)
+    bb2_area = (x2_2 - x1_2) * (y2_2 - y1_2)
+    union_area = np.clip(bb1_area + bb2_area - intersection_area, a_min=EPSILON, a_max=None)
+    return intersection_area / union_area
 
 
 def _get_iou(bb1: Dict[str, Any], bb2: Dict[str, Any]) -> float:
@@ -387,18 +442,10 @@ def _get_iou(bb1: Dict[str, Any], bb2: Dict[str, Any]) -> float:
 def _has_overlap(bbox_list, labels):
     """This function determines whether each labeled box overlaps with another box of a different class (i.e. virtually the same box having multiple conflicting annotations). It returns a boolean array."""
     iou_matrix = _get_overlap_matrix(bbox_list, bbox_list)
-    results_overlap = []
-    for i in range(0, len(iou_matrix)):
-        is_overlap = False
-        for j in range(0, len(iou_matrix)):
-            if i != j:
-                if iou_matrix[i][j] >= LABEL_OVERLAP_THRESHOLD:
-                    lab_1 = labels[i]
-                    lab_2 = labels[j]
-                    if lab_1 != lab_2:
-                        is_overlap = True
-        results_overlap.append(is_overlap)
-    return np.array(results_overlap)
+    labels = np.asarray(labels)
+    # boxes never conflict with themselves, since they have the same class
+    is_conflicting = (iou_matrix >= LABEL_OVERLAP_THRESHOLD) & (labels[:, None] != labels[None, :])
+    return np.any(is_conflicting, axis=1)
 
 
 def _euc_dis(box1: List[float], box2: List[float]) -> float:
@@ -412,33 +459,33 @@ def _euc_dis(box1: List[float], box2: List[float]) -> float:
 
 
 def _get_dist_matrix(bb1_list: np.ndarray, bb2_list: np.ndarray) -> np.ndarray:
-    """Returns a distance matrix of distances from all of boxes in bb1_list to all of boxes in bb2_list."""
-    wd = np.zeros(shape=(len(bb1_list), len(bb2_list)))
-    for i in range(len(bb1_list)):
-        for j in range(len(bb2_list)):
-            wd[i][j] = _euc_dis(bb1_list[i], bb2_list[j])
-    return wd
+    """Returns a distance matrix of distances from all of boxes in bb1_list to all of boxes in bb2_list.
 
+    All pairs are computed at once with broadcasting, giving the same values as calling `_euc_dis` on each pair.
+    """
+    if len(bb1_list) == 0 or len(bb2_list) == 0:
+        return np.zeros(shape=(len(bb1_list), len(bb2_list)))
+    x1_1, y1_1, x2_1, y2_1 = _bbox_coordinates(bb1_list)
+    x1_2, y1_2, x2_2, y2_2 = _bbox_coordinates(bb2_list)
+    dx = (x1_1 + x2_1)[:, None] / 2 - (x1_2 + x2_2)[None, :] / 2
+    dy = (y1_1 + y2_1)[:, None] / 2 - (y1_2 + y2_2)[None, :] / 2
+    return np.exp(-np.sqrt(dx**2 + dy**2) * EUC_FACTOR)
+
+
+def _get_similarity_matrix(
+    alpha: float, lab_bboxes: np.ndarray, pred_bboxes: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the similarity matrix and IoU matrix between the annotated boxes and predicted boxes of an image."""
+    iou_matrix = _get_overlap_matrix(lab_bboxes, pred_bboxes)
+    dist_matrix = 1 - _get_dist_matrix(lab_bboxes, pred_bboxes)
+    similarity_matrix = iou_matrix * alpha + (1 - alpha) * (1 - dist_matrix)
+    return similarity_matrix, iou_matrix
 
-def _get_min_possible_similarity(
-    alpha: float,
-    predictions,
-    labels: List[Dict[str, Any]],
-) -> float:
-    """Gets the min possible similarity score between two bounding boxes out of all images."""
-    min_possible_similarity = 1.0
-    for prediction, label in zip(predictions, labels):
-        lab_bboxes, lab_labels = _separate_label(label)
-        pred_bboxes, pred_labels, _ = _separate_prediction(prediction)
-        iou_matrix = _get_overlap_matrix(lab_bboxes, pred_bboxes)
-        dist_matrix = 1 - _get_dist_matrix(lab_bboxes, pred_bboxes)
-        similarity_matrix = iou_matrix * alpha + (1 - alpha) * (1 - dist_matrix)
-        non_zero_similarity_matrix = similarity_matrix[np.nonzero(similarity_matrix)]
-        min_image_similarity = (
-            1.0 if 0 in non_zero_similarity_matrix.shape else np.min(non_zero_similarity_matrix)
-        )
-        min_possible_similarity = np.min([min_possible_similarity, min_image_similarity])
-    return min_possible_similarity
+
+def _get_min_nonzero_similarity(similarity_matrix: np.ndarray) -> float:
+    """Returns the min similarity greater than 0 in the similarity matrix of an image, or 1 if there is none."""
+    non_zero_similarity_matrix = similarity_matrix[np.nonzero(similarity_matrix)]
+    return 1.0 if 0 in non_zero_similarity_matrix.shape else np.min(non_zero_similarity_matrix)
 
 
 def _get_valid_inputs_for_compute_scores_per_image(
@@ -471,19 +518,13 @@ def _get_valid_inputs_for_compute_scores_per_image(
         pred_bboxes, pred_labels, pred_label_probs = _separate_prediction(prediction)
 
     if similarity_matrix is None:
-        iou_matrix = _get_overlap_matrix(lab_bboxes, pred_bboxes)
-        dist_matrix = 1 - _get_dist_matrix(lab_bboxes, pred_bboxes)
-        similarity_matrix = iou_matrix * alpha + (1 - alpha) * (1 - dist_matrix)
+        similarity_matrix, iou_matrix = _get_similarity_matrix(alpha, lab_bboxes, pred_bboxes)
 
     if iou_matrix is None:
         iou_matrix = _get_overlap_matrix(lab_bboxes, pred_bboxes)
 
     if min_possible_similarity is None:
-        min_possible_similarity = (
-            1.0
-            if 0 in similarity_matrix.shape
-            else np.min(similarity_matrix[np.nonzero(similarity_matrix)])
-        )
+        min_possible_similarity = _get_min_nonzero_similarity(similarity_matrix)
 
     auxiliary_input_dict: AuxiliaryTypesDict = {
         "pred_labels": pred_labels,
@@ -501,27 +542,53 @@ def _get_valid_inputs_for_compute_scores_per_image(
 
 def _get_valid_inputs_for_compute_scores(
     alpha: float,
-    labels: Optional[List[Dict[str, Any]]] = None,
-    predictions: Optional[List[np.ndarray]] = None,
+    labels: Optional[Union[List[Dict[str, Any]], RaggedBoxes]] = None,
+    predictions: Optional[Union[List[np.ndarray], RaggedBoxes]] = None,
 ) -> List[AuxiliaryTypesDict]:
-    """Takes in alpha, labels and predictions and returns auxiliary input dictionary containing divided parts of labels and prediction per image."""
+    """Takes in alpha, labels and predictions and returns auxiliary input dictionary containing divided parts of labels and prediction per image.
+
+    The labels, predictions and similarity matrices of each image are computed in a single pass over the dataset,
+    so the returned auxiliary inputs can be shared by all of the box scoring functions without recomputing them.
+    """
     if predictions is None or labels is None:
         raise ValueError(
             f"Predictions and labels can not be None. Both are needed to get valid inputs."
         )
-    min_possible_similarity = _get_min_possible_similarity(alpha, predictions, labels)
 
     auxiliary_inputs = []
+    min_possible_similarity = 1.0
 
-    for prediction, label in zip(predictions, labels):
+    for i in range(min(len(labels), len(predictions))):
+        # Boxes stored in RaggedBoxes objects are read directly, without going through the list format
+        label, lab_bboxes, lab_labels = None, None, None
+        if isinstance(labels, RaggedBoxes):
+            lab_bboxes, lab_labels, _ = labels.image_boxes(i)
+        else:
+            label = labels[i]
+        prediction, pred_bboxes, pred_labels, pred_label_probs = None, None, None, None
+        if isinstance(predictions, RaggedBoxes):
+            pred_bboxes, pred_labels, pred_label_probs = predictions.image_boxes(i)
+        else:
+            prediction = predictions[i]
         auxiliary_input_dict = _get_valid_inputs_for_compute_scores_per_image(
             alpha=alpha,
             label=label,
             prediction=prediction,
-            min_possible_similarity=min_possible_similarity,
+            pred_labels=pred_labels,
+            pred_label_probs=pred_label_probs,
+            pred_bboxes=pred_bboxes,
+            lab_labels=lab_labels,
+            lab_bboxes=lab_bboxes,
+        )
+        min_possible_similarity = min(
+            min_possible_similarity, auxiliary_input_dict["min_possible_similarity"]
         )
         auxiliary_inputs.append(auxiliary_input_dict)
 
+    # The min possible similarity is shared by all images, so it's only known after seeing the entire dataset
+    for auxiliary_input_dict in auxiliary_inputs:
+        auxiliary_input_dict["min_possible_similarity"] = min_possible_similarity
+
     return auxiliary_inputs
 
 
@@ -594,6 +661,7 @@ def _compute_overlooked_box_scores_for_image(
         lab_labels=lab_labels,
         lab_bboxes=lab_bboxes,
         similarity_matrix=similarity_matrix,
+        iou_matrix=iou_matrix,
         min_possible_similarity=min_possible_similarity,
     )
 
@@ -626,8 +694,8 @@ def _compute_overlooked_box_scores_for_image(
 
 def compute_overlooked_box_scores(
     *,
-    labels: Optional[List[Dict[str, Any]]] = None,
-    predictions: Optional[List[np.ndarray]] = None,
+    labels: Optional[Union[List[Dict[str, Any]], RaggedBoxes]] = None,
+    predictions: Optional[Union[List[np.ndarray], RaggedBoxes]] = None,
     alpha: Optional[float] = None,
     high_probability_threshold: Optional[float] = None,
     auxiliary_inputs: Optional[List[AuxiliaryTypesDict]] = None,
@@ -764,8 +832,8 @@ def _compute_badloc_box_scores_for_image(
 
 def compute_badloc_box_scores(
     *,
-    labels: Optional[List[Dict[str, Any]]] = None,
-    predictions: Optional[List[np.ndarray]] = None,
+    labels: Optional[Union[List[Dict[str, Any]], RaggedBoxes]] = None,
+    predictions: Optional[Union[List[np.ndarray], RaggedBoxes]] = None,
     alpha: Optional[float] = None,
     low_probability_threshold: Optional[float] = None,
     auxiliary_inputs: Optional[List[AuxiliaryTypesDict]] = None,
@@ -865,12 +933,14 @@ def _compute_swap_box_scores_for_image(
         lab_labels=lab_labels,
         lab_bboxes=lab_bboxes,
         similarity_matrix=similarity_matrix,
+        iou_matrix=iou_matrix,
         min_possible_similarity=min_possible_similarity,
     )
 
     pred_labels = auxiliary_input_dict["pred_labels"]
     pred_label_probs = auxiliary_input_dict["pred_label_probs"]
     lab_labels = auxiliary_input_dict["lab_labels"]
+    lab_bboxes = auxiliary_input_dict["lab_bboxes"]
     similarity_matrix = auxiliary_input_dict["similarity_matrix"]
     min_possible_similarity = auxiliary_input_dict["min_possible_similarity"]
 
@@ -907,8 +977,8 @@ def _compute_swap_box_scores_for_image(
 
 def compute_swap_box_scores(
     *,
-    labels: Optional[List[Dict[str, Any]]] = None,
-    predictions: Optional[List[np.ndarray]] = None,
+    labels: Optional[Union[List[Dict[str, Any]], RaggedBoxes]] = None,
+    predictions: Optional[Union[List[np.ndarray], RaggedBoxes]] = None,
     alpha: Optional[float] = None,
     high_probability_threshold: Optional[float] = None,
     overlapping_label_check: Optional[bool] = True,
@@ -1031,8 +1101,8 @@ def pool_box_scores_per_image(
 
 
 def _get_subtype_label_quality_scores(
-    labels: List[Dict[str, Any]],
-    predictions: List[np.ndarray],
+    labels: Union[List[Dict[str, Any]], RaggedBoxes],
+    predictions: Union[List[np.ndarray], RaggedBoxes],
     *,
     alpha: Optional[float] = None,
     low_probability_threshold: Optional[float] = None,
@@ -1040,6 +1110,8 @@ def _get_subtype_label_quality_scores(
     temperature: Optional[float] = None,
     aggregation_weights: Optional[Dict[str, float]] = None,
     overlapping_label_check: Optional[bool] = True,
+    auxiliary_inputs: Optional[List[AuxiliaryTypesDict]] = None,
+    n_jobs: Optional[int] = 1,
 ) -> np.ndarray:
     """
     Returns a label quality score for each of the ``N`` images in the dataset.
@@ -1073,6 +1145,13 @@ def _get_subtype_label_quality_scores(
     overlapping_label_check : bool, default = True
         If True, boxes annotated with more than one class label have their swap score penalized. Set this to False if you are not concerned when two very similar boxes exist with different class labels in the given annotations.
 
+    auxiliary_inputs:
+        Optional list of ``N`` dictionaries containing sub-parts of label and prediction per image, as returned by ``_get_valid_inputs_for_compute_scores``.
+        If not provided, these are computed from `labels` and `predictions`.
+
+    n_jobs:
+        Number of processes used to compute the per-image subtype scores. ``None`` uses all available cores.
+
     Returns
     ---------
     label_quality_scores:
@@ -1086,9 +1165,88 @@ def _get_subtype_label_quality_scores(
     ) = _get_valid_subtype_score_params(
         alpha, low_probability_threshold, high_probability_threshold, temperature
     )
-    auxiliary_inputs = _get_valid_inputs_for_compute_scores(alpha, labels, predictions)
+    if auxiliary_inputs is None:
+        auxiliary_inputs = _get_valid_inputs_for_compute_scores(alpha, labels, predictions)
     aggregation_weights = _get_aggregation_weights(aggregation_weights)
 
+    n_jobs = get_num_jobs(n_jobs)
+    num_images = len(auxiliary_inputs)
+    # Score chunks of images in parallel, a few chunks per process to balance the load.
+    # Chunks are contiguous and returned in order, so results are the same as the sequential loop.
+    num_chunks = min(num_images, n_jobs * 4) if n_jobs > 1 else 1
+    chunk_bounds = np.linspace(0, num_images, num_chunks + 1, dtype=int) if num_images else [0, 0]
+    subtype_score_params = (
+        alpha,
+        low_probability_threshold,
+        high_probability_threshold,
+        temperature,
+        overlapping_label_check,
+    )
+
+    # Prepare multiprocessing shared data
+    # On Linux, multiprocessing is started with fork,
+    # so data can be shared with global variables + COW
+    # On Window/macOS, processes are started with spawn,
+    # so data will need to be pickled to the subprocesses through input args
+    os_name = platform.system()
+    if n_jobs == 1 or os_name == "Linux":
+        global auxiliary_inputs_shared
+        auxiliary_inputs_shared = auxiliary_inputs
+        args = [
+            [start, end, subtype_score_params, None]
+            for start, end in zip(chunk_bounds[:-1], chunk_bounds[1:])
+        ]
+    else:
+        args = [
+            [start, end, subtype_score_params, auxiliary_inputs[start:end]]
+            for start, end in zip(chunk_bounds[:-1], chunk_bounds[1:])
+        ]
+
+    if n_jobs > 1 and num_chunks > 1:
+        with multiprocessing.Pool(n_jobs) as p:
+            subtype_scores_per_chunk = p.map(_compute_subtype_scores_for_images, args, chunksize=1)
+    else:
+        subtype_scores_per_chunk = [_compute_subtype_scores_for_images(arg) for arg in args]
+    auxiliary_inputs_shared = []  # release the shared data
+
+    overlooked_score_per_image, badloc_score_per_image, swap_score_per_image = (
+        np.concatenate(subtype_scores) for subtype_scores in zip(*subtype_scores_per_chunk)
+    )
+
+    scores = (
+        aggregation_weights["overlooked"] * np.log(TINY_VALUE + overlooked_score_per_image)
+        + aggregation_weights["badloc"] * np.log(TINY_VALUE + badloc_score_per_image)
+        + aggregation_weights["swap"] * np.log(TINY_VALUE + swap_score_per_image)
+    )
+
+    scores = np.exp(scores)
+
+    return scores
+
+
+def _compute_subtype_scores_for_images(
+    args: list,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the overlooked, badloc and swap scores of each image in a chunk of the dataset.
+
+    Parameters
+    ----------
+    args:
+        List of [start, end, subtype_score_params, auxiliary_inputs] where images ``start`` to ``end`` are scored.
+        If `auxiliary_inputs` is None, they are read from the global ``auxiliary_inputs_shared``, otherwise
+        `auxiliary_inputs` holds the auxiliary inputs of this chunk of images only.
+    """
+    start, end, subtype_score_params, auxiliary_inputs = args
+    (
+        alpha,
+        low_probability_threshold,
+        high_probability_threshold,
+        temperature,
+        overlapping_label_check,
+    ) = subtype_score_params
+    if auxiliary_inputs is None:
+        auxiliary_inputs = auxiliary_inputs_shared[start:end]
+
     overlooked_scores_per_box = compute_overlooked_box_scores(
         alpha=alpha,
         high_probability_threshold=high_probability_threshold,
@@ -1114,13 +1272,4 @@ def _get_subtype_label_quality_scores(
         overlapping_label_check=overlapping_label_check,
     )
     swap_score_per_image = pool_box_scores_per_image(swap_scores_per_box, temperature=temperature)
-
-    scores = (
-        aggregation_weights["overlooked"] * np.log(TINY_VALUE + overlooked_score_per_image)
-        + aggregation_weights["badloc"] * np.log(TINY_VALUE + badloc_score_per_image)
-        + aggregation_weights["swap"] * np.log(TINY_VALUE + swap_score_per_image)
-    )
-
-    scores = np.exp(scores)
-
-    return scores
+    return overlooked_score_per_image, badloc_score_per_image, swap_score_per_image
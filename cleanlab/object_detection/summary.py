@@ -41,10 +41,8 @@ from cleanlab.internal.constants import (
     EPSILON,
     TINY_VALUE,
 )
-from cleanlab.object_detection.filter import (
-    _filter_by_class,
-    _calculate_true_positives_false_positives,
-)
+from cleanlab.object_detection.filter import _get_true_positives_false_positives_per_image
+from cleanlab.object_detection.ragged import RaggedBoxes
 from cleanlab.object_detection.rank import (
     _get_valid_inputs_for_compute_scores,
     _separate_prediction,
@@ -83,6 +81,8 @@ def object_counts_per_image(
 
         For more information on proper labels formatting, check out the `MMDetection library <https://mmdetection.readthedocs.io/en/dev-3.x/advanced_guides/customize_dataset.html>`_.
 
+        Labels may also be provided as a :py:class:`RaggedBoxes <cleanlab.object_detection.ragged.RaggedBoxes>` object.
+
     predictions :
         Predictions output by a trained object detection model.
         For the most accurate results, predictions should be out-of-sample to avoid overfitting, eg. obtained via :ref:`cross-validation <pred_probs_cross_val>`.
@@ -96,6 +96,8 @@ def object_counts_per_image(
 
         For more information see the `MMDetection package <https://github.com/open-mmlab/mmdetection>`_ for an example object detection library that outputs predictions in the correct format.
 
+        Predictions may also be provided as a :py:class:`RaggedBoxes <cleanlab.object_detection.ragged.RaggedBoxes>` object.
+
     auxiliary_inputs: optional
         Auxiliary inputs to be used in the computation of counts.
         The `auxiliary_inputs` can be computed using :py:func:`rank._get_valid_inputs_for_compute_scores <cleanlab.object_detection.rank._get_valid_inputs_for_compute_scores>`.
@@ -107,6 +109,12 @@ def object_counts_per_image(
         A tuple containing two lists. The first is an array of shape ``(N,)`` containing the number of annotated objects for each image in the dataset.
         The second is an array of shape ``(N,)`` containing the number of predicted objects for each image in the dataset.
     """
+    if (
+        auxiliary_inputs is None
+        and isinstance(labels, RaggedBoxes)
+        and isinstance(predictions, RaggedBoxes)
+    ):
+        return labels.num_boxes_per_image.tolist(), predictions.num_boxes_per_image.tolist()
     if auxiliary_inputs is None:
         auxiliary_inputs = _get_valid_inputs_for_compute_scores(ALPHA, labels, predictions)
     return (
@@ -478,37 +486,41 @@ def visualize(
 
 
 def _get_per_class_confusion_matrix_dict_(
-    labels: List[Dict[str, Any]],
-    predictions: List[np.ndarray],
-    iou_threshold: Optional[float] = 0.5,
+    labels: Union[List[Dict[str, Any]], RaggedBoxes],
+    predictions: Union[List[np.ndarray], RaggedBoxes],
+    iou_threshold: Union[float, np.ndarray] = 0.5,
     num_procs: int = 1,
-) -> DefaultDict[int, Dict[str, int]]:
+) -> DefaultDict[int, Dict[str, np.ndarray]]:
     """
     Returns a confusion matrix dictionary for each class containing the number of True Positive, False Positive, and False Negative detections from the object detection model.
+    If `iou_threshold` is an array of ``T`` thresholds, the IoU between boxes is computed once per image.
+    Each count is an array of shape ``(T,)`` holding the count at each threshold (``T = 1`` for a scalar `iou_threshold`).
     """
     num_classes = len(predictions[0])
-    num_images = len(predictions)
-    pool = Pool(num_procs)
-    counter_dict: DefaultDict[int, dict[str, int]] = collections.defaultdict(
-        lambda: {"TP": 0, "FP": 0, "FN": 0}
+    if num_procs > 1:
+        with Pool(num_procs) as pool:
+            tpfpfn_per_image = _get_true_positives_false_positives_per_image(
+                labels, predictions, iou_threshold, pool
+            )
+    else:
+        tpfpfn_per_image = _get_true_positives_false_positives_per_image(
+            labels, predictions, iou_threshold
+        )
+    num_thresholds = len(np.atleast_1d(iou_threshold))
+    counter_dict: DefaultDict[int, Dict[str, np.ndarray]] = collections.defaultdict(
+        lambda: {
+            "TP": np.zeros(num_thresholds),
+            "FP": np.zeros(num_thresholds),
+            "FN": np.zeros(num_thresholds),
+        }
     )
 
     for class_num in range(num_classes):
-        pred_bboxes, lab_bboxes = _filter_by_class(labels, predictions, class_num)
-        tpfpfn = pool.starmap(
-            _calculate_true_positives_false_positives,
-            zip(
-                pred_bboxes,
-                lab_bboxes,
-                [iou_threshold for _ in range(num_images)],
-                [True for _ in range(num_images)],
-            ),
-        )
-
-        for image_idx, (tp, fp, fn) in enumerate(tpfpfn):  # type: ignore
-            counter_dict[class_num]["TP"] += np.sum(tp)
-            counter_dict[class_num]["FP"] += np.sum(fp)
-            counter_dict[class_num]["FN"] += np.sum(fn)
+        for tpfpfn in tpfpfn_per_image:
+            tp, fp, fn = tpfpfn[class_num]
+            counter_dict[class_num]["TP"] += np.sum(tp, axis=1)
+            counter_dict[class_num]["FP"] += np.sum(fp, axis=1)
+            counter_dict[class_num]["FN"] += np.sum(fn, axis=1)
 
     return counter_dict
 
@@ -535,8 +547,8 @@ def _sort_dict_to_list(index_value_dict):
 
 
 def get_average_per_class_confusion_matrix(
-    labels: List[Dict[str, Any]],
-    predictions: List[np.ndarray],
+    labels: Union[List[Dict[str, Any]], RaggedBoxes],
+    predictions: Union[List[np.ndarray], RaggedBoxes],
     num_procs: int = 1,
     class_names: Optional[Dict[Any, Any]] = None,
 ) -> Dict[Union[int, str], Dict[str, float]]:
@@ -553,6 +565,7 @@ def get_average_per_class_confusion_matrix(
     Note:  lower TP at certain IoU thresholds does not necessarily imply that everything else is FP, instead it indicates that, at those specific IoU thresholds, the model is not performing as well in terms of correctly identifying class instances. The other metrics (FP and FN) provide additional information about the model's behavior.
 
     Note: Since we average over many IoU thresholds, 'TP', 'FP', and 'FN' may contain float values representing the average across these thresholds.
+    The overlap between boxes in each image is only computed once, and the detections are matched at all IoU thresholds together.
 
     Parameters
     ----------
@@ -585,15 +598,12 @@ def get_average_per_class_confusion_matrix(
     class_names = _sort_dict_to_list(class_names)
     avg_metrics = {class_num: {"TP": 0.0, "FP": 0.0, "FN": 0.0} for class_num in class_names}
 
-    for iou_threshold in iou_thrs:
-        results_dict = _get_per_class_confusion_matrix_dict_(
-            labels, predictions, iou_threshold, num_procs
-        )
-
+    results_dict = _get_per_class_confusion_matrix_dict_(labels, predictions, iou_thrs, num_procs)
+    for threshold_idx in range(len(iou_thrs)):
         for class_num in results_dict:
-            tp = results_dict[class_num]["TP"]
-            fp = results_dict[class_num]["FP"]
-            fn = results_dict[class_num]["FN"]
+            tp = results_dict[class_num]["TP"][threshold_idx]
+            fp = results_dict[class_num]["FP"][threshold_idx]
+            fn = results_dict[class_num]["FN"][threshold_idx]
 
             avg_metrics[class_names[class_num]]["TP"] += tp
             avg_metrics[class_names[class_num]]["FP"] += fp
@@ -608,8 +618,8 @@ def get_average_per_class_confusion_matrix(
 
 
 def calculate_per_class_metrics(
-    labels: List[Dict[str, Any]],
-    predictions: List[np.ndarray],
+    labels: Union[List[Dict[str, Any]], RaggedBoxes],
+    predictions: Union[List[np.ndarray], RaggedBoxes],
     num_procs: int = 1,
     class_names=None,
 ) -> Dict[Union[int, str], Dict[str, float]]:
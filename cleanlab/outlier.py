@@ -475,6 +475,42 @@ class OutOfDistribution:
             self.params["scaling_factor"] = float(
                 max(np.median(avg_knn_distances), 100 * np.finfo(np.float_).eps)
             )
+
+        ood_features_scores = self._transform_knn_distances(
+            avg_knn_distances, knn, t=t, distance_metric=distance_metric
+        )
+        return (ood_features_scores, knn)
+
+    def _transform_knn_distances(
+        self,
+        avg_knn_distances: np.ndarray,
+        knn: NearestNeighbors,
+        t: int = 1,
+        distance_metric: Optional[str] = None,
+    ) -> np.ndarray:
+        """
+        Transform the average distances of examples to their k nearest neighbors into OOD scores,
+        using the ``scaling_factor`` previously estimated when this estimator was fit.
+
+        Parameters
+        ----------
+        avg_knn_distances : np.ndarray
+        Array of shape ``(N,)`` with the average distance of each example to its `k` nearest neighbors.
+
+        knn : sklearn.neighbors.NearestNeighbors
+        The estimator used to find the nearest neighbors, whose distance metric determines how precision errors are corrected.
+
+        t : int, default=1
+        For details, see key `t` in the params dict arg of `~cleanlab.outlier.OutOfDistribution`.
+
+        distance_metric : str, optional
+        Name of the distance metric, if it has already been determined. Otherwise, it is read from `knn`.
+
+        Returns
+        -------
+        ood_features_scores : np.ndarray
+        Array of shape ``(N,)`` with the OOD scores of the examples.
+        """
         scaling_factor = self.params["scaling_factor"]
 
         if not isinstance(scaling_factor, float):
@@ -489,10 +525,9 @@ class OutOfDistribution:
         p = None
         if distance_metric == "minkowski":
             p = knn.p
-        ood_features_scores = correct_precision_errors(
+        return correct_precision_errors(
             ood_features_scores, avg_knn_distances, distance_metric, p=p
         )
-        return (ood_features_scores, knn)
 
 
 def _get_ood_predictions_scores(
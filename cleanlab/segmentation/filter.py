@@ -19,12 +19,26 @@ Methods to find label issues in image semantic segmentation datasets, where each
 
 """
 
-from typing import Optional, Tuple
+import multiprocessing as mp
+from typing import Iterator, Optional, Tuple, Union
 
 import numpy as np
 
-from cleanlab.experimental.label_issues_batched import LabelInspector
-from cleanlab.internal.segmentation_utils import _check_input, _get_valid_optional_params
+from cleanlab.internal.constants import (
+    CONFIDENT_THRESHOLDS_LOWER_BOUND,
+    FLOATING_POINT_COMPARISON,
+)
+from cleanlab.internal.segmentation_utils import (
+    _check_input,
+    _get_n_jobs,
+    _get_valid_optional_params,
+)
+from cleanlab.segmentation.sparse import SparsePixelIssues
+
+# global variable for multiproc on linux
+labels_shared: np.ndarray
+pred_probs_shared: np.ndarray
+adj_confident_thresholds_shared: np.ndarray
 
 
 def find_label_issues(
@@ -34,8 +48,9 @@ def find_label_issues(
     batch_size: Optional[int] = None,
     n_jobs: Optional[int] = None,
     verbose: bool = True,
+    return_sparse: bool = False,
     **kwargs,
-) -> np.ndarray:
+) -> Union[np.ndarray, SparsePixelIssues]:
     """
     Returns a boolean mask for the entire dataset, per pixel where ``True`` represents
     an example identified with a label issue and ``False`` represents an example of a pixel correctly labeled.
@@ -75,6 +90,11 @@ def find_label_issues(
     verbose:
       Set to ``False`` to suppress all print statements.
 
+    return_sparse:
+      If ``True``, returns the label issues as a :py:class:`SparsePixelIssues <cleanlab.segmentation.sparse.SparsePixelIssues>` object
+      storing only the flattened index of each pixel label issue per image, instead of a dense boolean mask.
+      This uses much less memory on high-resolution datasets, where label issues are usually a small fraction of the pixels.
+
     **kwargs:
       * downsample: int,
         Optional factor to shrink labels and pred_probs by. Default ``1``
@@ -85,6 +105,7 @@ def find_label_issues(
     label_issues: np.ndarray
       Returns a boolean **mask** for the entire dataset of length `(N,H,W)`
       where ``True`` represents a pixel label issue and ``False`` represents an example that is correctly labeled.
+      If `return_sparse` is ``True``, returns the same label issues as a :py:class:`SparsePixelIssues <cleanlab.segmentation.sparse.SparsePixelIssues>` object.
     """
     batch_size, n_jobs = _get_valid_optional_params(batch_size, n_jobs)
     downsample = kwargs.get("downsample", 1)
@@ -115,115 +136,170 @@ def find_label_issues(
 
         return small_labels, renorm_small_pred_probs
 
-    def flatten_and_preprocess_masks(
-        labels: np.ndarray, pred_probs: np.ndarray
-    ) -> Tuple[np.ndarray, np.ndarray]:
-        _, num_classes, _, _ = pred_probs.shape
-        labels_flat = labels.flatten().astype(int)
-        pred_probs_flat = np.moveaxis(pred_probs, 0, 1).reshape(num_classes, -1)
-
-        return labels_flat, pred_probs_flat.T
-
     ##
     _check_input(labels, pred_probs)
 
     # Added Downsampling
     pre_labels, pre_pred_probs = downsample_arrays(labels, pred_probs, downsample)
 
-    num_image, _, h, w = pre_pred_probs.shape
-
-    ### This section is a modified version of find_label_issues_batched(), old code is commented out
-    # ranked_label_issues = find_label_issues_batched(
-    #     pre_labels, pre_pred_probs, batch_size=batch_size, n_jobs=n_jobs, verbose=verbose
-    # )
-    lab = LabelInspector(
-        num_class=pre_pred_probs.shape[1],
-        verbose=verbose,
-        n_jobs=n_jobs,
-        quality_score_kwargs=None,
-        num_issue_kwargs=None,
-    )
-    n = len(pre_labels)
-
-    if verbose:
-        from tqdm.auto import tqdm
+    num_image, num_classes, h, w = pre_pred_probs.shape
 
-        pbar = tqdm(desc="number of examples processed for estimating thresholds", total=n)
+    # This follows LabelInspector / find_label_issues_batched(), but reads each batch of images directly
+    # in its (N,K,H,W) layout instead of reshaping it into a (N*H*W,K) array of pixels.
+    # On Linux, multiprocessing is started with fork, so data can be shared with global variables + COW
+    global labels_shared, pred_probs_shared, adj_confident_thresholds_shared
+    labels_shared, pred_probs_shared = pre_labels, pre_pred_probs
+    try:
+        n_jobs = _get_n_jobs(n_jobs)
 
-    # Precompute the size of each image in the batch
-    image_size = np.prod(pre_pred_probs.shape[1:])
-    images_per_batch = max(batch_size // image_size, 1)
+        # Precompute the size of each image in the batch
+        image_size = np.prod(pre_pred_probs.shape[1:])
+        images_per_batch = max(batch_size // image_size, 1)
+        batches = [
+            (start_index, min(start_index + images_per_batch, num_image))
+            for start_index in range(0, num_image, images_per_batch)
+        ]
 
-    for start_index in range(0, n, images_per_batch):
-        end_index = min(start_index + images_per_batch, n)
-        labels_batch, pred_probs_batch = flatten_and_preprocess_masks(
-            pre_labels[start_index:end_index], pre_pred_probs[start_index:end_index]
-        )
-        lab.update_confident_thresholds(labels_batch, pred_probs_batch)
         if verbose:
-            pbar.update(end_index - start_index)
+            from tqdm.auto import tqdm
 
-    if verbose:
-        pbar.close()
-        pbar = tqdm(desc="number of examples processed for checking labels", total=n)
+            pbar = tqdm(
+                desc="number of examples processed for estimating thresholds", total=num_image
+            )
 
-    for start_index in range(0, n, images_per_batch):
-        end_index = min(start_index + images_per_batch, n)
-        labels_batch, pred_probs_batch = flatten_and_preprocess_masks(
-            pre_labels[start_index:end_index], pre_pred_probs[start_index:end_index]
-        )
-        _ = lab.score_label_quality(labels_batch, pred_probs_batch)
-        if verbose:
-            pbar.update(end_index - start_index)
+        confident_thresholds = np.zeros((num_classes,))
+        examples_per_class = np.zeros((num_classes,))
+        for (batch_thresholds, batch_class_counts), (start_index, end_index) in zip(
+            _map_batches(_get_confident_thresholds_batch, batches, n_jobs), batches
+        ):
+            # Running average of the thresholds in each batch, same as LabelInspector.update_confident_thresholds()
+            confident_thresholds = (
+                examples_per_class * confident_thresholds + batch_class_counts * batch_thresholds
+            ) / np.clip(examples_per_class + batch_class_counts, a_min=1, a_max=None)
+            confident_thresholds = np.clip(
+                confident_thresholds, a_min=CONFIDENT_THRESHOLDS_LOWER_BOUND, a_max=None
+            )
+            examples_per_class += batch_class_counts
+            if verbose:
+                pbar.update(end_index - start_index)
 
-    if verbose:
-        pbar.close()
+        if verbose:
+            pbar.close()
+            pbar = tqdm(desc="number of examples processed for checking labels", total=num_image)
+
+        adj_confident_thresholds_shared = confident_thresholds - FLOATING_POINT_COMPARISON
+        label_quality_scores = []
+        num_issues = 0
+        for (batch_scores, batch_num_issues), (start_index, end_index) in zip(
+            _map_batches(_score_label_quality_batch, batches, n_jobs), batches
+        ):
+            label_quality_scores.append(batch_scores)
+            num_issues += batch_num_issues
+            if verbose:
+                pbar.update(end_index - start_index)
 
-    ranked_label_issues = lab.get_label_issues()
-    ### End find_label_issues_batched() section
+        if verbose:
+            pbar.close()
+    finally:
+        del labels_shared, pred_probs_shared
+        # only shared once the thresholds are estimated
+        globals().pop("adj_confident_thresholds_shared", None)
 
-    # Upsample carefully maintaining indicies
-    label_issues = np.full((num_image, h, w), False)
+    ranked_label_issues = np.concatenate(label_quality_scores).argsort()[:num_issues]
 
     # only want to call it an error if pred_probs doesnt match the label at those pixels
-    for i in range(0, ranked_label_issues.shape[0], batch_size):
-        issues_batch = ranked_label_issues[i : i + batch_size]
-        # Finding the right indicies
+    # Every pixel of the upsampled region of each issue is checked in one gather per batch of issues
+    full_h, full_w = h * downsample, w * downsample
+    offsets = np.arange(downsample)
+    issues_per_batch = max(batch_size // downsample**2, 1)
+    flat_label_issues = []
+    for i in range(0, ranked_label_issues.shape[0], issues_per_batch):
+        issues_batch = ranked_label_issues[i : i + issues_per_batch]
         image_batch, batch_coor_i, batch_coor_j = _get_indexes_from_ranked_issues(
             issues_batch, h, w
         )
-        label_issues[image_batch, batch_coor_i, batch_coor_j] = True
-        if downsample == 1:
-            # check if pred_probs matches the label at those pixels
-            pred_argmax = np.argmax(pred_probs[image_batch, :, batch_coor_i, batch_coor_j], axis=1)
-            mask = pred_argmax == labels[image_batch, batch_coor_i, batch_coor_j]
-            label_issues[image_batch[mask], batch_coor_i[mask], batch_coor_j[mask]] = False
-
-    if downsample != 1:
-        label_issues = label_issues.repeat(downsample, axis=1).repeat(downsample, axis=2)
-
-        for i in range(0, ranked_label_issues.shape[0], batch_size):
-            issues_batch = ranked_label_issues[i : i + batch_size]
-            image_batch, batch_coor_i, batch_coor_j = _get_indexes_from_ranked_issues(
-                issues_batch, h, w
-            )
-            # Upsample the coordinates
-            upsampled_ii = batch_coor_i * downsample
-            upsampled_jj = batch_coor_j * downsample
-            # Iterate over the upsampled region
-            for i in range(downsample):
-                for j in range(downsample):
-                    rows = upsampled_ii + i
-                    cols = upsampled_jj + j
-                    pred_argmax = np.argmax(pred_probs[image_batch, :, rows, cols], axis=1)
-                    # Check if the predicted class (argmax) at the identified issue location matches the true label
-                    mask = pred_argmax == labels[image_batch, rows, cols]
-                    # If they match, set the corresponding entries in the label_issues array to False
-                    label_issues[image_batch[mask], rows[mask], cols[mask]] = False
+        # Upsample the coordinates carefully maintaining indicies
+        image_batch = np.repeat(image_batch, downsample**2)
+        rows = (batch_coor_i[:, None, None] * downsample + offsets[None, :, None]).repeat(
+            downsample, axis=2
+        )
+        cols = (batch_coor_j[:, None, None] * downsample + offsets[None, None, :]).repeat(
+            downsample, axis=1
+        )
+        rows, cols = rows.ravel(), cols.ravel()
+        pred_argmax = np.argmax(pred_probs[image_batch, :, rows, cols], axis=1)
+        # Only keep the pixels where the predicted class (argmax) does not match the given label
+        mask = pred_argmax != labels[image_batch, rows, cols]
+        flat_label_issues.append(
+            (image_batch[mask].astype(np.int64) * full_h + rows[mask]) * full_w + cols[mask]
+        )
+
+    flat_label_issues = (
+        np.concatenate(flat_label_issues) if flat_label_issues else np.empty(0, dtype=np.int64)
+    )
+    if return_sparse:
+        return SparsePixelIssues.from_flat_indices(flat_label_issues, (num_image, full_h, full_w))
 
+    label_issues = np.full((num_image, full_h, full_w), False)
+    label_issues.ravel()[flat_label_issues] = True
     return label_issues
 
 
+def _map_batches(func, batches: list, n_jobs: int) -> Iterator:
+    """Applies `func` to each batch of images, in order, using `n_jobs` processes if there is more than one batch."""
+    if n_jobs > 1 and len(batches) > 1:
+        with mp.Pool(n_jobs) as pool:
+            yield from pool.imap(func, batches)
+    else:
+        yield from map(func, batches)
+
+
+def _get_label_probs(labels: np.ndarray, pred_probs: np.ndarray) -> np.ndarray:
+    """Returns the predicted probability of the given label of each pixel, as an array of shape ``(N,H,W)``."""
+    return np.take_along_axis(pred_probs, labels[:, np.newaxis, :, :], axis=1)[:, 0]
+
+
+def _get_confident_thresholds_batch(batch: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the confident thresholds and the number of pixels labeled as each class in a batch of images,
+    same as :py:func:`count.get_confident_thresholds <cleanlab.count.get_confident_thresholds>` on its pixels.
+    """
+    start_index, end_index = batch
+    labels_batch = np.asarray(labels_shared[start_index:end_index]).astype(int)
+    num_classes = pred_probs_shared.shape[1]
+    label_probs = _get_label_probs(
+        labels_batch, np.asarray(pred_probs_shared[start_index:end_index])
+    ).ravel()
+    labels_batch = labels_batch.ravel()
+
+    # Group the pixels by label, keeping them in order so the thresholds are the same as for the flattened pixels
+    class_counts = np.bincount(labels_batch, minlength=num_classes)
+    label_probs_per_class = np.split(
+        label_probs[np.argsort(labels_batch, kind="stable")], np.cumsum(class_counts)[:-1]
+    )
+    BIG_VALUE = 2  # missing classes in the batch have no weight in the running average
+    batch_thresholds = np.array(
+        [np.mean(probs) if len(probs) > 0 else BIG_VALUE for probs in label_probs_per_class]
+    )
+    batch_thresholds = np.clip(batch_thresholds, a_min=CONFIDENT_THRESHOLDS_LOWER_BOUND, a_max=None)
+    return batch_thresholds, class_counts
+
+
+def _score_label_quality_batch(batch: Tuple[int, int]) -> Tuple[np.ndarray, int]:
+    """Returns the self-confidence label quality score of each pixel in a batch of images
+    and the number of pixels that are estimated to be label issues, same as LabelInspector.score_label_quality().
+    """
+    start_index, end_index = batch
+    labels_batch = np.asarray(labels_shared[start_index:end_index]).astype(int)
+    pred_probs_batch = np.asarray(pred_probs_shared[start_index:end_index])
+    pred_class = np.argmax(pred_probs_batch, axis=1)
+    pred_class_probs = np.max(pred_probs_batch, axis=1)
+    num_issues = np.sum(
+        (pred_class_probs >= adj_confident_thresholds_shared[pred_class])
+        & (pred_class != labels_batch)
+    )
+    return _get_label_probs(labels_batch, pred_probs_batch).ravel(), int(num_issues)
+
+
 def _get_indexes_from_ranked_issues(
     ranked_label_issues: np.ndarray, h: int, w: int
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
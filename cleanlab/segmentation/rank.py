@@ -17,13 +17,26 @@
 """
 Methods to rank and score images in a semantic segmentation dataset based on how likely they are to contain mislabeled pixels.
 """
+import multiprocessing as mp
 import warnings
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union, cast
 
 import numpy as np
 
-from cleanlab.internal.segmentation_utils import _check_input, _get_valid_optional_params
+from cleanlab.internal.constants import SOFTMIN_CHUNK_SIZE
+from cleanlab.internal.multilabel_scorer import softmin
+from cleanlab.internal.segmentation_utils import (
+    _check_input,
+    _get_n_jobs,
+    _get_valid_optional_params,
+)
 from cleanlab.segmentation.filter import find_label_issues
+from cleanlab.segmentation.sparse import SparsePixelIssues
+
+# global variable for multiproc on linux
+labels_shared: np.ndarray
+pred_probs_shared: np.ndarray
+pixel_scores_shared: np.ndarray
 
 
 def get_label_quality_scores(
@@ -32,7 +45,8 @@ def get_label_quality_scores(
     *,
     method: str = "softmin",
     batch_size: Optional[int] = None,
-    n_jobs: Optional[int] = None,
+    n_jobs: Optional[int] = 1,
+    pixel_scores_file: Optional[str] = None,
     verbose: bool = True,
     **kwargs,
 ) -> Tuple[np.ndarray, np.ndarray]:
@@ -64,13 +78,22 @@ def get_label_quality_scores(
       - "num_pixel_issues" - Uses the number of pixels with label issues for each image using :py:func:`find_label_issues <cleanlab.segmentation.filter.find_label_issues>`
 
     batch_size :
-      Optional size of mini-batches to use for estimating the label issues for 'num_pixel_issues' only, not 'softmin'.
+      Optional size of mini-batches (number of entries of `pred_probs`) used to compute the scores in a streaming fashion,
+      and for estimating the label issues for 'num_pixel_issues'. Each mini-batch holds at least one image.
       To maximize efficiency, try to use the largest `batch_size` your memory allows. If not provided, a good default is used.
 
     n_jobs:
-      Optional number of processes for multiprocessing (default value = 1). Only used on Linux. For 'num_pixel_issues' only, not 'softmin'
+      Optional number of processes for multiprocessing over mini-batches of images, for both `method` values (default value = 1). Only used on Linux.
+      By default the scores are computed sequentially in the main process, set `n_jobs` greater than 1 to spread the mini-batches over a pool of processes.
       If `n_jobs=None`, will use either the number of: physical cores if psutil is installed, or logical cores otherwise.
 
+    pixel_scores_file:
+      Optional path to a ``.npy`` file to which the pixel scores are written in float32 one mini-batch at a time,
+      rather than holding them all in memory. The returned `pixel_scores` is then a memmap array of this file.
+      Together with `labels` and `pred_probs` loaded as memmap arrays via ``np.load(YOURFILE.npy, mmap_mode="r")``,
+      memory usage stays bounded by `batch_size` no matter how large the dataset is (except for 'num_pixel_issues',
+      which also returns a mask of label issues for every pixel).
+
     verbose:
       Set to ``False`` to suppress all print statements.
 
@@ -89,6 +112,7 @@ def get_label_quality_scores(
         Lower scores indicate image more likely to contain a label issue.
     pixel_scores:
         Array of shape ``(N,H,W)`` of scores between 0 and 1, one per pixel in the dataset.
+        This is a float32 memmap array if `pixel_scores_file` is provided.
     """
     batch_size, n_jobs = _get_valid_optional_params(batch_size, n_jobs)
     _check_input(labels, pred_probs)
@@ -96,58 +120,152 @@ def get_label_quality_scores(
     softmin_temperature = kwargs.get("temperature", 0.1)
     downsample_num_pixel_issues = kwargs.get("downsample", 1)
 
-    if method == "num_pixel_issues":
-        _, K, _, _ = pred_probs.shape
-        labels_expanded = labels[:, np.newaxis, :, :]
-        mask = np.arange(K)[np.newaxis, :, np.newaxis, np.newaxis] == labels_expanded
-        # Calculate pixel_scores
-        masked_pred_probs = np.where(mask, pred_probs, 0)
-        pixel_scores = masked_pred_probs.sum(axis=1)
-        scores = find_label_issues(
-            labels,
-            pred_probs,
-            downsample=downsample_num_pixel_issues,
-            n_jobs=n_jobs,
-            verbose=verbose,
-            batch_size=batch_size,
+    if method not in ["softmin", "num_pixel_issues"]:
+        raise Exception("Invalid Method: Specify correct method. Currently only supports 'softmin'")
+    num_im, num_class, h, w = pred_probs.shape
+    if method == "softmin":
+        if downsample_num_pixel_issues != 1:
+            warnings.warn(
+                f"image will not downsample for method {method} is only for method: num_pixel_issues"
+            )
+        if softmin_temperature == 0 or softmin_temperature is None:
+            raise Exception("Invalid Input: temperature cannot be zero or None")
+        if h * w == 0:
+            raise Exception("Invalid Input: pixel_scores cannot be None or an empty list")
+    if pixel_scores_file is not None:
+        pixel_scores = np.lib.format.open_memmap(
+            pixel_scores_file, mode="w+", dtype=np.float32, shape=(num_im, h, w)
         )
-        img_scores = 1 - np.mean(scores, axis=(1, 2))
-        return (img_scores, pixel_scores)
+    else:
+        pixel_scores = np.empty((num_im, h, w))
+
+    image_scores = _get_pixel_and_image_scores(
+        labels,
+        pred_probs,
+        pixel_scores,
+        temperature=softmin_temperature if method == "softmin" else None,
+        images_per_batch=max(batch_size // (num_class * h * w), 1),
+        n_jobs=n_jobs,
+        verbose=verbose,
+        desc=f"images processed using {method}",
+    )
+    if isinstance(pixel_scores, np.memmap):
+        pixel_scores.flush()
 
-    if downsample_num_pixel_issues != 1:
-        warnings.warn(
-            f"image will not downsample for method {method} is only for method: num_pixel_issues"
+    if method == "num_pixel_issues":
+        issues = cast(
+            SparsePixelIssues,
+            find_label_issues(
+                labels,
+                pred_probs,
+                downsample=downsample_num_pixel_issues,
+                n_jobs=n_jobs,
+                verbose=verbose,
+                batch_size=batch_size,
+                return_sparse=True,
+            ),
         )
+        image_scores = 1 - issues.num_issues_per_image / (h * w)
+    return image_scores, pixel_scores
 
-    num_im, num_class, h, w = pred_probs.shape
-    image_scores = np.empty((num_im,))
-    pixel_scores = np.empty((num_im, h, w))
-    if verbose:
-        from tqdm.auto import tqdm
-
-        pbar = tqdm(desc=f"images processed using {method}", total=num_im)
 
-    h_array = np.arange(h)[:, None]
-    w_array = np.arange(w)
+def _get_pixel_and_image_scores(
+    labels: np.ndarray,
+    pred_probs: np.ndarray,
+    pixel_scores: np.ndarray,
+    *,
+    temperature: Optional[float],
+    images_per_batch: int,
+    n_jobs: Optional[int],
+    verbose: bool,
+    desc: str,
+) -> np.ndarray:
+    """Fills in `pixel_scores` with the predicted probability of the given label of each pixel,
+    and returns the softmin of the pixel scores of each image (only if `temperature` is not None).
 
-    for image in range(num_im):
-        image_probs = pred_probs[image][
-            labels[image],
-            h_array,
-            w_array,
+    Images are processed in mini-batches of `images_per_batch` images, which are spread across `n_jobs` processes on Linux.
+    Worker processes write their pixel scores directly when `pixel_scores` is a memmap array,
+    which is shared between processes, otherwise they send them back to the main process.
+    """
+    num_im = len(labels)
+    n_jobs = _get_n_jobs(n_jobs)
+    write_in_worker = n_jobs == 1 or isinstance(pixel_scores, np.memmap)
+
+    # On Linux, multiprocessing is started with fork, so data can be shared with global variables + COW
+    global labels_shared, pred_probs_shared, pixel_scores_shared
+    labels_shared, pred_probs_shared, pixel_scores_shared = labels, pred_probs, pixel_scores
+    try:
+        args = [
+            [start, min(start + images_per_batch, num_im), temperature, write_in_worker]
+            for start in range(0, num_im, images_per_batch)
         ]
-        pixel_scores[image, :, :] = image_probs
-        image_scores[image] = _get_label_quality_per_image(
-            image_probs.flatten(), method=method, temperature=softmin_temperature
-        )
+
         if verbose:
-            pbar.update(1)
-    return image_scores, pixel_scores
+            from tqdm.auto import tqdm
+
+            pbar = tqdm(desc=desc, total=num_im)
+
+        image_scores = np.empty((num_im,))
+
+        def update(arg: list, result: Tuple[Optional[np.ndarray], Optional[np.ndarray]]) -> None:
+            start, end, _, _ = arg
+            image_scores_batch, pixel_scores_batch = result
+            if image_scores_batch is not None:
+                image_scores[start:end] = image_scores_batch
+            if pixel_scores_batch is not None:
+                pixel_scores[start:end] = pixel_scores_batch
+            if verbose:
+                pbar.update(end - start)
+
+        if n_jobs > 1 and len(args) > 1:
+            with mp.Pool(n_jobs) as pool:
+                for arg, result in zip(args, pool.imap(_get_pixel_and_image_scores_batch, args)):
+                    update(arg, result)
+        else:
+            for arg in args:
+                update(arg, _get_pixel_and_image_scores_batch(arg))
+
+        if verbose:
+            pbar.close()
+    finally:
+        del labels_shared, pred_probs_shared, pixel_scores_shared
+    return image_scores
+
+
+def _get_pixel_and_image_scores_batch(
+    arg: list,
+) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+    """Computes the pixel scores and softmin image scores of a mini-batch of images.
+    Pixel scores are written to `pixel_scores_shared` if ``arg[3]`` is True, otherwise they are returned.
+    """
+    start, end, temperature, write_pixel_scores = arg
+    labels_batch = np.asarray(labels_shared[start:end])
+    pred_probs_batch = np.asarray(pred_probs_shared[start:end])
+    pixel_scores_batch = np.take_along_axis(
+        pred_probs_batch, labels_batch[:, np.newaxis, :, :], axis=1
+    )[:, 0]
+
+    image_scores_batch = None
+    if temperature is not None:
+        image_scores_batch = softmin(
+            pixel_scores_batch.reshape(end - start, -1),
+            axis=1,
+            temperature=temperature,
+            chunk_size=SOFTMIN_CHUNK_SIZE,
+        )
+    if write_pixel_scores:
+        pixel_scores_shared[start:end] = pixel_scores_batch
+        return image_scores_batch, None
+    return image_scores_batch, pixel_scores_batch
 
 
 def issues_from_scores(
-    image_scores: np.ndarray, pixel_scores: Optional[np.ndarray] = None, threshold: float = 0.1
-) -> np.ndarray:
+    image_scores: np.ndarray,
+    pixel_scores: Optional[np.ndarray] = None,
+    threshold: float = 0.1,
+    *,
+    return_sparse: bool = False,
+) -> Union[np.ndarray, SparsePixelIssues]:
     """
     Converts scores output by `~cleanlab.segmentation.rank.get_label_quality_scores`
     to a list of issues of similar format as output by :py:func:`segmentation.filter.find_label_issues <cleanlab.segmentation.filter.find_label_issues>`.
@@ -174,6 +292,10 @@ def issues_from_scores(
         Optional quality scores threshold that determines which pixels are included in result. Pixels with with quality scores above the `threshold` are not
         included in the result. If not provided, all pixels are included in result.
 
+    return_sparse:
+        If ``True`` and `pixel_scores` is provided, returns the issues as a :py:class:`SparsePixelIssues <cleanlab.segmentation.sparse.SparsePixelIssues>` object
+        instead of a dense boolean mask. `pixel_scores` is then thresholded one image at a time, so it can be a memmap array.
+
     Returns
     ---------
     issues:
@@ -194,6 +316,16 @@ def issues_from_scores(
         raise ValueError("threshold must be between 0 and 1")
 
     if pixel_scores is not None:
+        if return_sparse:
+            num_images, h, w = pixel_scores.shape
+            indices = [np.flatnonzero(pixel_scores[i] < threshold) for i in range(num_images)]
+            indptr = np.zeros(num_images + 1, dtype=np.int64)
+            np.cumsum([len(image_indices) for image_indices in indices], out=indptr[1:])
+            return SparsePixelIssues(
+                np.concatenate(indices) if num_images else np.empty(0, dtype=np.int64),
+                indptr,
+                (num_images, h, w),
+            )
         return pixel_scores < threshold
 
     ranking = np.argsort(image_scores)
@@ -202,8 +334,6 @@ def issues_from_scores(
 
 
 def _get_label_quality_per_image(pixel_scores, method=None, temperature=0.1):
-    from cleanlab.internal.multilabel_scorer import softmin
-
     """
     Input pixel scores and get label quality score for that image, currently using the "softmin" method.
 
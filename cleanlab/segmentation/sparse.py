@@ -0,0 +1,154 @@
+# Copyright (C) 2017-2024  Cleanlab Inc.
+# This file is part of cleanlab.
+#
+# cleanlab is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# cleanlab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with cleanlab.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Sparse representation of the pixel label issues found in a semantic segmentation dataset.
+
+Label issues usually only affect a small fraction of the pixels, so instead of a dense boolean mask of shape ``(N,H,W)``,
+a :py:class:`SparsePixelIssues` object only stores the (flattened) index of each pixel with a label issue within its image,
+along with the offsets where the pixels of each image start (the CSR format of sparse matrices).
+It is returned by :py:func:`segmentation.filter.find_label_issues <cleanlab.segmentation.filter.find_label_issues>`
+and :py:func:`segmentation.rank.issues_from_scores <cleanlab.segmentation.rank.issues_from_scores>` with ``return_sparse=True``,
+and can be passed as the `issues` argument of the methods in :py:mod:`segmentation.summary <cleanlab.segmentation.summary>`.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+
+class SparsePixelIssues:
+    """
+    Stores the pixel label issues of ``N`` images of height ``H`` and width ``W`` in CSR format,
+    where the issues of the `i`-th image are the pixels ``indices[indptr[i]:indptr[i+1]]`` of the flattened image.
+
+    Use :py:meth:`from_mask` to convert a dense boolean mask and :py:meth:`to_mask` to convert back.
+    To store the issues on disk, save the `indices` and `indptr` arrays along with the `shape`, or use :py:meth:`to_csr`.
+
+    Parameters
+    ----------
+    indices:
+        Array of shape ``(I,)`` with the index of each pixel label issue in its flattened image of ``H*W`` pixels,
+        sorted within each image, where ``I`` is the total number of issues in the dataset.
+
+    indptr:
+        Array of shape ``(N+1,)`` where the issues of the `i`-th image are ``indices[indptr[i]:indptr[i+1]]``.
+
+    shape:
+        Shape ``(N,H,W)`` of the dense boolean mask of label issues.
+    """
+
+    def __init__(self, indices: np.ndarray, indptr: np.ndarray, shape: Tuple[int, int, int]):
+        if len(shape) != 3:
+            raise ValueError("shape must be (N, H, W)")
+        num_images, h, w = (int(dim) for dim in shape)
+        indptr = np.asarray(indptr, dtype=np.int64)
+        indices = np.asarray(indices).astype(_get_index_dtype(h * w), copy=False)
+        if indptr.shape != (num_images + 1,) or indptr[0] != 0 or indptr[-1] != len(indices):
+            raise ValueError(
+                f"indptr must be of shape ({num_images + 1},), start at 0 and end at the number of issues ({len(indices)})."
+            )
+        if len(indices) and (indices.min() < 0 or indices.max() >= h * w):
+            raise ValueError(f"indices must be in 0, 1, ..., {h * w - 1}.")
+
+        self.indices = indices
+        self.indptr = indptr
+        self.shape = (num_images, h, w)
+
+    @classmethod
+    def from_mask(cls, mask: np.ndarray) -> "SparsePixelIssues":
+        """
+        Converts a dense boolean mask of shape ``(N,H,W)`` to a ``SparsePixelIssues`` object.
+        The mask is read one image at a time, so it can also be a memmap array.
+        """
+        num_images, h, w = mask.shape
+        indices_per_image = [np.flatnonzero(mask[i]) for i in range(num_images)]
+        indptr = np.zeros(num_images + 1, dtype=np.int64)
+        np.cumsum([len(indices) for indices in indices_per_image], out=indptr[1:])
+        if num_images == 0:
+            return cls(np.empty(0, dtype=np.int64), indptr, (num_images, h, w))
+        return cls(np.concatenate(indices_per_image), indptr, (num_images, h, w))
+
+    @classmethod
+    def from_flat_indices(
+        cls, flat_indices: np.ndarray, shape: Tuple[int, int, int]
+    ) -> "SparsePixelIssues":
+        """
+        Creates a ``SparsePixelIssues`` object from the (unique) indices of the pixel label issues in the flattened ``(N,H,W)`` mask,
+        in any order.
+        """
+        num_images, h, w = shape
+        flat_indices = np.sort(np.asarray(flat_indices, dtype=np.int64))
+        image_ids = flat_indices // (h * w)
+        indptr = np.zeros(num_images + 1, dtype=np.int64)
+        np.cumsum(np.bincount(image_ids, minlength=num_images), out=indptr[1:])
+        return cls(flat_indices - image_ids * (h * w), indptr, shape)
+
+    @property
+    def num_issues_per_image(self) -> np.ndarray:
+        """Array of shape ``(N,)`` with the number of pixel label issues in each image."""
+        return np.diff(self.indptr)
+
+    @property
+    def image_ids(self) -> np.ndarray:
+        """Array of shape ``(I,)`` with the index of the image of each pixel label issue."""
+        return np.repeat(np.arange(len(self)), self.num_issues_per_image)
+
+    def coords(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the image, row and column index of each pixel label issue, like ``np.where(mask)``."""
+        rows, cols = np.divmod(self.indices, self.shape[2])
+        return self.image_ids, rows, cols
+
+    def image_mask(self, i: int) -> np.ndarray:
+        """Returns the dense boolean mask of shape ``(H,W)`` for the `i`-th image."""
+        _, h, w = self.shape
+        mask = np.zeros(h * w, dtype=bool)
+        mask[self.indices[self.indptr[i] : self.indptr[i + 1]]] = True
+        return mask.reshape(h, w)
+
+    def select(self, keep: np.ndarray) -> "SparsePixelIssues":
+        """Returns the pixel label issues where the boolean array `keep` of shape ``(I,)`` is True, as a new ``SparsePixelIssues`` object."""
+        indptr = np.zeros(len(self) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.image_ids[keep], minlength=len(self)), out=indptr[1:])
+        return type(self)(self.indices[keep], indptr, self.shape)
+
+    def to_mask(self) -> np.ndarray:
+        """Returns the dense boolean mask of shape ``(N,H,W)``."""
+        mask = np.zeros(self.shape, dtype=bool)
+        image_ids, rows, cols = self.coords()
+        mask[image_ids, rows, cols] = True
+        return mask
+
+    def to_csr(self):
+        """Returns the issues as a ``scipy.sparse.csr_matrix`` of shape ``(N, H*W)``, e.g. to save them with ``scipy.sparse.save_npz``."""
+        from scipy.sparse import csr_matrix
+
+        num_images, h, w = self.shape
+        data = np.ones(len(self.indices), dtype=bool)
+        return csr_matrix((data, self.indices, self.indptr), shape=(num_images, h * w))
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    @property
+    def nnz(self) -> int:
+        """Total number of pixel label issues in the dataset."""
+        return len(self.indices)
+
+
+def _get_index_dtype(num_pixels: int):
+    """Returns the smallest integer dtype that can index `num_pixels` pixels."""
+    return np.int32 if num_pixels <= np.iinfo(np.int32).max else np.int64
@@ -18,18 +18,17 @@
 Methods to display images and their label issues in a semantic segmentation dataset, as well as summarize the overall types of issues identified.
 """
 
-from typing import Any, Dict, List, Optional, cast
+from typing import List, Optional, Tuple, Union, cast
 
 import numpy as np
 import pandas as pd
-from tqdm.auto import tqdm
-
 
 from cleanlab.internal.segmentation_utils import _get_summary_optional_params
+from cleanlab.segmentation.sparse import SparsePixelIssues
 
 
 def display_issues(
-    issues: np.ndarray,
+    issues: Union[np.ndarray, SparsePixelIssues],
     *,
     labels: Optional[np.ndarray] = None,
     pred_probs: Optional[np.ndarray] = None,
@@ -52,6 +51,7 @@ def display_issues(
 
       Same format as output by :py:func:`segmentation.filter.find_label_issues <cleanlab.segmentation.filter.find_label_issues>`
       or :py:func:`segmentation.rank.issues_from_scores <cleanlab.segmentation.rank.issues_from_scores>`.
+      Can also be a :py:class:`SparsePixelIssues <cleanlab.segmentation.sparse.SparsePixelIssues>` object, as output with ``return_sparse=True``.
 
     labels:
       Optional discrete array of noisy labels for a segmantic segmentation dataset, in the shape ``(N,H,W,)``,
@@ -98,7 +98,11 @@ def display_issues(
 
     top = min(top, len(issues))
 
-    correct_ordering = np.argsort(-np.sum(issues, axis=(1, 2)))[:top]
+    if isinstance(issues, SparsePixelIssues):
+        num_issues_per_image = issues.num_issues_per_image
+    else:
+        num_issues_per_image = np.sum(issues, axis=(1, 2))
+    correct_ordering = np.argsort(-num_issues_per_image)[:top]
 
     try:
         import matplotlib.pyplot as plt
@@ -164,7 +168,10 @@ def display_issues(
             mask = np.full((h, w), True)
             if labels is not None and len(exclude) != 0:
                 mask = ~np.isin(labels[i], exclude)
-            ax.imshow(issues[i] & mask, cmap=error_cmap, vmin=0, vmax=1)
+            image_issues = (
+                issues.image_mask(i) if isinstance(issues, SparsePixelIssues) else issues[i]
+            )
+            ax.imshow(image_issues & mask, cmap=error_cmap, vmin=0, vmax=1)
             ax.set_title(f"Image {i}: Suggested Errors (in Red)")
 
         plt.show(**kwargs)
@@ -173,7 +180,7 @@ def display_issues(
 
 
 def common_label_issues(
-    issues: np.ndarray,
+    issues: Union[np.ndarray, SparsePixelIssues],
     labels: np.ndarray,
     pred_probs: np.ndarray,
     *,
@@ -201,6 +208,7 @@ def common_label_issues(
 
       Same format as output by :py:func:`segmentation.filter.find_label_issues <cleanlab.segmentation.filter.find_label_issues>`
       or :py:func:`segmentation.rank.issues_from_scores <cleanlab.segmentation.rank.issues_from_scores>`.
+      Can also be a :py:class:`SparsePixelIssues <cleanlab.segmentation.sparse.SparsePixelIssues>` object, as output with ``return_sparse=True``.
 
     labels:
       A discrete array of noisy labels for a segmantic segmentation dataset, in the shape ``(N,H,W,)``.
@@ -244,29 +252,20 @@ def common_label_issues(
     assert labels.shape == (N, H, W), "labels must be of shape (N, H, W)"
 
     class_names, exclude, top = _get_summary_optional_params(class_names, exclude, top)
-    # Find issues by pixel coordinates
-    issue_coords = np.column_stack(np.where(issues))
-
-    # Count issues per class (given label)
-    count: Dict[int, Any] = {}
-    for i, j, k in tqdm(issue_coords):
-        label = labels[i, j, k]
-        pred = pred_probs[i, :, j, k].argmax()
-        if label not in count:
-            count[label] = np.zeros(K, dtype=int)
-        if pred not in exclude:
-            count[label][pred] += 1
+    # Count issues per pair of (given label, predicted label) at the pixel coordinates of the issues
+    given_labels, predicted_labels = _get_issue_labels(issues, labels, pred_probs)
+    count = np.bincount(given_labels * K + predicted_labels, minlength=K * K).reshape(K, K)
+    count[:, [pred for pred in exclude if 0 <= pred < K]] = 0
 
     # Prepare output DataFrame
     if class_names is None:
         class_names = [str(i) for i in range(K)]
 
     info = []
-    for given_label, class_name in enumerate(class_names):
-        if given_label in count:
-            for pred_label, num_issues in enumerate(count[given_label]):
-                if num_issues > 0:
-                    info.append([class_name, class_names[pred_label], num_issues])
+    for given_label, class_name in enumerate(class_names[:K]):
+        for pred_label, num_issues in enumerate(count[given_label]):
+            if num_issues > 0:
+                info.append([class_name, class_names[pred_label], num_issues])
 
     info = sorted(info, key=lambda x: x[2], reverse=True)[:top]
     issues_df = pd.DataFrame(info, columns=["given_label", "predicted_label", "num_pixel_issues"])
@@ -282,8 +281,11 @@ def common_label_issues(
 
 
 def filter_by_class(
-    class_index: int, issues: np.ndarray, labels: np.ndarray, pred_probs: np.ndarray
-) -> np.ndarray:
+    class_index: int,
+    issues: Union[np.ndarray, SparsePixelIssues],
+    labels: np.ndarray,
+    pred_probs: np.ndarray,
+) -> Union[np.ndarray, SparsePixelIssues]:
     """
     Return label issues involving particular class. Note that this includes errors where the given label is the class of interest, and the predicted label is any other class.
 
@@ -298,6 +300,7 @@ def filter_by_class(
 
       Same format as output by :py:func:`segmentation.filter.find_label_issues <cleanlab.segmentation.filter.find_label_issues>`
       or :py:func:`segmentation.rank.issues_from_scores <cleanlab.segmentation.rank.issues_from_scores>`.
+      Can also be a :py:class:`SparsePixelIssues <cleanlab.segmentation.sparse.SparsePixelIssues>` object, as output with ``return_sparse=True``.
 
     labels:
       A discrete array of noisy labels for a segmantic segmentation dataset, in the shape ``(N,H,W,)``,
@@ -313,17 +316,38 @@ def filter_by_class(
     issues_subset:
       Boolean **mask** for the subset dataset where ``True`` represents a pixel label issue and ``False`` represents an example that is
       accurately labeled for the labeled class.
+      If `issues` is a :py:class:`SparsePixelIssues <cleanlab.segmentation.sparse.SparsePixelIssues>` object, the subset is returned in the same format.
 
       Returned mask shows **all** instances that involve the particular class of interest.
 
 
     """
+    if isinstance(issues, SparsePixelIssues):
+        given_labels, predicted_labels = _get_issue_labels(issues, labels, pred_probs)
+        return issues.select((given_labels == class_index) | (predicted_labels == class_index))
+
     issues_subset = (issues & np.isin(labels, class_index)) | (
         issues & np.isin(pred_probs.argmax(1), class_index)
     )
     return issues_subset
 
 
+def _get_issue_labels(
+    issues: Union[np.ndarray, SparsePixelIssues], labels: np.ndarray, pred_probs: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the given label and the predicted label (argmax of `pred_probs`) of each pixel label issue,
+    in the order of ``np.where(issues)``.
+    """
+    if isinstance(issues, SparsePixelIssues):
+        image_ids, rows, cols = issues.coords()
+    else:
+        image_ids, rows, cols = np.where(issues)
+    given_labels = np.asarray(labels[image_ids, rows, cols], dtype=np.int64)
+    predicted_labels = np.argmax(pred_probs[image_ids, :, rows, cols], axis=1)
+    return given_labels, predicted_labels
+
+
 def _generate_colormap(num_colors):
     """
     Finds a unique color map based on the number of colors inputted ideal for semantic segmentation.
@@ -21,21 +21,29 @@ The underlying algorithms are described in `this paper <https://arxiv.org/abs/22
 """
 
 import numpy as np
-from typing import List, Tuple
+from typing import List, Optional, Tuple, Union
 import warnings
 
 from cleanlab.filter import find_label_issues as find_label_issues_main
 from cleanlab.experimental.label_issues_batched import find_label_issues_batched
+from cleanlab.internal.token_classification_utils import (
+    _check_sentence_offsets,
+    _format_token_issues,
+    flatten_token_inputs,
+    unflatten_token_indices,
+)
 
 
 def find_label_issues(
-    labels: list,
-    pred_probs: list,
+    labels: Union[list, np.ndarray],
+    pred_probs: Union[list, np.ndarray],
     *,
     return_indices_ranked_by: str = "self_confidence",
     low_memory: bool = False,
+    offsets: Optional[np.ndarray] = None,
+    return_array: bool = False,
     **kwargs,
-) -> List[Tuple[int, int]]:
+) -> Union[List[Tuple[int, int]], np.ndarray]:
     """Identifies tokens with label issues in a token classification dataset.
 
     Tokens identified with issues will be ranked by their individual label quality score.
@@ -64,6 +72,18 @@ def find_label_issues(
         See :py:func:`cleanlab.filter.find_label_issues <cleanlab.filter.find_label_issues>`
         documentation for more details on each label quality scoring method.
 
+    offsets:
+        Optional array of shape ``(N+1,)`` for passing the dataset in a flat (ragged) format instead of nested lists.
+        `labels` is then an array of shape ``(L,)`` with the given labels of all L tokens in the dataset,
+        `pred_probs` is an array of shape ``(L, K)``, and the tokens of the `i`-th sentence are ``offsets[i]:offsets[i+1]``.
+
+        See :py:func:`token_classification.rank.get_label_quality_scores <cleanlab.token_classification.rank.get_label_quality_scores>`
+        for more details on this format.
+
+    return_array:
+        If ``True``, returns the issues as a structured NumPy array with integer fields ``"sentence"`` and ``"token"``
+        instead of a list of tuples, which is much more compact for large datasets.
+
     kwargs:
         Additional keyword arguments to pass into :py:func:`filter.find_label_issues <cleanlab.filter.find_label_issues>`
         which is internally applied at the token level. Can include values like `n_jobs` to control parallel processing, `frac_noise`, etc.
@@ -76,6 +96,9 @@ def find_label_issues(
 
         These tuples are ordered in `issues` list based on the likelihood that the corresponding token is mislabeled.
 
+        If `return_array` is ``True``, this is instead a structured array with the same issues in the same order,
+        where ``issues["sentence"]`` holds each `i` and ``issues["token"]`` each `j`.
+
         Use :py:func:`token_classification.summary.display_issues <cleanlab.token_classification.summary.display_issues>`
         to view these issues within the original sentences.
 
@@ -91,8 +114,11 @@ def find_label_issues(
     >>> find_label_issues(labels, pred_probs)
     [(1, 1)]
     """
-    labels_flatten = [l for label in labels for l in label]
-    pred_probs_flatten = np.array([pred for pred_prob in pred_probs for pred in pred_prob])
+    if offsets is None:
+        labels_flatten, pred_probs_flatten, offsets = flatten_token_inputs(labels, pred_probs)
+    else:
+        labels_flatten, pred_probs_flatten = np.asarray(labels), np.asarray(pred_probs)
+        offsets = _check_sentence_offsets(offsets, len(labels_flatten))
 
     if low_memory:
         for arg_name, _ in kwargs.items():
@@ -109,9 +135,5 @@ def find_label_issues(
             **kwargs,
         )
 
-    lengths = [len(label) for label in labels]
-    mapping = [[(i, j) for j in range(length)] for i, length in enumerate(lengths)]
-    mapping_flatten = [index for indicies in mapping for index in indicies]
-
-    issues = [mapping_flatten[issue] for issue in issues_main]
-    return issues
+    sentence_indices, token_indices = unflatten_token_indices(issues_main, offsets)
+    return _format_token_issues(sentence_indices, token_indices, return_array)
@@ -22,12 +22,20 @@ The underlying algorithms are described in `this paper <https://arxiv.org/abs/22
 
 import pandas as pd
 import numpy as np
-from typing import List, Optional, Union, Tuple
+from typing import List, Optional, Union, Tuple, overload
 
 from cleanlab.rank import get_label_quality_scores as main_get_label_quality_scores
-from cleanlab.internal.numerics import softmax
+from cleanlab.internal.multilabel_scorer import ragged_softmin
+from cleanlab.internal.token_classification_utils import (
+    _check_sentence_offsets,
+    _flatten_token_scores,
+    _format_token_issues,
+    flatten_token_inputs,
+    unflatten_token_indices,
+)
 
 
+@overload
 def get_label_quality_scores(
     labels: list,
     pred_probs: list,
@@ -36,7 +44,33 @@ def get_label_quality_scores(
     token_score_method: str = "self_confidence",
     sentence_score_method: str = "min",
     sentence_score_kwargs: dict = {},
-) -> Tuple[np.ndarray, list]:
+    offsets: None = None,
+) -> Tuple[np.ndarray, list]: ...
+
+
+@overload
+def get_label_quality_scores(
+    labels: Union[list, np.ndarray],
+    pred_probs: Union[list, np.ndarray],
+    *,
+    tokens: Optional[list] = None,
+    token_score_method: str = "self_confidence",
+    sentence_score_method: str = "min",
+    sentence_score_kwargs: dict = {},
+    offsets: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]: ...
+
+
+def get_label_quality_scores(
+    labels: Union[list, np.ndarray],
+    pred_probs: Union[list, np.ndarray],
+    *,
+    tokens: Optional[list] = None,
+    token_score_method: str = "self_confidence",
+    sentence_score_method: str = "min",
+    sentence_score_kwargs: dict = {},
+    offsets: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, Union[list, np.ndarray]]:
     """
     Returns overall quality scores for the labels in each sentence, as well as for the individual tokens' labels in a token classification dataset.
 
@@ -63,6 +97,7 @@ def get_label_quality_scores(
         Nested list such that `tokens[i]` is a list of tokens (strings/words) that comprise the `i`-th sentence.
 
         These strings are used to annotated the returned `token_scores` object, see its documentation for more information.
+        Not used if `offsets` is provided.
 
     sentence_score_method: {"min", "softmin"}, default="min"
         Method to aggregate individual token label quality scores into a single score for the sentence.
@@ -82,6 +117,15 @@ def get_label_quality_scores(
 
         See `~cleanlab.token_classification.rank._softmin_sentence_score` for more info about keyword arguments supported for that scoring method.
 
+    offsets:
+        Optional array of shape ``(N+1,)`` for passing the dataset in a flat (ragged) format instead of nested lists,
+        which is much faster for large datasets.
+        `labels` is then an array of shape ``(L,)`` with the given labels of all L tokens in the dataset,
+        `pred_probs` is an array of shape ``(L, K)``, and the tokens of the `i`-th sentence are ``offsets[i]:offsets[i+1]``.
+        Every sentence must contain at least one token.
+
+        Use `~cleanlab.internal.token_classification_utils.flatten_token_inputs` to convert nested lists to this format.
+
     Returns
     -------
     sentence_scores:
@@ -95,6 +139,9 @@ def get_label_quality_scores(
 
         If `tokens` strings were provided, they are used as index for each ``Series``.
 
+        If `offsets` is provided, this is instead an array of shape ``(L,)`` with the score of each token in the same flat format as `labels`,
+        so that no per-sentence ``Series`` is constructed.
+
     Examples
     --------
     >>> import numpy as np
@@ -120,27 +167,27 @@ def get_label_quality_scores(
         methods
     )
 
-    labels_flatten = np.array([l for label in labels for l in label])
-    pred_probs_flatten = np.array([p for pred_prob in pred_probs for p in pred_prob])
-
-    sentence_length = [len(label) for label in labels]
-
-    def nested_list(x, sentence_length):
-        i = iter(x)
-        return [[next(i) for _ in range(length)] for length in sentence_length]
+    if offsets is None:
+        labels_flatten, pred_probs_flatten, sentence_offsets = flatten_token_inputs(
+            labels, pred_probs
+        )
+    else:
+        labels_flatten, pred_probs_flatten = np.asarray(labels), np.asarray(pred_probs)
+        sentence_offsets = _check_sentence_offsets(offsets, len(labels_flatten))
 
     token_scores = main_get_label_quality_scores(
         labels=labels_flatten, pred_probs=pred_probs_flatten, method=token_score_method
     )
-    scores_nl = nested_list(token_scores, sentence_length)
-
-    if sentence_score_method == "min":
-        sentence_scores = np.array(list(map(np.min, scores_nl)))
-    else:
-        assert sentence_score_method == "softmin"
-        temperature = sentence_score_kwargs.get("temperature", 0.05)
-        sentence_scores = _softmin_sentence_score(scores_nl, temperature=temperature)
+    sentence_scores = _get_sentence_scores(
+        token_scores,
+        sentence_offsets,
+        method=sentence_score_method,
+        temperature=sentence_score_kwargs.get("temperature", 0.05),
+    )
+    if offsets is not None:
+        return sentence_scores, token_scores
 
+    scores_nl = np.split(token_scores, sentence_offsets[1:-1])
     if tokens:
         token_info = [pd.Series(scores, index=token) for scores, token in zip(scores_nl, tokens)]
     else:
@@ -149,7 +196,12 @@ def get_label_quality_scores(
 
 
 def issues_from_scores(
-    sentence_scores: np.ndarray, *, token_scores: Optional[list] = None, threshold: float = 0.1
+    sentence_scores: np.ndarray,
+    *,
+    token_scores: Optional[Union[list, np.ndarray]] = None,
+    threshold: float = 0.1,
+    offsets: Optional[np.ndarray] = None,
+    return_array: bool = False,
 ) -> Union[list, np.ndarray]:
     """
     Converts scores output by `~cleanlab.token_classification.rank.get_label_quality_scores`
@@ -181,6 +233,15 @@ def issues_from_scores(
         Tokens (or sentences, if `token_scores` is not provided) with quality scores above the `threshold` are not
         included in the result.
 
+    offsets:
+        Optional array of shape ``(N+1,)`` if `token_scores` is a flat array with the scores of all tokens in the dataset,
+        such that the scores of the `i`-th sentence are ``token_scores[offsets[i]:offsets[i+1]]``.
+        Same format as the `token_scores` returned by `~cleanlab.token_classification.rank.get_label_quality_scores` when `offsets` is provided.
+
+    return_array:
+        If ``True``, token-level issues are returned as a structured NumPy array with integer fields ``"sentence"`` and ``"token"``
+        instead of a list of tuples.
+
     Returns
     ---------
     issues:
@@ -225,22 +286,22 @@ def issues_from_scores(
     >>> issues_from_scores(sentence_scores, token_scores=token_scores)
     [(1, 0), (3, 1), (4, 2), (5, 3), (8, 0)]
     """
-    if token_scores:
-        issues_with_scores = []
-        for sentence_index, scores in enumerate(token_scores):
-            for token_index, score in enumerate(scores):
-                if score < threshold:
-                    issues_with_scores.append((sentence_index, token_index, score))
-
-        issues_with_scores = sorted(issues_with_scores, key=lambda x: x[2])
-        issues = [(i, j) for i, j, _ in issues_with_scores]
-        return issues
+    if token_scores is not None and len(token_scores) > 0:
+        if offsets is None:
+            token_scores, offsets = _flatten_token_scores(token_scores)
+        else:
+            offsets = _check_sentence_offsets(offsets, len(token_scores))
+        token_scores = np.asarray(token_scores)
+
+        # Stable sort keeps issues with equal scores in (sentence, token) order
+        issues_flat = np.flatnonzero(token_scores < threshold)
+        issues_flat = issues_flat[np.argsort(token_scores[issues_flat], kind="stable")]
+        sentence_indices, token_indices = unflatten_token_indices(issues_flat, offsets)
+        return _format_token_issues(sentence_indices, token_indices, return_array)
 
     else:
         ranking = np.argsort(sentence_scores)
-        cutoff = 0
-        while sentence_scores[ranking[cutoff]] < threshold and cutoff < len(ranking):
-            cutoff += 1
+        cutoff = np.count_nonzero(np.asarray(sentence_scores) < threshold)
         return ranking[:cutoff]
 
 
@@ -275,16 +336,25 @@ def _softmin_sentence_score(
     >>> _softmin_sentence_score(token_scores)
     array([6.00741787e-01, 1.80056239e-07, 8.00000000e-01])
     """
-    if temperature == 0:
-        return np.array([np.min(scores) for scores in token_scores])
+    flat_scores, offsets = _flatten_token_scores(token_scores)
+    return _get_sentence_scores(flat_scores, offsets, method="softmin", temperature=temperature)
 
-    if temperature == np.inf:
-        return np.array([np.mean(scores) for scores in token_scores])
-
-    def fun(scores: np.ndarray) -> float:
-        return np.dot(
-            scores, softmax(x=1 - np.array(scores), temperature=temperature, axis=0, shift=True)
-        )
 
-    sentence_scores = list(map(fun, token_scores))
-    return np.array(sentence_scores)
+def _get_sentence_scores(
+    token_scores: np.ndarray, offsets: np.ndarray, *, method: str = "min", temperature: float = 0.05
+) -> np.ndarray:
+    """
+    Aggregates the flat array of token scores into one score per sentence, where the tokens of the `i`-th sentence are ``offsets[i]:offsets[i+1]``.
+    All sentences are scored in one vectorized call, with `method` in {"min", "softmin"}.
+    """
+    lengths = np.diff(offsets)
+    if np.any(lengths < 1):
+        raise ValueError("Every sentence must contain at least one token.")
+    if len(lengths) == 0:
+        return np.empty(0)
+
+    if method == "min" or temperature == 0:
+        return np.minimum.reduceat(token_scores, offsets[:-1])
+    if temperature == np.inf:
+        return np.add.reduceat(token_scores, offsets[:-1]) / lengths
+    return ragged_softmin(token_scores, lengths, temperature=temperature)
@@ -18,12 +18,17 @@
 Methods to display sentences and their label issues in a token classification dataset (text data), as well as summarize the types of issues identified.
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
-from cleanlab.internal.token_classification_utils import color_sentence, get_sentence
+from cleanlab.internal.token_classification_utils import (
+    TokenIndex,
+    _get_issue_indices,
+    color_sentence,
+    get_sentence,
+)
 
 
 def display_issues(
@@ -109,7 +114,8 @@ def display_issues(
 
     top = min(top, len(issues))
     shown = 0
-    is_tuple = isinstance(issues[0], tuple)
+    # Rows of the structured array returned with `return_array=True` unpack like tuples
+    is_tuple = isinstance(issues[0], (tuple, np.void))
 
     for issue in issues:
         if is_tuple:
@@ -153,8 +159,8 @@ def display_issues(
 
 
 def common_label_issues(
-    issues: List[Tuple[int, int]],
-    tokens: List[List[str]],
+    issues: Union[List[Tuple[int, int]], np.ndarray],
+    tokens: Union[List[List[str]], TokenIndex],
     *,
     labels: Optional[list] = None,
     pred_probs: Optional[list] = None,
@@ -175,9 +181,12 @@ def common_label_issues(
 
         Same format as output by :py:func:`token_classification.filter.find_label_issues <cleanlab.token_classification.filter.find_label_issues>`
         or :py:func:`token_classification.rank.issues_from_scores <cleanlab.token_classification.rank.issues_from_scores>`.
+        Can also be a structured array with fields ``"sentence"`` and ``"token"``, as returned with ``return_array=True``.
 
     tokens:
         Nested list such that `tokens[i]` is a list of tokens (strings/words) that comprise the `i`-th sentence.
+        Can also be a `~cleanlab.internal.token_classification_utils.TokenIndex` built from this list,
+        which is reused to find the token of each issue without re-scanning the tokens.
 
     labels:
         Optional nested list of given labels for all tokens in the same format as `labels` for `~cleanlab.token_classification.summary.display_issues`.
@@ -234,17 +243,11 @@ def common_label_issues(
     0      An                 1
     1  ?weird                 1
     """
-    count: Dict[str, Any] = {}
+    sentence_indices, token_indices = _get_issue_indices(issues)
+    # Integer code of the token of each issue, numbered in order of first appearance in `issues`
+    word_codes, words = _get_issue_word_codes(tokens, sentence_indices, token_indices)
     if not labels or not pred_probs:
-        for issue in issues:
-            i, j = issue
-            word = tokens[i][j]
-            if word not in count:
-                count[word] = 0
-            count[word] += 1
-
-        words = [word for word in count.keys()]
-        freq = [count[word] for word in words]
+        freq = np.bincount(word_codes, minlength=len(words)).tolist()
         rank = np.argsort(freq)[::-1][:top]
 
         for r in rank:
@@ -263,22 +266,28 @@ def common_label_issues(
         print("Specify this argument to see the string names of each class. \n")
 
     n = pred_probs[0].shape[1]
-    for issue in issues:
-        i, j = issue
-        word = tokens[i][j]
-        label = labels[i][j]
-        pred = pred_probs[i][j].argmax()
-        if word not in count:
-            count[word] = np.zeros([n, n], dtype=int)
-        if (label, pred) not in exclude:
-            count[word][label][pred] += 1
-    words = [word for word in count.keys()]
-    freq = [np.sum(count[word]) for word in words]
+    issue_coords = list(zip(sentence_indices.tolist(), token_indices.tolist()))
+    given_labels = np.array([labels[i][j] for i, j in issue_coords], dtype=np.int64)
+    predicted_labels = (
+        np.array([pred_probs[i][j] for i, j in issue_coords], dtype=float)
+        .reshape(-1, n)
+        .argmax(axis=1)
+    )
+    excluded_pairs = [a * n + b for a, b in exclude if 0 <= a < n and 0 <= b < n]
+    keep = ~np.isin(given_labels * n + predicted_labels, excluded_pairs)
+
+    # Count each (token, given label, predicted label) triple in one pass over their encoded keys,
+    # which are sorted by token (in order of first appearance), then given label, then predicted label.
+    keys = (word_codes[keep] * n + given_labels[keep]) * n + predicted_labels[keep]
+    unique_keys, key_counts = np.unique(keys, return_counts=True)
+    key_words, key_pairs = np.divmod(unique_keys, n * n)
+    freq = np.bincount(word_codes[keep], minlength=len(words))
     rank = np.argsort(freq)[::-1][:top]
 
     for r in rank:
-        matrix = count[words[r]]
-        most_frequent = np.argsort(count[words[r]].flatten())[::-1]
+        matrix = np.zeros([n, n], dtype=int)
+        matrix.flat[key_pairs[key_words == r]] = key_counts[key_words == r]
+        most_frequent = np.argsort(matrix.flatten())[::-1]
         print(
             f"Token '{words[r]}' is potentially mislabeled {freq[r]} times throughout the dataset"
         )
@@ -300,15 +309,12 @@ def common_label_issues(
                     )
         print()
     info = []
-    for word in words:
-        for i in range(n):
-            for j in range(n):
-                num = count[word][i][j]
-                if num > 0:
-                    if not class_names:
-                        info.append([word, i, j, num])
-                    else:
-                        info.append([word, class_names[i], class_names[j], num])
+    for word_code, pair, num in zip(key_words.tolist(), key_pairs.tolist(), key_counts.tolist()):
+        i, j = divmod(pair, n)
+        if not class_names:
+            info.append([words[word_code], i, j, num])
+        else:
+            info.append([words[word_code], class_names[i], class_names[j], num])
     info = sorted(info, key=lambda x: x[3], reverse=True)
     return pd.DataFrame(
         info, columns=["token", "given_label", "predicted_label", "num_label_issues"]
@@ -316,8 +322,10 @@ def common_label_issues(
 
 
 def filter_by_token(
-    token: str, issues: List[Tuple[int, int]], tokens: List[List[str]]
-) -> List[Tuple[int, int]]:
+    token: str,
+    issues: Union[List[Tuple[int, int]], np.ndarray],
+    tokens: Union[List[List[str]], TokenIndex],
+) -> Union[List[Tuple[int, int]], np.ndarray]:
     """
     Return subset of label issues involving a particular token.
 
@@ -330,9 +338,13 @@ def filter_by_token(
         List of tuples ``(i, j)`` representing a label issue for the `j`-th token of the `i`-th sentence.
         Same format as output by :py:func:`token_classification.filter.find_label_issues <cleanlab.token_classification.filter.find_label_issues>`
         or :py:func:`token_classification.rank.issues_from_scores <cleanlab.token_classification.rank.issues_from_scores>`.
+        Can also be a structured array with fields ``"sentence"`` and ``"token"``, as returned with ``return_array=True``,
+        in which case the subset is returned as a structured array too.
 
     tokens:
         Nested list such that `tokens[i]` is a list of tokens (strings/words) that comprise the `i`-th sentence.
+        Can also be a `~cleanlab.internal.token_classification_utils.TokenIndex` built from this list,
+        which is reused to find the token of each issue without re-scanning the tokens.
 
     Returns
     ----------
@@ -353,9 +365,31 @@ def filter_by_token(
     >>> filter_by_token(token, issues, tokens)
     [(0, 1)]
     """
-    returned_issues = []
-    for issue in issues:
-        i, j = issue
-        if token.lower() == tokens[i][j].lower():
-            returned_issues.append(issue)
-    return returned_issues
+    if isinstance(tokens, TokenIndex):
+        token_ids = tokens.get_token_ids(*_get_issue_indices(issues))
+        keep = np.isin(token_ids, tokens.find(token))
+    else:
+        token = token.lower()
+        keep = np.array([tokens[i][j].lower() == token for i, j in issues], dtype=bool)
+    if isinstance(issues, np.ndarray):
+        return issues[keep]
+    return [issue for issue, is_kept in zip(issues, keep) if is_kept]
+
+
+def _get_issue_word_codes(
+    tokens: Union[List[List[str]], TokenIndex],
+    sentence_indices: np.ndarray,
+    token_indices: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns an integer code for the token of each issue, where distinct tokens are numbered in order of first appearance,
+    along with the array of distinct tokens such that ``words[codes[k]]`` is the token of the `k`-th issue.
+    """
+    if isinstance(tokens, TokenIndex):
+        word_codes, token_ids = pd.factorize(tokens.get_token_ids(sentence_indices, token_indices))
+        return word_codes, tokens.vocabulary[token_ids]
+    issue_words = np.empty(len(sentence_indices), dtype=object)
+    issue_words[:] = [
+        tokens[i][j] for i, j in zip(sentence_indices.tolist(), token_indices.tolist())
+    ]
+    return pd.factorize(issue_words)
@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 from hypothesis import HealthCheck, given, settings
 from hypothesis.extra.numpy import array_shapes, arrays
@@ -156,6 +157,66 @@ class TestNullIssueManager:
         assert info["average_null_score"] == pytest.approx(expected=18 / 20, abs=1e-7)
         assert info["column_impact"] == [0, 0.25, 0, 0, 0.25]
 
+    def test_dataframe_and_arrow_columns_match_numpy(self, issue_manager, embeddings_with_null):
+        issue_manager.find_issues(features=embeddings_with_null)
+        expected_issues, expected_info = issue_manager.issues, issue_manager.info
+
+        features_df = pd.DataFrame(embeddings_with_null, columns=["a", "b", "c"])
+        issue_manager.find_issues(features=features_df)
+        pd.testing.assert_frame_equal(issue_manager.issues, expected_issues)
+        assert issue_manager.info == expected_info
+
+        features_table = pa.Table.from_pandas(features_df)
+        issue_manager.find_issues(features=features_table)
+        pd.testing.assert_frame_equal(issue_manager.issues, expected_issues)
+        assert issue_manager.info == expected_info
+
+    def test_arrow_validity_bitmap(self, issue_manager):
+        features = pa.table(
+            {
+                "int": pa.array([1, None, 3, None], type=pa.int64()),
+                "str": pa.array(["a", None, None, "d"]),
+                "float": pa.array([np.nan, None, 0.5, 1.0]),
+            }
+        )
+        issue_manager.find_issues(features=features)
+        np.testing.assert_array_equal(
+            issue_manager.issues["is_null_issue"], [False, True, False, False]
+        )
+        np.testing.assert_allclose(issue_manager.issues["null_score"], [2 / 3, 0, 2 / 3, 2 / 3])
+        assert issue_manager.info["column_impact"] == [0.5, 0.5, 0.5]
+
+    def test_most_common_issue_ties_go_to_first_pattern(self, issue_manager):
+        features = np.array(
+            [
+                [1.0, 1.0, 1.0],
+                [1.0, np.nan, 1.0],
+                [np.nan, 1.0, 1.0],
+                [np.nan, 1.0, 1.0],
+                [1.0, np.nan, 1.0],
+            ]
+        )
+        issue_manager.find_issues(features=features)
+        most_common_issue = issue_manager.info["most_common_issue"]
+        assert most_common_issue["pattern"] == "010"
+        assert most_common_issue["rows_affected"] == [1, 4]
+        assert most_common_issue["count"] == 2
+
+    def test_wide_features(self, issue_manager):
+        np.random.seed(SEED)
+        features = np.random.random((50, 2000))
+        features[np.random.random(features.shape) < 0.1] = np.nan
+        features[[3, 7, 11]] = np.nan
+        issue_manager.find_issues(features=features)
+        null_tracker = np.isnan(features)
+        np.testing.assert_allclose(
+            issue_manager.issues["null_score"], 1 - null_tracker.mean(axis=1)
+        )
+        np.testing.assert_allclose(issue_manager.info["column_impact"], null_tracker.mean(axis=0))
+        most_common_issue = issue_manager.info["most_common_issue"]
+        assert most_common_issue["rows_affected"] == [3, 7, 11]
+        assert most_common_issue["pattern"] == "1" * 2000
+
     # Strategy for generating NaN values
     nan_strategy = just(np.nan)
 
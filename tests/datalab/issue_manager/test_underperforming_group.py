@@ -6,6 +6,7 @@ import scipy.sparse as sp
 from cleanlab.datalab.internal.issue_manager.underperforming_group import (
     UnderperformingGroupIssueManager,
 )
+from cleanlab.internal.neighbor.knn_graph import create_knn_graph_and_index
 from sklearn.datasets import make_blobs, load_iris
 
 SEED = 42
@@ -237,3 +238,70 @@ class TestUnderperformingGroupIssueManager:
         assert (
             "--------------- underperforming_group issues ---------------\n\nNumber of examples with this issue"
         ) in report
+
+    def test_invalid_clustering_algorithm(self, lab):
+        with pytest.raises(ValueError, match="Invalid clustering_algorithm"):
+            UnderperformingGroupIssueManager(datalab=lab, clustering_algorithm="kmeans")
+
+    def test_find_issues_connected_components(self, lab, make_data, monkeypatch):
+        data = make_data(noisy=True)
+        features, labels, pred_probs = data["features"], data["labels"], data["pred_probs"]
+        monkeypatch.setattr(lab._labels, "labels", labels)
+        issue_manager = UnderperformingGroupIssueManager(
+            datalab=lab,
+            threshold=0.2,
+            clustering_kwargs={"eps": 2},
+            clustering_algorithm="connected_components",
+        )
+        issue_manager.find_issues(features=features, pred_probs=pred_probs)
+        issues, summary = issue_manager.issues, issue_manager.summary
+        expected_issue_mask = labels == 0
+        assert np.all(issues["is_underperforming_group_issue"] == expected_issue_mask)
+        assert summary["score"][0] == pytest.approx(0.1428, rel=1e-3)
+        clustering_info = issue_manager.info["clustering"]
+        assert clustering_info["algorithm"] == "connected_components"
+        assert clustering_info["params"] == {"eps": 2, "min_samples": 5}
+        assert clustering_info["stats"]["n_clusters"] == 4
+
+    def test_connected_components_matches_dbscan(self, lab, make_data):
+        data = make_data()
+        features = data["features"]
+        dbscan_manager = UnderperformingGroupIssueManager(
+            datalab=lab, clustering_kwargs={"eps": 2, "min_samples": 5}
+        )
+        graph_manager = UnderperformingGroupIssueManager(
+            datalab=lab,
+            clustering_kwargs={"eps": 2, "min_samples": 5},
+            clustering_algorithm="connected_components",
+        )
+        knn_graph, _ = create_knn_graph_and_index(features, n_neighbors=10)
+        data_before = knn_graph.data.copy()
+        dbscan_ids = dbscan_manager.perform_clustering(knn_graph)
+        graph_ids = graph_manager.perform_clustering(knn_graph)
+        np.testing.assert_array_equal(knn_graph.data, data_before)
+        np.testing.assert_array_equal(graph_ids, dbscan_ids)
+
+    def test_connected_components_outliers_and_borders(self, lab):
+        # Two chains of core points, one border point and one isolated point
+        dist = np.zeros((7, 7))
+        edges = [(0, 1, 0.1), (1, 2, 0.1), (3, 4, 0.1), (4, 5, 0.1), (2, 6, 0.4), (5, 6, 0.3)]
+        for i, j, d in edges:
+            dist[i, j] = dist[j, i] = d
+        knn_graph = sp.csr_matrix(dist)
+        issue_manager = UnderperformingGroupIssueManager(
+            datalab=lab,
+            clustering_kwargs={"eps": 0.2, "min_samples": 2},
+            clustering_algorithm="connected_components",
+        )
+        cluster_ids = issue_manager.perform_clustering(knn_graph)
+        np.testing.assert_array_equal(cluster_ids, [0, 0, 0, 1, 1, 1, -1])
+
+        issue_manager.clustering_kwargs = {"eps": 0.5, "min_samples": 3}
+        cluster_ids = issue_manager.perform_clustering(knn_graph)
+        # Point 6 is a core point linking both chains
+        np.testing.assert_array_equal(cluster_ids, np.zeros(7))
+
+        issue_manager.clustering_kwargs = {"eps": 0.35, "min_samples": 3}
+        cluster_ids = issue_manager.perform_clustering(knn_graph)
+        # Only 1, 4 and 5 are core points, the other points are borders of their nearest core point
+        np.testing.assert_array_equal(cluster_ids, [0, 0, 0, 1, 1, 1, 1])
@@ -0,0 +1,120 @@
+# Copyright (C) 2017-2024  Cleanlab Inc.
+# This file is part of cleanlab.
+#
+# cleanlab is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# cleanlab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with cleanlab.  If not, see <https://www.gnu.org/licenses/>.
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from sklearn.neighbors import NearestNeighbors
+
+from cleanlab.experimental.ood_scoring import OutOfDistributionScorer
+from cleanlab.outlier import OutOfDistribution
+
+SEED = 42
+
+
+class TestOutOfDistributionScorer:
+    @pytest.fixture(params=[3, 10], ids=["euclidean", "cosine"])
+    def num_features(self, request):
+        return request.param
+
+    @pytest.fixture
+    def data(self, num_features):
+        rng = np.random.default_rng(SEED)
+        train_features = rng.normal(size=(300, num_features))
+        test_features = rng.normal(size=(257, num_features))
+        test_features[:5] *= 10  # outliers
+        return train_features, test_features
+
+    @pytest.fixture
+    def ood(self, data):
+        ood = OutOfDistribution()
+        ood.fit(features=data[0], verbose=False)
+        return ood
+
+    @pytest.mark.parametrize("batch_size, n_jobs", [(1024, 1), (32, 1), (32, 4)])
+    def test_score_matches_ood(self, ood, data, batch_size, n_jobs):
+        expected_scores = ood.score(features=data[1])
+        with OutOfDistributionScorer(ood, batch_size=batch_size, n_jobs=n_jobs) as scorer:
+            scores = scorer.score(data[1])
+            np.testing.assert_allclose(scores, expected_scores)
+            np.testing.assert_allclose(scorer.score(data[1][0]), expected_scores[:1])
+
+    def test_submit_concurrent_requests(self, ood, data):
+        test_features = data[1]
+        expected_scores = ood.score(features=test_features)
+        request_slices = [slice(i, min(i + 7, len(test_features))) for i in range(0, 257, 7)]
+        with OutOfDistributionScorer(
+            ood, batch_size=16, n_jobs=2, max_batch_size=40, max_wait=0.01
+        ) as scorer:
+            with ThreadPoolExecutor(max_workers=8) as clients:
+                futures = list(
+                    clients.map(lambda s: scorer.submit(test_features[s]), request_slices)
+                )
+            for s, future in zip(request_slices, futures):
+                np.testing.assert_allclose(future.result(timeout=10), expected_scores[s])
+            # Requests bigger than a micro-batch are scored on their own
+            np.testing.assert_allclose(
+                scorer.submit(test_features).result(timeout=10), expected_scores
+            )
+
+        with pytest.raises(RuntimeError, match="closed"):
+            scorer.submit(test_features)
+
+    def test_latency_percentiles(self, ood, data):
+        scorer = OutOfDistributionScorer(ood)
+        latency = scorer.latency_percentiles()
+        assert list(latency) == ["p50", "p99"]
+        assert all(np.isnan(v) for v in latency.values())
+
+        for i in range(20):
+            scorer.score(data[1][i : i + 1])
+        scorer.submit(data[1][:4]).result(timeout=10)
+        latency = scorer.latency_percentiles((50, 90, 99))
+        assert list(latency) == ["p50", "p90", "p99"]
+        assert 0 < latency["p50"] <= latency["p90"] <= latency["p99"]
+        scorer.close()
+        scorer.close()
+
+    def test_knn_param(self, data):
+        train_features, test_features = data
+        knn = NearestNeighbors(n_neighbors=8).fit(train_features)
+        ood = OutOfDistribution(params={"knn": knn, "k": 5})
+        with pytest.raises(ValueError, match="fit on features first"):
+            OutOfDistributionScorer(ood)
+
+        expected_scores = ood.score(features=train_features)  # sets the scaling factor
+        with OutOfDistributionScorer(ood, batch_size=50, n_jobs=None) as scorer:
+            assert scorer.k == 5
+            np.testing.assert_allclose(scorer.score(train_features), expected_scores)
+            np.testing.assert_allclose(
+                scorer.score(test_features), ood.score(features=test_features)
+            )
+
+        ood = OutOfDistribution(params={"knn": knn, "k": 10})
+        ood.params["scaling_factor"] = 1.0
+        with pytest.warns(UserWarning, match="cannot be greater than n_neighbors"):
+            scorer = OutOfDistributionScorer(ood)
+        assert scorer.k == 8
+
+    def test_invalid_features(self, ood, data):
+        scorer = OutOfDistributionScorer(ood)
+        with pytest.raises(ValueError, match="columns"):
+            scorer.score(data[1][:, :2])
+        with pytest.raises(ValueError, match="2D array"):
+            scorer.submit(data[1][None])
+        with pytest.raises(ValueError, match="batch_size"):
+            OutOfDistributionScorer(ood, batch_size=0)
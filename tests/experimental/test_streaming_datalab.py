@@ -0,0 +1,177 @@
+# Copyright (C) 2017-2024  Cleanlab Inc.
+# This file is part of cleanlab.
+#
+# cleanlab is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# cleanlab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with cleanlab.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+
+import numpy as np
+import pytest
+from datasets import ClassLabel, Dataset
+
+from cleanlab.datalab.datalab import Datalab
+from cleanlab.experimental.datalab.streaming_datalab import StreamingDatalab
+from cleanlab.experimental.label_issues_batched import find_label_issues_batched
+
+SEED = 42
+
+
+class TestStreamingDatalab:
+    N = 500
+    batch_size = 64
+
+    @pytest.fixture
+    def data(self):
+        rng = np.random.default_rng(SEED)
+        features = rng.normal(size=(self.N, 3))
+        features[:5] *= 20  # outliers
+        labels = rng.choice(["a", "b", "c"], size=self.N, p=[0.49, 0.49, 0.02])
+        pred_probs = rng.dirichlet(np.ones(3), size=self.N)
+        x1 = [None if i % 7 == 0 else float(v) for i, v in enumerate(rng.normal(size=self.N))]
+        x2 = [np.nan if i % 14 == 0 else 1.0 for i in range(self.N)]
+        return {
+            "dataset": {"x1": x1, "x2": x2, "y": labels},
+            "features": features,
+            "pred_probs": pred_probs,
+        }
+
+    @pytest.fixture
+    def lab(self, data, tmp_path):
+        dataset = Dataset.from_dict(data["dataset"])
+        return StreamingDatalab(
+            dataset, str(tmp_path), label_name="y", batch_size=self.batch_size, verbose=False
+        )
+
+    def test_find_issues_writes_results(self, lab, data, tmp_path):
+        lab.find_issues(pred_probs=data["pred_probs"], features=data["features"])
+        issue_types = ["null", "class_imbalance", "label", "outlier"]
+        assert lab.issue_summary["issue_type"].tolist() == issue_types
+        for issue_name in issue_types:
+            is_issue = np.load(os.path.join(tmp_path, f"is_{issue_name}_issue.npy"), mmap_mode="r")
+            scores = np.load(os.path.join(tmp_path, f"{issue_name}_score.npy"), mmap_mode="r")
+            assert is_issue.shape == scores.shape == (self.N,)
+            assert np.all((scores >= 0) & (scores <= 1))
+        assert os.path.exists(os.path.join(tmp_path, "issue_summary.csv"))
+        assert os.path.exists(os.path.join(tmp_path, "info.json"))
+        issues = lab.get_issues()
+        assert issues.shape == (self.N, 2 * len(issue_types))
+        assert list(lab.get_issues("label").columns) == ["is_label_issue", "label_score"]
+
+    def test_null_issues(self, lab):
+        lab.find_issues(issue_types={"null": {}})
+        issues = lab.get_issues("null")
+        x1_null = np.arange(self.N) % 7 == 0
+        x2_null = np.arange(self.N) % 14 == 0
+        expected_scores = 1 - (x1_null.astype(int) + x2_null.astype(int)) / 2
+        np.testing.assert_allclose(issues["null_score"], expected_scores)
+        np.testing.assert_array_equal(issues["is_null_issue"], x1_null & x2_null)
+        info = lab.get_info("null")
+        # the null counts are accumulated exactly across batches
+        np.testing.assert_array_equal(
+            info["column_impact"], [np.sum(x1_null) / self.N, np.sum(x2_null) / self.N]
+        )
+        assert info["feature_columns"] == ["x1", "x2"]
+
+    def test_matches_datalab(self, lab, data):
+        lab.find_issues(
+            features=data["features"], issue_types={"class_imbalance": {}, "outlier": {}}
+        )
+        datalab = Datalab(data["dataset"], label_name="y")
+        datalab.find_issues(
+            features=data["features"], issue_types={"class_imbalance": {}, "outlier": {}}
+        )
+        assert lab.class_names == datalab.class_names
+        for issue_name in ["class_imbalance", "outlier"]:
+            issues = lab.get_issues(issue_name)
+            expected_issues = datalab.get_issues(issue_name)
+            np.testing.assert_array_equal(
+                issues[f"is_{issue_name}_issue"], expected_issues[f"is_{issue_name}_issue"]
+            )
+            np.testing.assert_allclose(
+                issues[f"{issue_name}_score"], expected_issues[f"{issue_name}_score"]
+            )
+        assert lab.get_issues("outlier")["is_outlier_issue"][:5].all()
+        assert lab.get_info("class_imbalance")["Rarest Class"] == "c"
+
+    def test_label_issues_match_batched(self, lab, data):
+        lab.find_issues(pred_probs=data["pred_probs"], issue_types={"label": {}})
+        labels = np.searchsorted(["a", "b", "c"], data["dataset"]["y"])
+        expected_mask = find_label_issues_batched(
+            labels,
+            data["pred_probs"],
+            batch_size=self.batch_size,
+            verbose=False,
+            return_mask=True,
+        )
+        np.testing.assert_array_equal(lab.get_issues("label")["is_label_issue"], expected_mask)
+        summary = lab.get_issue_summary("label")
+        assert summary["num_issues"][0] == np.sum(expected_mask)
+
+    def test_outlier_reference_subset(self, lab, data):
+        lab.find_issues(
+            features=data["features"],
+            issue_types={"outlier": {"num_reference_examples": 200, "k": 5}},
+        )
+        assert lab.get_info("outlier")["num_reference_examples"] == 200
+        assert lab.get_issues("outlier")["is_outlier_issue"][:5].all()
+
+    def test_contiguous_slices_only(self, lab, data):
+        # like Zarr arrays, which do not support fancy or boolean indexing
+        class SliceOnlyArray:
+            def __init__(self, array):
+                self.array = array
+                self.shape = array.shape
+
+            def __len__(self):
+                return len(self.array)
+
+            def __getitem__(self, key):
+                assert isinstance(key, slice)
+                return self.array[key].copy()
+
+        lab.find_issues(
+            pred_probs=SliceOnlyArray(data["pred_probs"]),
+            features=SliceOnlyArray(data["features"]),
+            issue_types={"label": {}, "outlier": {"num_reference_examples": 200, "k": 5}},
+        )
+        scores = lab.get_issues()[["label_score", "outlier_score"]].to_numpy()
+        lab.find_issues(
+            pred_probs=data["pred_probs"],
+            features=data["features"],
+            issue_types={"label": {}, "outlier": {"num_reference_examples": 200, "k": 5}},
+        )
+        np.testing.assert_array_equal(
+            lab.get_issues()[["label_score", "outlier_score"]].to_numpy(), scores
+        )
+
+    def test_class_label_feature(self, tmp_path):
+        dataset = Dataset.from_dict({"x": [1.0, 2.0, 3.0, 4.0], "y": [0, 1, 1, 1]})
+        dataset = dataset.cast_column("y", ClassLabel(names=["cat", "dog"]))
+        lab = StreamingDatalab(dataset, str(tmp_path), label_name="y", batch_size=3, verbose=False)
+        assert lab.class_names == ["cat", "dog"]
+        lab.find_issues(issue_types={"class_imbalance": {"threshold": 0.9}})
+        np.testing.assert_array_equal(
+            lab.get_issues("class_imbalance")["is_class_imbalance_issue"],
+            [True, False, False, False],
+        )
+
+    def test_invalid_inputs(self, lab, data):
+        with pytest.raises(ValueError, match="Unsupported issue types"):
+            lab.find_issues(issue_types={"near_duplicate": {}})
+        with pytest.raises(ValueError, match="does not match"):
+            lab.find_issues(pred_probs=data["pred_probs"][:10])
+        with pytest.raises(ValueError, match="pred_probs must be provided"):
+            lab.find_issues(issue_types={"label": {}})
+        with pytest.raises(ValueError, match="not found"):
+            lab.get_issues("outlier")
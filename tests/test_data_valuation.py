@@ -109,3 +109,56 @@ class TestDataShapleyKNNScore:
         assert scores.shape == (len(labels),)
         assert np.all(scores >= -1)
         assert np.all(scores <= 1)
+
+
+def _knn_shapley_score_reference(neighbor_indices: np.ndarray, y: np.ndarray, k: int) -> np.ndarray:
+    """Dense O(N^2) reference implementation of the KNN-Shapley recursion."""
+    N = y.shape[0]
+    scores = np.zeros((N, N))
+    for y_alpha, s_alpha, idx in zip(y, scores, neighbor_indices):
+        ans_matches = (y[idx] == y_alpha).flatten()
+        for j in range(k - 2, -1, -1):
+            s_alpha[idx[j]] = s_alpha[idx[j + 1]] + float(
+                int(ans_matches[j]) - int(ans_matches[j + 1])
+            )
+    return np.mean(scores / k, axis=0)
+
+
+class TestDataShapleyKNNScoreEquivalence:
+    """Check that the sparse O(N * k) implementation matches the dense recursion it replaces."""
+
+    @settings(max_examples=200, deadline=None)
+    @given(valid_data())
+    def test_matches_dense_reference(self, data):
+        labels, features, k = data
+
+        knn_graph, _ = create_knn_graph_and_index(features, n_neighbors=k)
+        neighbor_indices = knn_graph.indices.reshape(-1, k)
+
+        scores = _knn_shapley_score(neighbor_indices, labels, k)
+        expected = _knn_shapley_score_reference(neighbor_indices, labels, k)
+        np.testing.assert_allclose(scores, expected, atol=1e-12)
+
+    @pytest.mark.parametrize("n_jobs", [None, 2, 3])
+    def test_parallel_matches_sequential(self, n_jobs):
+        np.random.seed(0)
+        N, k = 2000, 10
+        features = np.random.rand(N, 5)
+        labels = np.random.randint(0, 3, N)
+        knn_graph, _ = create_knn_graph_and_index(features, n_neighbors=k)
+
+        scores = data_shapley_knn(labels, knn_graph=knn_graph, k=k)
+        scores_parallel = data_shapley_knn(labels, knn_graph=knn_graph, k=k, n_jobs=n_jobs)
+        np.testing.assert_allclose(scores_parallel, scores, atol=1e-12)
+
+    def test_uses_first_k_neighbors(self):
+        np.random.seed(0)
+        N, k = 300, 5
+        features = np.random.rand(N, 3)
+        labels = np.random.randint(0, 2, N)
+        knn_graph, _ = create_knn_graph_and_index(features, n_neighbors=2 * k)
+        neighbor_indices = knn_graph.indices.reshape(N, -1)
+
+        scores = _knn_shapley_score(neighbor_indices, labels, k)
+        expected = _knn_shapley_score_reference(neighbor_indices, labels, k)
+        np.testing.assert_allclose(scores, expected, atol=1e-12)
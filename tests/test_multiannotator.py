@@ -12,9 +12,18 @@ from cleanlab.benchmarking.noise_generation import (
 )
 from cleanlab.internal.multiannotator_utils import (
     assert_valid_inputs_multiannotator,
+    SparseMultiannotatorLabels,
+    compute_soft_cross_entropy,
+    compute_temp_scaled_soft_cross_entropy,
+    find_best_temp_scaler,
     format_multiannotator_labels,
+    get_empirical_label_distribution,
+    get_label_counts,
+    temp_scale_pred_probs,
 )
 from cleanlab.multiannotator import (
+    MultiannotatorState,
+    convert_long_to_sparse_dataset,
     convert_long_to_wide_dataset,
     get_active_learning_scores,
     get_active_learning_scores_ensemble,
@@ -196,6 +205,57 @@ def test_convert_long_to_wide():
     assert all(example_long["label"].reset_index(drop=True) == example_wide.reset_index(drop=True))
 
 
+def test_sparse_labels_multiannotator():
+    labels = data["labels"]
+    pred_probs = data["pred_probs"]
+    labels_long = make_data_long(labels)
+    labels_sparse = convert_long_to_sparse_dataset(labels_long)
+
+    assert isinstance(labels_sparse, SparseMultiannotatorLabels)
+    assert labels_sparse.shape == labels.shape
+    assert labels_sparse.nnz == len(labels_long)
+    assert np.array_equal(labels_sparse.to_dense(), labels.to_numpy(dtype=float), equal_nan=True)
+
+    # scipy sparse matrices store class 0 as explicit zeros
+    labels_csr = labels_sparse.to_csr()
+    assert labels_csr.nnz == len(labels_long)
+    labels_from_csr = SparseMultiannotatorLabels.from_csr(labels_csr)
+    assert np.array_equal(labels_from_csr.labels, labels_sparse.labels)
+    assert np.array_equal(labels_from_csr.annotator_idx, labels_sparse.annotator_idx)
+
+    results_dense = get_label_quality_multiannotator(
+        labels, pred_probs, return_detailed_quality=True, verbose=False
+    )
+    for labels_multiannotator in [labels_sparse, labels_csr]:
+        results_sparse = get_label_quality_multiannotator(
+            labels_multiannotator, pred_probs, return_detailed_quality=True, verbose=False
+        )
+        assert np.allclose(
+            results_dense["label_quality"].to_numpy(dtype=float),
+            results_sparse["label_quality"].to_numpy(dtype=float),
+        )
+        assert np.allclose(
+            results_dense["annotator_stats"]
+            .loc[results_sparse["annotator_stats"].index, "annotator_quality"]
+            .to_numpy(),
+            results_sparse["annotator_stats"]["annotator_quality"].to_numpy(),
+        )
+
+        # detailed label quality is returned in long format for sparse labels
+        detailed_label_quality = results_sparse["detailed_label_quality"]
+        assert list(detailed_label_quality.columns) == ["task", "annotator", "quality"]
+        assert len(detailed_label_quality) == len(labels_long)
+
+    dense_quality = results_dense["detailed_label_quality"].to_numpy()
+    assert np.allclose(dense_quality[~np.isnan(dense_quality)], detailed_label_quality["quality"])
+
+    assert np.array_equal(get_majority_vote_label(labels), get_majority_vote_label(labels_sparse))
+    assert np.allclose(
+        get_active_learning_scores(labels, pred_probs)[0],
+        get_active_learning_scores(labels_sparse, pred_probs)[0],
+    )
+
+
 def test_label_quality_scores_multiannotator():
     labels = data["labels"]
     pred_probs = data["pred_probs"]
@@ -381,9 +441,11 @@ def test_label_quality_scores_multiannotator_ensemble():
     labels = ensemble_data["labels"]
     pred_probs = ensemble_data["pred_probs"]
 
+    pred_probs_copy = pred_probs.copy()
     multiannotator_dict = get_label_quality_multiannotator_ensemble(
         labels, pred_probs, return_weights=True
     )
+    assert np.array_equal(pred_probs, pred_probs_copy)
     assert isinstance(multiannotator_dict, dict)
     assert len(multiannotator_dict) == 5
     assert isinstance(multiannotator_dict["label_quality"], pd.DataFrame)
@@ -497,19 +559,120 @@ def test_get_active_learning_scores():
     get_active_learning_scores(labels, pred_probs, pred_probs)
 
 
+def test_multiannotator_state():
+    labels = np.array(data["labels"])
+    pred_probs = data["pred_probs"]
+    pred_probs_unlabeled = data["pred_probs_unlabeled"]
+    num_labeled, num_annotators = labels.shape
+
+    # pool of labeled and unlabeled examples
+    labels_pool = np.vstack([labels, np.full((len(pred_probs_unlabeled), num_annotators), np.NaN)])
+    pred_probs_pool = np.vstack([pred_probs, pred_probs_unlabeled])
+    state = MultiannotatorState(labels_pool, pred_probs_pool)
+
+    active_learning_scores, active_learning_scores_unlabeled = get_active_learning_scores(
+        labels, pred_probs, pred_probs_unlabeled
+    )
+    assert np.allclose(state.active_learning_scores[:num_labeled], active_learning_scores)
+    assert np.allclose(state.active_learning_scores[num_labeled:], active_learning_scores_unlabeled)
+    assert np.all(state.consensus_label[num_labeled:] == -1)
+
+    # label the lowest scoring examples, one of them by a new annotator
+    example_idx = np.argsort(state.active_learning_scores)[:3]
+    annotator_idx = np.array([num_annotators, 0, 1])
+    annotator_idx[1:] = [
+        np.flatnonzero(np.isnan(labels_pool[example]))[0] for example in example_idx[1:]
+    ]
+    new_labels = np.array([0, 1, 2])
+    scores_before = state.active_learning_scores.copy()
+    updated_idx = state.add_annotations(example_idx, annotator_idx, new_labels)
+
+    assert np.array_equal(updated_idx, np.sort(example_idx))
+    assert len(state.annotator_weight) == num_annotators + 1
+    assert np.all(
+        state.num_annotations[example_idx]
+        == np.sum(~np.isnan(labels_pool[example_idx]), axis=1) + 1
+    )
+    not_updated_mask = np.ones(len(pred_probs_pool), dtype=bool)
+    not_updated_mask[example_idx] = False
+    assert np.array_equal(
+        state.active_learning_scores[not_updated_mask], scores_before[not_updated_mask]
+    )
+    assert np.all((state.active_learning_scores >= 0) & (state.active_learning_scores <= 1))
+
+    # each annotator can only label each example once
+    with pytest.raises(ValueError, match="already labeled"):
+        state.add_annotations(example_idx[:1], annotator_idx[:1], new_labels[:1])
+
+    # new annotators are added without gaps, and invalid annotations do not change the state
+    annotator_weight_before = state.annotator_weight.copy()
+    with pytest.raises(ValueError, match="without gaps"):
+        state.add_annotations(np.array([0]), np.array([num_annotators + 3]), np.array([0]))
+    assert np.array_equal(state.annotator_weight, annotator_weight_before)
+
+    # refitting gives the same scores as recomputing them from scratch
+    labels_pool = np.hstack([labels_pool, np.full((len(labels_pool), 1), np.NaN)])
+    labels_pool[example_idx, annotator_idx] = new_labels
+    assert np.array_equal(state.labels_multiannotator.to_dense(), labels_pool, equal_nan=True)
+    state.refit()
+    labeled_mask = ~np.isnan(labels_pool).all(axis=1)
+    active_learning_scores, active_learning_scores_unlabeled = get_active_learning_scores(
+        labels_pool[labeled_mask], pred_probs_pool[labeled_mask], pred_probs_pool[~labeled_mask]
+    )
+    assert np.allclose(state.active_learning_scores[labeled_mask], active_learning_scores)
+    assert np.allclose(
+        state.active_learning_scores[~labeled_mask], active_learning_scores_unlabeled
+    )
+
+    # a single annotator per example is scored like in get_active_learning_scores until some example has multiple labels
+    state = MultiannotatorState(np.array([[0], [1], [np.NaN]]), np.full((3, 2), 0.5))
+    assert state.model_weight == 1
+    state.add_annotations(np.array([2]), np.array([0]), np.array([1]))
+    assert state.temperature == 1
+    state.add_annotations(np.array([0]), np.array([1]), np.array([0]))
+    assert np.all(state.consensus_label == [0, 1, 1])
+
+    # scoring a separate pool of unlabeled examples
+    state = MultiannotatorState(labels, pred_probs)
+    _, active_learning_scores_unlabeled = get_active_learning_scores(
+        labels, pred_probs, pred_probs_unlabeled
+    )
+    scores_unlabeled = state.get_unlabeled_active_learning_scores(pred_probs_unlabeled)
+    assert np.allclose(scores_unlabeled, active_learning_scores_unlabeled)
+    top_idx, top_scores = state.get_unlabeled_active_learning_scores(
+        pred_probs_unlabeled, top=5, n_jobs=2
+    )
+    assert np.array_equal(top_idx, np.argsort(scores_unlabeled, kind="stable")[:5])
+    assert np.array_equal(top_scores, scores_unlabeled[top_idx])
+    with pytest.raises(ValueError, match="same number of classes"):
+        state.get_unlabeled_active_learning_scores(pred_probs_unlabeled[:, :-1])
+
+
 def test_get_active_learning_scores_ensemble():
     labels = ensemble_data["labels"]
     pred_probs = ensemble_data["pred_probs"]
     labels_unlabeled = ensemble_data["labels_unlabeled"]
     pred_probs_unlabeled = ensemble_data["pred_probs_unlabeled"]
 
-    # test default case
+    # test default case, the given pred_probs are not modified by temperature scaling
+    pred_probs_copy = pred_probs.copy()
     active_learning_scores, active_learning_scores_unlabeled = get_active_learning_scores_ensemble(
         labels, pred_probs, pred_probs_unlabeled
     )
     assert isinstance(active_learning_scores, np.ndarray)
     assert len(active_learning_scores) == len(labels)
     assert len(active_learning_scores_unlabeled) == pred_probs_unlabeled.shape[1]
+    assert np.array_equal(pred_probs, pred_probs_copy)
+
+    # scores do not depend on the number of threads, and pred_probs_unlabeled is not modified
+    pred_probs_unlabeled_copy = pred_probs_unlabeled.copy()
+    _, active_learning_scores_unlabeled_threaded = get_active_learning_scores_ensemble(
+        labels, pred_probs, pred_probs_unlabeled, n_jobs=2
+    )
+    assert np.array_equal(
+        active_learning_scores_unlabeled_threaded, active_learning_scores_unlabeled
+    )
+    assert np.array_equal(pred_probs_unlabeled, pred_probs_unlabeled_copy)
 
     # test case where all examples are already labeled
     # also tests passing labels as np array
@@ -751,6 +914,100 @@ def test_get_consensus_label():
     assert all(consensus_label == np.array([1, 1, 0, 2, 2, 1]))
 
 
+def test_label_counts():
+    labels = np.array(
+        [
+            [1, np.NaN, 2, 1],
+            [np.NaN, 0, 0, np.NaN],
+            [2, 2, np.NaN, 0],
+        ]
+    )
+    labels_sparse = SparseMultiannotatorLabels.from_dense(labels)
+    assert np.array_equal(labels_sparse.num_annotations, [3, 2, 3])
+    assert np.array_equal(labels_sparse.num_examples_labeled, [2, 2, 2, 2])
+    assert np.array_equal(labels_sparse.labels, labels[~np.isnan(labels)])
+    assert np.array_equal(labels_sparse.to_dense(), labels, equal_nan=True)
+
+    label_counts = get_label_counts(labels_sparse, num_classes=4)
+    assert np.array_equal(label_counts, [[0, 2, 1, 0], [2, 0, 0, 0], [1, 0, 2, 0]])
+
+    annotator_weight = np.array([0.5, 0.25, 1.0, 2.0])
+    label_weight = get_label_counts(labels_sparse, num_classes=4, annotator_weight=annotator_weight)
+    assert np.allclose(label_weight, [[0, 2.5, 1, 0], [1.25, 0, 0, 0], [2, 0, 0.75, 0]])
+
+
+def test_empirical_label_distribution():
+    # counts must land at the class index of each label, even when lower classes were never chosen
+    labels = np.array([[2, np.NaN, 2], [0, 1, np.NaN], [np.NaN, 1, 1]])
+    empirical_label_distribution = get_empirical_label_distribution(labels, num_classes=3)
+    assert np.allclose(empirical_label_distribution, [[0, 0, 1], [0.5, 0.5, 0], [0, 1, 0]])
+
+    pred_probs = np.array([[0.1, 0.1, 0.8], [0.5, 0.4, 0.1], [0.2, 0.6, 0.2]])
+    expected_soft_cross_entropy = -np.sum(
+        empirical_label_distribution * np.log(pred_probs), axis=1
+    ) / np.log(3)
+    assert np.allclose(compute_soft_cross_entropy(labels, pred_probs), expected_soft_cross_entropy)
+
+
+def test_temp_scaled_soft_cross_entropy():
+    labels = data["labels"].to_numpy(dtype=float)
+    pred_probs = data["pred_probs"]
+    temps = [0.1, 0.5, 1, 2, 8]
+
+    # small blocks to check that results do not depend on the block size
+    soft_cross_entropy = compute_temp_scaled_soft_cross_entropy(
+        labels, pred_probs, temps, block_size=100
+    )
+    expected_soft_cross_entropy = [
+        np.mean(compute_soft_cross_entropy(labels, temp_scale_pred_probs(pred_probs, temp)))
+        for temp in temps
+    ]
+    assert np.allclose(soft_cross_entropy, expected_soft_cross_entropy)
+
+    best_temp = find_best_temp_scaler(labels, pred_probs)
+    best_temp_bounded = find_best_temp_scaler(labels, pred_probs, method="bounded")
+    best_soft_cross_entropy, best_soft_cross_entropy_bounded = (
+        compute_temp_scaled_soft_cross_entropy(labels, pred_probs, [best_temp, best_temp_bounded])
+    )
+    assert best_soft_cross_entropy_bounded <= best_soft_cross_entropy + 1e-6
+
+    with pytest.raises(ValueError, match="not a valid temperature search method"):
+        find_best_temp_scaler(labels, pred_probs, method="newton")
+
+
+def test_agreement_quality_method_post_pred_probs():
+    # the posterior of the agreement method is the fraction of annotators that gave each label,
+    # so with self_confidence scores the quality of each label is its fraction of annotators
+    labels = np.array(
+        [
+            [1, np.NaN, 2, 1],
+            [np.NaN, 2, 2, np.NaN],
+            [2, 2, np.NaN, 1],
+            [1, 1, 1, np.NaN],
+        ]
+    )
+    pred_probs = np.full((len(labels), 3), 1 / 3)
+    results = get_label_quality_multiannotator(
+        labels,
+        pred_probs,
+        quality_method="agreement",
+        return_detailed_quality=True,
+        verbose=False,
+    )
+    expected_quality = np.array(
+        [
+            [2 / 3, np.NaN, 1 / 3, 2 / 3],
+            [np.NaN, 1, 1, np.NaN],
+            [2 / 3, 2 / 3, np.NaN, 1 / 3],
+            [1, 1, 1, np.NaN],
+        ]
+    )
+    assert np.allclose(
+        results["detailed_label_quality"].to_numpy(), expected_quality, equal_nan=True
+    )
+    assert np.array_equal(results["label_quality"]["consensus_label"], [1, 2, 2, 1])
+
+
 def test_impute_nonoverlaping_annotators():
     labels = np.array(
         [
@@ -809,6 +1066,11 @@ def test_assert_valid_inputs_multiannotator_warnings(recwarn):
         assert_valid_inputs_multiannotator(not_agree_labels)
 
     agree_labels = np.array([[1, 3, 3], [1, 4, 2]])
-    assert_valid_inputs_multiannotator(agree_labels)
+    labels_sparse = assert_valid_inputs_multiannotator(agree_labels)
     # Assert no new warning were raised
     assert len(recwarn) == 0
+
+    # the validated labels are returned in sparse format, and are not converted again
+    assert isinstance(labels_sparse, SparseMultiannotatorLabels)
+    assert np.array_equal(labels_sparse.to_dense(), agree_labels)
+    assert assert_valid_inputs_multiannotator(labels_sparse) is labels_sparse
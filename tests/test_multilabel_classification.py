@@ -30,8 +30,14 @@ from sklearn.multiclass import OneVsRestClassifier
 
 from cleanlab import multilabel_classification as ml_classification
 from cleanlab.internal import multilabel_scorer as ml_scorer
-from cleanlab.internal.multilabel_utils import get_onehot_num_classes, onehot2int, stack_complement
-from cleanlab.multilabel_classification import filter
+from cleanlab.internal.multilabel_utils import (
+    find_one_vs_rest_label_issues,
+    get_onehot_num_classes,
+    int2onehot,
+    onehot2int,
+    stack_complement,
+)
+from cleanlab.multilabel_classification import SparseMultilabelLabels, filter
 from cleanlab.multilabel_classification.dataset import (
     common_multilabel_issues,
     multilabel_health_summary,
@@ -421,6 +427,126 @@ def test_multilabel_find_label_issues(data_multilabel):
     np.testing.assert_array_equal(issues_lm2, issues_lm)
 
 
+@pytest.mark.parametrize(
+    "filter_by",
+    [
+        "prune_by_noise_rate",
+        "prune_by_class",
+        "both",
+        "confident_learning",
+        "predicted_neq_given",
+        "low_normalized_margin",
+        "low_self_confidence",
+    ],
+)
+def test_find_one_vs_rest_label_issues(data_multilabel, filter_by):
+    import cleanlab.filter
+    from cleanlab.count import compute_confident_joint
+
+    labels, pred_probs = data_multilabel
+    y_one, num_classes = get_onehot_num_classes(labels, pred_probs)
+    kwargs = {"min_examples_per_class": 5}
+    if filter_by in ["prune_by_noise_rate", "prune_by_class", "both"]:
+        kwargs["frac_noise"] = 0.8
+    label_issues = find_one_vs_rest_label_issues(y_one, pred_probs, filter_by=filter_by, **kwargs)
+
+    # same as solving the one-vs-rest problem of each class separately
+    for k in range(num_classes):
+        label_issues_k = cleanlab.filter.find_label_issues(
+            y_one[:, k], stack_complement(pred_probs[:, k]), filter_by=filter_by, n_jobs=1, **kwargs
+        )
+        np.testing.assert_array_equal(label_issues[:, k], label_issues_k)
+    np.testing.assert_array_equal(
+        find_one_vs_rest_label_issues(y_one, pred_probs, filter_by=filter_by, n_jobs=2, **kwargs),
+        label_issues,
+    )
+
+    confident_joint = compute_confident_joint(labels, pred_probs, multi_label=True)
+    for k in range(num_classes):
+        np.testing.assert_array_equal(
+            confident_joint[k],
+            compute_confident_joint(y_one[:, k], stack_complement(pred_probs[:, k])),
+        )
+
+
+def test_sparse_multilabel_labels(labels_multilabel, pred_probs_multilabel):
+    from scipy.sparse import csr_matrix
+
+    num_classes = pred_probs_multilabel.shape[1]
+    labels_sparse = SparseMultilabelLabels.from_lists(labels_multilabel, num_classes=num_classes)
+    y_one = int2onehot(labels_multilabel, K=num_classes)
+    assert len(labels_sparse) == len(labels_multilabel)
+    assert labels_sparse.shape == y_one.shape
+    assert labels_sparse.nnz == y_one.sum()
+    np.testing.assert_array_equal(labels_sparse.to_onehot(), y_one)
+    np.testing.assert_array_equal(labels_sparse.to_one_vs_rest(), y_one.T.astype(bool))
+    np.testing.assert_array_equal(labels_sparse.class_counts, y_one.sum(axis=0))
+    assert labels_sparse.to_lists() == labels_multilabel
+    np.testing.assert_array_equal(labels_sparse.to_csr().toarray(), y_one)
+    for converted in [
+        SparseMultilabelLabels.from_onehot(y_one),
+        SparseMultilabelLabels.from_csr(csr_matrix(y_one)),
+        SparseMultilabelLabels.from_lists([label[::-1] * 2 for label in labels_multilabel], 5),
+    ]:
+        np.testing.assert_array_equal(converted.indices, labels_sparse.indices)
+        np.testing.assert_array_equal(converted.indptr, labels_sparse.indptr)
+    assert labels_sparse.select([4, 0]).to_lists() == [[0, 2, 3], [0]]
+    np.testing.assert_array_equal(labels_sparse.select(y_one[:, 1] == 1).to_onehot(), y_one[[1, 2]])
+
+    with pytest.raises(ValueError, match="wrong format for labels"):
+        SparseMultilabelLabels.from_lists([0, 1, 2])
+    with pytest.raises(ValueError, match="indices must be in"):
+        SparseMultilabelLabels.from_lists(labels_multilabel, num_classes=3)
+    with pytest.raises(ValueError, match="sorted within each example"):
+        SparseMultilabelLabels([1, 0], [0, 2], num_classes=2)
+
+    # the sparse labels give the same results as the List[List[int]] format
+    np.testing.assert_array_equal(
+        ml_classification.get_label_quality_scores(labels_sparse, pred_probs_multilabel),
+        ml_classification.get_label_quality_scores(labels_multilabel, pred_probs_multilabel),
+    )
+    np.testing.assert_array_equal(
+        get_label_quality_scores_per_class(labels_sparse, pred_probs_multilabel),
+        get_label_quality_scores_per_class(labels_multilabel, pred_probs_multilabel),
+    )
+    np.testing.assert_array_equal(
+        ml_scorer.MultilabelScorer()(labels_sparse, pred_probs_multilabel),
+        ml_scorer.MultilabelScorer()(y_one, pred_probs_multilabel),
+    )
+    for filter_by in ["prune_by_noise_rate", "low_self_confidence"]:
+        np.testing.assert_array_equal(
+            filter.find_label_issues(
+                labels_sparse,
+                pred_probs_multilabel,
+                filter_by=filter_by,
+                return_indices_ranked_by="self_confidence",
+            ),
+            filter.find_label_issues(
+                labels_multilabel,
+                pred_probs_multilabel,
+                filter_by=filter_by,
+                return_indices_ranked_by="self_confidence",
+            ),
+        )
+    assert common_multilabel_issues(labels_sparse, pred_probs_multilabel).equals(
+        common_multilabel_issues(labels_multilabel, pred_probs_multilabel)
+    )
+    # the deprecated multi_label argument of cleanlab.filter also accepts the sparse labels
+    from cleanlab.filter import find_label_issues as find_label_issues_main
+
+    with pytest.warns(DeprecationWarning):
+        np.testing.assert_array_equal(
+            find_label_issues_main(labels_sparse, pred_probs_multilabel, multi_label=True),
+            find_label_issues_main(labels_multilabel, pred_probs_multilabel, multi_label=True),
+        )
+    # labels with fewer classes than pred_probs are widened, not densified
+    labels_few_classes = SparseMultilabelLabels.from_lists(labels_multilabel)
+    assert labels_few_classes.shape == (len(labels_multilabel), 4)
+    assert overall_multilabel_health_score(
+        labels_few_classes, pred_probs_multilabel
+    ) == overall_multilabel_health_score(labels_multilabel, pred_probs_multilabel)
+
+
 @pytest.mark.parametrize("min_examples_per_class", [10, 90])
 def test_multilabel_min_examples_per_class(data_multilabel, min_examples_per_class):
     labels, pred_probs = data_multilabel
@@ -733,6 +859,44 @@ class TestExponentialMovingAverage:
                 ml_scorer.exponential_moving_average(np.ones(5).reshape(1, -1), alpha=alpha)
 
 
+class TestSoftmin:
+    """Test the streaming and ragged versions of the ml_scorer.softmin function."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 100])
+    @pytest.mark.parametrize("temperature", [0.001, 0.1, 10])
+    def test_chunked_softmin(self, chunk_size, temperature):
+        s = np.random.default_rng(0).random((4, 50))
+        s[2, 40:] = 0.0  # minimum in the last chunk
+        expected = ml_scorer.softmin(s, temperature=temperature)
+        np.testing.assert_allclose(
+            ml_scorer.softmin(s, temperature=temperature, chunk_size=chunk_size), expected
+        )
+        np.testing.assert_allclose(
+            ml_scorer.softmin(
+                s.T.astype(np.float32), temperature=temperature, axis=0, chunk_size=chunk_size
+            ),
+            expected,
+            rtol=1e-6,
+        )
+        with pytest.raises(ValueError, match="chunk_size"):
+            ml_scorer.softmin(s, chunk_size=0)
+
+    def test_ragged_softmin(self):
+        rng = np.random.default_rng(0)
+        rows = [rng.random(length) for length in [1, 5, 2, 30]]
+        s, lengths = np.concatenate(rows), [len(row) for row in rows]
+        for temperature in [0.01, 0.1, 1]:
+            expected = [ml_scorer.softmin(row[None], temperature=temperature)[0] for row in rows]
+            np.testing.assert_allclose(
+                ml_scorer.ragged_softmin(s, lengths, temperature=temperature), expected
+            )
+        assert ml_scorer.ragged_softmin(np.empty(0), []).shape == (0,)
+        with pytest.raises(ValueError, match="at least one score"):
+            ml_scorer.ragged_softmin(s, lengths + [0])
+        with pytest.raises(ValueError, match="must sum"):
+            ml_scorer.ragged_softmin(s, lengths[:-1])
+
+
 def flip_labels(label, flip_prob):
     """Flips binary labels with a given probability."""
     rand_flip = np.random.choice(
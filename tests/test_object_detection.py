@@ -22,9 +22,12 @@ from cleanlab.internal.object_detection_utils import (
     softmin1d,
     calculate_bounding_box_areas,
 )
+import cleanlab.object_detection.filter as od_filter
+import cleanlab.object_detection.rank as od_rank
 from cleanlab.object_detection.filter import (
     _calculate_true_positives_false_positives,
     _filter_by_class,
+    _get_true_positives_false_positives_per_image,
     _find_label_issues,
     _find_label_issues_per_box,
     _get_per_class_ap,
@@ -32,11 +35,14 @@ from cleanlab.object_detection.filter import (
     _process_class_list,
     find_label_issues,
 )
+from cleanlab.object_detection.ragged import RaggedBoxes
 from cleanlab.object_detection.rank import (
     _compute_label_quality_scores,
+    _euc_dis,
     _get_aggregation_weights,
     _get_dist_matrix,
     _get_min_pred_prob,
+    _get_overlap,
     _get_overlap_matrix,
     _get_prediction_type,
     _get_valid_inputs_for_compute_scores,
@@ -361,6 +367,29 @@ def test_similarity_matrix():
     assert (similarity_matrix.flatten() >= 0).all() and (similarity_matrix.flatten() <= 1).all()
 
 
+@pytest.mark.parametrize("image_idx", [0, 3])
+def test_overlap_and_dist_matrices_match_pairwise(image_idx):
+    lab_bboxes, _ = _separate_label(labels[image_idx])
+    det_bboxes, _, _ = _separate_prediction(predictions[image_idx])
+    # Include disjoint, touching and degenerate (zero-area) boxes
+    extra_bboxes = np.array(
+        [[0.0, 0.0, 1.0, 1.0], [1.0, 0.0, 2.0, 1.0], [5.0, 5.0, 5.0, 5.0], [0.0, 0.0, 0.0, 0.0]]
+    )
+    bb1_list = np.concatenate([lab_bboxes, extra_bboxes])
+    bb2_list = np.concatenate([det_bboxes, extra_bboxes])
+
+    iou_matrix = _get_overlap_matrix(bb1_list, bb2_list)
+    dist_matrix = _get_dist_matrix(bb1_list, bb2_list)
+    assert iou_matrix.shape == dist_matrix.shape == (len(bb1_list), len(bb2_list))
+    for i, bb1 in enumerate(bb1_list):
+        for j, bb2 in enumerate(bb2_list):
+            assert iou_matrix[i, j] == pytest.approx(_get_overlap(bb1, bb2), abs=1e-12)
+            assert dist_matrix[i, j] == pytest.approx(_euc_dis(bb1, bb2), abs=1e-12)
+
+    assert _get_overlap_matrix(bb1_list, np.array([])).shape == (len(bb1_list), 0)
+    assert _get_dist_matrix(np.array([]), bb2_list).shape == (0, len(bb2_list))
+
+
 def test_compute_label_quality_scores():
     scores = _compute_label_quality_scores(labels, predictions)
     scores_with_threshold = _compute_label_quality_scores(labels, predictions, threshold=0.99)
@@ -435,6 +464,51 @@ def test_swap_score_shifts_in_correct_direction():
     assert scores[1] > scores[2]
 
 
+def test_auxiliary_inputs_computed_once(monkeypatch):
+    auxiliary_inputs = _get_valid_inputs_for_compute_scores(ALPHA, labels, predictions)
+    min_similarities = []
+    for label, prediction, auxiliary_input_dict in zip(labels, predictions, auxiliary_inputs):
+        test_inputs = _get_valid_inputs_for_compute_scores_per_image(
+            alpha=ALPHA, label=label, prediction=prediction
+        )
+        assert np.array_equal(
+            test_inputs["similarity_matrix"], auxiliary_input_dict["similarity_matrix"]
+        )
+        assert np.array_equal(test_inputs["iou_matrix"], auxiliary_input_dict["iou_matrix"])
+        min_similarities.append(test_inputs["min_possible_similarity"])
+    # The min possible similarity is taken over the entire dataset
+    for auxiliary_input_dict in auxiliary_inputs:
+        assert auxiliary_input_dict["min_possible_similarity"] == min(min_similarities)
+
+    expected_issue_idx = find_label_issues(labels, predictions, return_indices_ranked_by_score=True)
+    num_calls = []
+
+    def counting_get_valid_inputs(*args, **kwargs):
+        num_calls.append(1)
+        return _get_valid_inputs_for_compute_scores(*args, **kwargs)
+
+    monkeypatch.setattr(
+        od_filter, "_get_valid_inputs_for_compute_scores", counting_get_valid_inputs
+    )
+    monkeypatch.setattr(od_rank, "_get_valid_inputs_for_compute_scores", counting_get_valid_inputs)
+    issue_idx = find_label_issues(labels, predictions, return_indices_ranked_by_score=True)
+    assert len(num_calls) == 1
+    assert np.array_equal(issue_idx, expected_issue_idx)
+
+
+@pytest.mark.parametrize("n_jobs", [2, None])
+def test_get_label_quality_scores_n_jobs(n_jobs, monkeypatch):
+    expected_scores = get_label_quality_scores(labels, predictions)
+    scores = get_label_quality_scores(labels, predictions, n_jobs=n_jobs)
+    assert np.array_equal(scores, expected_scores)
+
+    # Auxiliary inputs are pickled to the worker processes on platforms that do not fork
+    monkeypatch.setattr(od_rank.platform, "system", lambda: "Windows")
+    scores = get_label_quality_scores(labels, predictions, n_jobs=n_jobs)
+    assert np.array_equal(scores, expected_scores)
+    assert len(get_label_quality_scores(labels[:1], predictions[:1], n_jobs=n_jobs)) == 1
+
+
 def test_find_label_issues():
     auxiliary_inputs = _get_valid_inputs_for_compute_scores(ALPHA, labels, predictions)
     test_inputs = _get_valid_inputs_for_compute_scores_per_image(
@@ -980,6 +1054,45 @@ def test_calculate_true_positives_false_positives(return_false_negative):
     assert counter_dict[0][1] == 4
 
 
+def test_true_positives_false_positives_grouped_by_image():
+    iou_thresholds = np.array([0.3, 0.5, 0.9])
+    tpfpfn_per_image = _get_true_positives_false_positives_per_image(
+        labels, predictions, iou_thresholds
+    )
+    assert len(tpfpfn_per_image) == len(labels)
+    for class_num in range(len(predictions[0])):
+        pred_bboxes, lab_bboxes = _filter_by_class(labels, predictions, class_num)
+        for image_idx in range(len(labels)):
+            tp, fp, fn = tpfpfn_per_image[image_idx][class_num]
+            assert tp.shape == fp.shape == (len(iou_thresholds), len(pred_bboxes[image_idx]))
+            assert fn.shape == (len(iou_thresholds), len(lab_bboxes[image_idx]))
+            for threshold_idx, iou_threshold in enumerate(iou_thresholds):
+                expected = _calculate_true_positives_false_positives(
+                    pred_bboxes[image_idx], lab_bboxes[image_idx], iou_threshold, True
+                )
+                for result, expected_result in zip((tp, fp, fn), expected):
+                    np.testing.assert_array_equal(result[threshold_idx], np.ravel(expected_result))
+
+    # Greedy matching in order of confidence, only the best overlapping label is considered
+    pred_bboxes = np.array(
+        [[0, 0, 10, 10, 0.6], [0, 0, 10, 9, 0.9], [20, 20, 30, 30, 0.8], [0, 0, 9, 10, 0.7]]
+    )
+    lab_bboxes = np.array([[0, 0, 10, 10], [0, 0, 9, 9], [40, 40, 50, 50]])
+    tp, fp, fn = _calculate_true_positives_false_positives(pred_bboxes, lab_bboxes, 0.5, True)
+    np.testing.assert_array_equal(tp, [[0, 1, 0, 0]])
+    np.testing.assert_array_equal(fp, [[1, 0, 1, 1]])
+    np.testing.assert_array_equal(fn, [[0, 1, 1]])
+
+
+def test_metrics_num_procs():
+    assert _get_per_class_ap(labels, predictions, num_procs=2) == _get_per_class_ap(
+        labels, predictions
+    )
+    assert get_average_per_class_confusion_matrix(
+        labels, predictions, num_procs=2
+    ) == get_average_per_class_confusion_matrix(labels, predictions)
+
+
 def test_calculate_true_positives_false_positives_high_threshold():
     pred_bboxes = np.array([[1, 1, 5, 5]])
     lab_bboxes = np.array([[1, 1, 6, 6], [3, 3, 8, 8]])
@@ -1025,3 +1138,112 @@ def test_calculate_areas_across_boxes():
 
     rectangles = np.array([[1, 1, 1, 1]])
     assert calculate_bounding_box_areas(rectangles) == 0
+
+
+class TestRaggedBoxes:
+    @pytest.fixture
+    def ragged_labels(self):
+        return RaggedBoxes.from_labels(labels, num_classes=NUM_CLASSES)
+
+    @pytest.fixture
+    def ragged_predictions(self):
+        return RaggedBoxes.from_predictions(predictions)
+
+    def test_round_trip(self, ragged_labels, ragged_predictions):
+        assert len(ragged_labels) == len(ragged_predictions) == len(labels)
+        assert not ragged_labels.is_prediction and ragged_predictions.is_prediction
+        assert ragged_predictions.num_classes == NUM_CLASSES
+        for label, ragged_label in zip(labels, ragged_labels.to_labels()):
+            assert np.array_equal(label["bboxes"], ragged_label["bboxes"])
+            assert np.array_equal(label["labels"], ragged_label["labels"])
+        for prediction, ragged_prediction in zip(predictions, ragged_predictions.to_predictions()):
+            assert len(prediction) == len(ragged_prediction)
+            for class_prediction, ragged_class_prediction in zip(prediction, ragged_prediction):
+                assert np.array_equal(class_prediction, ragged_class_prediction)
+                # Converting back to the list format does not copy the boxes
+                if len(ragged_class_prediction):
+                    assert np.shares_memory(ragged_class_prediction, ragged_predictions.pred_probs)
+        assert np.array_equal(
+            ragged_labels.num_boxes_per_image, [len(label["labels"]) for label in labels]
+        )
+        bboxes, classes, pred_probs = ragged_predictions.image_boxes(-1 % len(predictions))
+        assert np.array_equal(
+            np.column_stack([bboxes, pred_probs]), np.concatenate(predictions[-1])
+        )
+        with pytest.raises(IndexError):
+            ragged_labels[len(labels)]
+        with pytest.raises(ValueError, match="to_predictions"):
+            ragged_labels.to_predictions()
+
+    def test_constructor_sorts_predictions_by_class(self):
+        bboxes = np.array([[0, 0, 1, 1], [1, 1, 2, 2], [2, 2, 3, 3], [3, 3, 4, 4]], dtype=float)
+        ragged_predictions = RaggedBoxes(
+            bboxes,
+            classes=[1, 0, 1, 0],
+            offsets=[0, 3, 4],
+            pred_probs=[0.1, 0.2, 0.3, 0.4],
+            num_classes=2,
+        )
+        prediction = ragged_predictions[0]
+        assert np.array_equal(prediction[0], [[1, 1, 2, 2, 0.2]])
+        assert np.array_equal(prediction[1], [[0, 0, 1, 1, 0.1], [2, 2, 3, 3, 0.3]])
+        assert np.array_equal(ragged_predictions[1][0], [[3, 3, 4, 4, 0.4]])
+        assert ragged_predictions[1][1].shape == (0, 5)
+        pruned_predictions = ragged_predictions.prune(0.25)
+        assert np.array_equal(pruned_predictions.num_boxes_per_image, [1, 1])
+        assert pruned_predictions[0][0].shape == (0, 5)
+
+        with pytest.raises(ValueError, match="offsets"):
+            RaggedBoxes(bboxes, classes=[0, 0, 0, 0], offsets=[0, 3])
+        with pytest.raises(ValueError, match="Class labels"):
+            RaggedBoxes(bboxes, classes=[0, 1, 2, 0], offsets=[0, 4], num_classes=2)
+
+    def test_rank_and_filter_accept_ragged_boxes(self, ragged_labels, ragged_predictions):
+        expected_scores = get_label_quality_scores(labels, predictions)
+        scores = get_label_quality_scores(ragged_labels, ragged_predictions)
+        assert np.allclose(scores, expected_scores)
+        expected_scores = _compute_label_quality_scores(labels, predictions, threshold=0.99)
+        scores = _compute_label_quality_scores(ragged_labels, ragged_predictions, threshold=0.99)
+        assert np.allclose(scores, expected_scores)
+
+        for compute_box_scores in [
+            compute_overlooked_box_scores,
+            compute_badloc_box_scores,
+            compute_swap_box_scores,
+        ]:
+            expected_box_scores = compute_box_scores(labels=labels, predictions=predictions)
+            box_scores = compute_box_scores(labels=ragged_labels, predictions=ragged_predictions)
+            for box_score, expected_box_score in zip(box_scores, expected_box_scores):
+                assert np.allclose(box_score, expected_box_score, equal_nan=True)
+
+        assert np.array_equal(
+            find_label_issues(ragged_labels, ragged_predictions),
+            find_label_issues(labels, predictions),
+        )
+        assert np.array_equal(
+            find_label_issues(
+                ragged_labels, ragged_predictions, return_indices_ranked_by_score=True
+            ),
+            find_label_issues(labels, predictions, return_indices_ranked_by_score=True),
+        )
+
+    def test_summary_accepts_ragged_boxes(self, ragged_labels, ragged_predictions):
+        assert object_counts_per_image(ragged_labels, ragged_predictions) == (
+            object_counts_per_image(labels, predictions)
+        )
+        assert class_label_distribution(ragged_labels, ragged_predictions) == (
+            class_label_distribution(labels, predictions)
+        )
+        assert get_sorted_bbox_count_idxs(ragged_labels, ragged_predictions) == (
+            get_sorted_bbox_count_idxs(labels, predictions)
+        )
+        assert get_average_per_class_confusion_matrix(ragged_labels, ragged_predictions) == (
+            get_average_per_class_confusion_matrix(labels, predictions)
+        )
+        for class_num in range(NUM_CLASSES):
+            for ragged_boxes, expected_boxes in zip(
+                _filter_by_class(ragged_labels, ragged_predictions, class_num),
+                _filter_by_class(labels, predictions, class_num),
+            ):
+                for boxes, expected in zip(ragged_boxes, expected_boxes):
+                    assert np.array_equal(boxes, expected)
@@ -18,6 +18,7 @@
 Scripts to test cleanlab.segmentation package
 """
 import numpy as np
+import pandas as pd
 import random
 
 np.random.seed(0)
@@ -47,6 +48,9 @@ from cleanlab.segmentation.rank import (
     _get_label_quality_per_image,
 )
 
+# Sparse
+from cleanlab.segmentation.sparse import SparsePixelIssues
+
 # Summary
 from cleanlab.segmentation.summary import (
     display_issues,
@@ -164,6 +168,78 @@ def test_results_are_consistent_with_batch_size(tmp_path: Path):
         assert np.array_equal(issues_list[i], issues_list[i + 1])
 
 
+@pytest.mark.parametrize("downsample", [1, 2])
+def test_find_label_issues_batches_and_downsample(downsample):
+    labels = np.random.randint(0, 3, (12, 8, 6))
+    pred_probs = np.random.random((12, 3, 8, 6))
+    pred_probs /= pred_probs.sum(axis=1, keepdims=True)
+    issues = find_label_issues(
+        labels, pred_probs, downsample=downsample, n_jobs=1, batch_size=10000, verbose=False
+    )
+    assert issues.shape == labels.shape
+    assert issues.any()
+    # Pixels whose label matches the predicted class are never issues
+    assert not np.any(issues & (np.argmax(pred_probs, axis=1) == labels))
+    for batch_size, n_jobs in [(1, 1), (3 * 8 * 6 * 5, 2)]:
+        np.testing.assert_array_equal(
+            find_label_issues(
+                labels,
+                pred_probs,
+                downsample=downsample,
+                n_jobs=n_jobs,
+                batch_size=batch_size,
+                verbose=False,
+            ),
+            issues,
+        )
+
+
+@pytest.mark.parametrize("downsample", [1, 2])
+def test_find_label_issues_sparse(downsample):
+    labels = np.random.randint(0, 3, (12, 8, 6))
+    pred_probs = np.random.random((12, 3, 8, 6))
+    pred_probs /= pred_probs.sum(axis=1, keepdims=True)
+    issues = find_label_issues(labels, pred_probs, downsample=downsample, verbose=False)
+    sparse_issues = find_label_issues(
+        labels, pred_probs, downsample=downsample, batch_size=100, verbose=False, return_sparse=True
+    )
+    assert isinstance(sparse_issues, SparsePixelIssues)
+    assert sparse_issues.shape == issues.shape
+    assert sparse_issues.nnz == issues.sum()
+    np.testing.assert_array_equal(sparse_issues.to_mask(), issues)
+    np.testing.assert_array_equal(sparse_issues.num_issues_per_image, issues.sum(axis=(1, 2)))
+
+
+def test_sparse_pixel_issues():
+    mask = np.random.random((4, 5, 7)) < 0.1
+    mask[2] = False
+    sparse_issues = SparsePixelIssues.from_mask(mask)
+    assert len(sparse_issues) == 4 and sparse_issues.indices.dtype == np.int32
+    np.testing.assert_array_equal(sparse_issues.to_mask(), mask)
+    for i in range(len(mask)):
+        np.testing.assert_array_equal(sparse_issues.image_mask(i), mask[i])
+    for coords, expected_coords in zip(sparse_issues.coords(), np.where(mask)):
+        np.testing.assert_array_equal(coords, expected_coords)
+    np.testing.assert_array_equal(sparse_issues.to_csr().toarray(), mask.reshape(4, -1))
+
+    flat_indices = np.random.permutation(np.flatnonzero(mask))
+    from_flat = SparsePixelIssues.from_flat_indices(flat_indices, mask.shape)
+    np.testing.assert_array_equal(from_flat.indices, sparse_issues.indices)
+    np.testing.assert_array_equal(from_flat.indptr, sparse_issues.indptr)
+
+    keep = np.arange(sparse_issues.nnz) % 2 == 0
+    expected_mask = np.zeros_like(mask)
+    expected_mask[tuple(c[keep] for c in np.where(mask))] = True
+    np.testing.assert_array_equal(sparse_issues.select(keep).to_mask(), expected_mask)
+
+    empty = SparsePixelIssues.from_mask(np.zeros((0, 5, 7), dtype=bool))
+    assert empty.nnz == 0 and empty.to_mask().shape == (0, 5, 7)
+    with pytest.raises(ValueError, match="indptr"):
+        SparsePixelIssues(sparse_issues.indices, sparse_issues.indptr[:-1], mask.shape)
+    with pytest.raises(ValueError, match="indices"):
+        SparsePixelIssues([35], [0, 1], (1, 5, 7))
+
+
 def test_find_label_issues_sizes():
     # checks inputs of different sizes
     labels, pred_probs = np.random.randint(0, 2, (2, 9, 7)), np.random.random((2, 2, 9, 7))
@@ -252,6 +328,45 @@ def test_get_label_quality_scores_exceptions(
     assert expected_message in str(exc_info.value)
 
 
+@pytest.mark.parametrize("method", ["softmin", "num_pixel_issues"])
+def test_get_label_quality_scores_streaming(tmp_path: Path, method):
+    labels_file = tmp_path / "labels.npy"
+    pred_probs_file = tmp_path / "pred_probs.npy"
+    np.save(labels_file, np.random.randint(0, 3, (20, 6, 8)))
+    pred_probs = np.random.random((20, 3, 6, 8))
+    np.save(pred_probs_file, pred_probs / pred_probs.sum(axis=1, keepdims=True))
+    labels_mmap = np.load(labels_file, mmap_mode="r")
+    pred_probs_mmap = np.load(pred_probs_file, mmap_mode="r")
+
+    expected_image_scores, expected_pixel_scores = get_label_quality_scores(
+        np.array(labels_mmap), np.array(pred_probs_mmap), method=method, n_jobs=1, verbose=False
+    )
+    for batch_size, n_jobs in [(1, 1), (3 * 6 * 8 * 3, 2)]:
+        pixel_scores_file = str(tmp_path / f"pixel_scores_{batch_size}.npy")
+        image_scores, pixel_scores = get_label_quality_scores(
+            labels_mmap,
+            pred_probs_mmap,
+            method=method,
+            batch_size=batch_size,
+            n_jobs=n_jobs,
+            pixel_scores_file=pixel_scores_file,
+            verbose=False,
+        )
+        assert isinstance(pixel_scores, np.memmap)
+        assert pixel_scores.dtype == np.float32
+        np.testing.assert_allclose(image_scores, expected_image_scores)
+        np.testing.assert_array_equal(
+            np.load(pixel_scores_file), expected_pixel_scores.astype(np.float32)
+        )
+
+    # In-memory pixel scores are sent back from the worker processes
+    image_scores, pixel_scores = get_label_quality_scores(
+        labels_mmap, pred_probs_mmap, method=method, batch_size=1, n_jobs=2, verbose=False
+    )
+    np.testing.assert_allclose(image_scores, expected_image_scores)
+    np.testing.assert_array_equal(pixel_scores, expected_pixel_scores)
+
+
 # different size inpits
 def test_get_label_quality_scores_sizes():
     # checks inputs of different sizes
@@ -292,6 +407,17 @@ def test_issues_from_scores():
     assert error[sort_by_score[0]] == 1
 
 
+def test_issues_from_scores_sparse():
+    image_scores, pixel_scores = get_label_quality_scores(labels, pred_probs, verbose=False)
+    for threshold in [0, 0.5, 1]:
+        sparse_issues = issues_from_scores(
+            image_scores, pixel_scores, threshold=threshold, return_sparse=True
+        )
+        np.testing.assert_array_equal(
+            sparse_issues.to_mask(), issues_from_scores(image_scores, pixel_scores, threshold)
+        )
+
+
 def test_issues_from_scores_no_pixel_scores():
     # Test if function works correctly when pixel_scores is None
     image_scores_softmin, _ = get_label_quality_scores(labels, pred_probs, method="softmin")
@@ -469,6 +595,27 @@ def test_filter_by_class():
     assert np.sum(class_300_issues) == 0
 
 
+def test_summary_sparse_issues(monkeypatch):
+    monkeypatch.setattr(plt, "show", lambda: None)
+    labels = np.random.randint(0, 3, (6, 8, 6))
+    pred_probs = np.random.random((6, 3, 8, 6))
+    issues = find_label_issues(labels, pred_probs, verbose=False)
+    sparse_issues = SparsePixelIssues.from_mask(issues)
+
+    for exclude in [None, [1]]:
+        pd.testing.assert_frame_equal(
+            common_label_issues(sparse_issues, labels, pred_probs, exclude=exclude, verbose=False),
+            common_label_issues(issues, labels, pred_probs, exclude=exclude, verbose=False),
+        )
+    for class_index in [0, 2, 300]:
+        class_issues = filter_by_class(class_index, sparse_issues, labels, pred_probs)
+        assert isinstance(class_issues, SparsePixelIssues)
+        np.testing.assert_array_equal(
+            class_issues.to_mask(), filter_by_class(class_index, issues, labels, pred_probs)
+        )
+    display_issues(sparse_issues, labels=labels, pred_probs=pred_probs, exclude=[0], top=2)
+
+
 def test_summary_sizes(monkeypatch):
     monkeypatch.setattr(plt, "show", lambda: None)
 
@@ -6,6 +6,11 @@ from cleanlab.internal.token_classification_utils import (
     merge_probs,
     color_sentence,
     _replace_sentence,
+    TOKEN_ISSUE_DTYPE,
+    TokenIndex,
+    flatten_token_inputs,
+    flatten_token_indices,
+    unflatten_token_indices,
 )
 from cleanlab.token_classification.filter import find_label_issues
 from cleanlab.token_classification.rank import (
@@ -273,6 +278,85 @@ def test_get_label_quality_scores(label_quality_scores):
     assert "Select from the following methods:" in str(excinfo.value)
 
 
+@pytest.mark.parametrize("sentence_score_method", ["min", "softmin"])
+def test_get_label_quality_scores_ragged(label_quality_scores, sentence_score_method):
+    labels_flat, pred_probs_flat, offsets = flatten_token_inputs(labels, pred_probs)
+    np.testing.assert_array_equal(labels_flat, [0, 0, 1, 1, 1, 2])
+    np.testing.assert_array_equal(pred_probs_flat, np.concatenate(pred_probs))
+    np.testing.assert_array_equal(offsets, [0, 2, 5, 6])
+
+    expected_sentence_scores, expected_token_info = get_label_quality_scores(
+        labels, pred_probs, sentence_score_method=sentence_score_method
+    )
+    sentence_scores, token_scores = get_label_quality_scores(
+        labels_flat, pred_probs_flat, sentence_score_method=sentence_score_method, offsets=offsets
+    )
+    assert isinstance(token_scores, np.ndarray)
+    np.testing.assert_allclose(sentence_scores, expected_sentence_scores)
+    np.testing.assert_allclose(token_scores, np.concatenate(expected_token_info))
+
+    with pytest.raises(ValueError, match="offsets"):
+        get_label_quality_scores(labels_flat, pred_probs_flat, offsets=[0, 2, 5])
+    with pytest.raises(ValueError, match="at least one token"):
+        get_label_quality_scores(labels_flat, pred_probs_flat, offsets=[0, 2, 2, 6])
+
+
+def test_flatten_unflatten_token_indices():
+    offsets = np.array([0, 3, 3, 5])  # the second sentence is empty
+    sentence_indices, token_indices = unflatten_token_indices([4, 0, 2, 3], offsets)
+    np.testing.assert_array_equal(sentence_indices, [2, 0, 0, 2])
+    np.testing.assert_array_equal(token_indices, [1, 0, 2, 0])
+    np.testing.assert_array_equal(
+        flatten_token_indices(sentence_indices, token_indices, offsets), [4, 0, 2, 3]
+    )
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_find_label_issues_ragged():
+    expected_issues = find_label_issues(labels, pred_probs, n_jobs=1)
+    labels_flat, pred_probs_flat, offsets = flatten_token_inputs(labels, pred_probs)
+    assert find_label_issues(labels_flat, pred_probs_flat, offsets=offsets, n_jobs=1) == (
+        expected_issues
+    )
+    issues = find_label_issues(labels, pred_probs, return_array=True, n_jobs=1)
+    assert issues.dtype.names == ("sentence", "token")
+    assert list(zip(issues["sentence"], issues["token"])) == expected_issues
+
+
+def test_issues_from_scores_ragged(label_quality_scores):
+    sentence_scores, token_scores = label_quality_scores
+    for threshold in [0.1, 0.65, 1.0]:
+        expected_issues = [
+            (i, j)
+            for i, j, _ in sorted(
+                [
+                    (i, j, score)
+                    for i, scores in enumerate(token_scores)
+                    for j, score in enumerate(scores)
+                    if score < threshold
+                ],
+                key=lambda x: x[2],
+            )
+        ]
+        issues = issues_from_scores(sentence_scores, token_scores=token_scores, threshold=threshold)
+        assert issues == expected_issues
+        token_scores_flat = np.concatenate(token_scores)
+        offsets = np.array([0, 2, 5, 6])
+        issues_array = issues_from_scores(
+            sentence_scores,
+            token_scores=token_scores_flat,
+            offsets=offsets,
+            threshold=threshold,
+            return_array=True,
+        )
+        assert list(zip(issues_array["sentence"], issues_array["token"])) == expected_issues
+
+    # All sentences are below the threshold
+    np.testing.assert_array_equal(
+        issues_from_scores(sentence_scores, threshold=1.0), np.argsort(sentence_scores)
+    )
+
+
 def test_issues_from_scores(label_quality_scores):
     sentence_scores, token_scores = label_quality_scores
     issues = issues_from_scores(sentence_scores, token_scores=token_scores)
@@ -341,3 +425,47 @@ def test_common_label_issues(test_issues, test_kwargs):
 def test_filter_by_token(test_token, expected_issues):
     returned_issues = filter_by_token(test_token, issues, words)
     assert returned_issues == expected_issues
+
+
+def test_token_index():
+    token_index = TokenIndex(words + [["hello", "A"]])
+    np.testing.assert_array_equal(token_index.offsets, [0, 2, 5, 6, 8])
+    assert list(token_index.vocabulary) == [
+        "Hello",
+        "World",
+        "#I",
+        "love",
+        "Cleanlab",
+        "A",
+        "hello",
+    ]
+    np.testing.assert_array_equal(token_index.get_token_ids([3, 0, 2], [1, 0, 0]), [5, 0, 5])
+    np.testing.assert_array_equal(token_index.find("HELLO"), [0, 6])
+    assert len(token_index.find("missing")) == 0
+
+
+@pytest.mark.parametrize(
+    "test_kwargs",
+    [{}, TEST_KWARGS, {**TEST_KWARGS, "exclude": [(1, 2)], "top": 1}],
+    ids=["no kwargs", "labels+pred_probs+class_names", "...+exclude+top"],
+)
+def test_common_label_issues_token_index(test_kwargs):
+    test_issues = [(1, 0), (0, 1), (1, 0), (2, 0), (1, 2)]
+    expected_df = common_label_issues(test_issues, words, verbose=False, **test_kwargs)
+    issues_array = np.array(test_issues, dtype=TOKEN_ISSUE_DTYPE)
+    for test_tokens in [words, TokenIndex(words)]:
+        for issues_input in [test_issues, issues_array]:
+            df = common_label_issues(issues_input, test_tokens, verbose=False, **test_kwargs)
+            pd.testing.assert_frame_equal(df, expected_df)
+
+
+@pytest.mark.parametrize("test_token", ["Hello", "#i", "Missing"])
+def test_filter_by_token_token_index(test_token):
+    test_issues = [(1, 0), (0, 1), (2, 0), (0, 0)]
+    expected_issues = filter_by_token(test_token, test_issues, words)
+    assert filter_by_token(test_token, test_issues, TokenIndex(words)) == expected_issues
+    issues_array = filter_by_token(
+        test_token, np.array(test_issues, dtype=TOKEN_ISSUE_DTYPE), TokenIndex(words)
+    )
+    assert issues_array.dtype == TOKEN_ISSUE_DTYPE
+    assert list(zip(issues_array["sentence"], issues_array["token"])) == expected_issues